@@ -0,0 +1,482 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatistic(Message):
+    final_position_counts: List[int] = betterproto.uint32_field(1)
+    recent_round: "AccountMahjongStatisticRoundSummary" = betterproto.message_field(2)
+    recent_hu: "AccountMahjongStatisticHuSummary" = betterproto.message_field(3)
+    highest_hu: "HighestHuRecord" = betterproto.message_field(4)
+    recent_20_hu_summary: "AccountMahjongStatisticLiqi20Summary" = (
+        betterproto.message_field(6)
+    )
+    recent_10_hu_summary: "AccountMahjongStatisticLiQi10Summary" = (
+        betterproto.message_field(7)
+    )
+    recent_10_game_result: List["AccountMahjongStatisticGameResult"] = (
+        betterproto.message_field(8)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticRoundSummary(Message):
+    total_count: int = betterproto.uint32_field(1)
+    rong_count: int = betterproto.uint32_field(2)
+    zimo_count: int = betterproto.uint32_field(3)
+    fangchong_count: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticHuSummary(Message):
+    total_count: int = betterproto.uint32_field(1)
+    dora_round_count: int = betterproto.uint32_field(2)
+    total_fan: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticLiqi20Summary(Message):
+    total_count: int = betterproto.uint32_field(1)
+    total_lidora_count: int = betterproto.uint32_field(2)
+    average_hu_point: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticLiQi10Summary(Message):
+    total_xuanshang: int = betterproto.uint32_field(1)
+    total_fanshu: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMahjongStatisticGameResult(Message):
+    rank: int = betterproto.uint32_field(1)
+    final_point: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticData(Message):
+    mahjong_category: int = betterproto.uint32_field(1)
+    game_category: int = betterproto.uint32_field(2)
+    statistic: "AccountMahjongStatistic" = betterproto.message_field(3)
+    game_type: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AccountLevel(Message):
+    id: int = betterproto.uint32_field(1)
+    score: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class Account(Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+    login_time: int = betterproto.uint32_field(3)
+    logout_time: int = betterproto.uint32_field(4)
+    room_id: int = betterproto.uint32_field(5)
+    anti_addiction: "AntiAddiction" = betterproto.message_field(6)
+    title: int = betterproto.uint32_field(7)
+    signature: str = betterproto.string_field(8)
+    email: str = betterproto.string_field(9)
+    email_verify: int = betterproto.uint32_field(10)
+    gold: int = betterproto.uint32_field(11)
+    diamond: int = betterproto.uint32_field(12)
+    avatar_id: int = betterproto.uint32_field(13)
+    vip: int = betterproto.uint32_field(14)
+    birthday: int = betterproto.int32_field(15)
+    phone: str = betterproto.string_field(16)
+    phone_verify: int = betterproto.uint32_field(17)
+    platform_diamond: List["AccountPlatformDiamond"] = betterproto.message_field(18)
+    level: "AccountLevel" = betterproto.message_field(21)
+    level3: "AccountLevel" = betterproto.message_field(22)
+    avatar_frame: int = betterproto.uint32_field(23)
+    skin_ticket: int = betterproto.uint32_field(24)
+    platform_skin_ticket: List["AccountPlatformSkinTicket"] = betterproto.message_field(
+        25
+    )
+    verified: int = betterproto.uint32_field(26)
+    challenge_levels: List["AccountChallengeLevel"] = betterproto.message_field(27)
+    frozen_state: int = betterproto.uint32_field(29)
+    achievement_count: List["AccountAchievementCount"] = betterproto.message_field(28)
+    loading_image: List[int] = betterproto.uint32_field(30)
+    favorite_hu: List["FavoriteHu"] = betterproto.message_field(34)
+    badges: List["AccountBadge"] = betterproto.message_field(35)
+
+
+@dataclass(eq=False, repr=False)
+class AccountPlatformDiamond(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountPlatformSkinTicket(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountChallengeLevel(Message):
+    season: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    rank: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountAchievementCount(Message):
+    rare: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountBadge(Message):
+    id: int = betterproto.uint32_field(1)
+    achieved_time: int = betterproto.uint32_field(2)
+    achieved_counter: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountOwnerData(Message):
+    unlock_characters: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdate(Message):
+    numerical: List["AccountUpdateNumericalUpdate"] = betterproto.message_field(1)
+    character: "AccountUpdateCharacterUpdate" = betterproto.message_field(2)
+    bag: "BagUpdate" = betterproto.message_field(3)
+    achievement: "AccountUpdateAchievementUpdate" = betterproto.message_field(4)
+    shilian: "AccountShiLian" = betterproto.message_field(5)
+    daily_task: "AccountUpdateDailyTaskUpdate" = betterproto.message_field(6)
+    title: "AccountUpdateTitleUpdate" = betterproto.message_field(7)
+    new_recharged_list: List[int] = betterproto.uint32_field(8)
+    activity_task: "AccountUpdateTaskUpdate" = betterproto.message_field(9)
+    activity_flip_task: "AccountUpdateTaskUpdate" = betterproto.message_field(10)
+    activity_period_task: "AccountUpdateTaskUpdate" = betterproto.message_field(11)
+    activity_random_task: "AccountUpdateTaskUpdate" = betterproto.message_field(12)
+    challenge: "AccountUpdateAccountChallengeUpdate" = betterproto.message_field(13)
+    ab_match: "AccountUpdateAccountAbMatchUpdate" = betterproto.message_field(14)
+    activity: "AccountActivityUpdate" = betterproto.message_field(15)
+    activity_segment_task: "AccountUpdateSegmentTaskUpdate" = betterproto.message_field(
+        16
+    )
+    month_ticket: "AccountUpdateMonthTicketUpdate" = betterproto.message_field(17)
+    main_character: "AccountUpdateMainCharacterUpdate" = betterproto.message_field(18)
+    badge: "AccountUpdateBadgeUpdate" = betterproto.message_field(19)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateNumericalUpdate(Message):
+    id: int = betterproto.uint32_field(1)
+    final: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateCharacterUpdate(Message):
+    characters: List["Character"] = betterproto.message_field(2)
+    skins: List[int] = betterproto.uint32_field(3)
+    finished_endings: List[int] = betterproto.uint32_field(4)
+    rewarded_endings: List[int] = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateAchievementUpdate(Message):
+    progresses: List["AchievementProgress"] = betterproto.message_field(1)
+    rewarded_group: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateDailyTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    task_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateTitleUpdate(Message):
+    new_titles: List[int] = betterproto.uint32_field(1)
+    remove_titles: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    task_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateAccountChallengeUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    level: int = betterproto.uint32_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    match_count: int = betterproto.uint32_field(4)
+    ticket_id: int = betterproto.uint32_field(5)
+    task_list: List[int] = betterproto.uint32_field(6)
+    rewarded_season: List[int] = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateAccountAbMatchUpdate(Message):
+    match_id: int = betterproto.uint32_field(1)
+    match_count: int = betterproto.uint32_field(2)
+    buy_in_count: int = betterproto.uint32_field(3)
+    point: int = betterproto.uint32_field(4)
+    rewarded: bool = betterproto.bool_field(5)
+    match_max_point: List["AccountUpdateAccountAbMatchUpdateMatchPoint"] = (
+        betterproto.message_field(6)
+    )
+    quit: bool = betterproto.bool_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateAccountAbMatchUpdateMatchPoint(Message):
+    match_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateSegmentTaskUpdate(Message):
+    progresses: List["SegmentTaskProgress"] = betterproto.message_field(1)
+    task_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateMonthTicketUpdate(Message):
+    end_time: int = betterproto.uint32_field(1)
+    last_pay_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateMainCharacterUpdate(Message):
+    character_id: int = betterproto.uint32_field(1)
+    skin_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountUpdateBadgeUpdate(Message):
+    progresses: List["BadgeAchieveProgress"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountPlayingGame(Message):
+    game_uuid: str = betterproto.string_field(1)
+    category: int = betterproto.uint32_field(2)
+    meta: "GameMetaData" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountCacheView(Message):
+    cache_version: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    login_time: int = betterproto.uint32_field(4)
+    logout_time: int = betterproto.uint32_field(5)
+    is_online: bool = betterproto.bool_field(6)
+    room_id: int = betterproto.uint32_field(7)
+    title: int = betterproto.uint32_field(8)
+    avatar_id: int = betterproto.uint32_field(9)
+    vip: int = betterproto.uint32_field(10)
+    level: "AccountLevel" = betterproto.message_field(11)
+    playing_game: "AccountPlayingGame" = betterproto.message_field(12)
+    level3: "AccountLevel" = betterproto.message_field(13)
+    avatar_frame: int = betterproto.uint32_field(14)
+    verified: int = betterproto.uint32_field(15)
+    ban_deadline: int = betterproto.uint32_field(16)
+    comment_ban: int = betterproto.uint32_field(17)
+    ban_state: int = betterproto.uint32_field(18)
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticByGameMode(Message):
+    mode: int = betterproto.uint32_field(1)
+    game_count_sum: int = betterproto.uint32_field(2)
+    game_final_position: List[int] = betterproto.uint32_field(3)
+    fly_count: int = betterproto.uint32_field(4)
+    gold_earn_sum: float = betterproto.float_field(5)
+    round_count_sum: int = betterproto.uint32_field(6)
+    dadian_sum: float = betterproto.float_field(7)
+    round_end: List["AccountStatisticByGameModeRoundEndData"] = (
+        betterproto.message_field(8)
+    )
+    ming_count_sum: int = betterproto.uint32_field(9)
+    liqi_count_sum: int = betterproto.uint32_field(10)
+    xun_count_sum: int = betterproto.uint32_field(11)
+    highest_lianzhuang: int = betterproto.uint32_field(12)
+    score_earn_sum: int = betterproto.uint32_field(13)
+    rank_score: List["AccountStatisticByGameModeRankScore"] = betterproto.message_field(
+        14
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticByGameModeRoundEndData(Message):
+    type: int = betterproto.uint32_field(1)
+    sum: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticByGameModeRankScore(Message):
+    rank: int = betterproto.uint32_field(1)
+    score_sum: int = betterproto.int32_field(2)
+    count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountStatisticByFan(Message):
+    fan_id: int = betterproto.uint32_field(1)
+    sum: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountFanAchieved(Message):
+    mahjong_category: int = betterproto.uint32_field(1)
+    fan: List["AccountStatisticByFan"] = betterproto.message_field(2)
+    liujumanguan: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatistic(Message):
+    game_mode: List["AccountStatisticByGameMode"] = betterproto.message_field(1)
+    fan: List["AccountStatisticByFan"] = betterproto.message_field(2)
+    liujumanguan: int = betterproto.uint32_field(3)
+    fan_achieved: List["AccountFanAchieved"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticByCategory(Message):
+    category: int = betterproto.uint32_field(1)
+    detail_statistic: "AccountDetailStatistic" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2(Message):
+    friend_room_statistic: "AccountDetailStatistic" = betterproto.message_field(1)
+    rank_statistic: "AccountDetailStatisticV2RankStatistic" = betterproto.message_field(
+        2
+    )
+    customized_contest_statistic: (
+        "AccountDetailStatisticV2CustomizedContestStatistic"
+    ) = betterproto.message_field(3)
+    leisure_match_statistic: "AccountDetailStatistic" = betterproto.message_field(4)
+    challenge_match_statistic: "AccountDetailStatisticV2ChallengeStatistic" = (
+        betterproto.message_field(5)
+    )
+    activity_match_statistic: "AccountDetailStatistic" = betterproto.message_field(6)
+    ab_match_statistic: "AccountDetailStatistic" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2RankStatistic(Message):
+    total_statistic: "AccountDetailStatisticV2RankStatisticRankData" = (
+        betterproto.message_field(1)
+    )
+    month_statistic: "AccountDetailStatisticV2RankStatisticRankData" = (
+        betterproto.message_field(2)
+    )
+    month_refresh_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2RankStatisticRankData(Message):
+    all_level_statistic: "AccountDetailStatistic" = betterproto.message_field(1)
+    level_data_list: List[
+        "AccountDetailStatisticV2RankStatisticRankDataRankLevelData"
+    ] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2RankStatisticRankDataRankLevelData(Message):
+    rank_level: int = betterproto.uint32_field(1)
+    statistic: "AccountDetailStatistic" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2CustomizedContestStatistic(Message):
+    total_statistic: "AccountDetailStatistic" = betterproto.message_field(1)
+    month_statistic: "AccountDetailStatistic" = betterproto.message_field(2)
+    month_refresh_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2ChallengeStatistic(Message):
+    all_season: "AccountDetailStatistic" = betterproto.message_field(1)
+    season_data_list: List["AccountDetailStatisticV2ChallengeStatisticSeasonData"] = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountDetailStatisticV2ChallengeStatisticSeasonData(Message):
+    season_id: int = betterproto.uint32_field(1)
+    statistic: "AccountDetailStatistic" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountShiLian(Message):
+    step: int = betterproto.uint32_field(1)
+    state: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountActivityUpdate(Message):
+    mine_data: List["MineActivityData"] = betterproto.message_field(1)
+    rpg_data: List["RpgActivity"] = betterproto.message_field(2)
+    feed_data: List["ActivityFeedData"] = betterproto.message_field(3)
+    spot_data: List["ActivitySpotData"] = betterproto.message_field(4)
+    friend_gift_data: List["ActivityFriendGiftData"] = betterproto.message_field(5)
+    upgrade_data: List["ActivityUpgradeData"] = betterproto.message_field(6)
+    gacha_data: List["ActivityGachaUpdateData"] = betterproto.message_field(7)
+    simulation_data: List["ActivitySimulationData"] = betterproto.message_field(8)
+    combining_data: List["ActivityCombiningLqData"] = betterproto.message_field(9)
+    village_data: List["ActivityVillageData"] = betterproto.message_field(10)
+    festival_data: List["ActivityFestivalData"] = betterproto.message_field(11)
+    island_data: List["ActivityIslandData"] = betterproto.message_field(12)
+    story_data: List["ActivityStoryData"] = betterproto.message_field(14)
+    choose_up_data: List["ActivityChooseUpData"] = betterproto.message_field(15)
+    simulation_v2_data: List["SimulationV2Data"] = betterproto.message_field(16)
+    quest_crew_data: List["ActivityQuestCrewChanges"] = betterproto.message_field(17)
+    shoot_data: List["ActivityShootData"] = betterproto.message_field(18)
+    bingo_data: List["ActivityBingoData"] = betterproto.message_field(19)
+    snowball_data: List["ActivitySnowballValueChanges"] = betterproto.message_field(20)
+    choose_group_up_data: List["ActivityChooseGroupData"] = betterproto.message_field(
+        21
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountActiveState(Message):
+    account_id: int = betterproto.uint32_field(1)
+    login_time: int = betterproto.uint32_field(2)
+    logout_time: int = betterproto.uint32_field(3)
+    is_online: bool = betterproto.bool_field(4)
+    playing: "AccountPlayingGame" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AccountSetting(Message):
+    key: int = betterproto.uint32_field(1)
+    value: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountResourceSnapshot(Message):
+    bag_item: List["AccountResourceSnapshotBagItemSnapshot"] = (
+        betterproto.message_field(1)
+    )
+    currency: List["AccountResourceSnapshotCurrencySnapshot"] = (
+        betterproto.message_field(2)
+    )
+    title: "AccountResourceSnapshotTitleSnapshot" = betterproto.message_field(3)
+    used_title: "AccountResourceSnapshotUsedTitleSnapshot" = betterproto.message_field(
+        4
+    )
+    currency_convert: int = betterproto.uint32_field(5)
@@ -0,0 +1,170 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class AccountResourceSnapshotBagItemSnapshot(Message):
+    resource_id: int = betterproto.uint32_field(1)
+    resource_count: int = betterproto.uint32_field(2)
+    resource_version: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountResourceSnapshotCurrencySnapshot(Message):
+    currency_id: int = betterproto.uint32_field(1)
+    currency_count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountResourceSnapshotTitleSnapshot(Message):
+    title_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountResourceSnapshotUsedTitleSnapshot(Message):
+    title_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountCharacterSnapshot(Message):
+    created_characters: List[int] = betterproto.uint32_field(1)
+    removed_characters: List["Character"] = betterproto.message_field(2)
+    modified_characters: List["Character"] = betterproto.message_field(3)
+    main_character: "AccountCharacterSnapshotMainCharacterSnapshot" = (
+        betterproto.message_field(4)
+    )
+    skins: "AccountCharacterSnapshotSkinsSnapshot" = betterproto.message_field(5)
+    hidden_characters: "AccountCharacterSnapshotHiddenCharacter" = (
+        betterproto.message_field(6)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountCharacterSnapshotMainCharacterSnapshot(Message):
+    character_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountCharacterSnapshotSkinsSnapshot(Message):
+    skin_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountCharacterSnapshotHiddenCharacter(Message):
+    hidden_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMailRecord(Message):
+    created_mails: List[int] = betterproto.uint32_field(1)
+    removed_mails: List["AccountMailRecordMailSnapshot"] = betterproto.message_field(2)
+    modified_mails: List["AccountMailRecordMailSnapshot"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMailRecordMailSnapshot(Message):
+    mail_id: int = betterproto.uint32_field(1)
+    reference_id: int = betterproto.uint32_field(2)
+    create_time: int = betterproto.uint32_field(3)
+    expire_time: int = betterproto.uint32_field(4)
+    take_attachment: int = betterproto.uint32_field(5)
+    attachments: List["RewardSlot"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class AccountAchievementSnapshot(Message):
+    achievements: List["AchievementProgress"] = betterproto.message_field(1)
+    rewarded_group: "AccountAchievementSnapshotRewardedGroupSnapshot" = (
+        betterproto.message_field(2)
+    )
+    version: "AccountAchievementSnapshotAchievementVersion" = betterproto.message_field(
+        3
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountAchievementSnapshotRewardedGroupSnapshot(Message):
+    rewarded_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountAchievementSnapshotAchievementVersion(Message):
+    version: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshot(Message):
+    faith_data: "FaithData" = betterproto.message_field(1)
+    vip_reward_gained: "AccountMiscSnapshotAccountVipRewardSnapshot" = (
+        betterproto.message_field(2)
+    )
+    vip: "AccountMiscSnapshotAccountVip" = betterproto.message_field(3)
+    shop_info: "ShopInfo" = betterproto.message_field(4)
+    month_ticket: "AccountMiscSnapshotAccountMonthTicketSnapshot" = (
+        betterproto.message_field(5)
+    )
+    recharged: "AccountMiscSnapshotAccountRechargeInfo" = betterproto.message_field(6)
+    month_ticket_v2: "AccountMiscSnapshotAccountMonthTicketSnapshotV2" = (
+        betterproto.message_field(7)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountVipRewardSnapshot(Message):
+    rewarded: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotMonthTicketInfo(Message):
+    id: int = betterproto.uint32_field(1)
+    end_time: int = betterproto.uint32_field(2)
+    last_pay_time: int = betterproto.uint32_field(3)
+    record_start_time: int = betterproto.uint32_field(4)
+    history: List[int] = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountMonthTicketSnapshot(Message):
+    tickets: List["AccountMiscSnapshotMonthTicketInfo"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountVip(Message):
+    vip: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountRechargeInfo(Message):
+    records: List["AccountMiscSnapshotAccountRechargeInfoRechargeRecord"] = (
+        betterproto.message_field(1)
+    )
+    has_data: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountRechargeInfoRechargeRecord(Message):
+    level: int = betterproto.uint32_field(1)
+    recharge_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AccountMiscSnapshotAccountMonthTicketSnapshotV2(Message):
+    end_time: int = betterproto.uint32_field(1)
+    last_pay_time: int = betterproto.uint32_field(2)
+    record_start_time: int = betterproto.uint32_field(3)
+    history: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AccountGiftCodeRecord(Message):
+    used_gift_code: List[str] = betterproto.string_field(1)
@@ -0,0 +1,269 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ActionMjStart(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class ActionNewCard(Message):
+    field_spell: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ActionNewRound(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    tiles: List[str] = betterproto.string_field(4)
+    dora: str = betterproto.string_field(5)
+    scores: List[int] = betterproto.int32_field(6)
+    operation: "OptionalOperationList" = betterproto.message_field(7)
+    liqibang: int = betterproto.uint32_field(8)
+    tingpais0: List["TingPaiDiscardInfo"] = betterproto.message_field(9)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(10)
+    al: bool = betterproto.bool_field(11)
+    md5: str = betterproto.string_field(12)
+    left_tile_count: int = betterproto.uint32_field(13)
+    doras: List[str] = betterproto.string_field(14)
+    opens: List["NewRoundOpenedTiles"] = betterproto.message_field(15)
+    muyu: "MuyuInfo" = betterproto.message_field(16)
+    ju_count: int = betterproto.uint32_field(17)
+    field_spell: int = betterproto.uint32_field(18)
+    sha256: str = betterproto.string_field(19)
+    yongchang: "YongchangInfo" = betterproto.message_field(20)
+    salt_sha256: str = betterproto.string_field(21)
+    xia_ke_shang: "XiaKeShangInfo" = betterproto.message_field(26)
+
+
+@dataclass(eq=False, repr=False)
+class ActionPrototype(Message):
+    step: int = betterproto.uint32_field(1)
+    name: str = betterproto.string_field(2)
+    data: bytes = betterproto.bytes_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActionSelectGap(Message):
+    gap_types: List[int] = betterproto.uint32_field(1)
+    tingpais0: List["TingPaiDiscardInfo"] = betterproto.message_field(2)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActionChangeTile(Message):
+    in_tiles: List[str] = betterproto.string_field(1)
+    in_tile_states: List[int] = betterproto.int32_field(2)
+    out_tiles: List[str] = betterproto.string_field(3)
+    out_tile_states: List[int] = betterproto.int32_field(4)
+    doras: List[str] = betterproto.string_field(5)
+    tingpais0: List["TingPaiDiscardInfo"] = betterproto.message_field(6)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(7)
+    operation: "OptionalOperationList" = betterproto.message_field(8)
+    change_type: int = betterproto.uint32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActionRevealTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    is_liqi: bool = betterproto.bool_field(2)
+    is_wliqi: bool = betterproto.bool_field(3)
+    moqie: bool = betterproto.bool_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    liqibang: int = betterproto.uint32_field(6)
+    operation: "OptionalOperationList" = betterproto.message_field(7)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(8)
+    tile: str = betterproto.string_field(9)
+    zhenting: bool = betterproto.bool_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class ActionUnveilTile(Message):
+    seat: int = betterproto.int32_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActionLockTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    tile: str = betterproto.string_field(4)
+    operation: "OptionalOperationList" = betterproto.message_field(5)
+    zhenting: bool = betterproto.bool_field(6)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    lock_state: int = betterproto.int32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActionDiscardTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    is_liqi: bool = betterproto.bool_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    moqie: bool = betterproto.bool_field(5)
+    zhenting: bool = betterproto.bool_field(6)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    is_wliqi: bool = betterproto.bool_field(9)
+    tile_state: int = betterproto.uint32_field(10)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+    revealed: bool = betterproto.bool_field(12)
+    scores: List[int] = betterproto.int32_field(13)
+    liqibang: int = betterproto.uint32_field(14)
+    yongchang: "YongchangInfo" = betterproto.message_field(25)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(26)
+    liqi_type_beishuizhizhan: int = betterproto.uint32_field(27)
+
+
+@dataclass(eq=False, repr=False)
+class ActionDealTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    left_tile_count: int = betterproto.uint32_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    doras: List[str] = betterproto.string_field(6)
+    zhenting: bool = betterproto.bool_field(7)
+    tingpais: List["TingPaiDiscardInfo"] = betterproto.message_field(8)
+    tile_state: int = betterproto.uint32_field(9)
+    muyu: "MuyuInfo" = betterproto.message_field(10)
+    tile_index: int = betterproto.uint32_field(11)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class ActionFillAwaitingTiles(Message):
+    awaiting_tiles: List[str] = betterproto.string_field(1)
+    left_tile_count: int = betterproto.uint32_field(2)
+    operation: "OptionalOperationList" = betterproto.message_field(3)
+    liqi: "LiQiSuccess" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActionChiPengGang(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tiles: List[str] = betterproto.string_field(3)
+    froms: List[int] = betterproto.uint32_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    operation: "OptionalOperationList" = betterproto.message_field(6)
+    zhenting: bool = betterproto.bool_field(7)
+    tingpais: List["TingPaiDiscardInfo"] = betterproto.message_field(8)
+    tile_states: List[int] = betterproto.uint32_field(9)
+    muyu: "MuyuInfo" = betterproto.message_field(10)
+    scores: List[int] = betterproto.int32_field(11)
+    liqibang: int = betterproto.uint32_field(12)
+    yongchang: "YongchangInfo" = betterproto.message_field(13)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class ActionGangResult(Message):
+    gang_infos: "ChuanmaGang" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ActionGangResultEnd(Message):
+    gang_infos: "ChuanmaGang" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ActionAnGangAddGang(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tiles: str = betterproto.string_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    doras: List[str] = betterproto.string_field(6)
+    zhenting: bool = betterproto.bool_field(7)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(8)
+    muyu: "MuyuInfo" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActionBaBei(Message):
+    seat: int = betterproto.uint32_field(1)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    doras: List[str] = betterproto.string_field(6)
+    zhenting: bool = betterproto.bool_field(7)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(8)
+    moqie: bool = betterproto.bool_field(9)
+    tile_state: int = betterproto.uint32_field(10)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ActionHule(Message):
+    hules: List["HuleInfo"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    wait_timeout: int = betterproto.uint32_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    gameend: "GameEnd" = betterproto.message_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    baopai: int = betterproto.int32_field(9)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class ActionHuleXueZhanMid(Message):
+    hules: List["HuInfoXueZhanMid"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    scores: List[int] = betterproto.int32_field(5)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    liqi: "LiQiSuccess" = betterproto.message_field(9)
+    zhenting: bool = betterproto.bool_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class ActionHuleXueZhanEnd(Message):
+    hules: List["HuInfoXueZhanMid"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    scores: List[int] = betterproto.int32_field(4)
+    wait_timeout: int = betterproto.uint32_field(5)
+    gameend: "GameEnd" = betterproto.message_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActionLiuJu(Message):
+    type: int = betterproto.uint32_field(1)
+    gameend: "GameEnd" = betterproto.message_field(2)
+    seat: int = betterproto.uint32_field(3)
+    tiles: List[str] = betterproto.string_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    allplayertiles: List[str] = betterproto.string_field(6)
+    muyu: "MuyuInfo" = betterproto.message_field(7)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActionNoTile(Message):
+    liujumanguan: bool = betterproto.bool_field(1)
+    players: List["NoTilePlayerInfo"] = betterproto.message_field(2)
+    scores: List["NoTileScoreInfo"] = betterproto.message_field(3)
+    gameend: bool = betterproto.bool_field(4)
+    muyu: "MuyuInfo" = betterproto.message_field(5)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
@@ -0,0 +1,411 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ActivityArenaData(Message):
+    win_count: int = betterproto.uint32_field(1)
+    lose_count: int = betterproto.uint32_field(2)
+    activity_id: int = betterproto.uint32_field(3)
+    enter_time: int = betterproto.uint32_field(4)
+    daily_enter_count: int = betterproto.uint32_field(5)
+    daily_enter_time: int = betterproto.uint32_field(6)
+    max_win_count: int = betterproto.uint32_field(7)
+    total_win_count: int = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningWorkbench(Message):
+    craft_id: int = betterproto.uint32_field(1)
+    pos: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningMenuData(Message):
+    menu_group: int = betterproto.uint32_field(1)
+    generated: List["ActivityCombiningMenuDataMenuRequire"] = betterproto.message_field(
+        2
+    )
+    multi_generated: List["ActivityCombiningMenuDataMenuRequire"] = (
+        betterproto.message_field(3)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningMenuDataMenuRequire(Message):
+    level: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningOrderData(Message):
+    id: int = betterproto.uint32_field(1)
+    pos: int = betterproto.uint32_field(2)
+    unlock_day: int = betterproto.uint32_field(4)
+    char_id: int = betterproto.uint32_field(5)
+    finished_craft_id: List[int] = betterproto.uint32_field(6)
+    craft_id: List[int] = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningLqData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    workbench: List["ActivityCombiningWorkbench"] = betterproto.message_field(2)
+    orders: List["ActivityCombiningOrderData"] = betterproto.message_field(3)
+    recycle_bin: "ActivityCombiningWorkbench" = betterproto.message_field(4)
+    unlocked_craft: List[int] = betterproto.uint32_field(5)
+    daily_bonus_count: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningPoolData(Message):
+    group: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    workbench: List["ActivityCombiningWorkbench"] = betterproto.message_field(2)
+    orders: List["ActivityCombiningOrderData"] = betterproto.message_field(3)
+    recycle_bin: "ActivityCombiningWorkbench" = betterproto.message_field(4)
+    menu: "ActivityCombiningMenuData" = betterproto.message_field(5)
+    current_order_id: int = betterproto.uint32_field(6)
+    bonus: "ActivityCombiningDataBonusData" = betterproto.message_field(7)
+    unlocked_craft: List[int] = betterproto.uint32_field(8)
+    craft_pool: List["ActivityCombiningPoolData"] = betterproto.message_field(9)
+    order_pool: List["ActivityCombiningPoolData"] = betterproto.message_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityCombiningDataBonusData(Message):
+    count: int = betterproto.uint32_field(1)
+    update_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityVillageData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    buildings: List["VillageBuildingData"] = betterproto.message_field(2)
+    trip: List["VillageTripData"] = betterproto.message_field(3)
+    tasks: List["VillageTaskData"] = betterproto.message_field(6)
+    round: int = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFestivalData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    proposal_list: List["FestivalProposalData"] = betterproto.message_field(3)
+    event_list: List[int] = betterproto.uint32_field(4)
+    buy_record: "SignedTimeCounterData" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityIslandData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    zone: int = betterproto.uint32_field(2)
+    bags: List["IslandBagData"] = betterproto.message_field(3)
+    zones: List["IslandZoneData"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFeedData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    feed_count: int = betterproto.uint32_field(2)
+    friend_receive_data: "ActivityFeedDataCountWithTimeData" = (
+        betterproto.message_field(3)
+    )
+    friend_send_data: "ActivityFeedDataCountWithTimeData" = betterproto.message_field(4)
+    gift_inbox: List["ActivityFeedDataGiftBoxData"] = betterproto.message_field(5)
+    max_inbox_id: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFeedDataCountWithTimeData(Message):
+    count: int = betterproto.uint32_field(1)
+    last_update_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFeedDataGiftBoxData(Message):
+    id: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+    from_account_id: int = betterproto.uint32_field(4)
+    time: int = betterproto.uint32_field(5)
+    received: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityStoryData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    unlocked_story: List["UnlockedStoryData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityProgressRewardData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    rewarded_progresses: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewEffectResult(Message):
+    result_change: "ActivityQuestCrewEffectResultQcQuestResultChange" = (
+        betterproto.message_field(1)
+    )
+    consumed_change: List["ActivityQuestCrewEffectResultQcQuestConsumeChange"] = (
+        betterproto.message_field(2)
+    )
+    reward: "ActivityQuestCrewEffectResultQcItemReward" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewEffectResultQcQuestResultChange(Message):
+    from_: int = betterproto.uint32_field(1)
+    to: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewEffectResultQcQuestConsumeChange(Message):
+    member_id: int = betterproto.uint32_field(1)
+    from_: int = betterproto.uint32_field(2)
+    to: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewEffectResultQcItemReward(Message):
+    execute_reward: List["ExecuteReward"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    members: List["QcMember"] = betterproto.message_field(2)
+    quest_board: List["QcQuest"] = betterproto.message_field(3)
+    market_board: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewChanges(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    members: "ActivityQuestCrewChangesQcMemberArrayDirty" = betterproto.message_field(2)
+    quest_board: "ActivityQuestCrewChangesQcQuestArrayDirty" = (
+        betterproto.message_field(3)
+    )
+    market_board: "UInt32ArrayDirty" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewChangesQcMemberArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["QcMember"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityQuestCrewChangesQcQuestArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["QcQuest"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityChooseUpData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    chest_id: int = betterproto.uint32_field(2)
+    selection: int = betterproto.uint32_field(3)
+    is_end: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityChooseGroupData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    chest_id: int = betterproto.uint32_field(2)
+    selection_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFriendGiftData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    max_inbox_id: int = betterproto.uint32_field(2)
+    receive_data: "ActivityFriendGiftDataCountWithTimeData" = betterproto.message_field(
+        3
+    )
+    send_data: "ActivityFriendGiftDataCountWithTimeData" = betterproto.message_field(4)
+    gift_inbox: List["ActivityFriendGiftDataGiftBoxData"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFriendGiftDataCountWithTimeData(Message):
+    count: int = betterproto.uint32_field(1)
+    last_update_time: int = betterproto.uint32_field(2)
+    send_friend_id: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityFriendGiftDataGiftBoxData(Message):
+    id: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+    from_account_id: int = betterproto.uint32_field(4)
+    time: int = betterproto.uint32_field(5)
+    received: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityUpgradeData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    groups: List["ActivityUpgradeDataLevelGroup"] = betterproto.message_field(2)
+    received_level: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityUpgradeDataLevelGroup(Message):
+    group_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityGachaData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    gained: List["GachaRecord"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityGachaUpdateData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    gained: List["GachaRecord"] = betterproto.message_field(2)
+    remain_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationGameRecordMessage(Message):
+    type: int = betterproto.uint32_field(1)
+    args: List[int] = betterproto.uint32_field(2)
+    xun: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationGameRecord(Message):
+    round: int = betterproto.uint32_field(1)
+    seats: List[int] = betterproto.uint32_field(2)
+    uuid: str = betterproto.string_field(3)
+    start_time: int = betterproto.uint32_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    messages: List["ActivitySimulationGameRecordMessage"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationDailyContest(Message):
+    day: int = betterproto.uint32_field(1)
+    characters: List[int] = betterproto.uint32_field(2)
+    records: List["ActivitySimulationGameRecord"] = betterproto.message_field(3)
+    round: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationTrainRecord(Message):
+    time: int = betterproto.uint32_field(1)
+    modify_stats: List[int] = betterproto.int32_field(2)
+    final_stats: List[int] = betterproto.uint32_field(3)
+    type: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySimulationData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    stats: List[int] = betterproto.uint32_field(2)
+    stamina_update_time: int = betterproto.uint32_field(3)
+    daily_contest: List["ActivitySimulationDailyContest"] = betterproto.message_field(4)
+    train_records: List["ActivitySimulationTrainRecord"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySpotData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    spots: List["ActivitySpotDataSpotData"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySpotDataSpotData(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    rewarded: int = betterproto.uint32_field(2)
+    unlocked_ending: List[int] = betterproto.uint32_field(3)
+    unlocked: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class Activity(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    type: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAccumulatedPointData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.int32_field(2)
+    gained_reward_list: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityRankPointData(Message):
+    leaderboard_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.int32_field(2)
+    gained_reward: bool = betterproto.bool_field(3)
+    gainable_time: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityBuffData(Message):
+    buff_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(5)
+    count: int = betterproto.uint32_field(6)
+    update_time: int = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootValueChange(Message):
+    level: "ActivityShootValueChangeUint32ValueDirty" = betterproto.message_field(1)
+    enemies: "ActivityShootEnemyInfoDirty" = betterproto.message_field(2)
+    rewarded_ids: "ActivityShootValueChangeRewardArrayDirty" = (
+        betterproto.message_field(3)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootValueChangeUint32ValueDirty(Message):
+    value: int = betterproto.uint32_field(1)
+    dirty: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootValueChangeRewardArrayDirty(Message):
+    reward_ids: List[int] = betterproto.uint32_field(1)
+    dirty: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootEnemyInfoDirty(Message):
+    dirty: int = betterproto.uint32_field(1)
+    enemies: List["ActivityShootEnemyInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    enemies: List["ActivityShootEnemyInfo"] = betterproto.message_field(3)
+    rewarded_ids: List[int] = betterproto.uint32_field(4)
+    ended: bool = betterproto.bool_field(5)
+    rewarded_records: List["ActivityShootRewardRecord"] = betterproto.message_field(6)
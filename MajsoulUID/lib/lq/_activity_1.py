@@ -0,0 +1,225 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootEnemyInfo(Message):
+    group_id: int = betterproto.uint32_field(1)
+    enemy_id: int = betterproto.uint32_field(2)
+    hp: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityShootRewardRecord(Message):
+    enemy_id: int = betterproto.uint32_field(1)
+    reward_id: int = betterproto.uint32_field(2)
+    rewarded_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityBingoCardData(Message):
+    card_id: int = betterproto.uint32_field(1)
+    achieved_pos: List[int] = betterproto.uint32_field(2)
+    rewarded_ids: List[int] = betterproto.uint32_field(3)
+    state: int = betterproto.uint32_field(4)
+    achieved_records: List["ActivityBingoCardDataBingoAchievedRecord"] = (
+        betterproto.message_field(5)
+    )
+    reward_records: List["ActivityBingoCardDataBingoRewardRecord"] = (
+        betterproto.message_field(6)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ActivityBingoCardDataBingoAchievedRecord(Message):
+    pos: int = betterproto.uint32_field(1)
+    time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityBingoCardDataBingoRewardRecord(Message):
+    id: int = betterproto.uint32_field(1)
+    time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityBingoData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    cards: List["ActivityBingoCardData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityIdTimeRecord(Message):
+    id: int = betterproto.uint32_field(1)
+    time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    upgrade: List["ActivitySnowballUpgrade"] = betterproto.message_field(3)
+    rewarded_level: List[int] = betterproto.uint32_field(4)
+    finished_level: List[int] = betterproto.uint32_field(5)
+    random_seed: int = betterproto.uint32_field(6)
+    battle_id: str = betterproto.string_field(7)
+    level_finished_count: int = betterproto.uint32_field(8)
+    player_combo: int = betterproto.uint32_field(9)
+    reward_records: List["ActivityIdTimeRecord"] = betterproto.message_field(10)
+    finish_records: List["ActivityIdTimeRecord"] = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballUpgrade(Message):
+    id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballUpgradeDirty(Message):
+    value: List["ActivitySnowballUpgrade"] = betterproto.message_field(1)
+    dirty: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballValueChanges(Message):
+    level: "UInt32Dirty" = betterproto.message_field(1)
+    upgrade: "ActivitySnowballUpgradeDirty" = betterproto.message_field(2)
+    rewarded_level: "UInt32ArrayDirty" = betterproto.message_field(3)
+    finished_level: "UInt32ArrayDirty" = betterproto.message_field(4)
+    level_finished_count: "UInt32Dirty" = betterproto.message_field(5)
+    player_combo: "UInt32Dirty" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballPlayerAttackedInfo(Message):
+    target: int = betterproto.uint32_field(1)
+    track: int = betterproto.uint32_field(2)
+    damage: int = betterproto.uint32_field(3)
+    critia: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballPlayerAction(Message):
+    tick: int = betterproto.uint32_field(1)
+    track: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivitySnowballPlayerState(Message):
+    player: int = betterproto.uint32_field(1)
+    hp: int = betterproto.uint32_field(2)
+    mp: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityMarathonData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    highest_record: "MarathonGameRecord" = betterproto.message_field(2)
+    race_data: "ActivityMarathonDataMarathonRaceData" = betterproto.message_field(3)
+    history: List["ActivityMarathonDataMarathonRaceHistory"] = (
+        betterproto.message_field(4)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ActivityMarathonDataMarathonRaceData(Message):
+    id: str = betterproto.string_field(1)
+    random_seed: int = betterproto.uint32_field(2)
+    start_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityMarathonDataMarathonRaceHistory(Message):
+    race_data: "ActivityMarathonDataMarathonRaceData" = betterproto.message_field(1)
+    record: "MarathonGameRecord" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityMarathonCheckData(Message):
+    round: int = betterproto.uint32_field(1)
+    item: List[int] = betterproto.uint32_field(2)
+    tile: str = betterproto.string_field(3)
+    tick: int = betterproto.uint32_field(4)
+    point: int = betterproto.uint32_field(5)
+    time_end: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletHuRecord(Message):
+    point: str = betterproto.string_field(1)
+    pai: str = betterproto.string_field(2)
+    fan: str = betterproto.string_field(3)
+    base: str = betterproto.string_field(4)
+    effect_builds: List["ActivityAmuletEffectRecordData"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletUpgradeData(Message):
+    skill: List["AmuletSkillData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletIllustratedBookData(Message):
+    effect_collection: List[int] = betterproto.uint32_field(1)
+    badge_collection: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletEffectRecordData(Message):
+    id: int = betterproto.uint32_field(1)
+    badge_id: int = betterproto.uint32_field(2)
+    volume: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletGameRecordData(Message):
+    effect_builds: List["ActivityAmuletEffectRecordData"] = betterproto.message_field(1)
+    level: int = betterproto.uint32_field(2)
+    highest_level_score: str = betterproto.string_field(3)
+    highest_fan: str = betterproto.string_field(4)
+    highest_score: str = betterproto.string_field(5)
+    coin_consumed: str = betterproto.string_field(6)
+    pack_count: int = betterproto.uint32_field(7)
+    time: int = betterproto.uint32_field(8)
+    highest_hu: "ActivityAmuletHuRecord" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletStatisticData(Message):
+    highest_level: int = betterproto.uint32_field(1)
+    highest_hu: "ActivityAmuletHuRecord" = betterproto.message_field(2)
+    highest_level_score: str = betterproto.string_field(3)
+    highest_fan: str = betterproto.string_field(4)
+    highest_score: str = betterproto.string_field(5)
+    pass_game_count: int = betterproto.uint32_field(6)
+    round_count: int = betterproto.uint32_field(7)
+    open_pack_count: int = betterproto.uint32_field(8)
+    highest_coin_consumed: str = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    game: "AmuletGameData" = betterproto.message_field(2)
+    version: int = betterproto.uint32_field(3)
+    upgrade: "ActivityAmuletUpgradeData" = betterproto.message_field(4)
+    illustrated_book: "ActivityAmuletIllustratedBookData" = betterproto.message_field(5)
+    book_effect_id: int = betterproto.uint32_field(6)
+    game_records: List["ActivityAmuletGameRecordData"] = betterproto.message_field(7)
+    statistic: "ActivityAmuletStatisticData" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ActivityAmuletHuRecordDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: "ActivityAmuletHuRecord" = betterproto.message_field(2)
@@ -0,0 +1,510 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class AmuletBadgeData(Message):
+    id: int = betterproto.uint32_field(1)
+    uid: int = betterproto.uint32_field(2)
+    store: List[str] = betterproto.string_field(3)
+    random: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectData(Message):
+    id: int = betterproto.uint32_field(1)
+    uid: int = betterproto.uint32_field(2)
+    store: List[str] = betterproto.string_field(3)
+    badge: "AmuletBadgeData" = betterproto.message_field(4)
+    volume: int = betterproto.uint32_field(5)
+    tags: List[int] = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletTile(Message):
+    id: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletBuffData(Message):
+    id: int = betterproto.uint32_field(1)
+    store: List[str] = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameShopGoods(Message):
+    id: int = betterproto.uint32_field(1)
+    sold: bool = betterproto.bool_field(2)
+    goods_id: int = betterproto.uint32_field(3)
+    price: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletActivityTingInfo(Message):
+    tile: str = betterproto.string_field(1)
+    fan: str = betterproto.string_field(2)
+    ting_tile: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletShowDesktopTileData(Message):
+    id: int = betterproto.uint32_field(1)
+    pos: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletMingInfo(Message):
+    type: int = betterproto.uint32_field(1)
+    tile_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameOperation(Message):
+    type: int = betterproto.uint32_field(1)
+    gang: List["AmuletGameOperationGangTiles"] = betterproto.message_field(2)
+    value: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameOperationGangTiles(Message):
+    tiles: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletTileScore(Message):
+    tile: str = betterproto.string_field(1)
+    score: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectCounterData(Message):
+    effect_id: int = betterproto.uint32_field(1)
+    pack_candidate_count: int = betterproto.uint32_field(2)
+    gain_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameRecordData(Message):
+    yiman_count: int = betterproto.uint32_field(1)
+    level_hu_count: int = betterproto.uint32_field(2)
+    game_hu_count: int = betterproto.uint32_field(3)
+    effect_gain: int = betterproto.uint32_field(4)
+    coin_consume: str = betterproto.string_field(5)
+    coin_gain: str = betterproto.string_field(6)
+    highest_hu: "ActivityAmuletHuRecord" = betterproto.message_field(7)
+    highest_level_score: str = betterproto.string_field(8)
+    highest_fan: str = betterproto.string_field(9)
+    pack_count: int = betterproto.uint32_field(10)
+    round_count: int = betterproto.uint32_field(11)
+    effect_counter: List["AmuletEffectCounterData"] = betterproto.message_field(12)
+    hu_tiles_id: List[int] = betterproto.uint32_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletSkillData(Message):
+    id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameRoundData(Message):
+    pool: List["AmuletTile"] = betterproto.message_field(1)
+    tile_replace: List["AmuletTile"] = betterproto.message_field(2)
+    tian_dora: List[str] = betterproto.string_field(3)
+    dora: List[int] = betterproto.uint32_field(5)
+    hands: List[int] = betterproto.uint32_field(6)
+    used_desktop: List[int] = betterproto.uint32_field(8)
+    ming: List["AmuletMingInfo"] = betterproto.message_field(9)
+    locked_tile: List[int] = betterproto.uint32_field(12)
+    change_tile_count: int = betterproto.uint32_field(13)
+    total_change_tile_count: int = betterproto.uint32_field(14)
+    next_operation: List["AmuletGameOperation"] = betterproto.message_field(15)
+    ting_list: List["AmuletActivityTingInfo"] = betterproto.message_field(16)
+    point: str = betterproto.string_field(18)
+    target_point: str = betterproto.string_field(19)
+    locked_tile_count: int = betterproto.uint32_field(22)
+    mountain: List[int] = betterproto.uint32_field(4)
+    used: List[int] = betterproto.uint32_field(7)
+    desktop: List[int] = betterproto.uint32_field(10)
+    show_desktop: List[int] = betterproto.uint32_field(11)
+    after_gang: int = betterproto.uint32_field(17)
+    desktop_remain: int = betterproto.uint32_field(20)
+    show_desktop_tiles: List["AmuletShowDesktopTileData"] = betterproto.message_field(
+        21
+    )
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectCandidate(Message):
+    id: int = betterproto.uint32_field(1)
+    badge_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameEffectData(Message):
+    effect_list: List["AmuletEffectData"] = betterproto.message_field(1)
+    buff_list: List["AmuletBuffData"] = betterproto.message_field(2)
+    skill_buff_list: List["AmuletBuffData"] = betterproto.message_field(3)
+    shop_buff_list: List["AmuletBuffData"] = betterproto.message_field(4)
+    free_reward_candidates: List["AmuletEffectCandidate"] = betterproto.message_field(5)
+    level_reward_candidates: List["AmuletEffectCandidate"] = betterproto.message_field(
+        6
+    )
+    level_reward_packs: List[int] = betterproto.uint32_field(7)
+    current_level_reward_pack: int = betterproto.uint32_field(8)
+    max_effect_volume: int = betterproto.uint32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletShopData(Message):
+    goods: List["AmuletGameShopGoods"] = betterproto.message_field(1)
+    candidate_effect_list: List["AmuletEffectCandidate"] = betterproto.message_field(2)
+    shop_refresh_count: int = betterproto.uint32_field(3)
+    refresh_price: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameData(Message):
+    round: "AmuletGameRoundData" = betterproto.message_field(1)
+    effect: "AmuletGameEffectData" = betterproto.message_field(2)
+    game: "AmuletGameInfoData" = betterproto.message_field(3)
+    stage: int = betterproto.uint32_field(4)
+    shop: "AmuletShopData" = betterproto.message_field(5)
+    record: "AmuletGameRecordData" = betterproto.message_field(6)
+    ended: bool = betterproto.bool_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameInfoData(Message):
+    level: int = betterproto.uint32_field(1)
+    coin: str = betterproto.string_field(2)
+    max_effect_volume: int = betterproto.uint32_field(3)
+    next_boss_buff: List[int] = betterproto.uint32_field(4)
+    boss_buff: List[int] = betterproto.uint32_field(5)
+    tile_score_map: List["AmuletTileScore"] = betterproto.message_field(6)
+    book_effect_id: int = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletFan(Message):
+    id: int = betterproto.uint32_field(1)
+    val: str = betterproto.string_field(2)
+    count: int = betterproto.uint32_field(3)
+    yiman: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResult(Message):
+    add_effect: List["AmuletHookResultAddEffectResult"] = betterproto.message_field(1)
+    remove_effect: List[int] = betterproto.uint32_field(2)
+    add_buff: List[int] = betterproto.uint32_field(3)
+    remove_buff: List[int] = betterproto.uint32_field(4)
+    add_tian_dora: List[str] = betterproto.string_field(5)
+    add_dora: "AmuletHookResultAddDoraResult" = betterproto.message_field(6)
+    coin_modify: "AmuletHookResultValueResult" = betterproto.message_field(8)
+    tile_replace: List["AmuletTile"] = betterproto.message_field(10)
+    add_show_tile: List[int] = betterproto.uint32_field(11)
+    modify_tile_score: List["AmuletTileScore"] = betterproto.message_field(12)
+    modify_desktop_count: int = betterproto.int32_field(14)
+    modify_show_desktop_count: int = betterproto.int32_field(15)
+    modify_lock_tile_count: int = betterproto.int32_field(16)
+    modify_change_hands_count: int = betterproto.int32_field(17)
+    modify_change_hands_tile_count: int = betterproto.int32_field(18)
+    force_moqie: bool = betterproto.bool_field(19)
+    replace_hu: bool = betterproto.bool_field(20)
+    modify_target_point: str = betterproto.string_field(21)
+    upgrade_level: bool = betterproto.bool_field(22)
+    modify_dora: List["AmuletHookResultModifyDoraResult"] = betterproto.message_field(
+        23
+    )
+    modify_dora_max_count: int = betterproto.int32_field(25)
+    modify_shop_goods_count: int = betterproto.int32_field(26)
+    modify_shop_rare_weight: bool = betterproto.bool_field(27)
+    modify_shop_goods_price: bool = betterproto.bool_field(28)
+    modify_shop_pack_effect: List[int] = betterproto.uint32_field(29)
+    modify_effect_max_count: int = betterproto.int32_field(30)
+    modify_goods: List["AmuletGameShopGoods"] = betterproto.message_field(31)
+    remove_goods: List[int] = betterproto.uint32_field(32)
+    modify_base: "AmuletHookResultValueResult" = betterproto.message_field(33)
+    modify_fan: "AmuletHookResultValueResult" = betterproto.message_field(34)
+    modify_fan_info: List["AmuletFan"] = betterproto.message_field(37)
+    transform_effect: List["AmuletHookResultTransformResult"] = (
+        betterproto.message_field(39)
+    )
+    add_badge: List["AmuletHookResultAddBadge"] = betterproto.message_field(40)
+    remove_badge: List[int] = betterproto.uint32_field(41)
+    modify_effect_price: str = betterproto.string_field(42)
+    copy_effect: List["AmuletHookResultCopyEffect"] = betterproto.message_field(43)
+    effect_growth: bool = betterproto.bool_field(44)
+    modify_tile_score_aura: str = betterproto.string_field(45)
+    modify_hule_count: int = betterproto.uint32_field(46)
+    can_gang: bool = betterproto.bool_field(47)
+    modify_change_hands_list: List[int] = betterproto.uint32_field(48)
+    modify_change_desktop: "AmuletHookResultAmuletChangeDesktopResult" = (
+        betterproto.message_field(49)
+    )
+    self_effect_id: int = betterproto.uint32_field(50)
+    modify_change_coin: str = betterproto.string_field(51)
+    set_tile_score: List["AmuletTileScore"] = betterproto.message_field(52)
+    upgrade_effect: List["AmuletHookResultUpgradeEffectResult"] = (
+        betterproto.message_field(53)
+    )
+    modify_tile_base_score: List["AmuletTileScore"] = betterproto.message_field(54)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultAddEffectResult(Message):
+    uid: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+    merge_type: int = betterproto.uint32_field(3)
+    merged_list: List[int] = betterproto.uint32_field(4)
+    merged_result: int = betterproto.uint32_field(5)
+    badge: "AmuletBadgeData" = betterproto.message_field(6)
+    store: List[str] = betterproto.string_field(7)
+    volume: int = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultAddDoraResult(Message):
+    count: int = betterproto.uint32_field(1)
+    list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultValueResult(Message):
+    origin: str = betterproto.string_field(1)
+    modify: str = betterproto.string_field(2)
+    final: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultModifyDoraResult(Message):
+    tile: str = betterproto.string_field(1)
+    is_dora: bool = betterproto.bool_field(2)
+    is_red_dora: bool = betterproto.bool_field(3)
+    is_tian_dora: bool = betterproto.bool_field(4)
+    dora_count: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultTransformResult(Message):
+    uid: int = betterproto.uint32_field(1)
+    effect_id: int = betterproto.uint32_field(2)
+    add_result: "AmuletHookResultAddEffectResult" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultAddBadge(Message):
+    uid: int = betterproto.uint32_field(1)
+    badge_id: int = betterproto.uint32_field(2)
+    badge_uid: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultCopyEffect(Message):
+    uid: int = betterproto.uint32_field(1)
+    from_uid: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultAmuletChangeDesktopResult(Message):
+    show_desktop_tiles: List["AmuletShowDesktopTileData"] = betterproto.message_field(1)
+    locked_tile_count: int = betterproto.uint32_field(3)
+    desktop_remain: int = betterproto.uint32_field(4)
+    locked_tile: List[int] = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletHookResultUpgradeEffectResult(Message):
+    uid: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+    badge: "AmuletBadgeData" = betterproto.message_field(3)
+    store: List[str] = betterproto.string_field(4)
+    volume: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectedHookData(Message):
+    uid: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+    result: "AmuletHookResult" = betterproto.message_field(3)
+    type: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectCandidatesArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletEffectCandidate"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletTileArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletTile"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletMingInfoArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletMingInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameOperationArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletGameOperation"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletTingInfoArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletActivityTingInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletShowDesktopTileDataArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletShowDesktopTileData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletRoundDataChanges(Message):
+    pool: "AmuletTileArrayDirty" = betterproto.message_field(1)
+    tile_replace: "AmuletTileArrayDirty" = betterproto.message_field(2)
+    tian_dora: "StringArrayDirty" = betterproto.message_field(3)
+    dora: "UInt32ArrayDirty" = betterproto.message_field(5)
+    hands: "UInt32ArrayDirty" = betterproto.message_field(6)
+    used_desktop: "UInt32ArrayDirty" = betterproto.message_field(7)
+    used: "UInt32ArrayDirty" = betterproto.message_field(8)
+    ming: "AmuletMingInfoArrayDirty" = betterproto.message_field(9)
+    locked_tile: "UInt32ArrayDirty" = betterproto.message_field(12)
+    change_tile_count: "UInt32Dirty" = betterproto.message_field(13)
+    total_change_tile_count: "UInt32Dirty" = betterproto.message_field(14)
+    next_operation: "AmuletGameOperationArrayDirty" = betterproto.message_field(15)
+    ting_list: "AmuletTingInfoArrayDirty" = betterproto.message_field(16)
+    point: "StringDirty" = betterproto.message_field(18)
+    target_point: "StringDirty" = betterproto.message_field(19)
+    desktop_remain: "UInt32Dirty" = betterproto.message_field(20)
+    show_desktop_tiles: "AmuletShowDesktopTileDataArrayDirty" = (
+        betterproto.message_field(21)
+    )
+    locked_tile_count: "UInt32Dirty" = betterproto.message_field(22)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectDataArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletEffectData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletBuffDataArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletBuffData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectDataChanges(Message):
+    effect_list: "AmuletEffectDataArrayDirty" = betterproto.message_field(1)
+    buff_list: "AmuletBuffDataArrayDirty" = betterproto.message_field(2)
+    skill_buff_list: "AmuletBuffDataArrayDirty" = betterproto.message_field(3)
+    shop_buff_list: "AmuletBuffDataArrayDirty" = betterproto.message_field(4)
+    free_reward_candidates: "AmuletEffectCandidatesArrayDirty" = (
+        betterproto.message_field(5)
+    )
+    level_reward_candidates: "AmuletEffectCandidatesArrayDirty" = (
+        betterproto.message_field(6)
+    )
+    current_level_reward_pack: "UInt32Dirty" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletTileScoreArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletTileScore"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletGameInfoDataChanges(Message):
+    level: "UInt32Dirty" = betterproto.message_field(1)
+    coin: "StringDirty" = betterproto.message_field(2)
+    max_effect_volume: "UInt32Dirty" = betterproto.message_field(3)
+    next_boss_buff: "UInt32ArrayDirty" = betterproto.message_field(4)
+    boss_buff: "UInt32ArrayDirty" = betterproto.message_field(5)
+    tile_score_map: "AmuletTileScoreArrayDirty" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletShopGoodsArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletGameShopGoods"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletShopDataChanges(Message):
+    goods: "AmuletShopGoodsArrayDirty" = betterproto.message_field(1)
+    candidate_effect_list: "AmuletEffectCandidatesArrayDirty" = (
+        betterproto.message_field(2)
+    )
+    shop_refresh_count: "UInt32Dirty" = betterproto.message_field(3)
+    refresh_price: "UInt32Dirty" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEffectCounterDataArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List["AmuletEffectCounterData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletRecordDataChanges(Message):
+    yiman_count: "UInt32Dirty" = betterproto.message_field(1)
+    level_hu_count: "UInt32Dirty" = betterproto.message_field(2)
+    game_hu_count: "UInt32Dirty" = betterproto.message_field(3)
+    effect_gain: "UInt32Dirty" = betterproto.message_field(4)
+    coin_consume: "StringDirty" = betterproto.message_field(5)
+    coin_gain: "StringDirty" = betterproto.message_field(6)
+    highest_hu: "ActivityAmuletHuRecordDirty" = betterproto.message_field(7)
+    highest_level_score: "StringDirty" = betterproto.message_field(8)
+    highest_fan: "StringDirty" = betterproto.message_field(9)
+    pack_count: "UInt32Dirty" = betterproto.message_field(10)
+    round_count: "UInt32Dirty" = betterproto.message_field(11)
+    effect_counter: "AmuletEffectCounterDataArrayDirty" = betterproto.message_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletValueChanges(Message):
+    round: "AmuletRoundDataChanges" = betterproto.message_field(1)
+    effect: "AmuletEffectDataChanges" = betterproto.message_field(2)
+    game: "AmuletGameInfoDataChanges" = betterproto.message_field(3)
+    stage: int = betterproto.uint32_field(4)
+    shop: "AmuletShopDataChanges" = betterproto.message_field(5)
+    record: "AmuletRecordDataChanges" = betterproto.message_field(6)
+    ended: bool = betterproto.bool_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResult(Message):
+    deal_result: "AmuletEventResultDealResult" = betterproto.message_field(1)
+    hu_result: "AmuletEventResultHuResult" = betterproto.message_field(2)
+    game_end_result: "AmuletEventResultGameEndResult" = betterproto.message_field(3)
+    gang_result: "AmuletEventResultGangResult" = betterproto.message_field(4)
+    upgrade_result: "AmuletEventResultUpgradeResult" = betterproto.message_field(5)
+    new_game_result: "AmuletGameData" = betterproto.message_field(6)
+    sell_effect_result: "AmuletEventResultSellEffectResult" = betterproto.message_field(
+        7
+    )
+    select_pack_result: "AmuletEventResultSelectPackResult" = betterproto.message_field(
+        8
+    )
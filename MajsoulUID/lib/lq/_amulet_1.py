@@ -0,0 +1,77 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultDealResult(Message):
+    tile: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultHuResult(Message):
+    hu_final: "AmuletEventResultHuResultHuInfo" = betterproto.message_field(1)
+    hu_base: "AmuletEventResultHuResultHuInfo" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultHuResultHuInfo(Message):
+    tile: int = betterproto.uint32_field(1)
+    fan_list: List["AmuletFan"] = betterproto.message_field(2)
+    fan: str = betterproto.string_field(3)
+    base: str = betterproto.string_field(4)
+    point: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultGameEndResult(Message):
+    reason: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultGangResult(Message):
+    new_dora: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultUpgradeResult(Message):
+    level_coin: str = betterproto.string_field(1)
+    point_coin: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultSellEffectResult(Message):
+    price: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventResultSelectPackResult(Message):
+    uid: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+    merge_type: int = betterproto.uint32_field(3)
+    merged_list: List[int] = betterproto.uint32_field(4)
+    merged_result: int = betterproto.uint32_field(5)
+    badge: "AmuletBadgeData" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventHookData(Message):
+    remove_effect: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class AmuletEventData(Message):
+    type: int = betterproto.uint32_field(1)
+    effected_hooks: List["AmuletEffectedHookData"] = betterproto.message_field(2)
+    value_changes: "AmuletValueChanges" = betterproto.message_field(3)
+    result: "AmuletEventResult" = betterproto.message_field(4)
+    event_hooks: List["AmuletEventHookData"] = betterproto.message_field(5)
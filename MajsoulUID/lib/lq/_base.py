@@ -0,0 +1,26 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import sys
+from typing import Any, Dict, Type, get_type_hints
+
+import betterproto
+
+
+class _LazyNamespace(dict):
+    """类型注解中引用的其他子模块的消息, 通过 lq.__getattr__ 按需导入"""
+
+    def __missing__(self, key: str) -> Any:
+        try:
+            return getattr(sys.modules[__package__], key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+class Message(betterproto.Message):
+    @classmethod
+    def _type_hints(cls) -> Dict[str, Type]:
+        module = sys.modules[cls.__module__]
+        return get_type_hints(cls, module.__dict__, _LazyNamespace())
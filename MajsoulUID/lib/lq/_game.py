@@ -0,0 +1,428 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+class GamePlayerState(betterproto.Enum):
+    NULL = 0
+    AUTH = 1
+    SYNCING = 2
+    READY = 3
+
+
+@dataclass(eq=False, repr=False)
+class GameMetaData(Message):
+    room_id: int = betterproto.uint32_field(1)
+    mode_id: int = betterproto.uint32_field(2)
+    contest_uid: int = betterproto.uint32_field(3)
+    contest_info: "ContestGameMetaData" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class GameSetting(Message):
+    emoji_switch: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GameMode(Message):
+    mode: int = betterproto.uint32_field(1)
+    ai: bool = betterproto.bool_field(4)
+    extendinfo: str = betterproto.string_field(5)
+    detail_rule: "GameDetailRule" = betterproto.message_field(6)
+    testing_environment: "GameTestingEnvironmentSet" = betterproto.message_field(7)
+    game_setting: "GameSetting" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class GameTestingEnvironmentSet(Message):
+    paixing: int = betterproto.uint32_field(1)
+    left_count: int = betterproto.uint32_field(2)
+    field_spell_var: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameDetailRule(Message):
+    time_fixed: int = betterproto.uint32_field(1)
+    time_add: int = betterproto.uint32_field(2)
+    dora_count: int = betterproto.uint32_field(3)
+    shiduan: int = betterproto.uint32_field(4)
+    init_point: int = betterproto.uint32_field(5)
+    fandian: int = betterproto.uint32_field(6)
+    can_jifei: bool = betterproto.bool_field(7)
+    tianbian_value: int = betterproto.uint32_field(8)
+    liqibang_value: int = betterproto.uint32_field(9)
+    changbang_value: int = betterproto.uint32_field(10)
+    noting_fafu_1: int = betterproto.uint32_field(11)
+    noting_fafu_2: int = betterproto.uint32_field(12)
+    noting_fafu_3: int = betterproto.uint32_field(13)
+    have_liujumanguan: bool = betterproto.bool_field(14)
+    have_qieshangmanguan: bool = betterproto.bool_field(15)
+    have_biao_dora: bool = betterproto.bool_field(16)
+    have_gang_biao_dora: bool = betterproto.bool_field(17)
+    ming_dora_immediately_open: bool = betterproto.bool_field(18)
+    have_li_dora: bool = betterproto.bool_field(19)
+    have_gang_li_dora: bool = betterproto.bool_field(20)
+    have_sifenglianda: bool = betterproto.bool_field(21)
+    have_sigangsanle: bool = betterproto.bool_field(22)
+    have_sijializhi: bool = betterproto.bool_field(23)
+    have_jiuzhongjiupai: bool = betterproto.bool_field(24)
+    have_sanjiahele: bool = betterproto.bool_field(25)
+    have_toutiao: bool = betterproto.bool_field(26)
+    have_helelianzhuang: bool = betterproto.bool_field(27)
+    have_helezhongju: bool = betterproto.bool_field(28)
+    have_tingpailianzhuang: bool = betterproto.bool_field(29)
+    have_tingpaizhongju: bool = betterproto.bool_field(30)
+    have_yifa: bool = betterproto.bool_field(31)
+    have_nanruxiru: bool = betterproto.bool_field(32)
+    jingsuanyuandian: int = betterproto.uint32_field(33)
+    shunweima_2: int = betterproto.int32_field(34)
+    shunweima_3: int = betterproto.int32_field(35)
+    shunweima_4: int = betterproto.int32_field(36)
+    bianjietishi: bool = betterproto.bool_field(37)
+    ai_level: int = betterproto.uint32_field(38)
+    have_zimosun: bool = betterproto.bool_field(39)
+    disable_multi_yukaman: bool = betterproto.bool_field(40)
+    fanfu: int = betterproto.uint32_field(41)
+    guyi_mode: int = betterproto.uint32_field(42)
+    dora3_mode: int = betterproto.uint32_field(43)
+    begin_open_mode: int = betterproto.uint32_field(44)
+    jiuchao_mode: int = betterproto.uint32_field(45)
+    muyu_mode: int = betterproto.uint32_field(46)
+    open_hand: int = betterproto.uint32_field(47)
+    xuezhandaodi: int = betterproto.uint32_field(48)
+    huansanzhang: int = betterproto.uint32_field(49)
+    chuanma: int = betterproto.uint32_field(50)
+    reveal_discard: int = betterproto.uint32_field(51)
+    field_spell_mode: int = betterproto.uint32_field(52)
+    zhanxing: int = betterproto.uint32_field(53)
+    tianming_mode: int = betterproto.uint32_field(54)
+    disable_leijiyiman: bool = betterproto.bool_field(60)
+    disable_double_yakuman: int = betterproto.uint32_field(62)
+    disable_composite_yakuman: int = betterproto.uint32_field(63)
+    enable_shiti: int = betterproto.uint32_field(64)
+    enable_nontsumo_liqi: int = betterproto.uint32_field(65)
+    disable_double_wind_four_fu: int = betterproto.uint32_field(66)
+    disable_angang_guoshi: int = betterproto.uint32_field(67)
+    enable_renhe: int = betterproto.uint32_field(68)
+    enable_baopai_extend_settings: int = betterproto.uint32_field(69)
+    yongchang_mode: int = betterproto.uint32_field(70)
+    hunzhiyiji_mode: int = betterproto.uint32_field(71)
+    wanxiangxiuluo_mode: int = betterproto.uint32_field(72)
+    beishuizhizhan_mode: int = betterproto.uint32_field(73)
+    amusement_switches: List[int] = betterproto.uint32_field(74)
+
+
+@dataclass(eq=False, repr=False)
+class GameEndResult(Message):
+    players: List["GameEndResultPlayerItem"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GameEndResultPlayerItem(Message):
+    seat: int = betterproto.uint32_field(1)
+    total_point: int = betterproto.int32_field(2)
+    part_point_1: int = betterproto.int32_field(3)
+    part_point_2: int = betterproto.int32_field(4)
+    grading_score: int = betterproto.int32_field(5)
+    gold: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class GameConnectInfo(Message):
+    connect_token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    location: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class GameConfig(Message):
+    category: int = betterproto.uint32_field(1)
+    mode: "GameMode" = betterproto.message_field(2)
+    meta: "GameMetaData" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameLiveUnit(Message):
+    timestamp: int = betterproto.uint32_field(1)
+    action_category: int = betterproto.uint32_field(2)
+    action_data: bytes = betterproto.bytes_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameLiveSegment(Message):
+    actions: List["GameLiveUnit"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GameLiveSegmentUri(Message):
+    segment_id: int = betterproto.uint32_field(1)
+    segment_uri: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class GameLiveHead(Message):
+    uuid: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    game_config: "GameConfig" = betterproto.message_field(3)
+    players: List["PlayerGameView"] = betterproto.message_field(4)
+    seat_list: List[int] = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class GameNewRoundState(Message):
+    seat_states: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GameEndAction(Message):
+    state: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GameNoopAction(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundHuData(Message):
+    hupai: "GameRoundHuDataHuPai" = betterproto.message_field(1)
+    fans: List["GameRoundHuDataFan"] = betterproto.message_field(2)
+    score: int = betterproto.uint32_field(3)
+    xun: int = betterproto.uint32_field(4)
+    title_id: int = betterproto.uint32_field(5)
+    fan_sum: int = betterproto.uint32_field(6)
+    fu_sum: int = betterproto.uint32_field(7)
+    yakuman_count: int = betterproto.uint32_field(8)
+    biao_dora_count: int = betterproto.uint32_field(9)
+    red_dora_count: int = betterproto.uint32_field(10)
+    li_dora_count: int = betterproto.uint32_field(11)
+    babei_count: int = betterproto.uint32_field(12)
+    xuan_shang_count: int = betterproto.uint32_field(13)
+    pai_left_count: int = betterproto.uint32_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundHuDataHuPai(Message):
+    tile: str = betterproto.string_field(1)
+    seat: int = betterproto.uint32_field(2)
+    liqi: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundHuDataFan(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    fan: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundPlayerFangChongInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    pai_left_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundPlayerResult(Message):
+    type: int = betterproto.uint32_field(1)
+    hands: List[str] = betterproto.string_field(2)
+    ming: List[str] = betterproto.string_field(3)
+    liqi_type: int = betterproto.uint32_field(4)
+    is_fulu: bool = betterproto.bool_field(5)
+    is_liujumanguan: bool = betterproto.bool_field(6)
+    lian_zhuang: int = betterproto.uint32_field(7)
+    hu: "GameRoundHuData" = betterproto.message_field(8)
+    fangchongs: List["GameRoundPlayerFangChongInfo"] = betterproto.message_field(9)
+    liqi_fangchong: bool = betterproto.bool_field(10)
+    liqi_failed: bool = betterproto.bool_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundPlayer(Message):
+    score: int = betterproto.int32_field(1)
+    rank: int = betterproto.uint32_field(2)
+    result: "GameRoundPlayerResult" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameRoundSnapshot(Message):
+    ju: int = betterproto.uint32_field(1)
+    ben: int = betterproto.uint32_field(2)
+    players: List["GameRoundPlayer"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshot(Message):
+    uuid: str = betterproto.string_field(1)
+    state: int = betterproto.uint32_field(2)
+    category: int = betterproto.uint32_field(3)
+    mode: "GameMode" = betterproto.message_field(4)
+    meta: "GameMetaData" = betterproto.message_field(5)
+    calculate_param: "GameFinalSnapshotCalculateParam" = betterproto.message_field(6)
+    create_time: int = betterproto.uint32_field(7)
+    start_time: int = betterproto.uint32_field(8)
+    finish_time: int = betterproto.uint32_field(9)
+    seats: List["GameFinalSnapshotGameSeat"] = betterproto.message_field(10)
+    rounds: List["GameRoundSnapshot"] = betterproto.message_field(11)
+    account_views: List["PlayerGameView"] = betterproto.message_field(12)
+    final_players: List["GameFinalSnapshotFinalPlayer"] = betterproto.message_field(13)
+    afk_info: List["GameFinalSnapshotAfkInfo"] = betterproto.message_field(14)
+    robot_views: List["PlayerGameView"] = betterproto.message_field(15)
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotCalculateParam(Message):
+    init_point: int = betterproto.uint32_field(1)
+    jingsuanyuandian: int = betterproto.uint32_field(2)
+    rank_points: List[int] = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotGameSeat(Message):
+    type: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    notify_endpoint: "NetworkEndpoint" = betterproto.message_field(3)
+    client_address: str = betterproto.string_field(4)
+    is_connected: bool = betterproto.bool_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotFinalPlayer(Message):
+    seat: int = betterproto.uint32_field(1)
+    total_point: int = betterproto.int32_field(2)
+    part_point_1: int = betterproto.int32_field(3)
+    part_point_2: int = betterproto.int32_field(4)
+    grading_score: int = betterproto.int32_field(5)
+    gold: int = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class GameFinalSnapshotAfkInfo(Message):
+    deal_tile_count: int = betterproto.uint32_field(1)
+    moqie_count: int = betterproto.uint32_field(2)
+    seat: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameRuleSetting(Message):
+    round_type: int = betterproto.uint32_field(1)
+    shiduan: bool = betterproto.bool_field(2)
+    dora_count: int = betterproto.uint32_field(3)
+    thinking_type: int = betterproto.uint32_field(4)
+    use_detail_rule: bool = betterproto.bool_field(5)
+    detail_rule_v2: "ContestDetailRuleV2" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class GameRestore(Message):
+    snapshot: "GameSnapshot" = betterproto.message_field(1)
+    actions: List["ActionPrototype"] = betterproto.message_field(2)
+    passed_waiting_time: int = betterproto.uint32_field(3)
+    game_state: int = betterproto.uint32_field(4)
+    start_time: int = betterproto.uint32_field(5)
+    last_pause_time_ms: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class GameSnapshot(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    index_player: int = betterproto.uint32_field(4)
+    left_tile_count: int = betterproto.uint32_field(5)
+    hands: List[str] = betterproto.string_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    liqibang: int = betterproto.uint32_field(8)
+    players: List["GameSnapshotPlayerSnapshot"] = betterproto.message_field(9)
+    zhenting: bool = betterproto.bool_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class GameSnapshotPlayerSnapshot(Message):
+    score: int = betterproto.int32_field(1)
+    liqiposition: int = betterproto.int32_field(2)
+    tilenum: int = betterproto.uint32_field(3)
+    qipais: List[str] = betterproto.string_field(4)
+    mings: List["GameSnapshotPlayerSnapshotFulu"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class GameSnapshotPlayerSnapshotFulu(Message):
+    type: int = betterproto.uint32_field(1)
+    tile: List[str] = betterproto.string_field(2)
+    from_: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GameDetailRecords(Message):
+    records: List[bytes] = betterproto.bytes_field(1)
+    version: int = betterproto.uint32_field(2)
+    actions: List["GameAction"] = betterproto.message_field(3)
+    bar: bytes = betterproto.bytes_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class GameSelfOperation(Message):
+    type: int = betterproto.uint32_field(1)
+    index: int = betterproto.uint32_field(2)
+    tile: str = betterproto.string_field(3)
+    cancel_operation: bool = betterproto.bool_field(4)
+    moqie: bool = betterproto.bool_field(5)
+    timeuse: int = betterproto.uint32_field(6)
+    tile_state: int = betterproto.int32_field(7)
+    change_tiles: List[str] = betterproto.string_field(8)
+    tile_states: List[int] = betterproto.int32_field(9)
+    gap_type: int = betterproto.uint32_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class GameChiPengGang(Message):
+    type: int = betterproto.uint32_field(1)
+    index: int = betterproto.uint32_field(2)
+    cancel_operation: bool = betterproto.bool_field(3)
+    timeuse: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class GameVoteGameEnd(Message):
+    yes: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class GameUserInput(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    emo: int = betterproto.uint32_field(3)
+    operation: "GameSelfOperation" = betterproto.message_field(10)
+    cpg: "GameChiPengGang" = betterproto.message_field(11)
+    vote: "GameVoteGameEnd" = betterproto.message_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class GameUserEvent(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class GameAction(Message):
+    passed: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    result: bytes = betterproto.bytes_field(3)
+    user_input: "GameUserInput" = betterproto.message_field(4)
+    user_event: "GameUserEvent" = betterproto.message_field(5)
+    game_event: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class GameEnd(Message):
+    scores: List[int] = betterproto.int32_field(1)
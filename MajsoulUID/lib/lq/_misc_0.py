@@ -0,0 +1,421 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class Error(Message):
+    code: int = betterproto.uint32_field(1)
+    u32_params: List[int] = betterproto.uint32_field(2)
+    str_params: List[str] = betterproto.string_field(3)
+    json_param: str = betterproto.string_field(4)
+    level: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class Wrapper(Message):
+    name: str = betterproto.string_field(1)
+    data: bytes = betterproto.bytes_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NetworkEndpoint(Message):
+    family: str = betterproto.string_field(1)
+    address: str = betterproto.string_field(2)
+    port: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class StringDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class StringArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List[str] = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UInt32ArrayDirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class UInt32Dirty(Message):
+    dirty: bool = betterproto.bool_field(1)
+    value: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class AntiAddiction(Message):
+    online_duration: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class HighestHuRecord(Message):
+    fanshu: int = betterproto.uint32_field(1)
+    doranum: int = betterproto.uint32_field(2)
+    title: str = betterproto.string_field(3)
+    hands: List[str] = betterproto.string_field(4)
+    ming: List[str] = betterproto.string_field(5)
+    hupai: str = betterproto.string_field(6)
+    title_id: int = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ViewSlot(Message):
+    slot: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+    item_id_list: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class FavoriteHu(Message):
+    category: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    hu: "HighestHuRecord" = betterproto.message_field(3)
+    mode: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ContestGameMetaData(Message):
+    type_list: List["ContestGameMetaDataContestTypeZoneData"] = (
+        betterproto.message_field(1)
+    )
+    rank_type: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ContestGameMetaDataContestTypeZoneData(Message):
+    zone: int = betterproto.uint32_field(1)
+    contest_type: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RandomCharacter(Message):
+    character_id: int = betterproto.uint32_field(1)
+    skin_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class PlayerBaseView(Message):
+    account_id: int = betterproto.uint32_field(1)
+    avatar_id: int = betterproto.uint32_field(2)
+    title: int = betterproto.uint32_field(3)
+    nickname: str = betterproto.string_field(4)
+    level: "AccountLevel" = betterproto.message_field(5)
+    level3: "AccountLevel" = betterproto.message_field(6)
+    avatar_frame: int = betterproto.uint32_field(7)
+    verified: int = betterproto.uint32_field(8)
+    is_banned: int = betterproto.uint32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class PlayerGameView(Message):
+    account_id: int = betterproto.uint32_field(1)
+    avatar_id: int = betterproto.uint32_field(2)
+    title: int = betterproto.uint32_field(3)
+    nickname: str = betterproto.string_field(4)
+    level: "AccountLevel" = betterproto.message_field(5)
+    character: "Character" = betterproto.message_field(6)
+    level3: "AccountLevel" = betterproto.message_field(7)
+    avatar_frame: int = betterproto.uint32_field(8)
+    verified: int = betterproto.uint32_field(9)
+    views: List["ViewSlot"] = betterproto.message_field(10)
+    team_id: int = betterproto.uint32_field(11)
+    team_name: str = betterproto.string_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class Room(Message):
+    room_id: int = betterproto.uint32_field(1)
+    owner_id: int = betterproto.uint32_field(2)
+    mode: "GameMode" = betterproto.message_field(3)
+    max_player_count: int = betterproto.uint32_field(4)
+    persons: List["PlayerGameView"] = betterproto.message_field(5)
+    ready_list: List[int] = betterproto.uint32_field(6)
+    is_playing: bool = betterproto.bool_field(7)
+    public_live: bool = betterproto.bool_field(8)
+    robot_count: int = betterproto.uint32_field(9)
+    tournament_id: int = betterproto.uint32_field(10)
+    seq: int = betterproto.uint32_field(11)
+    pre_rule: str = betterproto.string_field(12)
+    robots: List["PlayerGameView"] = betterproto.message_field(13)
+    positions: List[int] = betterproto.uint32_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class ItemGainRecord(Message):
+    item_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ItemGainRecords(Message):
+    record_time: int = betterproto.uint32_field(1)
+    limit_source_id: int = betterproto.uint32_field(2)
+    records: List["ItemGainRecord"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class FakeRandomRecords(Message):
+    item_id: int = betterproto.uint32_field(1)
+    special_item_id: int = betterproto.uint32_field(2)
+    gain_count: int = betterproto.uint32_field(3)
+    gain_history: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class Item(Message):
+    item_id: int = betterproto.uint32_field(1)
+    stack: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class Bag(Message):
+    items: List["Item"] = betterproto.message_field(1)
+    daily_gain_record: List["ItemGainRecords"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class BagUpdate(Message):
+    update_items: List["Item"] = betterproto.message_field(1)
+    update_daily_gain_record: List["ItemGainRecords"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RewardSlot(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class OpenResult(Message):
+    reward: "RewardSlot" = betterproto.message_field(1)
+    replace: "RewardSlot" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RewardPlusResult(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    exchange: "RewardPlusResultExchange" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class RewardPlusResultExchange(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    exchange: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ExecuteReward(Message):
+    reward: "RewardSlot" = betterproto.message_field(1)
+    replace: "RewardSlot" = betterproto.message_field(2)
+    replace_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ExecuteResult(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class I18NContext(Message):
+    lang: str = betterproto.string_field(1)
+    context: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class Mail(Message):
+    mail_id: int = betterproto.uint32_field(1)
+    state: int = betterproto.uint32_field(2)
+    take_attachment: bool = betterproto.bool_field(3)
+    title: str = betterproto.string_field(4)
+    content: str = betterproto.string_field(5)
+    attachments: List["RewardSlot"] = betterproto.message_field(6)
+    create_time: int = betterproto.uint32_field(7)
+    expire_time: int = betterproto.uint32_field(8)
+    reference_id: int = betterproto.uint32_field(9)
+    title_i18_n: List["I18NContext"] = betterproto.message_field(10)
+    content_i18_n: List["I18NContext"] = betterproto.message_field(11)
+    template_id: int = betterproto.uint32_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class AchievementProgress(Message):
+    id: int = betterproto.uint32_field(1)
+    counter: int = betterproto.uint32_field(2)
+    achieved: bool = betterproto.bool_field(3)
+    rewarded: bool = betterproto.bool_field(4)
+    achieved_time: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class BadgeAchieveProgress(Message):
+    id: int = betterproto.uint32_field(1)
+    counter: int = betterproto.uint32_field(2)
+    achieved_counter: int = betterproto.uint32_field(3)
+    achieved_time: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ClientDeviceInfo(Message):
+    platform: str = betterproto.string_field(1)
+    hardware: str = betterproto.string_field(2)
+    os: str = betterproto.string_field(3)
+    os_version: str = betterproto.string_field(4)
+    is_browser: bool = betterproto.bool_field(5)
+    software: str = betterproto.string_field(6)
+    sale_platform: str = betterproto.string_field(7)
+    hardware_vendor: str = betterproto.string_field(8)
+    model_number: str = betterproto.string_field(9)
+    screen_width: int = betterproto.uint32_field(10)
+    screen_height: int = betterproto.uint32_field(11)
+    user_agent: str = betterproto.string_field(12)
+    screen_type: int = betterproto.uint32_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class ClientVersionInfo(Message):
+    resource: str = betterproto.string_field(1)
+    package: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class Announcement(Message):
+    id: int = betterproto.uint32_field(1)
+    title: str = betterproto.string_field(2)
+    content: str = betterproto.string_field(3)
+    header_image: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class TaskProgress(Message):
+    id: int = betterproto.uint32_field(1)
+    counter: int = betterproto.uint32_field(2)
+    achieved: bool = betterproto.bool_field(3)
+    rewarded: bool = betterproto.bool_field(4)
+    failed: bool = betterproto.bool_field(5)
+    rewarded_time: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class RpgState(Message):
+    player_damaged: int = betterproto.uint32_field(1)
+    monster_damaged: int = betterproto.uint32_field(2)
+    monster_seq: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class RpgActivity(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    last_show_uuid: str = betterproto.string_field(5)
+    last_played_uuid: str = betterproto.string_field(6)
+    current_state: "RpgState" = betterproto.message_field(7)
+    last_show_state: "RpgState" = betterproto.message_field(8)
+    received_rewards: List[int] = betterproto.uint32_field(9)
+    last_show_id: int = betterproto.uint32_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class FeedActivityData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    feed_count: int = betterproto.uint32_field(2)
+    friend_receive_data: "FeedActivityDataCountWithTimeData" = (
+        betterproto.message_field(3)
+    )
+    friend_send_data: "FeedActivityDataCountWithTimeData" = betterproto.message_field(4)
+    gift_inbox: List["FeedActivityDataGiftBoxData"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class FeedActivityDataCountWithTimeData(Message):
+    count: int = betterproto.uint32_field(1)
+    last_update_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FeedActivityDataGiftBoxData(Message):
+    id: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+    from_account_id: int = betterproto.uint32_field(4)
+    time: int = betterproto.uint32_field(5)
+    received: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class SegmentTaskProgress(Message):
+    id: int = betterproto.uint32_field(1)
+    counter: int = betterproto.uint32_field(2)
+    achieved: bool = betterproto.bool_field(3)
+    rewarded: bool = betterproto.bool_field(4)
+    failed: bool = betterproto.bool_field(5)
+    reward_count: int = betterproto.uint32_field(6)
+    achieved_count: int = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class MineActivityData(Message):
+    dig_point: List["Point"] = betterproto.message_field(1)
+    map: List["MineReward"] = betterproto.message_field(2)
+    id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class VillageReward(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class VillageBuildingData(Message):
+    id: int = betterproto.uint32_field(1)
+    reward: List["VillageReward"] = betterproto.message_field(3)
+    workers: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class VillageTripData(Message):
+    start_round: int = betterproto.uint32_field(1)
+    dest_id: int = betterproto.uint32_field(2)
+    reward: List["VillageReward"] = betterproto.message_field(3)
+    level: int = betterproto.uint32_field(4)
+    info: "VillageTargetInfo" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class VillageTaskData(Message):
+    id: int = betterproto.uint32_field(1)
+    completed_count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class VillageTargetInfo(Message):
+    nickname: str = betterproto.string_field(1)
+    avatar: int = betterproto.uint32_field(2)
+    avatar_frame: int = betterproto.uint32_field(3)
+    title: int = betterproto.uint32_field(4)
+    verified: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class TimeCounterData(Message):
+    count: int = betterproto.uint32_field(1)
+    update_time: int = betterproto.uint32_field(2)
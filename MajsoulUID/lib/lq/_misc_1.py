@@ -0,0 +1,473 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class SignedTimeCounterData(Message):
+    count: int = betterproto.int32_field(1)
+    update_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class FestivalProposalData(Message):
+    id: int = betterproto.uint32_field(1)
+    proposal_id: int = betterproto.uint32_field(2)
+    pos: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class IslandBagItemData(Message):
+    id: int = betterproto.uint32_field(1)
+    pos: List[int] = betterproto.uint32_field(2)
+    rotate: int = betterproto.uint32_field(3)
+    goods_id: int = betterproto.uint32_field(4)
+    price: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class IslandBagData(Message):
+    id: int = betterproto.uint32_field(1)
+    matrix: str = betterproto.string_field(2)
+    items: List["IslandBagItemData"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class IslandGoodsData(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.int32_field(2)
+    update_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class IslandZoneData(Message):
+    id: int = betterproto.uint32_field(1)
+    currency_used: "SignedTimeCounterData" = betterproto.message_field(2)
+    goods_records: List["IslandGoodsData"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class UnlockedStoryData(Message):
+    story_id: int = betterproto.uint32_field(1)
+    finished_ending: List[int] = betterproto.uint32_field(2)
+    rewarded_ending: List[int] = betterproto.uint32_field(3)
+    finish_rewarded: int = betterproto.uint32_field(4)
+    all_finish_rewarded: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class QcMember(Message):
+    member_id: int = betterproto.uint32_field(1)
+    consumed_sta: "TimeCounterData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class QcQuest(Message):
+    quest_id: int = betterproto.uint32_field(1)
+    finished: int = betterproto.uint32_field(2)
+    finished_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class GachaRecord(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class Friend(Message):
+    base: "PlayerBaseView" = betterproto.message_field(1)
+    state: "AccountActiveState" = betterproto.message_field(2)
+    remark: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class Point(Message):
+    x: int = betterproto.uint32_field(1)
+    y: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MineReward(Message):
+    point: "Point" = betterproto.message_field(1)
+    reward_id: int = betterproto.uint32_field(2)
+    received: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class CommentItem(Message):
+    comment_id: int = betterproto.uint32_field(1)
+    timestamp: int = betterproto.uint32_field(2)
+    commenter: "PlayerBaseView" = betterproto.message_field(3)
+    content: str = betterproto.string_field(4)
+    is_banned: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class RollingNotice(Message):
+    content: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
+    repeat_interval: int = betterproto.uint32_field(5)
+    repeat_time: List[int] = betterproto.uint32_field(7)
+    repeat_type: int = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class MaintainNotice(Message):
+    maintain_time: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class BillingGoods(Message):
+    id: str = betterproto.string_field(1)
+    name: str = betterproto.string_field(2)
+    desc: str = betterproto.string_field(3)
+    icon: str = betterproto.string_field(4)
+    resource_id: int = betterproto.uint32_field(5)
+    resource_count: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class BillShortcut(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    deal_price: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class BillingProduct(Message):
+    goods: "BillingGoods" = betterproto.message_field(1)
+    currency_code: str = betterproto.string_field(2)
+    currency_price: int = betterproto.uint32_field(3)
+    sort_weight: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class Character(Message):
+    charid: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    exp: int = betterproto.uint32_field(3)
+    views: List["ViewSlot"] = betterproto.message_field(4)
+    skin: int = betterproto.uint32_field(5)
+    is_upgraded: bool = betterproto.bool_field(6)
+    extra_emoji: List[int] = betterproto.uint32_field(7)
+    rewarded_level: List[int] = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class BuyRecord(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ZhpShop(Message):
+    goods: List[int] = betterproto.uint32_field(1)
+    buy_records: List["BuyRecord"] = betterproto.message_field(2)
+    free_refresh: "ZhpShopRefreshCount" = betterproto.message_field(3)
+    cost_refresh: "ZhpShopRefreshCount" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ZhpShopRefreshCount(Message):
+    count: int = betterproto.uint32_field(1)
+    limit: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class MonthTicketInfo(Message):
+    id: int = betterproto.uint32_field(1)
+    end_time: int = betterproto.uint32_field(2)
+    last_pay_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ShopInfo(Message):
+    zhp: "ZhpShop" = betterproto.message_field(1)
+    buy_records: List["BuyRecord"] = betterproto.message_field(2)
+    last_refresh_time: int = betterproto.uint32_field(3)
+    selected_package_records: List["ShopInfoSelectedPackageBuyRecord"] = (
+        betterproto.message_field(4)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ShopInfoSelectedPackageBuyRecord(Message):
+    package_id: int = betterproto.uint32_field(1)
+    buy_records: List["BuyRecord"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ChangeNicknameRecord(Message):
+    from_: str = betterproto.string_field(1)
+    to: str = betterproto.string_field(2)
+    time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ServerSettings(Message):
+    payment_setting: "PaymentSetting" = betterproto.message_field(3)
+    payment_setting_v2: "PaymentSettingV2" = betterproto.message_field(4)
+    nickname_setting: "NicknameSetting" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class NicknameSetting(Message):
+    enable: int = betterproto.uint32_field(1)
+    nicknames: List[str] = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingV2(Message):
+    open_payment: int = betterproto.uint32_field(1)
+    payment_platforms: List["PaymentSettingV2PaymentSettingUnit"] = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingV2PaymentMaintain(Message):
+    start_time: int = betterproto.uint32_field(1)
+    end_time: int = betterproto.uint32_field(2)
+    goods_click_action: int = betterproto.uint32_field(3)
+    goods_click_text: str = betterproto.string_field(4)
+    enabled_channel: List[str] = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingV2PaymentSettingUnit(Message):
+    platform: str = betterproto.string_field(1)
+    is_show: bool = betterproto.bool_field(2)
+    goods_click_action: int = betterproto.uint32_field(3)
+    goods_click_text: str = betterproto.string_field(4)
+    maintain: "PaymentSettingV2PaymentMaintain" = betterproto.message_field(5)
+    enable_for_frozen_account: bool = betterproto.bool_field(6)
+    extra_data: str = betterproto.string_field(7)
+    enabled_channel: List[str] = betterproto.string_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSetting(Message):
+    open_payment: int = betterproto.uint32_field(1)
+    payment_info_show_type: int = betterproto.uint32_field(2)
+    payment_info: str = betterproto.string_field(3)
+    wechat: "PaymentSettingWechatData" = betterproto.message_field(4)
+    alipay: "PaymentSettingAlipayData" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingWechatData(Message):
+    disable_create: bool = betterproto.bool_field(1)
+    payment_source_platform: int = betterproto.uint32_field(2)
+    enable_credit: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class PaymentSettingAlipayData(Message):
+    disable_create: bool = betterproto.bool_field(1)
+    payment_source_platform: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ChestData(Message):
+    chest_id: int = betterproto.uint32_field(1)
+    total_open_count: int = betterproto.uint32_field(2)
+    consume_count: int = betterproto.uint32_field(3)
+    face_black_count: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ChestDataV2(Message):
+    chest_id: int = betterproto.uint32_field(1)
+    total_open_count: int = betterproto.uint32_field(2)
+    face_black_count: int = betterproto.uint32_field(3)
+    ticket_face_black_count: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class FaithData(Message):
+    faith_id: int = betterproto.uint32_field(1)
+    total_open_count: int = betterproto.uint32_field(2)
+    consume_count: int = betterproto.uint32_field(3)
+    modify_count: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestBase(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    contest_id: int = betterproto.uint32_field(2)
+    contest_name: str = betterproto.string_field(3)
+    state: int = betterproto.uint32_field(4)
+    creator_id: int = betterproto.uint32_field(5)
+    create_time: int = betterproto.uint32_field(6)
+    start_time: int = betterproto.uint32_field(7)
+    finish_time: int = betterproto.uint32_field(8)
+    open: bool = betterproto.bool_field(9)
+    contest_type: int = betterproto.uint32_field(10)
+    public_notice: str = betterproto.string_field(11)
+    check_state: int = betterproto.uint32_field(12)
+    checking_name: str = betterproto.string_field(13)
+    rank_type: int = betterproto.uint32_field(14)
+    show_team_rank: bool = betterproto.bool_field(15)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestExtend(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    public_notice: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestAbstract(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    contest_id: int = betterproto.uint32_field(2)
+    contest_name: str = betterproto.string_field(3)
+    state: int = betterproto.uint32_field(4)
+    creator_id: int = betterproto.uint32_field(5)
+    create_time: int = betterproto.uint32_field(6)
+    start_time: int = betterproto.uint32_field(7)
+    finish_time: int = betterproto.uint32_field(8)
+    open: bool = betterproto.bool_field(9)
+    public_notice: str = betterproto.string_field(10)
+    contest_type: int = betterproto.uint32_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestDetail(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    contest_id: int = betterproto.uint32_field(2)
+    contest_name: str = betterproto.string_field(3)
+    state: int = betterproto.uint32_field(4)
+    create_time: int = betterproto.uint32_field(6)
+    start_time: int = betterproto.uint32_field(7)
+    finish_time: int = betterproto.uint32_field(8)
+    open: bool = betterproto.bool_field(9)
+    rank_rule: int = betterproto.uint32_field(10)
+    game_mode: "GameMode" = betterproto.message_field(11)
+    private_notice: str = betterproto.string_field(12)
+    observer_switch: int = betterproto.uint32_field(13)
+    emoji_switch: int = betterproto.uint32_field(14)
+    contest_type: int = betterproto.uint32_field(15)
+    disable_broadcast: int = betterproto.uint32_field(16)
+    signup_start_time: int = betterproto.uint32_field(17)
+    signup_end_time: int = betterproto.uint32_field(18)
+    signup_type: int = betterproto.uint32_field(19)
+    auto_match: int = betterproto.uint32_field(20)
+    rank_type: int = betterproto.uint32_field(21)
+    show_team_rank: bool = betterproto.bool_field(22)
+    tied_rank: int = betterproto.uint32_field(23)
+    match_start_time: int = betterproto.uint32_field(24)
+    match_end_time: int = betterproto.uint32_field(25)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestGamePlan(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    uuid: str = betterproto.string_field(2)
+    ready_players: List[int] = betterproto.uint32_field(3)
+    account_ids: List[int] = betterproto.uint32_field(4)
+    game_start_time: int = betterproto.uint32_field(5)
+    expired_time: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestPlayerReport(Message):
+    rank_rule: int = betterproto.uint32_field(1)
+    rank: int = betterproto.uint32_field(2)
+    point: int = betterproto.int32_field(3)
+    game_ranks: List[int] = betterproto.uint32_field(4)
+    total_game_count: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestGameStart(Message):
+    players: List["CustomizedContestGameStartItem"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestGameStartItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestGameEnd(Message):
+    players: List["CustomizedContestGameEndItem"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class CustomizedContestGameEndItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+    total_point: int = betterproto.int32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ExchangeRecord(Message):
+    exchange_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ContestDetailRule(Message):
+    init_point: int = betterproto.uint32_field(5)
+    fandian: int = betterproto.uint32_field(6)
+    can_jifei: bool = betterproto.bool_field(7)
+    tianbian_value: int = betterproto.uint32_field(8)
+    liqibang_value: int = betterproto.uint32_field(9)
+    changbang_value: int = betterproto.uint32_field(10)
+    noting_fafu_1: int = betterproto.uint32_field(11)
+    noting_fafu_2: int = betterproto.uint32_field(12)
+    noting_fafu_3: int = betterproto.uint32_field(13)
+    have_liujumanguan: bool = betterproto.bool_field(14)
+    have_qieshangmanguan: bool = betterproto.bool_field(15)
+    have_biao_dora: bool = betterproto.bool_field(16)
+    have_gang_biao_dora: bool = betterproto.bool_field(17)
+    ming_dora_immediately_open: bool = betterproto.bool_field(18)
+    have_li_dora: bool = betterproto.bool_field(19)
+    have_gang_li_dora: bool = betterproto.bool_field(20)
+    have_sifenglianda: bool = betterproto.bool_field(21)
+    have_sigangsanle: bool = betterproto.bool_field(22)
+    have_sijializhi: bool = betterproto.bool_field(23)
+    have_jiuzhongjiupai: bool = betterproto.bool_field(24)
+    have_sanjiahele: bool = betterproto.bool_field(25)
+    have_toutiao: bool = betterproto.bool_field(26)
+    have_helelianzhuang: bool = betterproto.bool_field(27)
+    have_helezhongju: bool = betterproto.bool_field(28)
+    have_tingpailianzhuang: bool = betterproto.bool_field(29)
+    have_tingpaizhongju: bool = betterproto.bool_field(30)
+    have_yifa: bool = betterproto.bool_field(31)
+    have_nanruxiru: bool = betterproto.bool_field(32)
+    jingsuanyuandian: int = betterproto.uint32_field(33)
+    shunweima_2: int = betterproto.int32_field(34)
+    shunweima_3: int = betterproto.int32_field(35)
+    shunweima_4: int = betterproto.int32_field(36)
+    bianjietishi: bool = betterproto.bool_field(37)
+    ai_level: int = betterproto.uint32_field(38)
+    have_zimosun: bool = betterproto.bool_field(39)
+    disable_multi_yukaman: bool = betterproto.bool_field(40)
+    guyi_mode: int = betterproto.uint32_field(41)
+    disable_leijiyiman: bool = betterproto.bool_field(42)
+    dora3_mode: int = betterproto.uint32_field(43)
+    xuezhandaodi: int = betterproto.uint32_field(44)
+    huansanzhang: int = betterproto.uint32_field(45)
+    chuanma: int = betterproto.uint32_field(46)
+    disable_double_yakuman: int = betterproto.uint32_field(62)
+    disable_composite_yakuman: int = betterproto.uint32_field(63)
+    enable_shiti: int = betterproto.uint32_field(64)
+    enable_nontsumo_liqi: int = betterproto.uint32_field(65)
+    disable_double_wind_four_fu: int = betterproto.uint32_field(66)
+    disable_angang_guoshi: int = betterproto.uint32_field(67)
+    enable_renhe: int = betterproto.uint32_field(68)
+    enable_baopai_extend_settings: int = betterproto.uint32_field(69)
+    fanfu: int = betterproto.uint32_field(70)
@@ -0,0 +1,425 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ContestDetailRuleV2(Message):
+    game_rule: "ContestDetailRule" = betterproto.message_field(1)
+    extra_rule: "ContestDetailRuleV2ExtraRule" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ContestDetailRuleV2ExtraRule(Message):
+    required_level: int = betterproto.uint32_field(1)
+    max_game_count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class VoteData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    vote: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class AccSn(Message):
+    resource: "AccountResourceSnapshot" = betterproto.message_field(1)
+    character: "AccountCharacterSnapshot" = betterproto.message_field(2)
+    mail: "AccountMailRecord" = betterproto.message_field(3)
+    achievement: "AccountAchievementSnapshot" = betterproto.message_field(4)
+    misc: "AccountMiscSnapshot" = betterproto.message_field(5)
+    gift_code: "AccountGiftCodeRecord" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class AccSnDa(Message):
+    account_id: int = betterproto.uint32_field(1)
+    time: int = betterproto.uint32_field(2)
+    snapshot: bytes = betterproto.bytes_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class TransparentData(Message):
+    method: str = betterproto.string_field(1)
+    data: bytes = betterproto.bytes_field(2)
+    session: str = betterproto.string_field(3)
+    remote: "NetworkEndpoint" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireReward(Message):
+    resource_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireDetail(Message):
+    id: int = betterproto.uint32_field(1)
+    version_id: int = betterproto.uint32_field(2)
+    effective_time_start: int = betterproto.uint32_field(3)
+    effective_time_end: int = betterproto.uint32_field(4)
+    rewards: List["QuestionnaireReward"] = betterproto.message_field(5)
+    banner_title: str = betterproto.string_field(6)
+    title: str = betterproto.string_field(7)
+    announcement_title: str = betterproto.string_field(8)
+    announcement_content: str = betterproto.string_field(9)
+    final_text: str = betterproto.string_field(10)
+    questions: List["QuestionnaireQuestion"] = betterproto.message_field(11)
+    type: int = betterproto.uint32_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestion(Message):
+    id: int = betterproto.uint32_field(1)
+    title: str = betterproto.string_field(2)
+    describe: str = betterproto.string_field(3)
+    type: str = betterproto.string_field(4)
+    sub_type: str = betterproto.string_field(5)
+    options: List["QuestionnaireQuestionQuestionOption"] = betterproto.message_field(6)
+    option_random_sort: bool = betterproto.bool_field(7)
+    require: bool = betterproto.bool_field(8)
+    max_choice: int = betterproto.uint32_field(9)
+    next_question: List["QuestionnaireQuestionNextQuestionData"] = (
+        betterproto.message_field(10)
+    )
+    matrix_row: List[str] = betterproto.string_field(11)
+    option_random_sort_index: int = betterproto.int32_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestionQuestionOption(Message):
+    label: str = betterproto.string_field(1)
+    value: str = betterproto.string_field(2)
+    allow_input: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestionNextQuestionData(Message):
+    target_question_id: int = betterproto.uint32_field(1)
+    conditions: List[
+        "QuestionnaireQuestionNextQuestionDataQuestionconditionWrapper"
+    ] = betterproto.message_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestionNextQuestionDataQuestionCondition(Message):
+    question_id: int = betterproto.uint32_field(1)
+    op: str = betterproto.string_field(2)
+    values: List[str] = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireQuestionNextQuestionDataQuestionconditionWrapper(
+    Message
+):
+    conditions: List["QuestionnaireQuestionNextQuestionDataQuestionCondition"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class QuestionnaireBrief(Message):
+    id: int = betterproto.uint32_field(1)
+    version_id: int = betterproto.uint32_field(2)
+    effective_time_start: int = betterproto.uint32_field(3)
+    effective_time_end: int = betterproto.uint32_field(4)
+    rewards: List["QuestionnaireReward"] = betterproto.message_field(5)
+    banner_title: str = betterproto.string_field(6)
+    title: str = betterproto.string_field(7)
+    type: int = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class SeerReport(Message):
+    uuid: str = betterproto.string_field(1)
+    events: List["SeerEvent"] = betterproto.message_field(2)
+    rounds: List["SeerRound"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SeerEvent(Message):
+    record_index: int = betterproto.int32_field(1)
+    seer_index: int = betterproto.int32_field(2)
+    recommends: List["SeerRecommend"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SeerRecommend(Message):
+    seat: int = betterproto.int32_field(1)
+    predictions: List["SeerPrediction"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SeerPrediction(Message):
+    action: int = betterproto.int32_field(1)
+    score: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SeerRound(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    player_scores: List["SeerScore"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SeerScore(Message):
+    seat: int = betterproto.uint32_field(1)
+    rating: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SeerBrief(Message):
+    uuid: str = betterproto.string_field(1)
+    state: int = betterproto.uint32_field(2)
+    expire_time: int = betterproto.uint32_field(3)
+    player_scores: List["SeerScore"] = betterproto.message_field(4)
+    create_time: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SnowballActivityBossAction(Message):
+    tick: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    track: int = betterproto.uint32_field(3)
+    attack_info: "SnowballActivityBossActionSnowballActivityBossAttackInfo" = (
+        betterproto.message_field(4)
+    )
+    mp_consume_info: "SnowballActivityBossActionSnowballActivityBossMpConsumeInfo" = (
+        betterproto.message_field(5)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SnowballActivityBossActionSnowballActivityBossAttackInfo(Message):
+    damage: int = betterproto.uint32_field(1)
+    is_con_attack: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SnowballActivityBossActionSnowballActivityBossMpConsumeInfo(Message):
+    mp_consume: int = betterproto.uint32_field(1)
+    before_delay: int = betterproto.uint32_field(2)
+    after_delay: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ClientDeviceInfoLog(Message):
+    device_info: "ClientDeviceInfo" = betterproto.message_field(1)
+    login_time: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class MarathonGameRecord(Message):
+    point: int = betterproto.uint32_field(1)
+    distance: int = betterproto.uint32_field(2)
+    used_tick: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SnsBlog(Message):
+    id: int = betterproto.uint32_field(1)
+    read_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SnsReply(Message):
+    id: int = betterproto.uint32_field(1)
+    reply_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ContestSetting(Message):
+    level_limit: List["ContestSettingLevelLimit"] = betterproto.message_field(1)
+    game_limit: int = betterproto.uint32_field(2)
+    system_broadcast: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ContestSettingLevelLimit(Message):
+    type: int = betterproto.uint32_field(1)
+    value: int = betterproto.uint32_field(2)
+    operate: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NewRoundOpenedTiles(Message):
+    seat: int = betterproto.uint32_field(1)
+    tiles: List[str] = betterproto.string_field(2)
+    count: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class MuyuInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    count_max: int = betterproto.uint32_field(3)
+    id: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ChuanmaGang(Message):
+    old_scores: List[int] = betterproto.int32_field(1)
+    delta_scores: List[int] = betterproto.int32_field(2)
+    scores: List[int] = betterproto.int32_field(3)
+    gameend: "GameEnd" = betterproto.message_field(4)
+    hules_history: List["HuleInfo"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class YongchangInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    moqie_count: int = betterproto.uint32_field(2)
+    moqie_bonus: int = betterproto.uint32_field(3)
+    shouqie_count: int = betterproto.uint32_field(4)
+    shouqie_bonus: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class XiaKeShangInfo(Message):
+    score_coefficients: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class OptionalOperation(Message):
+    type: int = betterproto.uint32_field(1)
+    combination: List[str] = betterproto.string_field(2)
+    change_tiles: List[str] = betterproto.string_field(3)
+    change_tile_states: List[int] = betterproto.int32_field(4)
+    gap_type: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class OptionalOperationList(Message):
+    seat: int = betterproto.uint32_field(1)
+    operation_list: List["OptionalOperation"] = betterproto.message_field(2)
+    time_add: int = betterproto.uint32_field(4)
+    time_fixed: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class LiQiSuccess(Message):
+    seat: int = betterproto.uint32_field(1)
+    score: int = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    failed: bool = betterproto.bool_field(4)
+    liqi_type_beishuizhizhan: int = betterproto.uint32_field(5)
+    xia_ke_shang: "XiaKeShangInfo" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class FanInfo(Message):
+    name: str = betterproto.string_field(1)
+    val: int = betterproto.uint32_field(2)
+    id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class HuleInfo(Message):
+    hand: List[str] = betterproto.string_field(1)
+    ming: List[str] = betterproto.string_field(2)
+    hu_tile: str = betterproto.string_field(3)
+    seat: int = betterproto.uint32_field(4)
+    zimo: bool = betterproto.bool_field(5)
+    qinjia: bool = betterproto.bool_field(6)
+    liqi: bool = betterproto.bool_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    li_doras: List[str] = betterproto.string_field(9)
+    yiman: bool = betterproto.bool_field(10)
+    count: int = betterproto.uint32_field(11)
+    fans: List["FanInfo"] = betterproto.message_field(12)
+    fu: int = betterproto.uint32_field(13)
+    title: str = betterproto.string_field(14)
+    point_rong: int = betterproto.uint32_field(15)
+    point_zimo_qin: int = betterproto.uint32_field(16)
+    point_zimo_xian: int = betterproto.uint32_field(17)
+    title_id: int = betterproto.uint32_field(18)
+    point_sum: int = betterproto.uint32_field(19)
+    dadian: int = betterproto.uint32_field(20)
+    baopai: int = betterproto.uint32_field(21)
+    baopai_seats: List[int] = betterproto.uint32_field(22)
+    lines: List[str] = betterproto.string_field(23)
+    tianming_bonus: int = betterproto.uint32_field(24)
+    baida_changed: List[str] = betterproto.string_field(25)
+    hu_tile_bai_da_changed: str = betterproto.string_field(26)
+    xia_ke_shang_coefficient: int = betterproto.uint32_field(27)
+
+
+@dataclass(eq=False, repr=False)
+class TingPaiInfo(Message):
+    tile: str = betterproto.string_field(1)
+    haveyi: bool = betterproto.bool_field(2)
+    yiman: bool = betterproto.bool_field(3)
+    count: int = betterproto.uint32_field(4)
+    fu: int = betterproto.uint32_field(5)
+    biao_dora_count: int = betterproto.uint32_field(6)
+    yiman_zimo: bool = betterproto.bool_field(7)
+    count_zimo: int = betterproto.uint32_field(8)
+    fu_zimo: int = betterproto.uint32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class TingPaiDiscardInfo(Message):
+    tile: str = betterproto.string_field(1)
+    zhenting: bool = betterproto.bool_field(2)
+    infos: List["TingPaiInfo"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class HunZhiYiJiBuffInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    continue_deal_count: int = betterproto.uint32_field(2)
+    overload: bool = betterproto.bool_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class HuInfoXueZhanMid(Message):
+    seat: int = betterproto.uint32_field(1)
+    hand_count: int = betterproto.uint32_field(2)
+    hand: List[str] = betterproto.string_field(3)
+    ming: List[str] = betterproto.string_field(4)
+    hu_tile: str = betterproto.string_field(5)
+    zimo: bool = betterproto.bool_field(6)
+    yiman: bool = betterproto.bool_field(7)
+    count: int = betterproto.uint32_field(8)
+    fans: List["FanInfo"] = betterproto.message_field(9)
+    fu: int = betterproto.uint32_field(10)
+    title_id: int = betterproto.uint32_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class NoTilePlayerInfo(Message):
+    tingpai: bool = betterproto.bool_field(3)
+    hand: List[str] = betterproto.string_field(4)
+    tings: List["TingPaiInfo"] = betterproto.message_field(5)
+    already_hule: bool = betterproto.bool_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class NoTileScoreInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    hand: List[str] = betterproto.string_field(4)
+    ming: List[str] = betterproto.string_field(5)
+    doras: List[str] = betterproto.string_field(6)
+    score: int = betterproto.uint32_field(7)
+    taxes: List[int] = betterproto.int32_field(8)
+    lines: List[str] = betterproto.string_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class PlayerLeaving(Message):
+    seat: int = betterproto.uint32_field(1)
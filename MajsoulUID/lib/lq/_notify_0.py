@@ -0,0 +1,354 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomGameStart(Message):
+    game_url: str = betterproto.string_field(1)
+    connect_token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    location: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyMatchGameStart(Message):
+    game_url: str = betterproto.string_field(1)
+    connect_token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    match_mode_id: int = betterproto.uint32_field(4)
+    location: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerReady(Message):
+    account_id: int = betterproto.uint32_field(1)
+    ready: bool = betterproto.bool_field(2)
+    account_list: "NotifyRoomPlayerReadyAccountReadyState" = betterproto.message_field(
+        3
+    )
+    seq: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerReadyAccountReadyState(Message):
+    account_id: int = betterproto.uint32_field(1)
+    ready: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerDressing(Message):
+    account_id: int = betterproto.uint32_field(1)
+    dressing: bool = betterproto.bool_field(2)
+    account_list: "NotifyRoomPlayerDressingAccountDressingState" = (
+        betterproto.message_field(3)
+    )
+    seq: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerDressingAccountDressingState(Message):
+    account_id: int = betterproto.uint32_field(1)
+    dressing: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomPlayerUpdate(Message):
+    owner_id: int = betterproto.uint32_field(3)
+    robot_count: int = betterproto.uint32_field(4)
+    player_list: List["PlayerGameView"] = betterproto.message_field(5)
+    seq: int = betterproto.uint32_field(6)
+    robots: List["PlayerGameView"] = betterproto.message_field(7)
+    positions: List[int] = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRoomKickOut(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyFriendStateChange(Message):
+    target_id: int = betterproto.uint32_field(1)
+    active_state: "AccountActiveState" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyFriendViewChange(Message):
+    target_id: int = betterproto.uint32_field(1)
+    base: "PlayerBaseView" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyFriendChange(Message):
+    account_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    friend: "Friend" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyNewFriendApply(Message):
+    account_id: int = betterproto.uint32_field(1)
+    apply_time: int = betterproto.uint32_field(2)
+    removed_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyClientMessage(Message):
+    sender: "PlayerBaseView" = betterproto.message_field(1)
+    type: int = betterproto.uint32_field(2)
+    content: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAccountUpdate(Message):
+    update: "AccountUpdate" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAnotherLogin(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAccountLogout(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAnnouncementUpdate(Message):
+    update_list: List["NotifyAnnouncementUpdateAnnouncementUpdate"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAnnouncementUpdateAnnouncementUpdate(Message):
+    lang: str = betterproto.string_field(1)
+    platform: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyNewMail(Message):
+    mail: "Mail" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyDeleteMail(Message):
+    mail_id_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyReviveCoinUpdate(Message):
+    has_gained: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyDailyTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    max_daily_task_count: int = betterproto.uint32_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityPeriodTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAccountRandomTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivitySegmentTaskUpdate(Message):
+    progresses: List["SegmentTaskProgress"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityUpdate(Message):
+    list: List["NotifyActivityUpdateFeedActivityData"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityUpdateFeedActivityData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    feed_count: int = betterproto.uint32_field(2)
+    friend_receive_data: "NotifyActivityUpdateFeedActivityDataCountWithTimeData" = (
+        betterproto.message_field(3)
+    )
+    friend_send_data: "NotifyActivityUpdateFeedActivityDataCountWithTimeData" = (
+        betterproto.message_field(4)
+    )
+    gift_inbox: List["NotifyActivityUpdateFeedActivityDataGiftBoxData"] = (
+        betterproto.message_field(5)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityUpdateFeedActivityDataCountWithTimeData(Message):
+    count: int = betterproto.uint32_field(1)
+    last_update_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityUpdateFeedActivityDataGiftBoxData(Message):
+    id: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+    from_account_id: int = betterproto.uint32_field(4)
+    time: int = betterproto.uint32_field(5)
+    received: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAccountChallengeTaskUpdate(Message):
+    progresses: List["TaskProgress"] = betterproto.message_field(1)
+    level: int = betterproto.uint32_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    match_count: int = betterproto.uint32_field(4)
+    ticket_id: int = betterproto.uint32_field(5)
+    rewarded_season: List[int] = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyNewComment(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyRollingNotice(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyMaintainNotice(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGiftSendRefresh(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyShopUpdate(Message):
+    shop_info: "ShopInfo" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyIntervalUpdate(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyVipLevelChange(Message):
+    gift_limit: int = betterproto.uint32_field(1)
+    friend_max_count: int = betterproto.uint32_field(2)
+    zhp_free_refresh_limit: int = betterproto.uint32_field(3)
+    zhp_cost_refresh_limit: int = betterproto.uint32_field(4)
+    buddy_bonus: float = betterproto.float_field(5)
+    record_collect_limit: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyServerSetting(Message):
+    settings: "ServerSettings" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyPayResult(Message):
+    pay_result: int = betterproto.uint32_field(1)
+    order_id: str = betterproto.string_field(2)
+    goods_id: int = betterproto.uint32_field(3)
+    new_month_ticket: int = betterproto.uint32_field(4)
+    resource_modify: List["NotifyPayResultResourceModify"] = betterproto.message_field(
+        5
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyPayResultResourceModify(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    final: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomContestAccountMsg(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    sender: str = betterproto.string_field(3)
+    content: str = betterproto.string_field(4)
+    verified: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomContestSystemMsg(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    uuid: str = betterproto.string_field(3)
+    game_start: "CustomizedContestGameStart" = betterproto.message_field(4)
+    game_end: "CustomizedContestGameEnd" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyMatchTimeout(Message):
+    sid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyMatchFailed(Message):
+    sid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomContestState(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    state: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityChange(Message):
+    new_activities: List["Activity"] = betterproto.message_field(1)
+    end_activities: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAfkResult(Message):
+    type: int = betterproto.uint32_field(1)
+    ban_end_time: int = betterproto.uint32_field(2)
+    game_uuid: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyLoginQueueFinished(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2(Message):
+    mode_id: int = betterproto.uint32_field(1)
+    level_change: "NotifyGameFinishRewardV2LevelChange" = betterproto.message_field(2)
+    match_chest: "NotifyGameFinishRewardV2MatchChest" = betterproto.message_field(3)
+    main_character: "NotifyGameFinishRewardV2MainCharacter" = betterproto.message_field(
+        4
+    )
+    character_gift: "NotifyGameFinishRewardV2CharacterGift" = betterproto.message_field(
+        5
+    )
+    badges: List["BadgeAchieveProgress"] = betterproto.message_field(6)
@@ -0,0 +1,260 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2LevelChange(Message):
+    origin: "AccountLevel" = betterproto.message_field(1)
+    final: "AccountLevel" = betterproto.message_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2MatchChest(Message):
+    chest_id: int = betterproto.uint32_field(1)
+    origin: int = betterproto.uint32_field(2)
+    final: int = betterproto.uint32_field(3)
+    is_graded: bool = betterproto.bool_field(4)
+    rewards: List["RewardSlot"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2MainCharacter(Message):
+    level: int = betterproto.uint32_field(1)
+    exp: int = betterproto.uint32_field(2)
+    add: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardV2CharacterGift(Message):
+    origin: int = betterproto.uint32_field(1)
+    final: int = betterproto.uint32_field(2)
+    add: int = betterproto.uint32_field(3)
+    is_graded: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityRewardV2(Message):
+    activity_reward: List["NotifyActivityRewardV2ActivityReward"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityRewardV2ActivityReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    rewards: List["RewardSlot"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityPointV2(Message):
+    activity_points: List["NotifyActivityPointV2ActivityPoint"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityPointV2ActivityPoint(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyLeaderboardPointV2(Message):
+    leaderboard_points: List["NotifyLeaderboardPointV2LeaderboardPoint"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyLeaderboardPointV2LeaderboardPoint(Message):
+    leaderboard_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifySeerReport(Message):
+    report: "SeerBrief" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyConnectionShutdown(Message):
+    reason: int = betterproto.uint32_field(1)
+    close_at: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomizedContestReady(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    ready: int = betterproto.uint32_field(2)
+    reason: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomizedContestRuleModify(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    auto_match: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomizedContestPlanReady(Message):
+    game_plan: "CustomizedContestGamePlan" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyCustomizedContestPlanCancel(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    uuid: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyNewGame(Message):
+    game_uuid: str = betterproto.string_field(1)
+    player_list: List[str] = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyPlayerLoadGameReady(Message):
+    ready_id_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameBroadcast(Message):
+    seat: int = betterproto.uint32_field(1)
+    content: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameEndResult(Message):
+    result: "GameEndResult" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameTerminate(Message):
+    reason: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyPlayerConnectionState(Message):
+    seat: int = betterproto.uint32_field(1)
+    state: "GamePlayerState" = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyAccountLevelChange(Message):
+    origin: "AccountLevel" = betterproto.message_field(1)
+    final: "AccountLevel" = betterproto.message_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishReward(Message):
+    mode_id: int = betterproto.uint32_field(1)
+    level_change: "NotifyGameFinishRewardLevelChange" = betterproto.message_field(2)
+    match_chest: "NotifyGameFinishRewardMatchChest" = betterproto.message_field(3)
+    main_character: "NotifyGameFinishRewardMainCharacter" = betterproto.message_field(4)
+    character_gift: "NotifyGameFinishRewardCharacterGift" = betterproto.message_field(5)
+    badges: List["BadgeAchieveProgress"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardLevelChange(Message):
+    origin: "AccountLevel" = betterproto.message_field(1)
+    final: "AccountLevel" = betterproto.message_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardMatchChest(Message):
+    chest_id: int = betterproto.uint32_field(1)
+    origin: int = betterproto.uint32_field(2)
+    final: int = betterproto.uint32_field(3)
+    is_graded: bool = betterproto.bool_field(4)
+    rewards: List["RewardSlot"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardMainCharacter(Message):
+    level: int = betterproto.uint32_field(1)
+    exp: int = betterproto.uint32_field(2)
+    add: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGameFinishRewardCharacterGift(Message):
+    origin: int = betterproto.uint32_field(1)
+    final: int = betterproto.uint32_field(2)
+    add: int = betterproto.uint32_field(3)
+    is_graded: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityReward(Message):
+    activity_reward: List["NotifyActivityRewardActivityReward"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityRewardActivityReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    rewards: List["RewardSlot"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityPoint(Message):
+    activity_points: List["NotifyActivityPointActivityPoint"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyActivityPointActivityPoint(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyLeaderboardPoint(Message):
+    leaderboard_points: List["NotifyLeaderboardPointLeaderboardPoint"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class NotifyLeaderboardPointLeaderboardPoint(Message):
+    leaderboard_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyGamePause(Message):
+    paused: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyEndGameVote(Message):
+    results: List["NotifyEndGameVoteVoteResult"] = betterproto.message_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    duration_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyEndGameVoteVoteResult(Message):
+    account_id: int = betterproto.uint32_field(1)
+    yes: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class NotifyObserveData(Message):
+    unit: "GameLiveUnit" = betterproto.message_field(1)
@@ -0,0 +1,466 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class RecordGame(Message):
+    uuid: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    config: "GameConfig" = betterproto.message_field(5)
+    accounts: List["RecordGameAccountInfo"] = betterproto.message_field(11)
+    result: "GameEndResult" = betterproto.message_field(12)
+    robots: List["RecordGameAccountInfo"] = betterproto.message_field(13)
+    standard_rule: int = betterproto.uint32_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class RecordGameAccountInfo(Message):
+    account_id: int = betterproto.uint32_field(1)
+    seat: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    avatar_id: int = betterproto.uint32_field(4)
+    character: "Character" = betterproto.message_field(5)
+    title: int = betterproto.uint32_field(6)
+    level: "AccountLevel" = betterproto.message_field(7)
+    level3: "AccountLevel" = betterproto.message_field(8)
+    avatar_frame: int = betterproto.uint32_field(9)
+    verified: int = betterproto.uint32_field(10)
+    views: List["ViewSlot"] = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class RecordListEntry(Message):
+    version: int = betterproto.uint32_field(1)
+    uuid: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
+    tag: int = betterproto.uint32_field(5)
+    subtag: int = betterproto.uint32_field(6)
+    players: List["RecordPlayerResult"] = betterproto.message_field(7)
+    standard_rule: int = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class RecordPlayerResult(Message):
+    rank: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    level: "AccountLevel" = betterproto.message_field(4)
+    level3: "AccountLevel" = betterproto.message_field(5)
+    seat: int = betterproto.uint32_field(6)
+    pt: int = betterproto.int32_field(7)
+    point: int = betterproto.int32_field(8)
+    max_hu_type: int = betterproto.uint32_field(9)
+    action_liqi: int = betterproto.uint32_field(10)
+    action_rong: int = betterproto.uint32_field(11)
+    action_zimo: int = betterproto.uint32_field(12)
+    action_chong: int = betterproto.uint32_field(13)
+    verified: int = betterproto.uint32_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class RecordCollectedData(Message):
+    uuid: str = betterproto.string_field(1)
+    remarks: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class RecordTingPaiInfo(Message):
+    tile: str = betterproto.string_field(1)
+    haveyi: bool = betterproto.bool_field(2)
+    yiman: bool = betterproto.bool_field(3)
+    count: int = betterproto.uint32_field(4)
+    fu: int = betterproto.uint32_field(5)
+    biao_dora_count: int = betterproto.uint32_field(6)
+    yiman_zimo: bool = betterproto.bool_field(7)
+    count_zimo: int = betterproto.uint32_field(8)
+    fu_zimo: int = betterproto.uint32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class RecordNoTilePlayerInfo(Message):
+    tingpai: bool = betterproto.bool_field(3)
+    hand: List[str] = betterproto.string_field(4)
+    tings: List["RecordTingPaiInfo"] = betterproto.message_field(5)
+    liuman: bool = betterproto.bool_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class RecordHuleInfo(Message):
+    hand: List[str] = betterproto.string_field(1)
+    ming: List[str] = betterproto.string_field(2)
+    hu_tile: str = betterproto.string_field(3)
+    seat: int = betterproto.uint32_field(4)
+    zimo: bool = betterproto.bool_field(5)
+    qinjia: bool = betterproto.bool_field(6)
+    liqi: bool = betterproto.bool_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    li_doras: List[str] = betterproto.string_field(9)
+    yiman: bool = betterproto.bool_field(10)
+    count: int = betterproto.uint32_field(11)
+    fans: List["RecordHuleInfoRecordFanInfo"] = betterproto.message_field(12)
+    fu: int = betterproto.uint32_field(13)
+    point_zimo_qin: int = betterproto.uint32_field(14)
+    point_zimo_xian: int = betterproto.uint32_field(15)
+    title_id: int = betterproto.uint32_field(16)
+    point_sum: int = betterproto.uint32_field(17)
+    dadian: int = betterproto.uint32_field(18)
+    is_jue_zhang: bool = betterproto.bool_field(19)
+    xun: int = betterproto.uint32_field(20)
+    ting_type: int = betterproto.uint32_field(21)
+    ting_mian: int = betterproto.uint32_field(22)
+
+
+@dataclass(eq=False, repr=False)
+class RecordHuleInfoRecordFanInfo(Message):
+    val: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordHulesInfo(Message):
+    seat: int = betterproto.int32_field(1)
+    hules: List["RecordHuleInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordLiujuInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordNoTileInfo(Message):
+    liujumanguan: bool = betterproto.bool_field(1)
+    players: List["RecordNoTilePlayerInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordLiqiInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    score: int = betterproto.uint32_field(2)
+    is_w: bool = betterproto.bool_field(3)
+    is_zhen_ting: bool = betterproto.bool_field(4)
+    xun: int = betterproto.uint32_field(5)
+    is_success: bool = betterproto.bool_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class RecordGangInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    pai: str = betterproto.string_field(3)
+    is_dora: bool = betterproto.bool_field(4)
+    xun: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class RecordBaBeiInfo(Message):
+    seat: int = betterproto.uint32_field(1)
+    is_zi_mo: bool = betterproto.bool_field(2)
+    is_chong: bool = betterproto.bool_field(3)
+    is_bei: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class RecordPeiPaiInfo(Message):
+    dora_count: int = betterproto.uint32_field(1)
+    r_dora_count: int = betterproto.uint32_field(2)
+    bei_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class RecordRoundInfo(Message):
+    name: str = betterproto.string_field(1)
+    chang: int = betterproto.uint32_field(2)
+    ju: int = betterproto.uint32_field(3)
+    ben: int = betterproto.uint32_field(4)
+    scores: List[int] = betterproto.uint32_field(5)
+    liqi_infos: List["RecordLiqiInfo"] = betterproto.message_field(7)
+    gang_infos: List["RecordGangInfo"] = betterproto.message_field(8)
+    peipai_infos: List["RecordPeiPaiInfo"] = betterproto.message_field(9)
+    babai_infos: List["RecordBaBeiInfo"] = betterproto.message_field(10)
+    hules_info: "RecordHulesInfo" = betterproto.message_field(11)
+    liuju_info: "RecordLiujuInfo" = betterproto.message_field(12)
+    no_tile_info: "RecordNoTileInfo" = betterproto.message_field(13)
+    xiuluo_hules_info: List["RecordHulesInfo"] = betterproto.message_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class RecordAnalysisedData(Message):
+    round_infos: List["RecordRoundInfo"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RecordNewCard(Message):
+    field_spell: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RecordNewRound(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    dora: str = betterproto.string_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    liqibang: int = betterproto.uint32_field(6)
+    tiles0: List[str] = betterproto.string_field(7)
+    tiles1: List[str] = betterproto.string_field(8)
+    tiles2: List[str] = betterproto.string_field(9)
+    tiles3: List[str] = betterproto.string_field(10)
+    tingpai: List["RecordNewRoundTingPai"] = betterproto.message_field(11)
+    operation: "OptionalOperationList" = betterproto.message_field(12)
+    md5: str = betterproto.string_field(13)
+    paishan: str = betterproto.string_field(14)
+    left_tile_count: int = betterproto.uint32_field(15)
+    doras: List[str] = betterproto.string_field(16)
+    opens: List["NewRoundOpenedTiles"] = betterproto.message_field(17)
+    muyu: "MuyuInfo" = betterproto.message_field(18)
+    operations: List["OptionalOperationList"] = betterproto.message_field(19)
+    ju_count: int = betterproto.uint32_field(20)
+    field_spell: int = betterproto.uint32_field(21)
+    sha256: str = betterproto.string_field(22)
+    yongchang: "YongchangInfo" = betterproto.message_field(23)
+    salt_sha256: str = betterproto.string_field(24)
+    salt: str = betterproto.string_field(25)
+    xia_ke_shang: "XiaKeShangInfo" = betterproto.message_field(26)
+
+
+@dataclass(eq=False, repr=False)
+class RecordNewRoundTingPai(Message):
+    seat: int = betterproto.uint32_field(1)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordSelectGap(Message):
+    gap_types: List[int] = betterproto.uint32_field(1)
+    tingpai: List["RecordSelectGapTingPai"] = betterproto.message_field(2)
+    operation: "OptionalOperationList" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class RecordSelectGapTingPai(Message):
+    seat: int = betterproto.uint32_field(1)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordChangeTile(Message):
+    doras: List[str] = betterproto.string_field(1)
+    tingpai: List["RecordChangeTileTingPai"] = betterproto.message_field(2)
+    change_tile_infos: List["RecordChangeTileChangeTile"] = betterproto.message_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+    change_type: int = betterproto.uint32_field(5)
+    operations: List["OptionalOperationList"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class RecordChangeTileTingPai(Message):
+    seat: int = betterproto.uint32_field(1)
+    tingpais1: List["TingPaiInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class RecordChangeTileChangeTile(Message):
+    in_tiles: List[str] = betterproto.string_field(1)
+    in_tile_states: List[int] = betterproto.int32_field(2)
+    out_tiles: List[str] = betterproto.string_field(3)
+    out_tile_states: List[int] = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class RecordRevealTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    is_liqi: bool = betterproto.bool_field(2)
+    is_wliqi: bool = betterproto.bool_field(3)
+    moqie: bool = betterproto.bool_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    liqibang: int = betterproto.uint32_field(6)
+    operations: List["OptionalOperationList"] = betterproto.message_field(7)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(8)
+    tile: str = betterproto.string_field(9)
+    zhenting: List[bool] = betterproto.bool_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class RecordUnveilTile(Message):
+    seat: int = betterproto.int32_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    operation: "OptionalOperationList" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class RecordLockTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    liqibang: int = betterproto.uint32_field(3)
+    tile: str = betterproto.string_field(4)
+    operation: List["OptionalOperationList"] = betterproto.message_field(5)
+    zhentings: List[bool] = betterproto.bool_field(6)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    lock_state: int = betterproto.int32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class RecordDiscardTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    is_liqi: bool = betterproto.bool_field(3)
+    moqie: bool = betterproto.bool_field(5)
+    zhenting: List[bool] = betterproto.bool_field(6)
+    tingpais: List["TingPaiInfo"] = betterproto.message_field(7)
+    doras: List[str] = betterproto.string_field(8)
+    is_wliqi: bool = betterproto.bool_field(9)
+    operations: List["OptionalOperationList"] = betterproto.message_field(10)
+    tile_state: int = betterproto.uint32_field(11)
+    muyu: "MuyuInfo" = betterproto.message_field(12)
+    yongchang: "YongchangInfo" = betterproto.message_field(13)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(14)
+    liqi_type_beishuizhizhan: int = betterproto.uint32_field(27)
+
+
+@dataclass(eq=False, repr=False)
+class RecordDealTile(Message):
+    seat: int = betterproto.uint32_field(1)
+    tile: str = betterproto.string_field(2)
+    left_tile_count: int = betterproto.uint32_field(3)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    doras: List[str] = betterproto.string_field(6)
+    zhenting: List[bool] = betterproto.bool_field(7)
+    operation: "OptionalOperationList" = betterproto.message_field(8)
+    tile_state: int = betterproto.uint32_field(9)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+    tile_index: int = betterproto.uint32_field(12)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class RecordFillAwaitingTiles(Message):
+    awaiting_tiles: List[str] = betterproto.string_field(1)
+    left_tile_count: int = betterproto.uint32_field(2)
+    operation: "OptionalOperationList" = betterproto.message_field(3)
+    liqi: "LiQiSuccess" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class RecordChiPengGang(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tiles: List[str] = betterproto.string_field(3)
+    froms: List[int] = betterproto.uint32_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    zhenting: List[bool] = betterproto.bool_field(7)
+    operation: "OptionalOperationList" = betterproto.message_field(8)
+    tile_states: List[int] = betterproto.uint32_field(9)
+    muyu: "MuyuInfo" = betterproto.message_field(10)
+    scores: List[int] = betterproto.int32_field(11)
+    liqibang: int = betterproto.uint32_field(12)
+    yongchang: "YongchangInfo" = betterproto.message_field(13)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(14)
+
+
+@dataclass(eq=False, repr=False)
+class RecordGangResult(Message):
+    gang_infos: "ChuanmaGang" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RecordGangResultEnd(Message):
+    gang_infos: "ChuanmaGang" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class RecordAnGangAddGang(Message):
+    seat: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tiles: str = betterproto.string_field(3)
+    doras: List[str] = betterproto.string_field(6)
+    operations: List["OptionalOperationList"] = betterproto.message_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class RecordBaBei(Message):
+    seat: int = betterproto.uint32_field(1)
+    doras: List[str] = betterproto.string_field(6)
+    operations: List["OptionalOperationList"] = betterproto.message_field(7)
+    moqie: bool = betterproto.bool_field(8)
+    tile_state: int = betterproto.uint32_field(10)
+    muyu: "MuyuInfo" = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class RecordHule(Message):
+    hules: List["HuleInfo"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    wait_timeout: int = betterproto.uint32_field(4)
+    scores: List[int] = betterproto.int32_field(5)
+    gameend: "GameEnd" = betterproto.message_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    baopai: int = betterproto.int32_field(9)
+    hun_zhi_yi_ji_info: "HunZhiYiJiBuffInfo" = betterproto.message_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class RecordHuleXueZhanMid(Message):
+    hules: List["HuInfoXueZhanMid"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    scores: List[int] = betterproto.int32_field(5)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    liqi: "LiQiSuccess" = betterproto.message_field(9)
+    zhenting: List[bool] = betterproto.bool_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class RecordHuleXueZhanEnd(Message):
+    hules: List["HuInfoXueZhanMid"] = betterproto.message_field(1)
+    old_scores: List[int] = betterproto.int32_field(2)
+    delta_scores: List[int] = betterproto.int32_field(3)
+    scores: List[int] = betterproto.int32_field(4)
+    wait_timeout: int = betterproto.uint32_field(5)
+    gameend: "GameEnd" = betterproto.message_field(6)
+    doras: List[str] = betterproto.string_field(7)
+    muyu: "MuyuInfo" = betterproto.message_field(8)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class RecordLiuJu(Message):
+    type: int = betterproto.uint32_field(1)
+    gameend: "GameEnd" = betterproto.message_field(2)
+    seat: int = betterproto.uint32_field(3)
+    tiles: List[str] = betterproto.string_field(4)
+    liqi: "LiQiSuccess" = betterproto.message_field(5)
+    allplayertiles: List[str] = betterproto.string_field(6)
+    muyu: "MuyuInfo" = betterproto.message_field(7)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class RecordNoTile(Message):
+    liujumanguan: bool = betterproto.bool_field(1)
+    players: List["NoTilePlayerInfo"] = betterproto.message_field(2)
+    scores: List["NoTileScoreInfo"] = betterproto.message_field(3)
+    gameend: bool = betterproto.bool_field(4)
+    muyu: "MuyuInfo" = betterproto.message_field(5)
+    hules_history: List["HuleInfo"] = betterproto.message_field(9)
@@ -0,0 +1,345 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqCommon(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenidCheck(Message):
+    type: int = betterproto.uint32_field(1)
+    token: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSignupAccount(Message):
+    account: str = betterproto.string_field(1)
+    password: str = betterproto.string_field(2)
+    code: str = betterproto.string_field(3)
+    type: int = betterproto.uint32_field(4)
+    device: "ClientDeviceInfo" = betterproto.message_field(5)
+    client_version_string: str = betterproto.string_field(6)
+    tag: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLogin(Message):
+    account: str = betterproto.string_field(1)
+    password: str = betterproto.string_field(2)
+    reconnect: bool = betterproto.bool_field(3)
+    device: "ClientDeviceInfo" = betterproto.message_field(4)
+    random_key: str = betterproto.string_field(5)
+    client_version: "ClientVersionInfo" = betterproto.message_field(6)
+    gen_access_token: bool = betterproto.bool_field(7)
+    currency_platforms: List[int] = betterproto.uint32_field(8)
+    type: int = betterproto.uint32_field(9)
+    version: int = betterproto.uint32_field(10)
+    client_version_string: str = betterproto.string_field(11)
+    tag: str = betterproto.string_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class ReqPrepareLogin(Message):
+    access_token: str = betterproto.string_field(1)
+    type: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFastLogin(Message):
+    client_version_string: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqEmailLogin(Message):
+    email: str = betterproto.string_field(1)
+    password: str = betterproto.string_field(2)
+    reconnect: bool = betterproto.bool_field(3)
+    device: "ClientDeviceInfo" = betterproto.message_field(4)
+    random_key: str = betterproto.string_field(5)
+    client_version: str = betterproto.string_field(6)
+    gen_access_token: bool = betterproto.bool_field(7)
+    currency_platforms: List[int] = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBindAccount(Message):
+    account: str = betterproto.string_field(1)
+    password: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreatePhoneVerifyCode(Message):
+    phone: str = betterproto.string_field(1)
+    usage: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateEmailVerifyCode(Message):
+    email: str = betterproto.string_field(1)
+    usage: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqVerifyCodeForSecure(Message):
+    code: str = betterproto.string_field(1)
+    operation: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBindPhoneNumber(Message):
+    code: str = betterproto.string_field(1)
+    phone: str = betterproto.string_field(2)
+    password: str = betterproto.string_field(3)
+    multi_bind_version: bool = betterproto.bool_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUnbindPhoneNumber(Message):
+    code: str = betterproto.string_field(1)
+    phone: str = betterproto.string_field(2)
+    password: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreatePhoneLoginBind(Message):
+    password: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBindEmail(Message):
+    email: str = betterproto.string_field(1)
+    code: str = betterproto.string_field(2)
+    password: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqModifyPassword(Message):
+    new_password: str = betterproto.string_field(1)
+    old_password: str = betterproto.string_field(2)
+    secure_token: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Auth(Message):
+    type: int = betterproto.uint32_field(1)
+    code: str = betterproto.string_field(2)
+    uid: str = betterproto.string_field(3)
+    client_version_string: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Check(Message):
+    type: int = betterproto.uint32_field(1)
+    access_token: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Signup(Message):
+    type: int = betterproto.uint32_field(1)
+    access_token: str = betterproto.string_field(2)
+    email: str = betterproto.string_field(3)
+    advertise_str: str = betterproto.string_field(4)
+    device: "ClientDeviceInfo" = betterproto.message_field(5)
+    client_version: "ClientVersionInfo" = betterproto.message_field(6)
+    client_version_string: str = betterproto.string_field(7)
+    tag: str = betterproto.string_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOauth2Login(Message):
+    type: int = betterproto.uint32_field(1)
+    access_token: str = betterproto.string_field(2)
+    reconnect: bool = betterproto.bool_field(3)
+    device: "ClientDeviceInfo" = betterproto.message_field(4)
+    random_key: str = betterproto.string_field(5)
+    client_version: "ClientVersionInfo" = betterproto.message_field(6)
+    gen_access_token: bool = betterproto.bool_field(7)
+    currency_platforms: List[int] = betterproto.uint32_field(8)
+    version: int = betterproto.uint32_field(9)
+    client_version_string: str = betterproto.string_field(10)
+    tag: str = betterproto.string_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ReqDmmPreLogin(Message):
+    finish_url: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLogout(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class ReqHeatBeat(Message):
+    no_operation_counter: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSearchAccountByEidLobby(Message):
+    eid: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLoginBeat(Message):
+    contract: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqJoinMatchQueue(Message):
+    match_mode: int = betterproto.uint32_field(1)
+    client_version_string: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCancelMatchQueue(Message):
+    match_mode: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAccountInfo(Message):
+    account_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateNickname(Message):
+    nickname: str = betterproto.string_field(1)
+    advertise_str: str = betterproto.string_field(2)
+    tag: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqModifyNickname(Message):
+    nickname: str = betterproto.string_field(1)
+    use_item_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqModifyBirthday(Message):
+    birthday: int = betterproto.int32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateRoom(Message):
+    player_count: int = betterproto.uint32_field(1)
+    mode: "GameMode" = betterproto.message_field(2)
+    public_live: bool = betterproto.bool_field(3)
+    client_version_string: str = betterproto.string_field(4)
+    pre_rule: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqJoinRoom(Message):
+    room_id: int = betterproto.uint32_field(1)
+    client_version_string: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRoomReady(Message):
+    ready: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRoomDressing(Message):
+    dressing: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRoomStart(Message):
+    pass
+
+
+@dataclass(eq=False, repr=False)
+class ReqRoomKickPlayer(Message):
+    id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqModifyRoom(Message):
+    robot_count: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAddRoomRobot(Message):
+    position: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChangeAvatar(Message):
+    avatar_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAccountStatisticInfo(Message):
+    account_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqShopPurchase(Message):
+    type: str = betterproto.string_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecord(Message):
+    game_uuid: str = betterproto.string_field(1)
+    client_version_string: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecordList(Message):
+    start: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecordListV2(Message):
+    tag: int = betterproto.uint32_field(1)
+    begin_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    ranks: List[int] = betterproto.uint32_field(4)
+    modes: List[int] = betterproto.uint32_field(5)
+    max_hu_type: int = betterproto.uint32_field(6)
+    level_mode: List[int] = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ReqNextGameRecordList(Message):
+    iterator: str = betterproto.string_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecordsDetail(Message):
+    uuid_list: List[str] = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameRecordsDetailV2(Message):
+    uuid_list: List[str] = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAddCollectedGameRecord(Message):
+    uuid: str = betterproto.string_field(1)
+    remarks: str = betterproto.string_field(2)
+    start_time: int = betterproto.uint32_field(3)
+    end_time: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRemoveCollectedGameRecord(Message):
+    uuid: str = betterproto.string_field(1)
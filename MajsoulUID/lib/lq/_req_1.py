@@ -0,0 +1,303 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqChangeCollectedGameRecordRemarks(Message):
+    uuid: str = betterproto.string_field(1)
+    remarks: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLevelLeaderboard(Message):
+    type: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChallangeLeaderboard(Message):
+    season: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqMutiChallengeLevel(Message):
+    account_id_list: List[int] = betterproto.uint32_field(1)
+    season: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqMultiAccountId(Message):
+    account_id_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqApplyFriend(Message):
+    target_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqHandleFriendApply(Message):
+    target_id: int = betterproto.uint32_field(1)
+    method: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRemoveFriend(Message):
+    target_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSearchAccountByPattern(Message):
+    search_next: bool = betterproto.bool_field(1)
+    pattern: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAccountList(Message):
+    account_id_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSearchAccountById(Message):
+    account_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUseBagItem(Message):
+    item_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenManualItem(Message):
+    item_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    select_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenRandomRewardItem(Message):
+    item_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenAllRewardItem(Message):
+    item_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqComposeShard(Message):
+    item_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchAnnouncement(Message):
+    lang: str = betterproto.string_field(1)
+    platform: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReadMail(Message):
+    mail_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqDeleteMail(Message):
+    mail_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqTakeAttachment(Message):
+    mail_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveAchievementGroupReward(Message):
+    group_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveAchievementReward(Message):
+    achievement_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUseTitle(Message):
+    title: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyShiLian(Message):
+    type: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateClientValue(Message):
+    key: int = betterproto.uint32_field(1)
+    value: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqClientMessage(Message):
+    timestamp: int = betterproto.uint32_field(1)
+    message: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCurrentMatchInfo(Message):
+    mode_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUserComplain(Message):
+    target_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    content: str = betterproto.string_field(3)
+    game_uuid: str = betterproto.string_field(4)
+    round_info: "ReqUserComplainGameRoundInfo" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUserComplainGameRoundInfo(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    seat: int = betterproto.uint32_field(4)
+    xun: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReadAnnouncement(Message):
+    announcement_id: int = betterproto.uint32_field(1)
+    announcement_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRefreshDailyTask(Message):
+    task_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUseGiftCode(Message):
+    code: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSendClientMessage(Message):
+    target_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    content: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameLiveInfo(Message):
+    game_uuid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameLiveLeftSegment(Message):
+    game_uuid: str = betterproto.string_field(1)
+    last_segment_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGameLiveList(Message):
+    filter_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateCommentSetting(Message):
+    comment_allow: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCommentList(Message):
+    target_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCommentContent(Message):
+    target_id: int = betterproto.uint32_field(1)
+    comment_id_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLeaveComment(Message):
+    target_id: int = betterproto.uint32_field(1)
+    content: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqDeleteComment(Message):
+    target_id: int = betterproto.uint32_field(1)
+    delete_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateReadComment(Message):
+    read_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchRollingNotice(Message):
+    lang: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqPlatformBillingProducts(Message):
+    shelves_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateBillingOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    payment_platform: int = betterproto.uint32_field(2)
+    client_type: int = betterproto.uint32_field(3)
+    account_id: int = betterproto.uint32_field(4)
+    client_version_string: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSolveGooglePlayOrder(Message):
+    inapp_purchase_data: str = betterproto.string_field(2)
+    inapp_data_signature: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSolveGooglePlayOrderV3(Message):
+    order_id: str = betterproto.string_field(1)
+    transaction_id: str = betterproto.string_field(2)
+    token: str = betterproto.string_field(3)
+    account_id: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCancelGooglePlayOrder(Message):
+    order_id: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateWechatNativeOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    account_ip: str = betterproto.string_field(4)
+    client_version_string: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateWechatAppOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    account_ip: str = betterproto.string_field(4)
+    client_version_string: str = betterproto.string_field(5)
@@ -0,0 +1,421 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateAlipayOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    alipay_trade_type: str = betterproto.string_field(4)
+    return_url: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateAlipayScanOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    client_version_string: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateAlipayAppOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    client_version_string: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpCreditCardOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpPaypalOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpAuOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpDocomoOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpWebMoneyOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpSoftbankOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpPayPayOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchJpCommonCreditCardOrder(Message):
+    order_id: str = betterproto.string_field(1)
+    account_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateJpgmoOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateYostarOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    order_type: int = betterproto.uint32_field(4)
+    client_version_string: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateEnPaypalOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateEnjcbOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateEnMasterCardOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateEnVisaOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateEnAlipayOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateKrPaypalOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateKrjcbOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateKrMasterCardOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateKrVisaOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateKrAlipayOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    return_url: str = betterproto.string_field(4)
+    access_token: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateDmmOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    client_type: int = betterproto.uint32_field(3)
+    client_version_string: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateIapOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    access_token: str = betterproto.string_field(4)
+    debt_order_id: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqVerificationIapOrder(Message):
+    order_id: str = betterproto.string_field(1)
+    transaction_id: str = betterproto.string_field(2)
+    receipt_data: str = betterproto.string_field(3)
+    account_id: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateSteamOrder(Message):
+    language: str = betterproto.string_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    client_type: int = betterproto.uint32_field(3)
+    goods_id: int = betterproto.uint32_field(4)
+    steam_id: str = betterproto.string_field(5)
+    debt_order_id: str = betterproto.string_field(6)
+    client_version_string: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRandomCharacter(Message):
+    enabled: bool = betterproto.bool_field(1)
+    pool: List["RandomCharacter"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqVerifySteamOrder(Message):
+    order_id: str = betterproto.string_field(1)
+    account_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateMyCardOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    debt_order_id: str = betterproto.string_field(4)
+    client_version_string: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqVerifyMyCardOrder(Message):
+    order_id: str = betterproto.string_field(1)
+    account_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreatePaypalOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    debt_order_id: str = betterproto.string_field(4)
+    client_version_string: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateXsollaOrder(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    client_type: int = betterproto.uint32_field(2)
+    account_id: int = betterproto.uint32_field(3)
+    payment_method: int = betterproto.uint32_field(4)
+    debt_order_id: str = betterproto.string_field(5)
+    client_version_string: str = betterproto.string_field(6)
+    account_ip: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ReqDeliverAa32Order(Message):
+    account_id: int = betterproto.uint32_field(1)
+    nsa_id: str = betterproto.string_field(2)
+    nsa_token: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenChest(Message):
+    chest_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    use_ticket: bool = betterproto.bool_field(3)
+    choose_up_activity_id: int = betterproto.uint32_field(4)
+    choose_group_activity_id: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyFromChestShop(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqDoActivitySignIn(Message):
+    activity_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateCharacterSort(Message):
+    sort: List[int] = betterproto.uint32_field(1)
+    other_sort: List[int] = betterproto.uint32_field(2)
+    hidden_characters: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChangeMainCharacter(Message):
+    character_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChangeCharacterSkin(Message):
+    character_id: int = betterproto.uint32_field(1)
+    skin: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChangeCharacterView(Message):
+    character_id: int = betterproto.uint32_field(1)
+    slot: int = betterproto.uint32_field(2)
+    item_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetHiddenCharacter(Message):
+    chara_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSendGiftToCharacter(Message):
+    character_id: int = betterproto.uint32_field(1)
+    gifts: List["ReqSendGiftToCharacterGift"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSendGiftToCharacterGift(Message):
+    item_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSellItem(Message):
+    sells: List["ReqSellItemItem"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSellItemItem(Message):
+    item_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChangeCommonView(Message):
+    slot: int = betterproto.uint32_field(1)
+    value: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSaveCommonViews(Message):
+    views: List["ViewSlot"] = betterproto.message_field(1)
+    save_index: int = betterproto.uint32_field(2)
+    is_use: int = betterproto.uint32_field(3)
+    name: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCommonViews(Message):
+    index: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUseCommonView(Message):
+    index: int = betterproto.uint32_field(3)
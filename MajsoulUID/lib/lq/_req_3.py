@@ -0,0 +1,291 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpgradeCharacter(Message):
+    character_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFinishedEnding(Message):
+    character_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+    ending_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGmCommand(Message):
+    command: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyFromShop(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    ver_price: List["ReqBuyFromShopItem"] = betterproto.message_field(3)
+    ver_goods: List["ReqBuyFromShopItem"] = betterproto.message_field(4)
+    package_goods: List["ReqBuyFromShopItem"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyFromShopItem(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyFromZhp(Message):
+    goods_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqPayMonthTicket(Message):
+    ticket_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReshZhpShop(Message):
+    free_refresh: int = betterproto.uint32_field(1)
+    cost_refresh: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqExchangeCurrency(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateAccountSettings(Message):
+    setting: "AccountSetting" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqModifySignature(Message):
+    signature: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateIdCardInfo(Message):
+    fullname: str = betterproto.string_field(1)
+    card_no: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGainVipReward(Message):
+    vip_level: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCustomizedContestList(Message):
+    start: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    lang: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCustomizedContestAuthInfo(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqEnterCustomizedContest(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    lang: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCustomizedContestOnlineInfo(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCustomizedContestByContestId(Message):
+    contest_id: int = betterproto.uint32_field(1)
+    lang: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSignupCustomizedContest(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    client_version_string: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStartCustomizedContest(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    client_version_string: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStopCustomizedContest(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqJoinCustomizedContestChatRoom(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSayChatMessage(Message):
+    content: str = betterproto.string_field(1)
+    unique_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCustomizedContestGameLiveList(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchCustomizedContestGameRecords(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    last_index: int = betterproto.uint32_field(2)
+    season_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqTargetCustomizedContest(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqExchangeActivityItem(Message):
+    exchange_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCompleteActivityTask(Message):
+    task_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCompleteActivityTaskBatch(Message):
+    task_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCompletePeriodActivityTaskBatch(Message):
+    task_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveActivityFlipTask(Message):
+    task_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveActivityFlipTaskBatch(Message):
+    task_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCompleteSegmentTaskReward(Message):
+    task_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchActivityFlipInfo(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCompleteActivityFlipTaskBatch(Message):
+    task_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGainAccumulatedPointActivityReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    reward_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGainMultiPointActivityReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    reward_id_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchRankPointLeaderboard(Message):
+    leaderboard_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGainRankPointReward(Message):
+    leaderboard_id: int = betterproto.uint32_field(1)
+    activity_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRichmanNextMove(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRichmanSpecialMove(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    step: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRichmanChestInfo(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateGameObserveAuth(Message):
+    game_uuid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRefreshGameObserveAuth(Message):
+    token: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpgradeActivityBuff(Message):
+    buff_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpgradeActivityLevel(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    group: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveUpgradeActivityReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveAllActivityGift(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqForceCompleteChallengeTask(Message):
+    task_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStartUnifiedMatch(Message):
+    match_sid: str = betterproto.string_field(1)
+    client_version_string: str = betterproto.string_field(2)
@@ -0,0 +1,296 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqCancelUnifiedMatch(Message):
+    match_sid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveChallengeRankReward(Message):
+    season_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyInAbMatch(Message):
+    match_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGamePointRank(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReadSns(Message):
+    id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReplySns(Message):
+    id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLikeSns(Message):
+    id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqDigMine(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    point: "Point" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchLastPrivacy(Message):
+    type: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCheckPrivacy(Message):
+    device_type: str = betterproto.string_field(1)
+    versions: List["ReqCheckPrivacyVersions"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCheckPrivacyVersions(Message):
+    version: str = betterproto.string_field(1)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchRpgBattleHistory(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyArenaTicket(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqArenaReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqEnterArena(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveRpgRewards(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveRpgReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    monster_seq: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchObToken(Message):
+    uuid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveCharacterRewards(Message):
+    character_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFeedActivityFeed(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSendActivityGiftToFriend(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    item_id: int = betterproto.uint32_field(2)
+    target_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveActivityGift(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchFriendGiftActivityData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    account_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenPreChestItem(Message):
+    item_id: int = betterproto.uint32_field(1)
+    pool_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchVoteActivity(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqVoteActivity(Message):
+    vote: int = betterproto.uint32_field(1)
+    activity_id: int = betterproto.uint32_field(2)
+    count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUnlockActivitySpot(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUnlockActivitySpotEnding(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    ending_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveActivitySpotReward(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqLogReport(Message):
+    success: int = betterproto.uint32_field(1)
+    failed: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBindOauth2(Message):
+    type: int = betterproto.uint32_field(1)
+    token: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchOauth2(Message):
+    type: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetLoadingImage(Message):
+    images: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqOpenGacha(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqTaskRequest(Message):
+    params: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimulationActivityTrain(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchSimulationGameRecord(Message):
+    game_uuid: str = betterproto.string_field(1)
+    activity_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStartSimulationActivityGame(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchSimulationGameRank(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    day: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGenerateCombiningCraft(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    bin_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqMoveCombiningCraft(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    from_: int = betterproto.uint32_field(2)
+    to: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCombiningRecycleCraft(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    pos: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRecoverCombiningRecycle(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFinishCombiningOrder(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    craft_pos: int = betterproto.uint32_field(2)
+    order_pos: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpgradeVillageBuilding(Message):
+    building_id: int = betterproto.uint32_field(1)
+    activity_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveVillageBuildingReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    building_id: int = betterproto.uint32_field(2)
+    rewards: List["RewardSlot"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStartVillageTrip(Message):
+    dest: int = betterproto.uint32_field(1)
+    activity_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqReceiveVillageTripReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    dest_id: int = betterproto.uint32_field(2)
+    rewards: List["RewardSlot"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCompleteVillageTask(Message):
+    task_id: int = betterproto.uint32_field(1)
+    activity_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGetFriendVillageData(Message):
+    account_list: List[int] = betterproto.uint32_field(1)
+    activity_id: int = betterproto.uint32_field(2)
@@ -0,0 +1,337 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetVillageWorker(Message):
+    building_id: int = betterproto.uint32_field(1)
+    worker_pos: int = betterproto.uint32_field(2)
+    activity_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqNextRoundVillage(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqResolveFestivalActivityProposal(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+    select: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqResolveFestivalActivityEvent(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+    select: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBuyFestivalProposal(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityMove(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    zone_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityBuy(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    items: List["ReqIslandActivityBuyBuyItems"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityBuyBuyItems(Message):
+    goods_id: int = betterproto.uint32_field(2)
+    pos: List[int] = betterproto.uint32_field(3)
+    rotate: int = betterproto.uint32_field(4)
+    bag_id: int = betterproto.uint32_field(5)
+    price: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivitySell(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    items: List["ReqIslandActivitySellSellItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivitySellSellItem(Message):
+    bag_id: int = betterproto.uint32_field(2)
+    id: int = betterproto.uint32_field(3)
+    price: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityTidyBag(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    bag_data: List["ReqIslandActivityTidyBagBagData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityTidyBagBagData(Message):
+    bag_id: int = betterproto.uint32_field(2)
+    items: List["ReqIslandActivityTidyBagBagDataITemData"] = betterproto.message_field(
+        3
+    )
+    drops: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityTidyBagBagDataITemData(Message):
+    id: int = betterproto.uint32_field(1)
+    pos: List[int] = betterproto.uint32_field(2)
+    rotate: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqIslandActivityUnlockBagGrid(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    bag_id: int = betterproto.uint32_field(2)
+    pos: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateCustomizedContest(Message):
+    name: str = betterproto.string_field(1)
+    open_show: int = betterproto.uint32_field(2)
+    game_rule_setting: "GameMode" = betterproto.message_field(3)
+    start_time: int = betterproto.uint32_field(4)
+    end_time: int = betterproto.uint32_field(5)
+    auto_match: int = betterproto.uint32_field(6)
+    rank_rule: int = betterproto.uint32_field(7)
+    contest_setting: "ContestSetting" = betterproto.message_field(8)
+    rank_type: int = betterproto.uint32_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchmanagerCustomizedContestList(Message):
+    lang: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchManagerCustomizedContest(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqUpdateManagerCustomizedContest(Message):
+    name: str = betterproto.string_field(1)
+    open_show: int = betterproto.uint32_field(2)
+    game_rule_setting: "GameMode" = betterproto.message_field(3)
+    start_time: int = betterproto.uint32_field(4)
+    end_time: int = betterproto.uint32_field(5)
+    unique_id: int = betterproto.uint32_field(6)
+    auto_match: int = betterproto.uint32_field(7)
+    rank_rule: int = betterproto.uint32_field(8)
+    contest_setting: "ContestSetting" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchContestPlayerRank(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    limit: int = betterproto.uint32_field(2)
+    offset: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchContestTeamRank(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    limit: int = betterproto.uint32_field(2)
+    offset: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchContestTeamPlayerRank(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    offset: int = betterproto.uint32_field(2)
+    limit: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchContestTeamMember(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    team_id: int = betterproto.uint32_field(2)
+    offset: int = betterproto.uint32_field(3)
+    limit: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchReadyPlayerList(Message):
+    unique_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateGamePlan(Message):
+    unique_id: int = betterproto.uint32_field(1)
+    account_list: List[int] = betterproto.uint32_field(2)
+    game_start_time: int = betterproto.uint32_field(3)
+    shuffle_seats: int = betterproto.uint32_field(4)
+    ai_level: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityFetchInfo(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityFetchBrief(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchAmuletActivityData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityStartGame(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityOperate(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    type: int = betterproto.uint32_field(2)
+    tile_list: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityUpgrade(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivitySelectPack(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityBuy(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivitySellEffect(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityEffectSort(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    sorted_id: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityGiveup(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityRefreshShop(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivitySelectFreeEffect(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    selected_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityUpgradeShopBuff(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivityEndShopping(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivitySetSkillLevel(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    skill: List["AmuletSkillData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivitySelectRewardPack(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAmuletActivitySelectBookEffect(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    effect_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStoryActivityUnlock(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStoryActivityUnlockEnding(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+    ending_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStoryActivityReceiveEndingReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+    ending_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStoryActivityReceiveFinishReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStoryActivityReceiveAllFinishReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqStoryActivityUnlockEndingAndReceive(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    story_id: int = betterproto.uint32_field(2)
+    ending_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchActivityRank(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    account_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchQuestionnaireList(Message):
+    lang: str = betterproto.string_field(1)
+    channel: str = betterproto.string_field(2)
@@ -0,0 +1,339 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchQuestionnaireDetail(Message):
+    id: int = betterproto.uint32_field(1)
+    lang: str = betterproto.string_field(2)
+    channel: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetVerifiedHidden(Message):
+    verified_hidden: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSubmitQuestionnaire(Message):
+    questionnaire_id: int = betterproto.uint32_field(1)
+    questionnaire_version_id: int = betterproto.uint32_field(2)
+    answers: List["ReqSubmitQuestionnaireQuestionnaireAnswer"] = (
+        betterproto.message_field(3)
+    )
+    open_time: int = betterproto.uint32_field(4)
+    finish_time: int = betterproto.uint32_field(5)
+    client: str = betterproto.string_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSubmitQuestionnaireQuestionnaireAnswer(Message):
+    question_id: int = betterproto.uint32_field(1)
+    values: List[
+        "ReqSubmitQuestionnaireQuestionnaireAnswerQuestionnaireAnswerValue"
+    ] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSubmitQuestionnaireQuestionnaireAnswerQuestionnaireAnswerValue(
+    Message
+):
+    value: str = betterproto.string_field(1)
+    custom_input: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetFriendRoomRandomBotChar(Message):
+    disable_random_char: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchAccountGameHuRecords(Message):
+    uuid: str = betterproto.string_field(1)
+    category: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchAccountInfoExtra(Message):
+    account_id: int = betterproto.uint32_field(1)
+    category: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSetAccountFavoriteHu(Message):
+    mode: int = betterproto.uint32_field(1)
+    category: int = betterproto.uint32_field(2)
+    type: int = betterproto.uint32_field(3)
+    uuid: str = betterproto.string_field(4)
+    chang: int = betterproto.uint32_field(5)
+    ju: int = betterproto.uint32_field(6)
+    ben: int = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchSeerReport(Message):
+    uuid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqCreateSeerReport(Message):
+    uuid: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSelectChestChooseUp(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    selection: int = betterproto.uint32_field(2)
+    chest_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSelectChestChooseGroupActivity(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    selection: int = betterproto.uint32_field(2)
+    chest_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGenerateAnnualReportToken(Message):
+    lang: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRemarkFriend(Message):
+    account_id: int = betterproto.uint32_field(1)
+    remark: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivityFetchInfo(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivityStartSeason(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivityTrain(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    ability: int = betterproto.uint32_field(2)
+    skip: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivitySelectEvent(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    selection_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivityStartMatch(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivityEndMatch(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivityGiveUp(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSimV2ActivitySetUpgrade(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    upgrade: "SimulationV2Ability" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqProgressRewardActivityReceive(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    progresses: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchProgressRewardActivityInfo(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqShootActivityAttackEnemies(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    bullets_count: int = betterproto.uint32_field(2)
+    position: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqQuestCrewActivityStartQuest(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    joined_members: List[int] = betterproto.uint32_field(2)
+    quest_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqQuestCrewActivityHire(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    member_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqQuestCrewActivityFeed(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    member_id: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqQuestCrewActivityRefreshMarket(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBingoActivityReceiveReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    rewards: List["ReqBingoActivityReceiveRewardBingoReward"] = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ReqBingoActivityReceiveRewardBingoReward(Message):
+    reward_id: int = betterproto.uint32_field(1)
+    card_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqFetchBingoActivityData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSnowballActivityStartBattle(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSnowballActivityFinishBattle(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    player_action: List["ActivitySnowballPlayerAction"] = betterproto.message_field(2)
+    result: int = betterproto.uint32_field(3)
+    battle_id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSnowballActivityUpgrade(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    upgrade: List["ActivitySnowballUpgrade"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSnowballActivityReceiveReward(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    level: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqMarathonActivityStartRace(Message):
+    activity_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqMarathonActivityFinishRace(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    race_data: List["ActivityMarathonCheckData"] = betterproto.message_field(2)
+    record: "MarathonGameRecord" = betterproto.message_field(3)
+    race_id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAuthGame(Message):
+    account_id: int = betterproto.uint32_field(1)
+    token: str = betterproto.string_field(2)
+    game_uuid: str = betterproto.string_field(3)
+    device: "ClientDeviceInfo" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSyncGame(Message):
+    round_id: str = betterproto.string_field(1)
+    step: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqSelfOperation(Message):
+    type: int = betterproto.uint32_field(1)
+    index: int = betterproto.uint32_field(2)
+    tile: str = betterproto.string_field(3)
+    cancel_operation: bool = betterproto.bool_field(4)
+    moqie: bool = betterproto.bool_field(5)
+    timeuse: int = betterproto.uint32_field(6)
+    tile_state: int = betterproto.int32_field(7)
+    change_tiles: List[str] = betterproto.string_field(8)
+    tile_states: List[int] = betterproto.int32_field(9)
+    gap_type: int = betterproto.uint32_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class ReqChiPengGang(Message):
+    type: int = betterproto.uint32_field(1)
+    index: int = betterproto.uint32_field(2)
+    cancel_operation: bool = betterproto.bool_field(3)
+    timeuse: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ReqBroadcastInGame(Message):
+    content: str = betterproto.string_field(1)
+    except_self: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ReqGmCommandInGaming(Message):
+    json_data: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqVoteGameEnd(Message):
+    yes: bool = betterproto.bool_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqAuthObserve(Message):
+    token: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRequestConnection(Message):
+    type: int = betterproto.uint32_field(2)
+    route_id: str = betterproto.string_field(3)
+    timestamp: int = betterproto.uint64_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ReqRequestRouteChange(Message):
+    before: str = betterproto.string_field(1)
+    route_id: str = betterproto.string_field(2)
+    type: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ReqHeartbeat(Message):
+    delay: int = betterproto.uint32_field(1)
+    no_operation_counter: int = betterproto.uint32_field(2)
+    platform: int = betterproto.uint32_field(3)
+    network_quality: int = betterproto.uint32_field(4)
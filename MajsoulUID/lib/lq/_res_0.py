@@ -0,0 +1,338 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResCommon(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountUpdate(Message):
+    error: "Error" = betterproto.message_field(1)
+    update: "AccountUpdate" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResConnectionInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    client_endpoint: "NetworkEndpoint" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchQueueInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    remain: int = betterproto.uint32_field(2)
+    rank: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResSignupAccount(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResLogin(Message):
+    error: "Error" = betterproto.message_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    account: "Account" = betterproto.message_field(3)
+    game_info: "GameConnectInfo" = betterproto.message_field(4)
+    has_unread_announcement: bool = betterproto.bool_field(5)
+    access_token: str = betterproto.string_field(6)
+    signup_time: int = betterproto.uint32_field(7)
+    is_id_card_authed: bool = betterproto.bool_field(8)
+    country: str = betterproto.string_field(9)
+    logined_version: List[int] = betterproto.uint32_field(10)
+    rewarded_version: List[int] = betterproto.uint32_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ResFastLogin(Message):
+    error: "Error" = betterproto.message_field(1)
+    game_info: "GameConnectInfo" = betterproto.message_field(2)
+    room: "Room" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResVerfiyCodeForSecure(Message):
+    error: "Error" = betterproto.message_field(1)
+    secure_token: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchPhoneLoginBind(Message):
+    error: "Error" = betterproto.message_field(1)
+    phone_login: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResOauth2Auth(Message):
+    error: "Error" = betterproto.message_field(1)
+    access_token: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResOauth2Check(Message):
+    error: "Error" = betterproto.message_field(1)
+    has_account: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResOauth2Signup(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResDmmPreLogin(Message):
+    error: "Error" = betterproto.message_field(2)
+    parameter: str = betterproto.string_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResLogout(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResSearchAccountbyEidLobby(Message):
+    error: "Error" = betterproto.message_field(1)
+    account_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    account: "Account" = betterproto.message_field(2)
+    room: "Room" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResSelfRoom(Message):
+    error: "Error" = betterproto.message_field(1)
+    room: "Room" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchGamingInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    game_info: "GameConnectInfo" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateRoom(Message):
+    error: "Error" = betterproto.message_field(1)
+    room: "Room" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResJoinRoom(Message):
+    error: "Error" = betterproto.message_field(1)
+    room: "Room" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountStatisticInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    statistic_data: List["AccountStatisticData"] = betterproto.message_field(2)
+    detail_data: "AccountDetailStatisticV2" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountChallengeRankInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    season_info: List["ResAccountChallengeRankInfoChallengeRank"] = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountChallengeRankInfoChallengeRank(Message):
+    season: int = betterproto.uint32_field(1)
+    rank: int = betterproto.uint32_field(2)
+    level: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountCharacterInfo(Message):
+    error: "Error" = betterproto.message_field(2)
+    unlock_list: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResShopPurchase(Message):
+    error: "Error" = betterproto.message_field(1)
+    update: "AccountUpdate" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecord(Message):
+    error: "Error" = betterproto.message_field(1)
+    head: "RecordGame" = betterproto.message_field(3)
+    data: bytes = betterproto.bytes_field(4)
+    data_url: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecordList(Message):
+    error: "Error" = betterproto.message_field(1)
+    total_count: int = betterproto.uint32_field(2)
+    record_list: List["RecordGame"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecordListV2(Message):
+    error: "Error" = betterproto.message_field(1)
+    iterator: str = betterproto.string_field(2)
+    iterator_expire: int = betterproto.uint32_field(3)
+    actual_begin_time: int = betterproto.uint32_field(4)
+    actual_end_time: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResNextGameRecordList(Message):
+    error: "Error" = betterproto.message_field(1)
+    next: bool = betterproto.bool_field(2)
+    entries: List["RecordListEntry"] = betterproto.message_field(3)
+    iterator_expire: int = betterproto.uint32_field(4)
+    next_end_time: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResCollectedGameRecordList(Message):
+    error: "Error" = betterproto.message_field(1)
+    record_list: List["RecordCollectedData"] = betterproto.message_field(2)
+    record_collect_limit: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecordsDetail(Message):
+    error: "Error" = betterproto.message_field(1)
+    record_list: List["RecordGame"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameRecordsDetailV2(Message):
+    error: "Error" = betterproto.message_field(1)
+    entries: List["RecordListEntry"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAddCollectedGameRecord(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResRemoveCollectedGameRecord(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResChangeCollectedGameRecordRemarks(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResLevelLeaderboard(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResLevelLeaderboardItem"] = betterproto.message_field(2)
+    self_rank: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResLevelLeaderboardItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    level: "AccountLevel" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResChallengeLeaderboard(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResChallengeLeaderboardItem"] = betterproto.message_field(2)
+    self_rank: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResChallengeLeaderboardItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResMutiChallengeLevel(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResMutiChallengeLevelItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResMutiChallengeLevelItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResMultiAccountBrief(Message):
+    error: "Error" = betterproto.message_field(1)
+    players: List["PlayerBaseView"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFriendList(Message):
+    error: "Error" = betterproto.message_field(1)
+    friends: List["Friend"] = betterproto.message_field(2)
+    friend_max_count: int = betterproto.uint32_field(3)
+    friend_count: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFriendApplyList(Message):
+    error: "Error" = betterproto.message_field(1)
+    applies: List["ResFriendApplyListFriendApply"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFriendApplyListFriendApply(Message):
+    account_id: int = betterproto.uint32_field(1)
+    apply_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSearchAccountByPattern(Message):
+    error: "Error" = betterproto.message_field(1)
+    is_finished: bool = betterproto.bool_field(2)
+    match_accounts: List[int] = betterproto.uint32_field(3)
+    decode_id: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountStates(Message):
+    error: "Error" = betterproto.message_field(1)
+    states: List["AccountActiveState"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSearchAccountById(Message):
+    error: "Error" = betterproto.message_field(1)
+    player: "PlayerBaseView" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResBagInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    bag: "Bag" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenRandomRewardItem(Message):
+    error: "Error" = betterproto.message_field(1)
+    results: List["OpenResult"] = betterproto.message_field(2)
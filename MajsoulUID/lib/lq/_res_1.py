@@ -0,0 +1,337 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenAllRewardItem(Message):
+    error: "Error" = betterproto.message_field(1)
+    results: List["OpenResult"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAnnouncement(Message):
+    error: "Error" = betterproto.message_field(1)
+    announcements: List["Announcement"] = betterproto.message_field(2)
+    sort: List[int] = betterproto.uint32_field(3)
+    read_list: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResMailInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    mails: List["Mail"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveAchievementGroupReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    execute_reward: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveAchievementReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    execute_reward: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAchievementRate(Message):
+    error: "Error" = betterproto.message_field(2)
+    rate: List["ResFetchAchievementRateAchievementRate"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAchievementRateAchievementRate(Message):
+    id: int = betterproto.uint32_field(1)
+    rate: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAchievement(Message):
+    error: "Error" = betterproto.message_field(1)
+    progresses: List["AchievementProgress"] = betterproto.message_field(2)
+    rewarded_group: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResTitleList(Message):
+    error: "Error" = betterproto.message_field(1)
+    title_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResClientValue(Message):
+    error: "Error" = betterproto.message_field(3)
+    datas: List["ResClientValueValue"] = betterproto.message_field(1)
+    recharged_count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResClientValueValue(Message):
+    key: int = betterproto.uint32_field(1)
+    value: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCurrentMatchInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    matches: List["ResCurrentMatchInfoCurrentMatchInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCurrentMatchInfoCurrentMatchInfo(Message):
+    mode_id: int = betterproto.uint32_field(1)
+    playing_count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReviveCoinInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    has_gained: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResDailyTask(Message):
+    error: "Error" = betterproto.message_field(1)
+    progresses: List["TaskProgress"] = betterproto.message_field(2)
+    has_refresh_count: bool = betterproto.bool_field(3)
+    max_daily_task_count: int = betterproto.uint32_field(4)
+    refresh_count: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResRefreshDailyTask(Message):
+    error: "Error" = betterproto.message_field(1)
+    progress: "TaskProgress" = betterproto.message_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResUseGiftCode(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["RewardSlot"] = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResUseSpecialGiftCode(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameLiveInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    left_start_seconds: int = betterproto.uint32_field(2)
+    live_head: "GameLiveHead" = betterproto.message_field(3)
+    segments: List["GameLiveSegmentUri"] = betterproto.message_field(4)
+    now_millisecond: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameLiveLeftSegment(Message):
+    error: "Error" = betterproto.message_field(1)
+    live_state: int = betterproto.uint32_field(2)
+    segments: List["GameLiveSegmentUri"] = betterproto.message_field(4)
+    now_millisecond: int = betterproto.uint32_field(5)
+    segment_end_millisecond: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameLiveList(Message):
+    error: "Error" = betterproto.message_field(1)
+    live_list: List["GameLiveHead"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCommentSetting(Message):
+    error: "Error" = betterproto.message_field(1)
+    comment_allow: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCommentList(Message):
+    error: "Error" = betterproto.message_field(1)
+    comment_allow: int = betterproto.uint32_field(2)
+    comment_id_list: List[int] = betterproto.uint32_field(3)
+    last_read_id: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCommentContent(Message):
+    error: "Error" = betterproto.message_field(1)
+    comments: List["CommentItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRollingNotice(Message):
+    error: "Error" = betterproto.message_field(2)
+    notice: "RollingNotice" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchMaintainNotice(Message):
+    error: "Error" = betterproto.message_field(1)
+    notice: "MaintainNotice" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResServerTime(Message):
+    server_time: int = betterproto.uint32_field(1)
+    error: "Error" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResPlatformBillingProducts(Message):
+    error: "Error" = betterproto.message_field(1)
+    products: List["BillingProduct"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateBillingOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateWechatNativeOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    qrcode_buffer: str = betterproto.string_field(2)
+    order_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateWechatAppOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    call_wechat_app_param: "ResCreateWechatAppOrderCallWechatAppParam" = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateWechatAppOrderCallWechatAppParam(Message):
+    appid: str = betterproto.string_field(1)
+    partnerid: str = betterproto.string_field(2)
+    prepayid: str = betterproto.string_field(3)
+    package: str = betterproto.string_field(4)
+    noncestr: str = betterproto.string_field(5)
+    timestamp: str = betterproto.string_field(6)
+    sign: str = betterproto.string_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateAlipayOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    alipay_url: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateAlipayScanOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    qrcode_buffer: str = betterproto.string_field(2)
+    order_id: str = betterproto.string_field(3)
+    qr_code: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateAlipayAppOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    alipay_url: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpCreditCardOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpPaypalOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpAuOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpDocomoOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpWebMoneyOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpSoftbankOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpPayPayOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchJpCommonCreditCardOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateJpgmoOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateYostarOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateEnPaypalOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateEnjcbOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateEnMasterCardOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateEnVisaOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateEnAlipayOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
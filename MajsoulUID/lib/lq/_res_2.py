@@ -0,0 +1,359 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateKrPaypalOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateKrjcbOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateKrMasterCardOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateKrVisaOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateKrAlipayOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateDmmOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+    transaction_id: str = betterproto.string_field(3)
+    dmm_user_id: str = betterproto.string_field(4)
+    token: str = betterproto.string_field(5)
+    callback_url: str = betterproto.string_field(6)
+    request_time: str = betterproto.string_field(9)
+    dmm_app_id: str = betterproto.string_field(10)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateIapOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResVerificationIapOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateSteamOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+    platform_order_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResRandomCharacter(Message):
+    error: "Error" = betterproto.message_field(1)
+    enabled: bool = betterproto.bool_field(2)
+    pool: List["RandomCharacter"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateMyCardOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    auth_code: str = betterproto.string_field(2)
+    order_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreatePaypalOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+    url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateXsollaOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    order_id: str = betterproto.string_field(2)
+    url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenChest(Message):
+    error: "Error" = betterproto.message_field(1)
+    results: List["OpenResult"] = betterproto.message_field(2)
+    total_open_count: int = betterproto.uint32_field(3)
+    faith_count: int = betterproto.uint32_field(4)
+    chest_replace_up: List["ResOpenChestChestReplaceCountData"] = (
+        betterproto.message_field(5)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenChestChestReplaceCountData(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResBuyFromChestShop(Message):
+    error: "Error" = betterproto.message_field(1)
+    chest_id: int = betterproto.uint32_field(2)
+    consume_count: int = betterproto.uint32_field(3)
+    faith_count: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResDailySignInInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    sign_in_days: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResDoActivitySignIn(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ResDoActivitySignInRewardData"] = betterproto.message_field(2)
+    sign_in_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResDoActivitySignInRewardData(Message):
+    resource_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCharacterInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    characters: List["Character"] = betterproto.message_field(2)
+    skins: List[int] = betterproto.uint32_field(3)
+    main_character_id: int = betterproto.uint32_field(4)
+    send_gift_count: int = betterproto.uint32_field(5)
+    send_gift_limit: int = betterproto.uint32_field(6)
+    finished_endings: List[int] = betterproto.uint32_field(7)
+    rewarded_endings: List[int] = betterproto.uint32_field(8)
+    character_sort: List[int] = betterproto.uint32_field(9)
+    hidden_characters: List[int] = betterproto.uint32_field(10)
+    other_character_sort: List[int] = betterproto.uint32_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ResSetHiddenCharacter(Message):
+    error: "Error" = betterproto.message_field(1)
+    hidden_characters: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSendGiftToCharacter(Message):
+    error: "Error" = betterproto.message_field(1)
+    level: int = betterproto.uint32_field(2)
+    exp: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResCommonView(Message):
+    error: "Error" = betterproto.message_field(1)
+    slots: List["ResCommonViewSlot"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCommonViewSlot(Message):
+    slot: int = betterproto.uint32_field(1)
+    value: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCommonViews(Message):
+    error: "Error" = betterproto.message_field(2)
+    views: List["ViewSlot"] = betterproto.message_field(1)
+    name: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAllcommonViews(Message):
+    views: List["ResAllcommonViewsViews"] = betterproto.message_field(1)
+    use: int = betterproto.uint32_field(2)
+    error: "Error" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAllcommonViewsViews(Message):
+    values: List["ViewSlot"] = betterproto.message_field(1)
+    index: int = betterproto.uint32_field(2)
+    name: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResUpgradeCharacter(Message):
+    error: "Error" = betterproto.message_field(1)
+    character: "Character" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResShopInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    shop_info: "ShopInfo" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResBuyFromShop(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["RewardSlot"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResPayMonthTicket(Message):
+    error: "Error" = betterproto.message_field(1)
+    resource_id: int = betterproto.uint32_field(2)
+    resource_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResRefreshZhpShop(Message):
+    error: "Error" = betterproto.message_field(1)
+    zhp: "ZhpShop" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResMonthTicketInfo(Message):
+    error: "Error" = betterproto.message_field(2)
+    month_ticket_info: "MonthTicketInfo" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResServerSettings(Message):
+    error: "Error" = betterproto.message_field(2)
+    settings: "ServerSettings" = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountSettings(Message):
+    error: "Error" = betterproto.message_field(1)
+    settings: List["AccountSetting"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResModNicknameTime(Message):
+    error: "Error" = betterproto.message_field(2)
+    last_mod_time: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResMisc(Message):
+    error: "Error" = betterproto.message_field(1)
+    recharged_list: List[int] = betterproto.uint32_field(2)
+    faiths: List["ResMiscMiscFaithData"] = betterproto.message_field(3)
+    verified_hidden: int = betterproto.uint32_field(4)
+    verified_value: int = betterproto.uint32_field(5)
+    disable_room_random_bot_char: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResMiscMiscFaithData(Message):
+    faith_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResIdCardInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    is_authed: bool = betterproto.bool_field(2)
+    country: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResVipReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    gained_vip_levels: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRefundOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    orders: List["ResFetchRefundOrderOrderInfo"] = betterproto.message_field(2)
+    clear_deadline: int = betterproto.uint32_field(3)
+    message: List["I18NContext"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRefundOrderOrderInfo(Message):
+    success_time: int = betterproto.uint32_field(1)
+    goods_id: int = betterproto.uint32_field(2)
+    cleared: int = betterproto.uint32_field(3)
+    order_id: str = betterproto.string_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCustomizedContestList(Message):
+    error: "Error" = betterproto.message_field(1)
+    contests: List["CustomizedContestBase"] = betterproto.message_field(2)
+    follow_contests: List["CustomizedContestBase"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCustomizedContestAuthInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    observer_level: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResEnterCustomizedContest(Message):
+    error: "Error" = betterproto.message_field(1)
+    detail_info: "CustomizedContestDetail" = betterproto.message_field(2)
+    player_report: "CustomizedContestPlayerReport" = betterproto.message_field(3)
+    is_followed: bool = betterproto.bool_field(4)
+    state: int = betterproto.uint32_field(5)
+    is_admin: bool = betterproto.bool_field(6)
+    game_plan: "CustomizedContestGamePlan" = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCustomizedContestOnlineInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    online_player: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCustomizedContestByContestId(Message):
+    error: "Error" = betterproto.message_field(1)
+    contest_info: "CustomizedContestAbstract" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSignupCustomizedContest(Message):
+    error: "Error" = betterproto.message_field(1)
+    state: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResJoinCustomizedContestChatRoom(Message):
+    error: "Error" = betterproto.message_field(1)
+    token: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCustomizedContestGameLiveList(Message):
+    error: "Error" = betterproto.message_field(1)
+    live_list: List["GameLiveHead"] = betterproto.message_field(2)
@@ -0,0 +1,442 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchCustomizedContestGameRecords(Message):
+    error: "Error" = betterproto.message_field(1)
+    next_index: int = betterproto.uint32_field(2)
+    record_list: List["RecordGame"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResActivityList(Message):
+    error: "Error" = betterproto.message_field(1)
+    activities: List["Activity"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityData(Message):
+    error: "Error" = betterproto.message_field(1)
+    exchange_records: List["ExchangeRecord"] = betterproto.message_field(2)
+    task_progress_list: List["TaskProgress"] = betterproto.message_field(3)
+    accumulated_point_list: List["ActivityAccumulatedPointData"] = (
+        betterproto.message_field(4)
+    )
+    rank_data_list: List["ActivityRankPointData"] = betterproto.message_field(5)
+    flip_task_progress_list: List["TaskProgress"] = betterproto.message_field(6)
+    sign_in_data: List["ResAccountActivityDataActivitySignInData"] = (
+        betterproto.message_field(7)
+    )
+    richman_data: List["ResAccountActivityDataActivityRichmanData"] = (
+        betterproto.message_field(8)
+    )
+    period_task_progress_list: List["TaskProgress"] = betterproto.message_field(9)
+    random_task_progress_list: List["TaskProgress"] = betterproto.message_field(10)
+    chest_up_data: List["ResAccountActivityDataChestUpData"] = (
+        betterproto.message_field(11)
+    )
+    sns_data: "ResAccountActivityDataActivitySnsData" = betterproto.message_field(12)
+    mine_data: List["MineActivityData"] = betterproto.message_field(13)
+    rpg_data: List["RpgActivity"] = betterproto.message_field(14)
+    arena_data: List["ActivityArenaData"] = betterproto.message_field(15)
+    feed_data: List["FeedActivityData"] = betterproto.message_field(16)
+    segment_task_progress_list: List["SegmentTaskProgress"] = betterproto.message_field(
+        17
+    )
+    vote_records: List["VoteData"] = betterproto.message_field(18)
+    spot_data: List["ActivitySpotData"] = betterproto.message_field(19)
+    friend_gift_data: List["ActivityFriendGiftData"] = betterproto.message_field(20)
+    upgrade_data: List["ActivityUpgradeData"] = betterproto.message_field(21)
+    gacha_data: List["ActivityGachaUpdateData"] = betterproto.message_field(22)
+    simulation_data: List["ActivitySimulationData"] = betterproto.message_field(23)
+    combining_data: List["ActivityCombiningLqData"] = betterproto.message_field(24)
+    village_data: List["ActivityVillageData"] = betterproto.message_field(25)
+    festival_data: List["ActivityFestivalData"] = betterproto.message_field(26)
+    island_data: List["ActivityIslandData"] = betterproto.message_field(27)
+    story_data: List["ActivityStoryData"] = betterproto.message_field(29)
+    choose_up_data: List["ActivityChooseUpData"] = betterproto.message_field(30)
+    progress_reward_data: List["ActivityProgressRewardData"] = (
+        betterproto.message_field(32)
+    )
+    quest_crew_data: List["ActivityQuestCrewData"] = betterproto.message_field(33)
+    shoot_data: List["ActivityShootData"] = betterproto.message_field(34)
+    bingo_data: List["ActivityBingoData"] = betterproto.message_field(35)
+    snowball_data: List["ActivitySnowballData"] = betterproto.message_field(36)
+    marathon_data: List["ActivityMarathonData"] = betterproto.message_field(37)
+    choose_group_up_data: List["ActivityChooseGroupData"] = betterproto.message_field(
+        38
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataActivitySignInData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    sign_in_count: int = betterproto.uint32_field(2)
+    last_sign_in_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataBuffData(Message):
+    type: int = betterproto.uint32_field(1)
+    remain: int = betterproto.uint32_field(2)
+    effect: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataActivityRichmanData(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    location: int = betterproto.uint32_field(2)
+    finished_count: int = betterproto.uint32_field(3)
+    chest_position: int = betterproto.uint32_field(4)
+    bank_save: int = betterproto.uint32_field(5)
+    exp: int = betterproto.uint32_field(6)
+    buff: List["ResAccountActivityDataBuffData"] = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataChestUpData(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAccountActivityDataActivitySnsData(Message):
+    blog: List["SnsBlog"] = betterproto.message_field(1)
+    liked_id: List[int] = betterproto.uint32_field(2)
+    reply: List["SnsReply"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResExchangeActivityItem(Message):
+    error: "Error" = betterproto.message_field(1)
+    execute_reward: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveActivityFlipTask(Message):
+    count: int = betterproto.uint32_field(1)
+    error: "Error" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveActivityFlipTaskBatch(Message):
+    error: "Error" = betterproto.message_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCompleteSegmentTaskReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityFlipInfo(Message):
+    rewards: List[int] = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    error: "Error" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResCompleteActivityFlipTaskBatch(Message):
+    error: "Error" = betterproto.message_field(1)
+    total_rewards: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRankPointLeaderboard(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResFetchRankPointLeaderboardItem"] = betterproto.message_field(2)
+    last_refresh_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRankPointLeaderboardItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    rank: int = betterproto.uint32_field(2)
+    view: "PlayerBaseView" = betterproto.message_field(3)
+    point: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanNextMove(Message):
+    paths: List["ResRichmanNextMovePathData"] = betterproto.message_field(1)
+    dice: int = betterproto.uint32_field(2)
+    location: int = betterproto.uint32_field(3)
+    finished_count: int = betterproto.uint32_field(4)
+    step: int = betterproto.uint32_field(5)
+    buff: List["ResRichmanNextMoveBuffData"] = betterproto.message_field(6)
+    bank_save: int = betterproto.uint32_field(7)
+    chest_position: int = betterproto.uint32_field(8)
+    exp: int = betterproto.uint32_field(9)
+    bank_save_add: int = betterproto.uint32_field(10)
+    error: "Error" = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanNextMoveRewardData(Message):
+    resource_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+    origin_count: int = betterproto.uint32_field(3)
+    type: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanNextMovePathData(Message):
+    location: int = betterproto.uint32_field(1)
+    rewards: List["ResRichmanNextMoveRewardData"] = betterproto.message_field(2)
+    events: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanNextMoveBuffData(Message):
+    type: int = betterproto.uint32_field(1)
+    remain: int = betterproto.uint32_field(2)
+    effect: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanChestInfo(Message):
+    items: List["ResRichmanChestInfoItemData"] = betterproto.message_field(1)
+    error: "Error" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResRichmanChestInfoItemData(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateGameObserveAuth(Message):
+    error: "Error" = betterproto.message_field(1)
+    token: str = betterproto.string_field(2)
+    location: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResRefreshGameObserveAuth(Message):
+    error: "Error" = betterproto.message_field(1)
+    ttl: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResActivityBuff(Message):
+    error: "Error" = betterproto.message_field(1)
+    buff_list: List["ActivityBuffData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResUpgradeActivityLevel(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveUpgradeActivityReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveAllActivityGift(Message):
+    error: "Error" = betterproto.message_field(1)
+    rewards: List["ExecuteReward"] = betterproto.message_field(2)
+    receive_gift: List["ResReceiveAllActivityGiftReceiveRewards"] = (
+        betterproto.message_field(3)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveAllActivityGiftReceiveRewards(Message):
+    id: int = betterproto.uint32_field(1)
+    from_account_id: int = betterproto.uint32_field(2)
+    item_id: int = betterproto.uint32_field(3)
+    count: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResUpgradeChallenge(Message):
+    error: "Error" = betterproto.message_field(1)
+    task_progress: List["TaskProgress"] = betterproto.message_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    level: int = betterproto.uint32_field(4)
+    match_count: int = betterproto.uint32_field(5)
+    ticket_id: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResRefreshChallenge(Message):
+    error: "Error" = betterproto.message_field(1)
+    task_progress: List["TaskProgress"] = betterproto.message_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    level: int = betterproto.uint32_field(4)
+    match_count: int = betterproto.uint32_field(5)
+    ticket_id: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchChallengeInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    task_progress: List["TaskProgress"] = betterproto.message_field(2)
+    refresh_count: int = betterproto.uint32_field(3)
+    level: int = betterproto.uint32_field(4)
+    match_count: int = betterproto.uint32_field(5)
+    ticket_id: int = betterproto.uint32_field(6)
+    rewarded_season: List[int] = betterproto.uint32_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAbMatch(Message):
+    error: "Error" = betterproto.message_field(1)
+    match_id: int = betterproto.uint32_field(2)
+    match_count: int = betterproto.uint32_field(3)
+    buy_in_count: int = betterproto.uint32_field(4)
+    point: int = betterproto.uint32_field(5)
+    rewarded: bool = betterproto.bool_field(6)
+    match_max_point: List["ResFetchAbMatchMatchPoint"] = betterproto.message_field(7)
+    quit: bool = betterproto.bool_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAbMatchMatchPoint(Message):
+    match_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResChallengeSeasonInfo(Message):
+    error: "Error" = betterproto.message_field(2)
+    challenge_season_list: List["ResChallengeSeasonInfoChallengeInfo"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResChallengeSeasonInfoChallengeInfo(Message):
+    season_id: int = betterproto.uint32_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    state: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveChallengeRankReward(Message):
+    error: "Error" = betterproto.message_field(2)
+    rewards: List["ResReceiveChallengeRankRewardReward"] = betterproto.message_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveChallengeRankRewardReward(Message):
+    resource_id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGamePointRank(Message):
+    error: "Error" = betterproto.message_field(1)
+    rank: List["ResGamePointRankRankInfo"] = betterproto.message_field(2)
+    self_rank: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResGamePointRankRankInfo(Message):
+    account_id: int = betterproto.uint32_field(1)
+    point: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSelfGamePointRank(Message):
+    error: "Error" = betterproto.message_field(1)
+    self_rate: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReadSns(Message):
+    error: "Error" = betterproto.message_field(1)
+    sns_content: "SnsBlog" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReplySns(Message):
+    error: "Error" = betterproto.message_field(1)
+    sns_reply: "SnsReply" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResLikeSns(Message):
+    error: "Error" = betterproto.message_field(1)
+    is_liked: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResDigMine(Message):
+    error: "Error" = betterproto.message_field(1)
+    map: List["MineReward"] = betterproto.message_field(2)
+    reward: List["RewardSlot"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchLastPrivacy(Message):
+    error: "Error" = betterproto.message_field(1)
+    privacy: List["ResFetchLastPrivacyPrivacyInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchLastPrivacyPrivacyInfo(Message):
+    type: int = betterproto.uint32_field(1)
+    version: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistory(Message):
+    error: "Error" = betterproto.message_field(1)
+    battle_result: List["ResFetchRpgBattleHistoryBattleResult"] = (
+        betterproto.message_field(2)
+    )
+    start_state: "RpgState" = betterproto.message_field(3)
+    current_state: "RpgState" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistoryBattleResult(Message):
+    uuid: str = betterproto.string_field(14)
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    target: int = betterproto.uint32_field(4)
+    damage: int = betterproto.uint32_field(5)
+    heal: int = betterproto.uint32_field(6)
+    monster_seq: int = betterproto.uint32_field(7)
+    chain_atk: int = betterproto.uint32_field(8)
+    killed: int = betterproto.uint32_field(9)
+    is_luk: int = betterproto.uint32_field(10)
+    is_dex: int = betterproto.uint32_field(11)
+    is_extra: int = betterproto.uint32_field(12)
+    reward: str = betterproto.string_field(13)
+    points: int = betterproto.uint32_field(15)
+    is_zimo: int = betterproto.uint32_field(16)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistoryV2(Message):
+    error: "Error" = betterproto.message_field(1)
+    battle_result: List["ResFetchRpgBattleHistoryV2BattleResultV2"] = (
+        betterproto.message_field(2)
+    )
+    start_state: "RpgState" = betterproto.message_field(3)
+    current_state: "RpgState" = betterproto.message_field(4)
+    recent_battle_result: List["ResFetchRpgBattleHistoryV2BattleResultV2"] = (
+        betterproto.message_field(5)
+    )
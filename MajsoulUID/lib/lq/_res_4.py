@@ -0,0 +1,382 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchRpgBattleHistoryV2BattleResultV2(Message):
+    uuid: str = betterproto.string_field(14)
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    damage: int = betterproto.uint32_field(5)
+    monster_seq: int = betterproto.uint32_field(7)
+    killed: int = betterproto.uint32_field(9)
+    buff: List["ActivityBuffData"] = betterproto.message_field(10)
+    points: int = betterproto.uint32_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ResArenaReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResArenaRewardRewardItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResArenaRewardRewardItem(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveRpgRewards(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResReceiveRpgRewardsRewardItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveRpgRewardsRewardItem(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchObToken(Message):
+    error: "Error" = betterproto.message_field(1)
+    token: str = betterproto.string_field(2)
+    create_time: int = betterproto.uint32_field(3)
+    delay: int = betterproto.uint32_field(4)
+    start_time: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveCharacterRewards(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResReceiveCharacterRewardsRewardItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveCharacterRewardsRewardItem(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFeedActivityFeed(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResFeedActivityFeedRewardItem"] = betterproto.message_field(2)
+    feed_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFeedActivityFeedRewardItem(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSendActivityGiftToFriend(Message):
+    error: "Error" = betterproto.message_field(1)
+    send_gift_count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchFriendGiftActivityData(Message):
+    error: "Error" = betterproto.message_field(1)
+    list: List["ResFetchFriendGiftActivityDataFriendData"] = betterproto.message_field(
+        2
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchFriendGiftActivityDataItemCountData(Message):
+    item: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchFriendGiftActivityDataFriendData(Message):
+    account_id: int = betterproto.uint32_field(1)
+    items: List["ResFetchFriendGiftActivityDataItemCountData"] = (
+        betterproto.message_field(2)
+    )
+    receive_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenPreChestItem(Message):
+    error: "Error" = betterproto.message_field(1)
+    results: List["OpenResult"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchVoteActivity(Message):
+    error: "Error" = betterproto.message_field(1)
+    update_time: int = betterproto.uint32_field(3)
+    data: List["ResFetchVoteActivityVoteRankData"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchVoteActivityVoteRankData(Message):
+    id: int = betterproto.uint32_field(1)
+    share: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResVoteActivity(Message):
+    error: "Error" = betterproto.message_field(1)
+    vote_records: List["VoteData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveActivitySpotReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResReceiveActivitySpotRewardRewardItem"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveActivitySpotRewardRewardItem(Message):
+    id: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchOauth2(Message):
+    error: "Error" = betterproto.message_field(1)
+    openid: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResDeleteAccount(Message):
+    error: "Error" = betterproto.message_field(1)
+    delete_time: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchShopInterval(Message):
+    error: "Error" = betterproto.message_field(1)
+    result: List["ResFetchShopIntervalShopInterval"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchShopIntervalShopInterval(Message):
+    group_id: int = betterproto.uint32_field(1)
+    interval: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityInterval(Message):
+    error: "Error" = betterproto.message_field(1)
+    result: List["ResFetchActivityIntervalActivityInterval"] = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityIntervalActivityInterval(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    interval: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchrecentFriend(Message):
+    error: "Error" = betterproto.message_field(1)
+    account_list: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResOpenGacha(Message):
+    error: "Error" = betterproto.message_field(1)
+    result_list: List[int] = betterproto.uint32_field(2)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(3)
+    sp_reward_items: List["ExecuteReward"] = betterproto.message_field(4)
+    remain_count: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimulationActivityTrain(Message):
+    error: "Error" = betterproto.message_field(1)
+    result_type: int = betterproto.uint32_field(2)
+    final_stats: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSimulationGameRecord(Message):
+    error: "Error" = betterproto.message_field(1)
+    messages: List["ActivitySimulationGameRecordMessage"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResStartSimulationActivityGame(Message):
+    error: "Error" = betterproto.message_field(1)
+    records: List["ActivitySimulationGameRecord"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSimulationGameRank(Message):
+    error: "Error" = betterproto.message_field(1)
+    rank: List["ResFetchSimulationGameRankRankInfo"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSimulationGameRankRankInfo(Message):
+    character: int = betterproto.uint32_field(1)
+    score: float = betterproto.float_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGenerateCombiningCraft(Message):
+    error: "Error" = betterproto.message_field(1)
+    pos: int = betterproto.uint32_field(2)
+    craft_id: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResMoveCombiningCraft(Message):
+    error: "Error" = betterproto.message_field(1)
+    pos: int = betterproto.uint32_field(2)
+    combined: int = betterproto.uint32_field(3)
+    craft_id: int = betterproto.uint32_field(4)
+    bonus: "ResMoveCombiningCraftBonusData" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResMoveCombiningCraftBonusData(Message):
+    craft_id: int = betterproto.uint32_field(1)
+    pos: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCombiningRecycleCraft(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResRecoverCombiningRecycle(Message):
+    error: "Error" = betterproto.message_field(1)
+    craft_id: int = betterproto.uint32_field(2)
+    pos: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFinishCombiningOrder(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    server_time: "ResServerTime" = betterproto.message_field(2)
+    server_setting: "ResServerSettings" = betterproto.message_field(3)
+    client_value: "ResClientValue" = betterproto.message_field(4)
+    friend_list: "ResFriendList" = betterproto.message_field(5)
+    friend_apply_list: "ResFriendApplyList" = betterproto.message_field(6)
+    recent_friend: "ResFetchrecentFriend" = betterproto.message_field(7)
+    mail_info: "ResMailInfo" = betterproto.message_field(8)
+    receive_coin_info: "ResReviveCoinInfo" = betterproto.message_field(9)
+    title_list: "ResTitleList" = betterproto.message_field(10)
+    bag_info: "ResBagInfo" = betterproto.message_field(11)
+    shop_info: "ResShopInfo" = betterproto.message_field(12)
+    shop_interval: "ResFetchShopInterval" = betterproto.message_field(13)
+    activity_data: "ResAccountActivityData" = betterproto.message_field(14)
+    activity_interval: "ResFetchActivityInterval" = betterproto.message_field(15)
+    activity_buff: "ResActivityBuff" = betterproto.message_field(16)
+    vip_reward: "ResVipReward" = betterproto.message_field(17)
+    month_ticket_info: "ResMonthTicketInfo" = betterproto.message_field(18)
+    achievement: "ResAchievement" = betterproto.message_field(19)
+    comment_setting: "ResCommentSetting" = betterproto.message_field(20)
+    account_settings: "ResAccountSettings" = betterproto.message_field(21)
+    mod_nickname_time: "ResModNicknameTime" = betterproto.message_field(22)
+    misc: "ResMisc" = betterproto.message_field(23)
+    announcement: "ResAnnouncement" = betterproto.message_field(24)
+    activity_list: "ResActivityList" = betterproto.message_field(26)
+    character_info: "ResCharacterInfo" = betterproto.message_field(27)
+    all_common_views: "ResAllcommonViews" = betterproto.message_field(28)
+    collected_game_record_list: "ResCollectedGameRecordList" = (
+        betterproto.message_field(29)
+    )
+    maintain_notice: "ResFetchMaintainNotice" = betterproto.message_field(30)
+    random_character: "ResRandomCharacter" = betterproto.message_field(31)
+    maintenance_info: "ResFetchServerMaintenanceInfo" = betterproto.message_field(32)
+    seer_info: "ResFetchSeerInfo" = betterproto.message_field(33)
+    annual_report_info: "ResFetchAnnualReportInfo" = betterproto.message_field(34)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSeerInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    remain_count: int = betterproto.uint32_field(2)
+    date_limit: int = betterproto.uint32_field(3)
+    expire_time: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchServerMaintenanceInfo(Message):
+    function_maintenance: List[
+        "ResFetchServerMaintenanceInfoServerFunctionMaintenanceInfo"
+    ] = betterproto.message_field(1)
+    activity_maintenance: List[
+        "ResFetchServerMaintenanceInfoServerActivityMaintenanceInfo"
+    ] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchServerMaintenanceInfoServerFunctionMaintenanceInfo(Message):
+    name: str = betterproto.string_field(1)
+    open: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchServerMaintenanceInfoServerActivityMaintenanceInfo(Message):
+    activity_type: str = betterproto.string_field(1)
+    open: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveVillageBuildingReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResReceiveVillageTripReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCompleteVillageTask(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGetFriendVillageData(Message):
+    error: "Error" = betterproto.message_field(1)
+    list: List["ResGetFriendVillageDataFriendVillageData"] = betterproto.message_field(
+        2
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResGetFriendVillageDataFriendVillageData(Message):
+    account_id: int = betterproto.uint32_field(1)
+    level: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSetVillageWorker(Message):
+    error: "Error" = betterproto.message_field(1)
+    building: "VillageBuildingData" = betterproto.message_field(2)
+    update_time: int = betterproto.uint32_field(3)
@@ -0,0 +1,429 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResNextRoundVillage(Message):
+    error: "Error" = betterproto.message_field(1)
+    activity_data: "ActivityVillageData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResResolveFestivalActivityProposal(Message):
+    error: "Error" = betterproto.message_field(1)
+    effected_buff: List[int] = betterproto.uint32_field(2)
+    result: int = betterproto.uint32_field(3)
+    reward_items: List["ExecuteResult"] = betterproto.message_field(4)
+    level: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResResolveFestivalActivityEvent(Message):
+    error: "Error" = betterproto.message_field(1)
+    effected_buff: List[int] = betterproto.uint32_field(2)
+    reward_items: List["ExecuteResult"] = betterproto.message_field(4)
+    ending_id: int = betterproto.uint32_field(5)
+    level: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResBuyFestivalProposal(Message):
+    error: "Error" = betterproto.message_field(1)
+    new_proposal: "FestivalProposalData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateCustomizedContest(Message):
+    error: "Error" = betterproto.message_field(1)
+    unique_id: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchManagerCustomizedContestList(Message):
+    error: "Error" = betterproto.message_field(1)
+    contests: List["CustomizedContestBase"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchManagerCustomizedContest(Message):
+    error: "Error" = betterproto.message_field(1)
+    name: str = betterproto.string_field(2)
+    open_show: int = betterproto.uint32_field(3)
+    game_rule_setting: "GameMode" = betterproto.message_field(4)
+    start_time: int = betterproto.uint32_field(5)
+    end_time: int = betterproto.uint32_field(6)
+    auto_match: int = betterproto.uint32_field(7)
+    rank_rule: int = betterproto.uint32_field(8)
+    check_state: int = betterproto.uint32_field(9)
+    checking_name: str = betterproto.string_field(10)
+    contest_setting: "ContestSetting" = betterproto.message_field(11)
+    rank_type: int = betterproto.uint32_field(12)
+    season: "ResFetchManagerCustomizedContestSeasonInfo" = betterproto.message_field(13)
+    match_start_time: int = betterproto.uint32_field(14)
+    match_end_time: int = betterproto.uint32_field(15)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchManagerCustomizedContestSeasonInfo(Message):
+    create_time: int = betterproto.uint32_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRank(Message):
+    error: "Error" = betterproto.message_field(1)
+    total: int = betterproto.uint32_field(2)
+    rank: List["ResFetchContestPlayerRankSeasonRank"] = betterproto.message_field(3)
+    player_data: "ResFetchContestPlayerRankPlayerData" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankContestPlayerAccountData(Message):
+    total_game_count: int = betterproto.uint32_field(1)
+    recent_games: List[
+        "ResFetchContestPlayerRankContestPlayerAccountDataContestGameResult"
+    ] = betterproto.message_field(2)
+    highest_series_points: List[
+        "ResFetchContestPlayerRankContestPlayerAccountDataContestSeriesGameResult"
+    ] = betterproto.message_field(3)
+    accumulate_point: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankContestPlayerAccountDataContestGameResult(
+    Message
+):
+    rank: int = betterproto.uint32_field(1)
+    total_point: int = betterproto.int32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankContestPlayerAccountDataContestSeriesGameResult(
+    Message
+):
+    key: int = betterproto.uint32_field(1)
+    results: List[
+        "ResFetchContestPlayerRankContestPlayerAccountDataContestGameResult"
+    ] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankSeasonRank(Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+    data: "ResFetchContestPlayerRankContestPlayerAccountData" = (
+        betterproto.message_field(3)
+    )
+    team_name: str = betterproto.string_field(4)
+    modify_score: int = betterproto.int32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestPlayerRankPlayerData(Message):
+    rank: int = betterproto.uint32_field(1)
+    data: "ResFetchContestPlayerRankContestPlayerAccountData" = (
+        betterproto.message_field(2)
+    )
+    team_name: str = betterproto.string_field(3)
+    modify_score: int = betterproto.int32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestTeamRank(Message):
+    error: "Error" = betterproto.message_field(1)
+    total: int = betterproto.uint32_field(2)
+    rank: List["ResFetchContestTeamRankSeasonTeamRank"] = betterproto.message_field(3)
+    self_team_rank: "ResFetchContestTeamRankSeasonTeamRank" = betterproto.message_field(
+        4
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestTeamRankContestTeamData(Message):
+    total_point: int = betterproto.int32_field(1)
+    total_game_count: int = betterproto.uint32_field(2)
+    member_count: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestTeamRankSeasonTeamRank(Message):
+    team_id: int = betterproto.uint32_field(1)
+    name: str = betterproto.string_field(2)
+    data: "ResFetchContestTeamRankContestTeamData" = betterproto.message_field(3)
+    rank: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestTeamMember(Message):
+    error: "Error" = betterproto.message_field(1)
+    total: int = betterproto.uint32_field(2)
+    rank: List["ResFetchContestTeamMemberContestTeamMemberRank"] = (
+        betterproto.message_field(3)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchContestTeamMemberContestTeamMemberRank(Message):
+    account_id: int = betterproto.uint32_field(1)
+    total_game_count: int = betterproto.uint32_field(3)
+    total_score: int = betterproto.int32_field(4)
+    nickname: str = betterproto.string_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchReadyPlayerList(Message):
+    error: "Error" = betterproto.message_field(1)
+    list: List["ResFetchReadyPlayerListPlayer"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchReadyPlayerListPlayer(Message):
+    account_id: int = betterproto.uint32_field(1)
+    nickname: str = betterproto.string_field(2)
+    team_name: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResGenerateContestManagerLoginCode(Message):
+    error: "Error" = betterproto.message_field(1)
+    code: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityFetchInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    data: "ActivityAmuletData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityFetchBrief(Message):
+    error: "Error" = betterproto.message_field(1)
+    upgrade: "ActivityAmuletUpgradeData" = betterproto.message_field(4)
+    illustrated_book: "ActivityAmuletIllustratedBookData" = betterproto.message_field(5)
+    game_records: List["ActivityAmuletGameRecordData"] = betterproto.message_field(7)
+    statistic: "ActivityAmuletStatisticData" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAmuletActivityData(Message):
+    error: "Error" = betterproto.message_field(1)
+    data: "ActivityAmuletData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletEventResponse(Message):
+    error: "Error" = betterproto.message_field(1)
+    events: List["AmuletEventData"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResAmuletActivityMaintainInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    mode: str = betterproto.string_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResStoryReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResStoryActivityUnlockEndingAndReceive(Message):
+    error: "Error" = betterproto.message_field(1)
+    ending_reward: List["ExecuteReward"] = betterproto.message_field(2)
+    finish_reward: List["ExecuteReward"] = betterproto.message_field(3)
+    all_finish_reward: List["ExecuteReward"] = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityRank(Message):
+    error: "Error" = betterproto.message_field(1)
+    items: List["ResFetchActivityRankActivityRankItem"] = betterproto.message_field(4)
+    self: "ResFetchActivityRankActivityRankItem" = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchActivityRankActivityRankItem(Message):
+    account_id: int = betterproto.uint32_field(1)
+    score: int = betterproto.uint64_field(2)
+    data: str = betterproto.string_field(3)
+    rank: int = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchQuestionnaireList(Message):
+    error: "Error" = betterproto.message_field(1)
+    list: List["QuestionnaireBrief"] = betterproto.message_field(2)
+    finished_list: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchQuestionnaireDetail(Message):
+    error: "Error" = betterproto.message_field(1)
+    detail: "QuestionnaireDetail" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountGameHuRecords(Message):
+    error: "Error" = betterproto.message_field(1)
+    records: List["ResFetchAccountGameHuRecordsGameHuRecords"] = (
+        betterproto.message_field(2)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountGameHuRecordsGameHuRecords(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    title_id: int = betterproto.uint32_field(4)
+    hands: List[str] = betterproto.string_field(5)
+    ming: List[str] = betterproto.string_field(6)
+    hupai: str = betterproto.string_field(7)
+    hu_fans: List[int] = betterproto.uint32_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtra(Message):
+    error: "Error" = betterproto.message_field(1)
+    recent_games: List["ResFetchAccountInfoExtraAccountInfoGameRecord"] = (
+        betterproto.message_field(2)
+    )
+    hu_type_details: List["ResFetchAccountInfoExtraGameHuTypeDetail"] = (
+        betterproto.message_field(3)
+    )
+    game_rank_details: List["ResFetchAccountInfoExtraAccountGameRankDetail"] = (
+        betterproto.message_field(4)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtraAccountInfoGameRecord(Message):
+    uuid: str = betterproto.string_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+    tag: int = betterproto.uint32_field(4)
+    sub_tag: int = betterproto.uint32_field(5)
+    rank: int = betterproto.uint32_field(6)
+    final_point: int = betterproto.uint32_field(7)
+    results: List["ResFetchAccountInfoExtraAccountInfoGameRecordAccountGameResult"] = (
+        betterproto.message_field(8)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtraAccountInfoGameRecordAccountGameResult(
+    Message
+):
+    rank: int = betterproto.uint32_field(1)
+    account_id: int = betterproto.uint32_field(2)
+    nickname: str = betterproto.string_field(3)
+    verified: int = betterproto.uint32_field(4)
+    grading_score: int = betterproto.int32_field(5)
+    final_point: int = betterproto.int32_field(6)
+    seat: int = betterproto.uint32_field(7)
+    level: "AccountLevel" = betterproto.message_field(8)
+    level3: "AccountLevel" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtraGameHuTypeDetail(Message):
+    type: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAccountInfoExtraAccountGameRankDetail(Message):
+    rank: int = betterproto.uint32_field(1)
+    count: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSeerReport(Message):
+    error: "Error" = betterproto.message_field(1)
+    report: "SeerReport" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResCreateSeerReport(Message):
+    error: "Error" = betterproto.message_field(1)
+    seer_report: "SeerBrief" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchSeerReportList(Message):
+    error: "Error" = betterproto.message_field(1)
+    seer_report_list: List["SeerBrief"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGenerateAnnualReportToken(Message):
+    error: "Error" = betterproto.message_field(1)
+    token: str = betterproto.string_field(2)
+    url: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchAnnualReportInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    start_time: int = betterproto.uint32_field(2)
+    end_time: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivityFetchInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    data: "SimulationV2Data" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivityStartSeason(Message):
+    error: "Error" = betterproto.message_field(1)
+    season: "SimulationV2SeasonData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivityTrain(Message):
+    error: "Error" = betterproto.message_field(1)
+    event: "SimulationV2Event" = betterproto.message_field(2)
+    ability: "SimulationV2Ability" = betterproto.message_field(3)
+    round: int = betterproto.uint32_field(4)
+    effect_list: List["SimulationV2Effect"] = betterproto.message_field(5)
+    train_result: int = betterproto.uint32_field(6)
+    is_end: bool = betterproto.bool_field(7)
+    record: "SimulationV2Record" = betterproto.message_field(8)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivitySelectEvent(Message):
+    error: "Error" = betterproto.message_field(1)
+    event: "SimulationV2Event" = betterproto.message_field(2)
+    ability: "SimulationV2Ability" = betterproto.message_field(3)
+    match: "SimulationV2Match" = betterproto.message_field(4)
+    effect_list: List["SimulationV2Effect"] = betterproto.message_field(5)
+    round: int = betterproto.uint32_field(7)
+    is_end: bool = betterproto.bool_field(8)
+    result_id: int = betterproto.uint32_field(9)
+    record: "SimulationV2Record" = betterproto.message_field(10)
+    effected_buff_list: List[int] = betterproto.uint32_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivityStartMatch(Message):
+    error: "Error" = betterproto.message_field(1)
+    event: "SimulationV2Event" = betterproto.message_field(2)
+    match: "SimulationV2Match" = betterproto.message_field(4)
+    effect_list: List["SimulationV2Effect"] = betterproto.message_field(5)
+    is_match_end: bool = betterproto.bool_field(6)
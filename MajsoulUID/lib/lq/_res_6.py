@@ -0,0 +1,221 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivityEndMatch(Message):
+    error: "Error" = betterproto.message_field(1)
+    round: int = betterproto.uint32_field(2)
+    is_end: bool = betterproto.bool_field(3)
+    record: "SimulationV2Record" = betterproto.message_field(4)
+    total_score: int = betterproto.int32_field(5)
+    match_history: List["SimulationV2MatchRecord"] = betterproto.message_field(6)
+    rewards: List["ResSimV2ActivityEndMatchSimulationV2MatchReward"] = (
+        betterproto.message_field(7)
+    )
+    effect_list: List["SimulationV2Effect"] = betterproto.message_field(8)
+    ability: "SimulationV2Ability" = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class ResSimV2ActivityEndMatchSimulationV2MatchReward(Message):
+    type: int = betterproto.uint32_field(1)
+    params: List[int] = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResProgressRewardActivityReceive(Message):
+    error: "Error" = betterproto.message_field(1)
+    reward_items: List["ExecuteReward"] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchProgressRewardActivityInfo(Message):
+    error: "Error" = betterproto.message_field(1)
+    progress: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResShootActivityAttackEnemies(Message):
+    error: "Error" = betterproto.message_field(1)
+    records: List["ResShootActivityAttackEnemiesActivityShootAttackRecord"] = (
+        betterproto.message_field(2)
+    )
+    value_change: "ActivityShootValueChange" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResShootActivityAttackEnemiesActivityShootAttackRecord(Message):
+    position: int = betterproto.uint32_field(1)
+    enemy: "ActivityShootEnemyInfo" = betterproto.message_field(2)
+    level: int = betterproto.uint32_field(3)
+    reward_ids: List[int] = betterproto.uint32_field(4)
+    rewards: List["ExecuteReward"] = betterproto.message_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class ResQuestCrewActivityStartQuest(Message):
+    error: "Error" = betterproto.message_field(1)
+    result: int = betterproto.uint32_field(2)
+    value_changes: "ActivityQuestCrewChanges" = betterproto.message_field(3)
+    effect_info: List["ResQuestCrewActivityStartQuestActivityQuestCrewEffectInfo"] = (
+        betterproto.message_field(4)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class ResQuestCrewActivityStartQuestActivityQuestCrewEffectInfo(Message):
+    member_id: int = betterproto.uint32_field(1)
+    effect_id: int = betterproto.uint32_field(2)
+    result: "ActivityQuestCrewEffectResult" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResQuestCrewActivityHire(Message):
+    error: "Error" = betterproto.message_field(1)
+    value_changes: "ActivityQuestCrewChanges" = betterproto.message_field(2)
+    execute_result: List["ExecuteResult"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResQuestCrewActivityFeed(Message):
+    error: "Error" = betterproto.message_field(1)
+    value_changes: "ActivityQuestCrewChanges" = betterproto.message_field(2)
+    execute_result: List["ExecuteResult"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResQuestCrewActivityRefreshMarket(Message):
+    error: "Error" = betterproto.message_field(1)
+    value_changes: "ActivityQuestCrewChanges" = betterproto.message_field(2)
+    execute_result: List["ExecuteResult"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResBingoActivityReceiveReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    execute_result: List["ExecuteResult"] = betterproto.message_field(2)
+    cards: List["ActivityBingoCardData"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResFetchBingoActivityData(Message):
+    error: "Error" = betterproto.message_field(1)
+    data: "ActivityBingoData" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSnowballActivityStartBattle(Message):
+    error: "Error" = betterproto.message_field(1)
+    random_seed: int = betterproto.uint32_field(2)
+    boss_action: List["SnowballActivityBossAction"] = betterproto.message_field(3)
+    battle_id: str = betterproto.string_field(4)
+    player_state: List["ActivitySnowballPlayerState"] = betterproto.message_field(5)
+    random_seq: List[int] = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class ResSnowballActivityFinishBattle(Message):
+    error: "Error" = betterproto.message_field(1)
+    changes: "ActivitySnowballValueChanges" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSnowballActivityUpgrade(Message):
+    error: "Error" = betterproto.message_field(1)
+    changes: "ActivitySnowballValueChanges" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResSnowballActivityReceiveReward(Message):
+    error: "Error" = betterproto.message_field(1)
+    changes: "ActivitySnowballValueChanges" = betterproto.message_field(2)
+    rewards: List["ExecuteReward"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResMarathonActivityStartRace(Message):
+    error: "Error" = betterproto.message_field(1)
+    random_seed: int = betterproto.uint32_field(2)
+    race_id: str = betterproto.string_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResMarathonActivityFinishRace(Message):
+    error: "Error" = betterproto.message_field(1)
+    highest_record: "MarathonGameRecord" = betterproto.message_field(2)
+    rewards: List["ExecuteReward"] = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResAuthGame(Message):
+    error: "Error" = betterproto.message_field(1)
+    players: List["PlayerGameView"] = betterproto.message_field(2)
+    seat_list: List[int] = betterproto.uint32_field(3)
+    is_game_start: bool = betterproto.bool_field(4)
+    game_config: "GameConfig" = betterproto.message_field(5)
+    ready_id_list: List[int] = betterproto.uint32_field(6)
+    robots: List["PlayerGameView"] = betterproto.message_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class ResEnterGame(Message):
+    error: "Error" = betterproto.message_field(1)
+    is_end: bool = betterproto.bool_field(2)
+    step: int = betterproto.uint32_field(3)
+    game_restore: "GameRestore" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResSyncGame(Message):
+    error: "Error" = betterproto.message_field(1)
+    is_end: bool = betterproto.bool_field(2)
+    step: int = betterproto.uint32_field(3)
+    game_restore: "GameRestore" = betterproto.message_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class ResGamePlayerState(Message):
+    error: "Error" = betterproto.message_field(1)
+    state_list: List["GamePlayerState"] = betterproto.enum_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResGameEndVote(Message):
+    success: bool = betterproto.bool_field(1)
+    vote_cd_end_time: int = betterproto.uint32_field(2)
+    error: "Error" = betterproto.message_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResStartObserve(Message):
+    head: "GameLiveHead" = betterproto.message_field(1)
+    passed: "GameLiveSegment" = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class ResRequestConnection(Message):
+    error: "Error" = betterproto.message_field(1)
+    timestamp: int = betterproto.uint64_field(2)
+    result: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResRequestRouteChange(Message):
+    error: "Error" = betterproto.message_field(1)
+    result: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class ResHeartbeat(Message):
+    error: "Error" = betterproto.message_field(1)
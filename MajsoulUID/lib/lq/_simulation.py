@@ -0,0 +1,266 @@
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Data(Message):
+    activity_id: int = betterproto.uint32_field(1)
+    season: "SimulationV2SeasonData" = betterproto.message_field(2)
+    highest_score: int = betterproto.int32_field(3)
+    upgrade: "SimulationV2Ability" = betterproto.message_field(4)
+    event_pool: List[int] = betterproto.uint32_field(5)
+    season_count: int = betterproto.uint32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2SeasonData(Message):
+    round: int = betterproto.uint32_field(1)
+    ability: "SimulationV2Ability" = betterproto.message_field(2)
+    effect_list: List["SimulationV2Effect"] = betterproto.message_field(3)
+    match: "SimulationV2Match" = betterproto.message_field(4)
+    event: "SimulationV2Event" = betterproto.message_field(5)
+    event_history: List["SimulationV2EventHistory"] = betterproto.message_field(6)
+    record: "SimulationV2Record" = betterproto.message_field(7)
+    total_score: int = betterproto.int32_field(8)
+    match_history: List["SimulationV2MatchRecord"] = betterproto.message_field(9)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2PlayerRecord(Message):
+    id: int = betterproto.uint32_field(1)
+    main: bool = betterproto.bool_field(2)
+    score: int = betterproto.int32_field(3)
+    rank: int = betterproto.uint32_field(4)
+    seat: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchRecord(Message):
+    players: List["SimulationV2PlayerRecord"] = betterproto.message_field(1)
+    round: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2EventHistory(Message):
+    id: int = betterproto.uint32_field(1)
+    round: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Event(Message):
+    id: int = betterproto.uint32_field(1)
+    selections: List["SimulationV2EventSimulationV2EventSelection"] = (
+        betterproto.message_field(2)
+    )
+    next_round: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2EventSimulationV2EventSelection(Message):
+    id: int = betterproto.uint32_field(1)
+    results: List[
+        "SimulationV2EventSimulationV2EventSelectionSimulationV2EventResult"
+    ] = betterproto.message_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2EventSimulationV2EventSelectionSimulationV2EventResult(
+    Message
+):
+    id: int = betterproto.uint32_field(1)
+    weight: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Ability(Message):
+    luk: int = betterproto.uint32_field(1)
+    tec: int = betterproto.uint32_field(2)
+    ins: int = betterproto.uint32_field(3)
+    int: builtins.int = betterproto.uint32_field(4)
+    res: builtins.int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Buff(Message):
+    id: int = betterproto.uint32_field(1)
+    round: int = betterproto.uint32_field(2)
+    store: List[int] = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Effect(Message):
+    id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchInfo(Message):
+    chang: int = betterproto.uint32_field(1)
+    ju: int = betterproto.uint32_field(2)
+    ben: int = betterproto.uint32_field(3)
+    gong: int = betterproto.uint32_field(4)
+    remain: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Record(Message):
+    hu_count: int = betterproto.uint32_field(1)
+    chong_count: int = betterproto.uint32_field(2)
+    highest_hu: int = betterproto.uint32_field(3)
+    rank: List[int] = betterproto.uint32_field(4)
+    round_count: int = betterproto.uint32_field(5)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistory(Message):
+    type: int = betterproto.uint32_field(1)
+    remain: int = betterproto.uint32_field(2)
+    score_modify: List[int] = betterproto.int32_field(3)
+    round_start: "SimulationV2MatchHistoryRoundStartArgs" = betterproto.message_field(4)
+    riichi: "SimulationV2MatchHistoryRiichiArgs" = betterproto.message_field(5)
+    fulu: "SimulationV2MatchHistoryFuluArgs" = betterproto.message_field(6)
+    hule: List["SimulationV2MatchHistoryHuleArgs"] = betterproto.message_field(7)
+    push_ting: "SimulationV2MatchHistoryPushTingArgs" = betterproto.message_field(8)
+    find_ting: "SimulationV2MatchHistoryFindTingArgs" = betterproto.message_field(9)
+    liuju: "SimulationV2MatchHistoryLiujuArgs" = betterproto.message_field(10)
+    story: "SimulationV2MatchHistoryStoryArgs" = betterproto.message_field(11)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryRoundStartArgs(Message):
+    info: "SimulationV2MatchInfo" = betterproto.message_field(1)
+    scores: List[int] = betterproto.int32_field(2)
+    ting: int = betterproto.uint32_field(3)
+    effected_buff_list: List[int] = betterproto.uint32_field(4)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryRiichiArgs(Message):
+    seat: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryFuluArgs(Message):
+    seat: int = betterproto.uint32_field(1)
+    ting: int = betterproto.uint32_field(2)
+    fulu: int = betterproto.uint32_field(3)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryHuleArgs(Message):
+    seat: int = betterproto.uint32_field(1)
+    zimo: bool = betterproto.bool_field(2)
+    chong_seat: int = betterproto.uint32_field(3)
+    point: int = betterproto.int32_field(4)
+    fan: int = betterproto.int32_field(5)
+    score_modify: List[int] = betterproto.int32_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryPushTingArgs(Message):
+    seat: int = betterproto.uint32_field(1)
+    ting: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryFindTingArgs(Message):
+    seat: int = betterproto.uint32_field(1)
+    target: int = betterproto.uint32_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryLiujuArgs(Message):
+    ting: List[int] = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchHistoryStoryArgs(Message):
+    story_id: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2Match(Message):
+    info: "SimulationV2MatchInfo" = betterproto.message_field(1)
+    players: List["SimulationV2MatchSimulationV2Player"] = betterproto.message_field(2)
+    history: List["SimulationV2MatchHistory"] = betterproto.message_field(3)
+    rank: List[int] = betterproto.uint32_field(4)
+    is_match_end: bool = betterproto.bool_field(5)
+    actions: List["SimulationActionData"] = betterproto.message_field(6)
+    buff_list: List["SimulationV2Buff"] = betterproto.message_field(9)
+    is_first_round: bool = betterproto.bool_field(10)
+    last_event_remain: int = betterproto.uint32_field(11)
+    effected_buff_list: List[int] = betterproto.uint32_field(12)
+    triggered_story: List[int] = betterproto.uint32_field(13)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationV2MatchSimulationV2Player(Message):
+    id: int = betterproto.uint32_field(1)
+    main: bool = betterproto.bool_field(2)
+    ting: int = betterproto.uint32_field(4)
+    score: int = betterproto.int32_field(5)
+    fulu: int = betterproto.uint32_field(6)
+    riichi: bool = betterproto.bool_field(7)
+    find_ting: List[int] = betterproto.uint32_field(8)
+    seat: int = betterproto.uint32_field(9)
+    con_push_ting: int = betterproto.uint32_field(10)
+    con_keep_ting: int = betterproto.uint32_field(11)
+    ippatsu: bool = betterproto.bool_field(12)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionData(Message):
+    type: int = betterproto.uint32_field(1)
+    riichi: "SimulationActionDataActionRiichiData" = betterproto.message_field(2)
+    hule: "SimulationActionDataActionHuleData" = betterproto.message_field(3)
+    fulu: "SimulationActionDataActionFuluData" = betterproto.message_field(4)
+    discard_tile: "SimulationActionDataActionDiscardData" = betterproto.message_field(5)
+    deal_tile: "SimulationActionDataActionDealTileData" = betterproto.message_field(6)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionDataActionRiichiData(Message):
+    seat: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionDataActionHuleData(Message):
+    hule: List["SimulationActionDataActionHuleDataHuleInfo"] = (
+        betterproto.message_field(1)
+    )
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionDataActionHuleDataHuleInfo(Message):
+    fan: int = betterproto.uint32_field(1)
+    zimo: bool = betterproto.bool_field(2)
+    point: int = betterproto.uint32_field(3)
+    oya: bool = betterproto.bool_field(4)
+    player: int = betterproto.uint32_field(5)
+    chong: int = betterproto.uint32_field(6)
+    toutiao: bool = betterproto.bool_field(7)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionDataActionFuluData(Message):
+    seat: int = betterproto.uint32_field(1)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionDataActionDiscardData(Message):
+    seat: int = betterproto.uint32_field(1)
+    riichi: bool = betterproto.bool_field(2)
+
+
+@dataclass(eq=False, repr=False)
+class SimulationActionDataActionDealTileData(Message):
+    seat: int = betterproto.uint32_field(1)
@@ -3,6 +3,7 @@ from typing import Dict, List
 from gsuid_core.config import core_config
 from gsuid_core.utils.plugins_config.models import (
     GSC,
+    GsIntConfig,
     GsStrConfig,
     GsBoolConfig,
 )
@@ -56,4 +57,52 @@ CONFIG_DEFAULT: Dict[str, GSC] = {
         "Tenhou",
         ["Tenhou", "Mjai"],
     ),
+    "MajsRpcMaxConcurrency": GsIntConfig(
+        "账号池单连接最大并发请求数",
+        "同一账号同时等待响应的请求数上限, 超出的请求会排队等待",
+        8,
+        64,
+    ),
+    "MajsRpcTimeout": GsIntConfig(
+        "账号池请求超时时间(秒)",
+        "单次请求等待响应的最长时间, 超时后放弃该请求",
+        30,
+        300,
+    ),
+    "MajsNotifyWorkers": GsIntConfig(
+        "账号池通知处理并发数",
+        "单个账号同时处理好友通知的worker数量",
+        4,
+        32,
+    ),
+    "MajsNotifyQueueSize": GsIntConfig(
+        "账号池通知队列长度",
+        "每个worker最多排队的通知数量",
+        256,
+        4096,
+    ),
+    "MajsNotifyOverflow": GsStrConfig(
+        "账号池通知队列溢出策略",
+        "drop: 丢弃新通知|coalesce: 合并同类通知",
+        "coalesce",
+        ["drop", "coalesce"],
+    ),
+    "MajsStartupConcurrency": GsIntConfig(
+        "账号池启动并发数",
+        "启动服务时同时登录的账号数量",
+        4,
+        32,
+    ),
+    "MajsFriendCapacity": GsIntConfig(
+        "账号池单账号好友上限",
+        "订阅的玩家按一致性哈希分配给账号池中的账号, 单个账号最多分配的好友数",
+        100,
+        500,
+    ),
+    "MajsPaipuCacheSize": GsIntConfig(
+        "牌谱缓存大小(MB)",
+        "在内存中缓存最近使用的牌谱与Review结果, 0为不缓存",
+        32,
+        1024,
+    ),
 }
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from copy import deepcopy
 from typing import Optional
@@ -40,19 +41,48 @@ async def draw_title(msg: str):
     return title
 
 
+def _cancel(*tasks: Optional[asyncio.Task]):
+    for task in tasks:
+        if task is not None:
+            task.cancel()
+
+
 @gs_cache()
 async def draw_majs_info_img(ev: Event, uid: str, mode: str = "auto"):
     MODE: bool = MAJS_CONFIG.get_config("UseFlowerHistory").data
-    data4 = await majs_api.get_player_stats(uid)
-    data3 = await majs_api.get_player_stats(uid, "3")
-
-    extended4 = await majs_api.get_player_extended(uid)
-    extended3 = await majs_api.get_player_extended(uid, "3")
+    # 四麻/三麻的数据互不依赖, 同时请求
+    stats4_task = asyncio.create_task(majs_api.get_player_stats(uid))
+    stats3_task = asyncio.create_task(majs_api.get_player_stats(uid, "3"))
+    extended4_task = asyncio.create_task(majs_api.get_player_extended(uid))
+    extended3_task = asyncio.create_task(
+        majs_api.get_player_extended(uid, "3")
+    )
+    # 指定了模式时无需等待段位数据即可请求对局记录
+    record_task = None
+    if mode in ("3", "4"):
+        record_task = asyncio.create_task(
+            majs_api.get_player_record(uid, MODE=mode)
+        )
 
     # from gsuid_core.utils.image.image_tools import get_avatar_with_ring
     # avatar = await get_avatar_with_ring(ev)
 
-    if data4 == data3 or extended3 == extended4:
+    # 等待请求期间先绘制与数据无关的部分
+    img = get_bg()
+    detail_bg = Image.open(TEXTURE / "detail_bg.png")
+    mid = Image.open(TEXTURE / "mid.png")
+    footer = get_footer()
+    char_card = await get_char_card()
+
+    tasks = (stats4_task, stats3_task, extended4_task, extended3_task)
+    try:
+        data4, data3 = await asyncio.gather(stats4_task, stats3_task)
+    except BaseException:
+        _cancel(*tasks, record_task)
+        raise
+
+    if data4 == data3:
+        _cancel(*tasks, record_task)
         return "不存在该ID的玩家数据...\n提示: 需要在金之间有一定数量的对局才能被正确记录！"
 
     if isinstance(data4, int):
@@ -60,100 +90,133 @@ async def draw_majs_info_img(ev: Event, uid: str, mode: str = "auto"):
     if isinstance(data3, int):
         data3 = deepcopy(player_stats_zero)
 
-    if isinstance(extended4, int):
-        extended4 = deepcopy(player_extend_zero)
-    if isinstance(extended3, int):
-        extended3 = deepcopy(player_extend_zero)
-
     if mode == "3" or (
         mode == "auto" and data4["level"]["score"] < data3["level"]["score"]
     ):
-        _mode = "三麻战绩"
-        data = data3
-        extended = extended3
-        record = await majs_api.get_player_record(uid, MODE="3")
+        record_mode = "3"
     else:
-        _mode = "四麻战绩"
-        data = data4
-        extended = extended4
-        record = await majs_api.get_player_record(uid)
+        record_mode = "4"
+    if record_task is None:
+        record_task = asyncio.create_task(
+            majs_api.get_player_record(uid, MODE=record_mode)
+        )
 
-    for s in player_extend_zero:
-        if s not in extended:
-            extended[s] = player_extend_zero[s]
+    try:
+        extended4, extended3 = await asyncio.gather(
+            extended4_task, extended3_task
+        )
+    except BaseException:
+        _cancel(extended4_task, extended3_task, record_task)
+        raise
+
+    # 绘制过程中出错或提前返回时, 不再等待对局记录
+    try:
+        if extended3 == extended4:
+            return "不存在该ID的玩家数据...\n提示: 需要在金之间有一定数量的对局才能被正确记录！"
+
+        if isinstance(extended4, int):
+            extended4 = deepcopy(player_extend_zero)
+        if isinstance(extended3, int):
+            extended3 = deepcopy(player_extend_zero)
+
+        if record_mode == "3":
+            _mode = "三麻战绩"
+            data = data3
+            extended = extended3
+        else:
+            _mode = "四麻战绩"
+            data = data4
+            extended = extended4
+
+        for s in player_extend_zero:
+            if s not in extended:
+                extended[s] = player_extend_zero[s]
+
+        level4_score = data4["level"]["score"] + data4["level"]["delta"]
+        level3_score = data3["level"]["score"] + data3["level"]["delta"]
+
+        level4 = PlayerLevel(data4["level"]["id"], level4_score)
+        level3 = PlayerLevel(data3["level"]["id"], level3_score)
+
+        detail_draw = ImageDraw.Draw(detail_bg)
+        mid_draw = ImageDraw.Draw(mid)
+
+        mid_draw.text((500, 40), _mode, W, majs_font(30), "mm")
+
+        title = await draw_title(f"{data['nickname']} · UID {uid}")
+        img.paste(title, (0, 0), title)
+
+        zm_rate = get_rate(extended["自摸率"])
+        mt_rate = get_rate(extended["默听率"])
+        lj_rate = get_rate(extended["流局率"])
+        lt_rate = get_rate(extended["流听率"])
+        fl_rate = get_rate(extended["副露率"])
+        lz_rate = get_rate(extended["立直率"])
+
+        hl_num = "{:.2f}".format(extended["和了巡数"])
+        avg_score = str(extended["平均打点"])
+        avg_chong = str(extended["平均铳点"])
+
+        bf_rate = get_rate(data["negative_rate"])
+        yf_rate = get_rate(extended["一发率"])
+        jddxl = str(extended["净打点效率"])
+
+        all_rong = extended["立直和了"] + extended["副露和了"] + extended["默听和了"]
+        lz_r_rate = extended["立直和了"] / all_rong
+        fl_r_rate = extended["副露和了"] / all_rong
+        mt_r_rate = extended["默听和了"] / all_rong
+
+        lz_f_rate = extended["放铳时立直率"]
+        fl_f_rate = extended["放铳时副露率"]
+
+        all_chong = extended["放铳至立直"] + extended["放铳至副露"] + extended["放铳至默听"]
+        lz_c_rate = extended["放铳至立直"] / all_chong
+        fl_c_rate = extended["放铳至副露"] / all_chong
+        mt_c_rate = extended["放铳至默听"] / all_chong
+
+        for index, _t in enumerate(
+            [
+                zm_rate,
+                mt_rate,
+                lj_rate,
+                lt_rate,
+                fl_rate,
+                lz_rate,
+                hl_num,
+                avg_score,
+                avg_chong,
+                bf_rate,
+                yf_rate,
+                jddxl,
+            ]
+        ):
+            detail_draw.text(
+                (151 + 138 * (index % 6), 65 + 86 * (index // 6)),
+                _t,
+                W,
+                majs_font(30),
+                "mm",
+            )
 
-    if isinstance(record, int):
-        record = []
+        rank4_icon = await get_rank_icon(level4, data4, extended4, "4")
+        rank3_icon = await get_rank_icon(level3, data3, extended3, "3")
 
-    level4_score = data4["level"]["score"] + data4["level"]["delta"]
-    level3_score = data3["level"]["score"] + data3["level"]["delta"]
+        lz_rong = await get_lz_bar("rong", lz_r_rate, fl_r_rate, mt_r_rate)
+        lz_chong = await get_lz_bar("chong", lz_f_rate, fl_f_rate)
+        lz_chongz = await get_lz_bar(
+            "chong_to", lz_c_rate, fl_c_rate, mt_c_rate
+        )
 
-    level4 = PlayerLevel(data4["level"]["id"], level4_score)
-    level3 = PlayerLevel(data3["level"]["id"], level3_score)
+        detail_bg.paste(lz_rong, (0, 238), lz_rong)
+        detail_bg.paste(lz_chong, (0, 328), lz_chong)
+        detail_bg.paste(lz_chongz, (0, 418), lz_chongz)
 
-    img = get_bg()
-    detail_bg = Image.open(TEXTURE / "detail_bg.png")
-    mid = Image.open(TEXTURE / "mid.png")
+        record = await record_task
+    finally:
+        _cancel(record_task)
 
-    detail_draw = ImageDraw.Draw(detail_bg)
-    mid_draw = ImageDraw.Draw(mid)
-
-    mid_draw.text((500, 40), _mode, W, majs_font(30), "mm")
-
-    title = await draw_title(f"{data['nickname']} · UID {uid}")
-    img.paste(title, (0, 0), title)
-
-    zm_rate = get_rate(extended["自摸率"])
-    mt_rate = get_rate(extended["默听率"])
-    lj_rate = get_rate(extended["流局率"])
-    lt_rate = get_rate(extended["流听率"])
-    fl_rate = get_rate(extended["副露率"])
-    lz_rate = get_rate(extended["立直率"])
-
-    hl_num = "{:.2f}".format(extended["和了巡数"])
-    avg_score = str(extended["平均打点"])
-    avg_chong = str(extended["平均铳点"])
-
-    bf_rate = get_rate(data["negative_rate"])
-    yf_rate = get_rate(extended["一发率"])
-    jddxl = str(extended["净打点效率"])
-
-    all_rong = extended["立直和了"] + extended["副露和了"] + extended["默听和了"]
-    lz_r_rate = extended["立直和了"] / all_rong
-    fl_r_rate = extended["副露和了"] / all_rong
-    mt_r_rate = extended["默听和了"] / all_rong
-
-    lz_f_rate = extended["放铳时立直率"]
-    fl_f_rate = extended["放铳时副露率"]
-
-    all_chong = extended["放铳至立直"] + extended["放铳至副露"] + extended["放铳至默听"]
-    lz_c_rate = extended["放铳至立直"] / all_chong
-    fl_c_rate = extended["放铳至副露"] / all_chong
-    mt_c_rate = extended["放铳至默听"] / all_chong
-
-    for index, _t in enumerate(
-        [
-            zm_rate,
-            mt_rate,
-            lj_rate,
-            lt_rate,
-            fl_rate,
-            lz_rate,
-            hl_num,
-            avg_score,
-            avg_chong,
-            bf_rate,
-            yf_rate,
-            jddxl,
-        ]
-    ):
-        detail_draw.text(
-            (151 + 138 * (index % 6), 65 + 86 * (index // 6)),
-            _t,
-            W,
-            majs_font(30),
-            "mm",
-        )
+    if isinstance(record, int):
+        record = []
 
     record_bg = Image.open(TEXTURE / "record_bg.png")
     record_p = Image.new("RGBA", record_bg.size)
@@ -211,20 +274,6 @@ async def draw_majs_info_img(ev: Event, uid: str, mode: str = "auto"):
             "mm",
         )
 
-    footer = get_footer()
-
-    rank4_icon = await get_rank_icon(level4, data4, extended4, "4")
-    rank3_icon = await get_rank_icon(level3, data3, extended3, "3")
-    char_card = await get_char_card()
-
-    lz_rong = await get_lz_bar("rong", lz_r_rate, fl_r_rate, mt_r_rate)
-    lz_chong = await get_lz_bar("chong", lz_f_rate, fl_f_rate)
-    lz_chongz = await get_lz_bar("chong_to", lz_c_rate, fl_c_rate, mt_c_rate)
-
-    detail_bg.paste(lz_rong, (0, 238), lz_rong)
-    detail_bg.paste(lz_chong, (0, 328), lz_chong)
-    detail_bg.paste(lz_chongz, (0, 418), lz_chongz)
-
     img.paste(char_card, (34, 518), char_card)
     img.paste(rank4_icon, (357, 545), rank4_icon)
     img.paste(rank3_icon, (357, 857), rank3_icon)
@@ -15,8 +15,8 @@ from gsuid_core.utils.database.api import get_uid
 
 from ..utils.api.remote import encode_account_id2
 from ..utils.database.models import MajsBind, MajsPush, MajsUser
+from ..utils.majs_api import majs_api
 from ..utils.error_reply import UID_HINT
-from ..utils.resource.RESOURCE_PATH import PAIPU_PATH
 from .constants import USER_AGENT, ModeId2Room
 from .draw_frame import render_frame
 from .draw_friend_rank import draw_friend_rank_img
@@ -25,8 +25,12 @@ from .majsoul import (
     TASK_NAME_MAJSOUL_NOTIFY,
     MajsoulMaintenanceError,
     get_paipu_by_game_id,
+    live_poller,
     manager,
 )
+from .paipu_store import paipu_store
+from .live_tracker import live_tracker
+from .live_subscribe import TASK_NAME_MAJSOUL_LIVE, live_subscribers
 from .tenhou.review import get_review_result, review_tenhou
 
 majsoul_notify = SV("雀魂推送服务", pm=0)
@@ -51,8 +55,6 @@ EXSAMPLE_JP_EN = """雀魂登陆日服 邮箱
 ⚠ 请自行使用任何小号, 本插件不为账号被封禁承担任何责任！！
 """
 
-cache_game = {}
-
 
 @majsoul_review.on_command(("牌谱Review", "牌谱review", "Review", "review"))
 async def majsoul_review_command(bot: Bot, ev: Event):
@@ -67,15 +69,15 @@ async def majsoul_review_command(bot: Bot, ev: Event):
     else:
         return await bot.send("❌ 请输入有效的牌谱URL!")
 
-    path1 = PAIPU_PATH / f"{desired_string} - raw.json"
-    path2 = PAIPU_PATH / f"{desired_string} - review.json"
-
-    if not (path1.exists() and path2.exists()):
-        conns = manager.get_all_conn()
-        if not conns:
+    if not (
+        await paipu_store.has(desired_string, "tenhou")
+        and await paipu_store.has(desired_string, "review")
+    ):
+        if not manager.get_all_conn():
             return await bot.send("❌ 未找到有效连接, 请先进行[雀魂推送启动]")
-        conn = random.choice(conns)
-        tenhou_log = await conn.fetchLogs(desired_string)
+        tenhou_log = await manager.route_call(
+            lambda conn: conn.fetchLogs(desired_string)
+        )
     else:
         tenhou_log = await get_paipu_by_game_id(desired_string)
 
@@ -115,14 +117,11 @@ async def majsoul_render_log(bot: Bot, ev: Event):
     kyoku_id = int(paipu_command[1])
     meguru_id = int(paipu_command[2])
 
-    for path in PAIPU_PATH.iterdir():
-        if path.name.startswith(paipu_id) and path.name.endswith("- raw.json"):
-            paipu_id = path.stem[:-6].strip()
-            paipu = await get_paipu_by_game_id(paipu_id)
-            break
-    else:
+    game_id = await paipu_store.find(paipu_id)
+    if game_id is None:
         return await bot.send("❌ 未找到有效牌谱!\n请先使用[雀魂牌谱review + URL]")
 
+    paipu = await get_paipu_by_game_id(game_id)
     if paipu is None:
         return await bot.send("❌ 未找到有效牌谱!\n请先使用[雀魂牌谱review + URL]")
 
@@ -339,7 +338,12 @@ async def majsoul_get_notify_command(bot: Bot, ev: Event):
         return await bot.send(UID_HINT)
 
     logger.info(f"[majs] 开始订阅推送 {uid}, 进行刷新账号数据中...")
-    await conn.fetchInfo()
+    # 先刷新好友列表, 已是某个账号好友的玩家不会被分配到其他账号
+    await manager.refresh_friends()
+
+    # 玩家按一致性哈希分配给账号池中的账号
+    if uid.isdigit():
+        conn = manager.get_conn_for(uid) or conn
 
     friend_code = await MajsUser.get_user_attr_by_uid(
         str(conn.account_id),
@@ -348,10 +352,7 @@ async def majsoul_get_notify_command(bot: Bot, ev: Event):
     if friend_code is None:
         return await bot.send("[majs] 账号池账号异常, 请联系管理员!")
 
-    for friend in conn.friends:
-        if uid == str(friend.account_id):
-            break
-    else:
+    if not (uid.isdigit() and int(uid) in conn.friends):
         await bot.send(
             "[majs] 未找到好友信息! 将使用观战订阅模式！\n"
             "该模式无法获取好友分数变化情况, 可能存在不准确的情况, 请自行关注！\n"
@@ -361,10 +362,11 @@ async def majsoul_get_notify_command(bot: Bot, ev: Event):
 
         await gs_subscribe.add_subscribe(
             "single",
-            "雀魂观战订阅",
+            TASK_NAME_MAJSOUL_LIVE,
             ev,
             extra_message=uid,
         )
+        live_subscribers.invalidate()
         return await bot.send("[观战模式] 订阅成功！")
 
     push_id = ev.group_id if ev.group_id else "on"
@@ -399,6 +401,8 @@ async def majsoul_notify_command(bot: Bot, event: Event):
     msg = "🥰 成功启动雀魂订阅消息推送服务！\n"
 
     msg += f"当前雀魂账号ID: {conn.account_id}, 昵称: {conn.nick_name}"
+    if len(manager.startup_report) > 1:
+        msg += f"\n{manager.format_startup_report()}"
     await bot.send(msg)
 
 
@@ -413,6 +417,37 @@ async def majsoul_notify_reset_command(bot: Bot, event: Event):
     await bot.send(msg)
 
 
+@majsoul_notify.on_fullmatch(("迁移牌谱", "牌谱迁移"))
+async def majsoul_paipu_migrate_command(bot: Bot, event: Event):
+    await bot.send("正在将本地JSON牌谱转换为压缩格式...可能需要一定时间!")
+    success, failed = await paipu_store.migrate()
+    await bot.send(f"🥰 牌谱迁移完成! 成功: {success}, 失败: {failed}")
+
+
+@majsoul_notify.on_fullmatch(("重建牌谱索引", "牌谱索引重建"))
+async def majsoul_paipu_reindex_command(bot: Bot, event: Event):
+    await bot.send("正在为本地牌谱重建索引...可能需要一定时间!")
+    success, failed = await paipu_store.rebuild_index()
+    await bot.send(f"🥰 牌谱索引重建完成! 成功: {success}, 失败: {failed}")
+
+
+@majsoul_notify.on_command(("导出牌谱", "牌谱导出"))
+async def majsoul_paipu_export_command(bot: Bot, event: Event):
+    game_id = event.text.strip()
+    if not game_id:
+        return await bot.send("❌ 请输入对局ID!")
+
+    paths = []
+    for section in ("tenhou", "review"):
+        path = await paipu_store.export_json(game_id, section)
+        if path is not None:
+            paths.append(str(path))
+
+    if not paths:
+        return await bot.send("❌ 未找到有效牌谱!")
+    await bot.send("🥰 牌谱已导出至:\n" + "\n".join(paths))
+
+
 @majsoul_notify.on_fullmatch(("检查服务", "检查订阅服务"))
 async def majsoul_notify_check_command(bot: Bot, event: Event):
     conns = manager.get_all_conn()
@@ -421,78 +456,88 @@ async def majsoul_notify_check_command(bot: Bot, event: Event):
 
     msg_list = []
     for conn in conns:
-        msg_list = []
         if await conn.check_alive():
             a = f"✅ 当前雀魂账号ID: {conn.account_id}, 昵称: {conn.nick_name}"
         else:
             a = f"❌ 当前雀魂账号ID: {conn.account_id}, 昵称: {conn.nick_name} 账号登录态失效!"
             a += "请使用[雀魂重启订阅服务]"
+        a += f"\n{conn.rpc_stats.format_stats()}"
+        a += f"\n{conn.notify_pool.format_stats()}"
 
         msg_list.append(a)
 
+    msg_list.append(await manager.format_shard_stats())
+    if manager.startup_report:
+        msg_list.append(f"启动记录:\n{manager.format_startup_report()}")
+    msg_list.append(paipu_store.cache.format_stats())
+    koromo_stats = majs_api.metrics.format_stats()
+    if koromo_stats:
+        msg_list.append(f"Koromo接口:\n{koromo_stats}")
     msg = "\n".join(msg_list)
     await bot.send(msg)
 
 
 @majsoul_friend_level_billboard.on_command("好友排行榜")
 async def majsoul_friend_billboard_command(bot: Bot, event: Event):
-    # get connection
-    conn = manager.get_conn()
-    if conn is None:
+    if not manager.get_all_conn():
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
 
-    # 去重
-    friends = conn.remove_duplicate_friends()
-    if "三" in event.text:
-        friends.sort(key=lambda x: (x.level3.id, x.level3_score), reverse=True)
-        msg = await draw_friend_rank_img(friends, "3")
-    else:
-        friends.sort(key=lambda x: (x.level.id, x.level_score), reverse=True)
-        msg = await draw_friend_rank_img(friends, "4")
+    mode = "3" if "三" in event.text else "4"
+    msg = await draw_friend_rank_img(manager.ranked_friends(mode), mode)
     await bot.send(msg)
 
 
 @majsoul_friend_manage.on_command("好友总览")
 async def majsoul_friend_overview_command(bot: Bot, event: Event):
-    conn = manager.get_conn()
-    if conn is None:
+    conns = manager.get_all_conn()
+    if not conns:
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
-    friends = conn.friends
     msg = "本群雀魂好友列表\n"
-    for friend in friends:
-        msg += f"{friend.nickname} {friend.account_id}\n"
+    for conn in conns:
+        if len(conns) > 1:
+            msg += f"[{conn.nick_name}]\n"
+        for friend in conn.friends:
+            msg += f"{friend.nickname} {friend.account_id}\n"
     await bot.send(msg)
 
 
 @majsoul_friend_manage.on_command(("获取好友全部申请", "好友申请"))
 async def majsoul_friend_apply_get_command(bot: Bot, event: Event):
-    conn = manager.get_conn()
-    if conn is None:
+    conns = manager.get_all_conn()
+    if not conns:
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
-    applys = conn.friend_apply_list
     msg = "本群雀魂好友申请列表\n"
-    for apply in applys:
-        msg += f"{apply}\n"
+    for conn in conns:
+        if len(conns) > 1 and conn.friend_apply_list:
+            msg += f"[{conn.nick_name}]\n"
+        for apply in conn.friend_apply_list:
+            msg += f"{apply}\n"
     await bot.send(msg)
 
 
 @majsoul_friend_manage.on_command("同意所有好友申请")
 async def majsoul_friend_apply_all_command(bot: Bot, event: Event):
-    conn = manager.get_conn()
-    if conn is None:
+    conns = manager.get_all_conn()
+    if not conns:
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
-    applys = conn.friend_apply_list
-    for apply in applys:
-        await conn.acceptFriendApply(apply)
+    skipped = 0
+    for conn in conns:
+        for apply in list(conn.friend_apply_list):
+            if not manager.shards.has_capacity(conn):
+                skipped += 1
+                continue
+            await conn.acceptFriendApply(apply)
+    if skipped:
+        return await bot.send(f"已同意好友申请, {skipped} 个申请因账号好友已满未处理")
     await bot.send("已同意所有好友申请")
 
 
 @majsoul_friend_manage.on_command("同意好友申请")
 async def majsoul_friend_apply_command(bot: Bot, event: Event):
-    conn = manager.get_conn()
+    apply = int(event.text.strip())
+    conn = manager.get_conn_by_apply(apply) or manager.get_conn_for(apply)
     if conn is None:
         return await bot.send("未找到有效连接, 请先进行[雀魂推送启动]")
-    apply = int(event.text.strip())
     await conn.acceptFriendApply(apply)
     await bot.send("已同意好友申请")
 
@@ -500,52 +545,66 @@ async def majsoul_friend_apply_command(bot: Bot, event: Event):
 @scheduler.scheduled_job("cron", minute="*/2")
 async def majsoul_notify_rank():
     await asyncio.sleep(random.randint(0, 1))
-    datas = await gs_subscribe.get_subscribe("雀魂观战订阅")
+    subscribers = await live_subscribers.get()
 
-    if not datas:
+    if not subscribers:
         return
 
     conn = await manager.start()
     if isinstance(conn, str):
         return logger.error(conn)
 
-    live_games = await conn.fetchLiveGames()
-
-    _cache_game = []
-    for subscribe in datas:
-        for live_game in live_games:
-            _cache_game.append(live_game.uuid)
-            if live_game.uuid in cache_game:
+    await live_tracker.load()
+    live = await live_poller.poll()
+
+    # 与所有正在进行的对局匹配, 而不只是新开始的对局:
+    # 订阅时玩家已在对局中, 或上一次推送失败的对局也需要推送
+    for live_game in live.games.values():
+        if live_game.uuid in live_tracker:
+            continue
+
+        mode_id = live_game.game_config.meta.mode_id
+        room_name = ModeId2Room.get(mode_id, "")
+        _id = f"对局ID: {live_game.uuid}"
+        watchers = []
+        for player in live_game.players:
+            account_id = str(player.account_id)
+            if account_id not in subscribers:
                 continue
-
-            for player in live_game.players:
-                if str(subscribe.extra_message) == str(player.account_id):
-                    mode_id = live_game.game_config.meta.mode_id
-                    room_name = ModeId2Room.get(mode_id, "")
-                    nickname = player.nickname
-                    _id = f"对局ID: {live_game.uuid}"
-                    msg = f"[订阅] {nickname} 正在进行 {room_name} 的对局!\n{_id}"
+            nickname = player.nickname
+            msg = f"[订阅] {nickname} 正在进行 {room_name} 的对局!\n{_id}"
+            sent = False
+            for subscribe in subscribers[account_id]:
+                try:
                     await subscribe.send(msg)
-                    cache_game[live_game.uuid] = {
-                        "game": live_game,
-                        "subscribe": subscribe,
-                        "nickname": nickname,
-                    }
-
-    del_game = []
-    for key in cache_game:
-        if key not in _cache_game:
-            game = cache_game[key]["game"]
-            subscribe = cache_game[key]["subscribe"]
-            mode_id = game.game_config.meta.mode_id
-            room_name = ModeId2Room.get(mode_id, "")
-            nickname = cache_game[key]["nickname"]
-            _id = f"对局ID: {key}"
-            msg = f"[订阅] {nickname} 结束了 {room_name} 的对局!\n{_id}"
-            del_game.append(key)
-
-    for key in del_game:
-        del cache_game[key]
+                    sent = True
+                except Exception as e:
+                    logger.warning(f"[majs] 推送对局开始消息失败: {e}")
+            # 全部发送失败时不跟踪, 下一次轮询重新推送
+            if sent:
+                watchers.append((account_id, nickname))
+
+        if watchers:
+            await live_tracker.track(live_game.uuid, mode_id, watchers)
+
+    # 观战列表不完整时无法判断对局是否已结束
+    if live.complete:
+        ended = await live_tracker.finish(
+            [uuid for uuid in live_tracker.games if uuid not in live.games]
+        )
+        for entry in ended:
+            room_name = ModeId2Room.get(entry.mode_id, "")
+            _id = f"对局ID: {entry.game_uuid}"
+            for account_id, nickname in entry.watchers:
+                msg = f"[订阅] {nickname} 结束了 {room_name} 的对局!\n{_id}"
+                # 对局已从跟踪中移除, 发送失败也不能中断其余消息的推送
+                for subscribe in subscribers.get(account_id, []):
+                    try:
+                        await subscribe.send(msg)
+                    except Exception as e:
+                        logger.warning(f"[majs] 推送对局结束消息失败: {e}")
+
+    await live_tracker.evict()
 
 
 @sv_majsoul_notify_sub.on_fullmatch("订阅雀魂推送")
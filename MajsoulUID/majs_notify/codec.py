@@ -3,7 +3,13 @@ import struct
 import betterproto
 
 from ..lib import lq as liblq
-from .model import InflightRequest, MajsoulLiqiProto, MajsoulDecodedMessage
+from .model import (
+    ReqRes,
+    MajsoulMethod,
+    InflightRequest,
+    MajsoulLiqiProto,
+    MajsoulDecodedMessage,
+)
 
 
 class MajsoulProtoCodec:
@@ -11,12 +17,37 @@ class MajsoulProtoCodec:
     REQUEST = 2
     RESPONSE = 3
 
+    # 请求序号在帧头中占 2 字节, 0 不使用
+    MAX_INDEX = 0xFFFF
+
     def __init__(self, pb_def: MajsoulLiqiProto, version: str):
         self._pb = pb_def
         self.index = 1
         self._inflight_requests: dict[int, InflightRequest] = {}
         self.version = version
 
+        # ".lq.Lobby.fetchInfo" -> ("ReqCommon", "ResFetchInfo")
+        self._rpcs: dict[str, ReqRes] = {}
+        # 以下在首次使用时才从 liblq 导入对应的类
+        self._methods: dict[str, MajsoulMethod] = {}
+        # ".lq.NotifyFriendStateChange" -> NotifyFriendStateChange
+        self._messages: dict[str, type[betterproto.Message]] = {}
+        self._build_tables()
+
+    def _build_tables(self):
+        known = set(liblq.__all__)
+        for package, nested in self._pb.nested.items():
+            for name, item in nested.nested.items():
+                if item.methods is None:
+                    continue
+                for rpc, proto_domain in item.methods.items():
+                    # liqi.json 可能比生成的 liblq 更新, 跳过本地不存在的类型
+                    if (
+                        proto_domain.requestType in known
+                        and proto_domain.responseType in known
+                    ):
+                        self._rpcs[f".{package}.{name}.{rpc}"] = proto_domain
+
     def unwrap(self, wrapped: bytes):
         data = liblq.Wrapper().parse(wrapped)
         return data
@@ -31,6 +62,26 @@ class MajsoulProtoCodec:
         liqi_method = getattr(liblq, path)
         return liqi_method
 
+    def lookup_rpc(self, method_name: str) -> MajsoulMethod:
+        method = self._methods.get(method_name)
+        if method is None:
+            proto_domain = self._rpcs.get(method_name)
+            if proto_domain is None:
+                raise ValueError(f"Unknown method {method_name}")
+            method = MajsoulMethod(
+                request_type=self.lookup_method(proto_domain.requestType),
+                response_type=self.lookup_method(proto_domain.responseType),
+            )
+            self._methods[method_name] = method
+        return method
+
+    def lookup_message(self, name: str) -> type[betterproto.Message]:
+        msg_obj = self._messages.get(name)
+        if msg_obj is None:
+            msg_obj = self.lookup_method(name.rsplit(".", 1)[-1])
+            self._messages[name] = msg_obj
+        return msg_obj
+
     def decode_message(self, buf: bytes):
         type_byte = buf[0]
 
@@ -38,18 +89,12 @@ class MajsoulProtoCodec:
             req_index = self.index
             msg = self.unwrap(buf[1:])
             method_name = msg.name
-            _, lq, notify = method_name.split(".")
-            msg_obj = self.lookup_method(notify)
+            msg_obj = self.lookup_message(method_name)
         elif type_byte == self.REQUEST:
             req_index = buf[1] | (buf[2] << 8)
             msg = self.unwrap(buf[3:])
             method_name = msg.name
-            _, lq, service, rpc = method_name.split(".")
-            proto_method = self._pb.nested[lq].nested[service].methods
-            if proto_method is None or rpc not in proto_method:
-                raise ValueError(f"Unknown method {rpc}")
-            proto_domain = proto_method[rpc]
-            msg_obj = self.lookup_method(proto_domain.requestType)
+            msg_obj = self.lookup_rpc(method_name).request_type
         elif type_byte == self.RESPONSE:
             req_index = buf[1] | (buf[2] << 8)
             msg = self.unwrap(buf[3:])
@@ -68,24 +113,27 @@ class MajsoulProtoCodec:
             payload=msg_obj().parse(msg.data),
         )
 
-    def encode_request(self, method_name: str, payload: dict):
-        current_index = self.index
-        self.index += 1
+    def next_index(self) -> int:
+        """取下一个空闲的请求序号, 到达上限后回绕并跳过仍在等待响应的序号"""
+        for _ in range(self.MAX_INDEX):
+            current_index = self.index
+            self.index = current_index % self.MAX_INDEX + 1
+            if current_index not in self._inflight_requests:
+                return current_index
+        raise RuntimeError("No free request index")
 
-        _, lq, service, rpc = method_name.split(".")
-        proto_method = self._pb.nested[lq].nested[service].methods
-        if proto_method is None or rpc not in proto_method:
-            raise ValueError(f"Unknown method {rpc}")
-        proto_domain = proto_method[rpc]
+    def cancel_request(self, req_index: int):
+        self._inflight_requests.pop(req_index, None)
 
-        requestType = self.lookup_method(proto_domain.requestType)
-        responseType = self.lookup_method(proto_domain.responseType)
+    def encode_request(self, method_name: str, payload: dict):
+        method = self.lookup_rpc(method_name)
+        current_index = self.next_index()
 
-        msg = requestType().from_dict(payload)
+        msg = method.request_type().from_dict(payload)
         msg = self.wrap(method_name, msg.SerializeToString())
 
         self._inflight_requests[current_index] = InflightRequest(
-            method_name=method_name, msg_obj=responseType
+            method_name=method_name, msg_obj=method.response_type
         )
 
         data = (
@@ -93,4 +141,4 @@ class MajsoulProtoCodec:
             + msg
         )
 
-        return data
+        return current_index, data
@@ -7,8 +7,8 @@ from gsuid_core.utils.image.convert import convert_img
 from gsuid_core.utils.image.image_tools import crop_center_img
 from gsuid_core.utils.fonts.fonts import core_font as majs_font
 
+from ..utils.map import res_map
 from ._level import MajsoulLevel
-from ..utils.map import lqc, extend_res
 from .majsoul_friend import MajsoulFriend
 from ..utils.image import get_bg, add_footer
 from ..utils.resource.get_res import get_charactor_img
@@ -30,11 +30,14 @@ async def draw_bar(
     bar_draw = ImageDraw.Draw(bar)
 
     avatar_id = str(avatar_id)
-    try:
-        path = lqc[avatar_id]["path"]
-    except KeyError:
+    await res_map.prepare()
+    path = res_map.get_skin_path(avatar_id)
+    if path is None:
         logger.info("找不到头像,采用默认头像")
-        path = lqc["400000"]["path"]
+        path = (
+            res_map.get_skin_path("400000")
+            or "extendRes/charactor/default_girl"
+        )
     name_path: str = path.split("/")[-1]
     local_path: Path = CHARACTOR_PATH / name_path / "bighead.png"
 
@@ -42,14 +45,12 @@ async def draw_bar(
         avatar = Image.open(local_path)
     else:
         path = path + "/bighead.png"
-        if path in extend_res:
-            path_prefix = extend_res[path]
-        else:
-            for i in extend_res:
-                if path in i:
-                    path_prefix = extend_res[i]
-                    path = i
-                    break
+        path_prefix = res_map.get_res_version(path)
+        if path_prefix is None:
+            # 仅存在带语言前缀的资源, 例如 jp/extendRes/...
+            found = res_map.find_res(path)
+            if found:
+                path, path_prefix = found[0]
             else:
                 path_prefix = "v0.11.14.w"
         url = f"https://game.maj-soul.com/1/{path_prefix}/{path}"
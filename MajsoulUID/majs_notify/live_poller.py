@@ -0,0 +1,94 @@
+import time
+import asyncio
+from typing import Dict, List, Callable, Awaitable
+
+from msgspec import Struct
+from gsuid_core.logger import logger
+
+from ..lib import lq as liblq
+from ..utils.api.remote_const import GameMode
+
+LIVE_FILTER_IDS = [int(f"2{gm.value}") for gm in GameMode]
+
+
+class TokenBucket:
+    """令牌桶限流: 平均每秒 rate 次, 最多连续 capacity 次"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class LiveGames(Struct):
+    # uuid -> 对局
+    games: Dict[str, liblq.GameLiveHead]
+    # 所有段位场都有结果(包括沿用上一次的结果), 为 False 时 games 可能不完整
+    complete: bool = True
+
+
+class MajsoulLivePoller:
+    """
+    并发获取所有段位场的观战列表。
+
+    某个段位场获取失败时沿用该段位场上一次的结果,
+    避免把其中的对局误判为已结束。
+    对局的开始/结束由调用方与已跟踪的对局 (live_tracker) 比较得出,
+    重启后也不会丢失。
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[List[liblq.GameLiveHead]]],
+        rate: float = 2,
+        capacity: int = 4,
+    ):
+        self.fetch = fetch
+        self.bucket = TokenBucket(rate, capacity)
+        self._by_filter: Dict[int, Dict[str, liblq.GameLiveHead]] = {}
+        self.complete = False
+
+    async def _fetch_filter(self, filter_id: int):
+        await self.bucket.acquire()
+        games = await self.fetch(filter_id)
+        return {game.uuid: game for game in games}
+
+    async def fetch_all(self) -> Dict[str, liblq.GameLiveHead]:
+        results = await asyncio.gather(
+            *(self._fetch_filter(i) for i in LIVE_FILTER_IDS),
+            return_exceptions=True,
+        )
+        games: Dict[str, liblq.GameLiveHead] = {}
+        self.complete = True
+        for filter_id, result in zip(LIVE_FILTER_IDS, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"[majs] 获取观战列表 {filter_id} 失败: {result}"
+                )
+                if filter_id not in self._by_filter:
+                    self.complete = False
+                    continue
+                result = self._by_filter[filter_id]
+            self._by_filter[filter_id] = result
+            games.update(result)
+        return games
+
+    async def poll(self) -> LiveGames:
+        games = await self.fetch_all()
+        return LiveGames(games=games, complete=self.complete)
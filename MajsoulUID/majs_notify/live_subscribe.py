@@ -0,0 +1,43 @@
+import time
+from typing import Dict, List, Optional
+
+from gsuid_core.subscribe import gs_subscribe
+from gsuid_core.utils.database.models import Subscribe
+
+TASK_NAME_MAJSOUL_LIVE = "雀魂观战订阅"
+
+
+class MajsoulLiveSubscribers:
+    """
+    观战订阅按雀魂账号ID建立的索引
+
+    订阅变化时由 invalidate() 重建; 为兼容在控制台等其他途径修改的订阅,
+    超过 ttl 秒后也会重新读取。
+    """
+
+    def __init__(self, task_name: str, ttl: float = 600):
+        self.task_name = task_name
+        self.ttl = ttl
+        self._index: Optional[Dict[str, List[Subscribe]]] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self):
+        self._index = None
+
+    async def get(self) -> Dict[str, List[Subscribe]]:
+        if (
+            self._index is None
+            or time.monotonic() - self._loaded_at >= self.ttl
+        ):
+            datas = await gs_subscribe.get_subscribe(self.task_name)
+            index: Dict[str, List[Subscribe]] = {}
+            for subscribe in datas or []:
+                index.setdefault(str(subscribe.extra_message), []).append(
+                    subscribe
+                )
+            self._index = index
+            self._loaded_at = time.monotonic()
+        return self._index
+
+
+live_subscribers = MajsoulLiveSubscribers(TASK_NAME_MAJSOUL_LIVE)
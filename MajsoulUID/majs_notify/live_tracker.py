@@ -0,0 +1,92 @@
+"""
+观战订阅的对局跟踪
+
+正在进行且有订阅玩家参与的对局保存在数据库 (MajsLiveGame) 中,
+重启后不会重复推送开始消息, 重启期间结束的对局也会推送结束消息。
+超过 ttl 仍未结束的对局视为异常数据直接丢弃, 避免长时间运行后占用内存。
+"""
+
+import time
+from typing import Dict, List, Tuple
+
+from msgspec import Struct, json
+from gsuid_core.logger import logger
+
+from ..utils.database.models import MajsLiveGame
+
+
+class LiveGameEntry(Struct):
+    game_uuid: str
+    mode_id: int
+    start_time: int
+    # [(雀魂账号ID, 昵称)]
+    watchers: List[Tuple[str, str]]
+
+
+class MajsoulLiveTracker:
+    def __init__(self, ttl: int = 4 * 3600):
+        self.ttl = ttl
+        self.games: Dict[str, LiveGameEntry] = {}
+        self._loaded = False
+
+    def __contains__(self, game_uuid: str) -> bool:
+        return game_uuid in self.games
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    async def load(self):
+        if self._loaded:
+            return
+        for row in await MajsLiveGame.get_all_games():
+            self.games[row.game_uuid] = LiveGameEntry(
+                game_uuid=row.game_uuid,
+                mode_id=row.mode_id,
+                start_time=row.start_time,
+                watchers=json.decode(row.watchers, type=List[Tuple[str, str]]),
+            )
+        self._loaded = True
+        logger.info(f"[majs] 载入 {len(self.games)} 个正在跟踪的对局")
+        await self.evict()
+
+    async def track(
+        self,
+        game_uuid: str,
+        mode_id: int,
+        watchers: List[Tuple[str, str]],
+    ) -> LiveGameEntry:
+        entry = LiveGameEntry(
+            game_uuid=game_uuid,
+            mode_id=mode_id,
+            start_time=int(time.time()),
+            watchers=watchers,
+        )
+        self.games[game_uuid] = entry
+        await MajsLiveGame.upsert_game(
+            game_uuid,
+            mode_id,
+            entry.start_time,
+            json.encode(watchers).decode(),
+        )
+        return entry
+
+    async def finish(self, game_uuids: List[str]) -> List[LiveGameEntry]:
+        entries = [
+            self.games.pop(uuid) for uuid in game_uuids if uuid in self.games
+        ]
+        await MajsLiveGame.delete_games([e.game_uuid for e in entries])
+        return entries
+
+    async def evict(self) -> List[LiveGameEntry]:
+        deadline = time.time() - self.ttl
+        stale = [
+            uuid
+            for uuid, entry in self.games.items()
+            if entry.start_time < deadline
+        ]
+        if stale:
+            logger.info(f"[majs] 丢弃 {len(stale)} 个超时未结束的对局")
+        return await self.finish(stale)
+
+
+live_tracker = MajsoulLiveTracker()
@@ -1,39 +1,55 @@
 import hmac
-import json
+import time
 import uuid
+import heapq
 import random
 import asyncio
 import hashlib
+from functools import partial
 from collections.abc import Iterable
-from typing import Dict, List, Union, Sequence, cast
+from typing import (
+    Set,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    TypeVar,
+    Callable,
+    Optional,
+    Sequence,
+    Awaitable,
+    cast,
+)
 
 import httpx
-import aiofiles
 import websockets.client
 from gsuid_core.gss import gss
 from gsuid_core.logger import logger
-from msgspec import ValidationError, convert
 from gsuid_core.subscribe import gs_subscribe
+from msgspec import Struct, ValidationError, convert
 
 from .utils import getRes
 from ..lib import lq as liblq
 from ._level import MajsoulLevel
+from .shard import MajsoulShardMap
 from .codec import MajsoulProtoCodec
-from .majsoul_friend import MajsoulFriend
-from ..utils.api.remote_const import GameMode
-from .tenhou.parser import MajsoulPaipuParser
+from .paipu_store import paipu_store
+from .singleflight import SingleFlight
+from .live_poller import MajsoulLivePoller
+from .notify_pool import MajsoulNotifyPool
 from .constants import USER_AGENT, ModeId2Room
 from ..majs_config.majs_config import MAJS_CONFIG
-from ..utils.resource.RESOURCE_PATH import PAIPU_PATH
-from ..utils.database.models import MajsPush, MajsUser, MajsPaipu
+from .router import MajsoulRouter, MajsoulRpcStats
+from ..utils.database.models import MajsPush, MajsUser
+from ..utils.database.paipu_writer import paipu_writer
+from .tenhou.parser import MajsoulPaipuParser, iter_record_actions
+from .majsoul_friend import MajsoulFriend, MajsoulFriendIndex, rank_key
 from ..utils.api.remote import (
     decode_log_id,
     encode_account_id,
     decode_account_id2,
 )
 from .model import (
-    MjsLog,
-    MjsLogItem,
     MajsoulConfig,
     MajsoulResInfo,
     MajsoulUSConfig,
@@ -44,12 +60,26 @@ from .model import (
 
 PP_HOST = "https://game.maj-soul.com/1/?paipu="
 TASK_NAME_MAJSOUL_NOTIFY = "订阅雀魂消息推送"
+CN_URL_BASE = "https://game.maj-soul.com/"
+
+# fetchMajsoulInfo 的结果: (server, pbDef, pbVersion, version_info)
+MajsoulInfo = Tuple[str, MajsoulLiqiProto, str, MajsoulVersionInfo]
+
+T = TypeVar("T")
+
+# 断线重连的等待时间: 第n次为 [0, min(MAX, BASE * 2^n)] 内的随机值
+RECONNECT_BASE_DELAY = 1
+RECONNECT_MAX_DELAY = 300
 
 
 class MajsoulMaintenanceError(Exception):
     pass
 
 
+class MajsoulRpcTimeoutError(TimeoutError):
+    pass
+
+
 def process_dict(obj):
     if isinstance(obj, dict):
         return {key: process_dict(value) for key, value in obj.items()}
@@ -67,11 +97,58 @@ def process_dict(obj):
 
 
 async def get_paipu_by_game_id(game_id: str) -> Union[Dict, None]:
-    path = PAIPU_PATH / f"{game_id} - raw.json"
-    if path.exists():
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            data = json.loads(await f.read())
-            return data
+    return await paipu_store.load(game_id, "tenhou")
+
+
+def parse_game_id(game_id: str) -> Tuple[str, Optional[int]]:
+    """牌谱URL中的对局ID -> (牌谱uuid, 视角玩家ID)"""
+    seps = game_id.split("_")
+    log_id = seps[0]
+
+    if len(seps) >= 3 and seps[2] == "2":
+        log_id = decode_log_id(log_id)
+
+    target_id = None
+    if len(seps) >= 2:
+        if seps[1][0] == "a":
+            target_id = decode_account_id2(int(seps[1][1:]))
+        else:
+            target_id = int(seps[1])
+    return log_id, target_id
+
+
+def convert_game_record(
+    game_id: str,
+    logs: liblq.ResGameRecord,
+    lookup: Optional[Callable[[str], type]] = None,
+) -> Dict:
+    """将 ResGameRecord 转换为天凤格式牌谱, 不涉及网络请求"""
+    log_id, target_id = parse_game_id(game_id)
+    detail_records = liblq.Wrapper().parse(logs.data)
+    payload = liblq.GameDetailRecords().parse(detail_records.data)
+
+    actions = (
+        iter_record_actions(payload, lookup)
+        if lookup is not None
+        else iter_record_actions(payload)
+    )
+    tenhou_log = MajsoulPaipuParser().parse(logs.head, actions)
+
+    tenhou_log["head"] = process_dict(logs.head.__dict__)
+    tenhou_log["game_id"] = game_id
+    tenhou_log["log_id"] = log_id
+    tenhou_log["target_id"] = target_id
+
+    if target_id is not None:
+        for acc in logs.head.accounts:
+            if acc.account_id == target_id:
+                tenhou_log["_target_actor"] = acc.seat
+                break
+    return tenhou_log
+
+
+# 多个账号连接共享, 同一牌谱同时只拉取解析一次
+fetch_logs_flight: SingleFlight[Dict] = SingleFlight()
 
 
 class MajsoulConnection:
@@ -85,15 +162,28 @@ class MajsoulConnection:
         self._endpoint = server
         self._codec = codec
         self._ws = None
-        self._req_events: dict[int, asyncio.Event] = {}
-        self._res: dict[int, MajsoulDecodedMessage] = {}
+        # 等待响应的请求, req_index -> future
+        self._pending: dict[int, asyncio.Future[MajsoulDecodedMessage]] = {}
+        self._rpc_limit = asyncio.Semaphore(
+            MAJS_CONFIG.get_config("MajsRpcMaxConcurrency").data
+        )
+        self.versionInfo = versionInfo
         self.clientVersionString = "web-" + versionInfo.version.replace(".w", "")
         self.no_operation_counter = 0
-        self.bg_tasks = []
-        self.queue = asyncio.queues.Queue()
+        self.bg_tasks: list[asyncio.Task] = []
+        # 已登录且连接正常
+        self.online = False
+        self.reconnects = 0
+        self.rpc_stats = MajsoulRpcStats()
+        self._reconnect_attempt = 0
+        self.notify_pool = MajsoulNotifyPool(
+            workers=MAJS_CONFIG.get_config("MajsNotifyWorkers").data,
+            maxsize=MAJS_CONFIG.get_config("MajsNotifyQueueSize").data,
+            policy=MAJS_CONFIG.get_config("MajsNotifyOverflow").data,
+        )
         self.account_id = 0
         self.nick_name = ""
-        self.friends: list[MajsoulFriend] = []
+        self.friends = MajsoulFriendIndex()
         self.friend_apply_list: list[int] = []
         self.random_key = str(uuid.uuid4())
         self.login_type = login_type
@@ -121,15 +211,107 @@ class MajsoulConnection:
             return False
         return True
 
-    async def start_sv(self):
-        await asyncio.gather(self.process(), self.dispatch_msg())
-
-    async def connect(self):
+    def _create_task(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self.bg_tasks.append(task)
+        task.add_done_callback(self._discard_task)
+        return task
+
+    def _discard_task(self, task: asyncio.Task):
+        if task in self.bg_tasks:
+            self.bg_tasks.remove(task)
+
+    async def close(self):
+        self.online = False
+        for task in list(self.bg_tasks):
+            task.cancel()
+        self.bg_tasks.clear()
+        await self._close_ws()
+
+    async def _close_ws(self):
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception as e:
+                logger.debug(f"[majs] 关闭连接时发生错误: {e}")
+
+    async def _open(self):
         logger.info(f"Connecting to {self._endpoint}")
         self._ws = await websockets.client.connect(  # type: ignore
             self._endpoint,
         )
-        self._msg_dispatcher = asyncio.create_task(self.start_sv())
+
+    async def connect(self):
+        await self._open()
+        self._create_task(self.process())
+        self._create_task(self._supervise())
+
+    async def _supervise(self):
+        """接收消息, 连接断开后只重连本账号, 不影响账号池中的其他连接"""
+        while True:
+            try:
+                await self.dispatch_msg()
+            except Exception as e:
+                logger.warning(f"[majs] 账号 {self.account_id} 连接断开: {e}")
+            self.online = False
+            await self._close_ws()
+            await self._reopen()
+            # 登录请求的响应需要由 dispatch_msg 接收, 放在单独的任务中执行
+            self._create_task(self._resume())
+
+    async def _reopen(self):
+        while True:
+            delay = random.uniform(
+                0,
+                min(
+                    RECONNECT_MAX_DELAY,
+                    RECONNECT_BASE_DELAY * 2**self._reconnect_attempt,
+                ),
+            )
+            self._reconnect_attempt += 1
+            logger.info(
+                f"[majs] 账号 {self.account_id} 将在 {delay:.1f}s 后"
+                f"进行第 {self._reconnect_attempt} 次重连"
+            )
+            await asyncio.sleep(delay)
+            try:
+                await self._open()
+                return
+            except Exception as e:
+                logger.warning(f"[majs] 账号 {self.account_id} 重连失败: {e}")
+
+    async def _resume(self):
+        """使用保存的 access_token 重新登录, 并重新获取好友状态"""
+        try:
+            await self.rpc_call(
+                ".lq.Route.heartbeat",
+                {
+                    "delay": random.randint(0, 200),
+                    "no_operation_counter": 0,
+                    "platform": 11,
+                    "network_quality": random.randint(0, 100),
+                },
+            )
+            if self.login_type == 7:
+                await self.jp_access_token_login(
+                    self.versionInfo, self.access_token
+                )
+            else:
+                await self.access_token_login(
+                    self.versionInfo, self.access_token
+                )
+            await self.fetchInfo()
+        except Exception as e:
+            logger.warning(f"[majs] 账号 {self.account_id} 重新登录失败: {e}")
+            # 关闭连接, 由 _supervise 继续重连
+            self.online = False
+            await self._close_ws()
+            return
+
+        self._reconnect_attempt = 0
+        self.reconnects += 1
+        logger.success(f"[majs] 账号 {self.account_id} 已重新连接")
 
     async def _notify_subscribers(self, task_name: str, message: str):
         """通知订阅者"""
@@ -195,16 +377,35 @@ class MajsoulConnection:
 
     async def handle_notify(self, notify: MajsoulDecodedMessage):
         logger.info(f"[majs] 通知: {notify}")
+        pool = self.notify_pool
         if notify.method_name == ".lq.NotifyFriendStateChange":
-            self.queue.put_nowait(self.handle_FriendStateChange(notify))
+            data = cast(liblq.NotifyFriendStateChange, notify.payload)
+            pool.submit(
+                data.target_id,
+                partial(self.handle_FriendStateChange, notify),
+            )
         elif notify.method_name == ".lq.NotifyFriendViewChange":
-            self.queue.put_nowait(self.handle_FriendViewChange(notify))
+            data = cast(liblq.NotifyFriendViewChange, notify.payload)
+            # 资料变更只需保留最新的一次
+            pool.submit(
+                data.target_id,
+                partial(self.handle_FriendViewChange, notify),
+                coalesce_key=(notify.method_name, data.target_id),
+            )
         elif notify.method_name == ".lq.NotifyNewFriendApply":
-            self.queue.put_nowait(self.handle_NewFriendApply(notify))
+            data = cast(liblq.NotifyNewFriendApply, notify.payload)
+            pool.submit(
+                data.account_id,
+                partial(self.handle_NewFriendApply, notify),
+            )
         elif notify.method_name == ".lq.NotifyFriendChange":
-            self.queue.put_nowait(self.handle_FriendChange(notify))
+            data = cast(liblq.NotifyFriendChange, notify.payload)
+            pool.submit(
+                data.account_id,
+                partial(self.handle_FriendChange, notify),
+            )
         elif notify.method_name == ".lq.NotifyAnotherLogin":
-            self.queue.put_nowait(self.handle_AnotherLogin())
+            pool.submit(self.account_id, self.handle_AnotherLogin)
         else:
             logger.warning(f"[majs] 未知通知: {notify}")
 
@@ -241,143 +442,124 @@ class MajsoulConnection:
         target_user = data.target_id
         active_state = data.active_state
         msg = ""
-        for friend in self.friends:
-            if friend.account_id == target_user:
-                nick_name = friend.nickname
-                # find what changed
-                if active_state.is_online and not friend.is_online:
-                    msg = f"{nick_name} 上线了"
-                elif not active_state.is_online and friend.is_online:
-                    msg = f"{nick_name} 下线了"
-
-                # if active_state have playing
-                active_uuid = active_state.playing.game_uuid
-                if active_uuid and not friend.playing.game_uuid:
-                    category, type_name, mode_id = get_playing(active_state)
-
-                    room_name = ModeId2Room.get(mode_id, "")
-                    if room_name:
-                        msg = f"{nick_name} 开始了在 {room_name} 的对局\n"
-                    else:
-                        msg = f"{nick_name} 开始了在 {type_name} 的对局\n"
-                    msg += f"对局id: {active_state.playing.game_uuid}"
-                    # save game_uuid
-                    if not await MajsPaipu.data_exist(uuid=active_uuid):
-                        await MajsPaipu.insert_data(
-                            account_id=str(friend.account_id),
-                            uuid=active_uuid,
-                            paipu_type=category,
-                            paipu_type_name=type_name,
-                        )
+        friend = self.friends.get(target_user)
+        if friend is not None:
+            nick_name = friend.nickname
+            # find what changed
+            if active_state.is_online and not friend.is_online:
+                msg = f"{nick_name} 上线了"
+            elif not active_state.is_online and friend.is_online:
+                msg = f"{nick_name} 下线了"
+
+            # if active_state have playing
+            active_uuid = active_state.playing.game_uuid
+            if active_uuid and not friend.playing.game_uuid:
+                category, type_name, mode_id = get_playing(active_state)
+
+                room_name = ModeId2Room.get(mode_id, "")
+                if room_name:
+                    msg = f"{nick_name} 开始了在 {room_name} 的对局\n"
+                else:
+                    msg = f"{nick_name} 开始了在 {type_name} 的对局\n"
+                msg += f"对局id: {active_state.playing.game_uuid}"
+                # save game_uuid
+                paipu_writer.add(
+                    account_id=str(friend.account_id),
+                    uuid=active_uuid,
+                    paipu_type=category,
+                    paipu_type_name=type_name,
+                )
 
-                elif not active_state.playing and friend.playing:
-                    category, type_name, mode_id = get_playing(friend.playing)
-
-                    mode_id = friend.playing.meta.mode_id
-                    room_name = ModeId2Room.get(mode_id, "")
-                    if room_name:
-                        msg = f"{nick_name} 结束了在 {room_name} 的对局\n"
-                    else:
-                        msg = f"{nick_name} 结束了在 {type_name} 的对局\n"
-                    uuid = friend.playing.game_uuid
-                    encode_aid = encode_account_id(friend.account_id)
-                    url = f"{PP_HOST}{uuid}_a{encode_aid}"
-
-                    # check 三麻 or 四麻
-                    is_sanma = False
-                    if "三" in room_name:
-                        is_sanma = True
-
-                    cvs = self.clientVersionString
-                    game_record = cast(
-                        liblq.ResGameRecord,
-                        await self.rpc_call(
-                            ".lq.Lobby.fetchGameRecord",
-                            {
-                                "game_uuid": uuid,
-                                "client_version_string": cvs,
-                            },
-                        ),
-                    )
+            elif not active_state.playing and friend.playing:
+                category, type_name, mode_id = get_playing(friend.playing)
 
-                    # check if game_record is valid
-                    if game_record.error.code:
-                        # check is_online before send message
-                        if not active_state.is_online:
-                            friend.change_state(active_state)
-                            if not await MajsPaipu.data_exist(uuid=active_uuid):
-                                await MajsPaipu.insert_data(
-                                    account_id=str(friend.account_id),
-                                    uuid=active_uuid,
-                                    paipu_type=category,
-                                    paipu_type_name=type_name,
-                                )
-                            return
-                        logger.error(f"获取牌谱失败: {game_record.error}, retrying")
-                        # sleep 1s
-                        await asyncio.sleep(1)
-                        # retry 1 time
-                        cvs = self.clientVersionString
-                        game_record = cast(
-                            liblq.ResGameRecord,
-                            await self.rpc_call(
-                                ".lq.Lobby.fetchGameRecord",
-                                {
-                                    "game_uuid": uuid,
-                                    "client_version_string": cvs,
-                                },
-                            ),
-                        )
-                        if game_record.error.code:
-                            logger.error(f"获取牌谱失败: {game_record.error}")
-                            msg += "获取牌谱失败\n"
-                            msg += f"对局id: {uuid}"
-                            msg += f"对局牌谱:{url}"
-                            friend.change_state(active_state)
-                            await self.send_msg_to_user(str(target_user), msg)
-                            continue
-
-                    accounts = game_record.head.accounts
-                    friend_seat = 0
-                    friend_level_id = 0
-                    friend_score = 0
-                    for account in accounts:
-                        if account.account_id == friend.account_id:
-                            friend_seat = account.seat
-                            if is_sanma:
-                                friend_level_id = account.level3.id
-                                friend_score = account.level3.score
-                            else:
-                                friend_level_id = account.level.id
-                                friend_score = account.level.score
-                            break
-                    record_result = game_record.head.result.players
-                    for i, player in enumerate(record_result):
-                        if player.seat == friend_seat:
-                            msg += f"排名:{i + 1} "
-                            msg += f"最终打点:{player.part_point_1} "
-                            msg += f"得点:{player.grading_score}\n"
-
-                            if category == 2:
-                                level_info = MajsoulLevel(
-                                    friend_level_id
-                                ).formatAdjustedScoreWithTag(
-                                    friend_score + player.grading_score
-                                )
-                                msg += f"当前段位:{level_info}\n"
-                            break
-
-                    msg += f"对局牌谱:{url}"
-                    if not await MajsPaipu.data_exist(uuid=active_uuid):
-                        await MajsPaipu.insert_data(
+                mode_id = friend.playing.meta.mode_id
+                room_name = ModeId2Room.get(mode_id, "")
+                if room_name:
+                    msg = f"{nick_name} 结束了在 {room_name} 的对局\n"
+                else:
+                    msg = f"{nick_name} 结束了在 {type_name} 的对局\n"
+                uuid = friend.playing.game_uuid
+                encode_aid = encode_account_id(friend.account_id)
+                url = f"{PP_HOST}{uuid}_a{encode_aid}"
+
+                # check 三麻 or 四麻
+                is_sanma = False
+                if "三" in room_name:
+                    is_sanma = True
+
+                game_record = await manager.route_call(
+                    lambda conn: conn.fetchGameRecord(uuid)
+                )
+
+                # check if game_record is valid
+                if game_record.error.code:
+                    # check is_online before send message
+                    if not active_state.is_online:
+                        friend.change_state(active_state)
+                        paipu_writer.add(
                             account_id=str(friend.account_id),
-                            uuid=active_uuid,
+                            uuid=uuid,
                             paipu_type=category,
                             paipu_type_name=type_name,
                         )
+                        return
+                    logger.error(f"获取牌谱失败: {game_record.error}, retrying")
+                    # sleep 1s
+                    await asyncio.sleep(1)
+                    # retry 1 time
+                    game_record = await manager.route_call(
+                        lambda conn: conn.fetchGameRecord(uuid)
+                    )
+                    if game_record.error.code:
+                        logger.error(f"获取牌谱失败: {game_record.error}")
+                        msg += "获取牌谱失败\n"
+                        msg += f"对局id: {uuid}"
+                        msg += f"对局牌谱:{url}"
+                        friend.change_state(active_state)
+                        await self.send_msg_to_user(str(target_user), msg)
+                        return
+
+                accounts = game_record.head.accounts
+                friend_seat = 0
+                friend_level_id = 0
+                friend_score = 0
+                for account in accounts:
+                    if account.account_id == friend.account_id:
+                        friend_seat = account.seat
+                        if is_sanma:
+                            friend_level_id = account.level3.id
+                            friend_score = account.level3.score
+                        else:
+                            friend_level_id = account.level.id
+                            friend_score = account.level.score
+                        break
+                record_result = game_record.head.result.players
+                for i, player in enumerate(record_result):
+                    if player.seat == friend_seat:
+                        msg += f"排名:{i + 1} "
+                        msg += f"最终打点:{player.part_point_1} "
+                        msg += f"得点:{player.grading_score}\n"
+
+                        if category == 2:
+                            level_info = MajsoulLevel(
+                                friend_level_id
+                            ).formatAdjustedScoreWithTag(
+                                friend_score + player.grading_score
+                            )
+                            msg += f"当前段位:{level_info}\n"
+                        break
+
+                msg += f"对局牌谱:{url}"
+                paipu_writer.add(
+                    account_id=str(friend.account_id),
+                    uuid=uuid,
+                    paipu_type=category,
+                    paipu_type_name=type_name,
+                )
 
-                # set friend state
-                friend.change_state(active_state)
+            # set friend state
+            friend.change_state(active_state)
         if msg:
             await self.send_msg_to_user(str(target_user), msg)
 
@@ -386,10 +568,8 @@ class MajsoulConnection:
         target_user = data.target_id
         changed_base = data.base
         msg = ""
-        for friend in self.friends:
-            if friend.account_id == target_user:
-                # set friend base
-                friend.change_base(changed_base)
+        # set friend base
+        self.friends.change_base(target_user, changed_base)
         if msg:
             await self.send_msg_to_user(str(target_user), msg)
 
@@ -399,33 +579,26 @@ class MajsoulConnection:
         meta_msg = ""
         if data.type == 1:
             # TODO: The meaning of type 1 is not clear, need to check
-            for friend in self.friends:
-                if friend.account_id == data.account_id:
-                    meta_msg = f"好友 {data.account_id} 已在好友列表中！"
-                    logger.error(meta_msg)
+            # maybe add friend
+            friend = MajsoulFriend(data.friend)
+            if self.friends.add(friend):
+                meta_msg = f"账号成功添加好友 {friend.nickname}！"
+                if data.account_id in self.friend_apply_list:
+                    self.friend_apply_list.remove(data.account_id)
             else:
-                # maybe add friend
-                friend = MajsoulFriend(data.friend)
-                if friend not in self.friends:
-                    self.friends.append(friend)
-                    meta_msg = f"账号成功添加好友 {friend.nickname}！"
-                    if data.account_id in self.friend_apply_list:
-                        self.friend_apply_list.remove(data.account_id)
-                else:
-                    meta_msg = f"账号已存在好友 {friend.nickname}！"
+                meta_msg = f"账号已存在好友 {friend.nickname}！"
+                logger.error(meta_msg)
         elif data.type == 2:
             # 删除好友
-            for friend in self.friends:
-                if friend.account_id == data.account_id:
-                    self.friends.remove(friend)
-                    meta_msg = f"账号成功删除好友 {friend.nickname}！"
-                    break
+            friend = self.friends.remove(data.account_id)
+            if friend is not None:
+                meta_msg = f"账号成功删除好友 {friend.nickname}！"
         else:
             # check if friend is in self.friends
-            for friend in self.friends:
-                if friend.account_id == data.account_id:
-                    friend = MajsoulFriend(data.friend)
-                    meta_msg = f"数据成功更新好友 {friend.nickname}！"
+            if data.account_id in self.friends:
+                friend = MajsoulFriend(data.friend)
+                self.friends.add(friend)
+                meta_msg = f"数据成功更新好友 {friend.nickname}！"
         if meta_msg:
             await self.send_meta(meta_msg)
 
@@ -434,12 +607,8 @@ class MajsoulConnection:
         account_id = data.account_id
         meta_msg = f"收到来自 {account_id} 的好友申请"
         self.friend_apply_list.append(account_id)
-        resp = cast(
-            liblq.ResMultiAccountBrief,
-            await self.rpc_call(
-                ".lq.Lobby.fetchMultiAccountBrief",
-                {"account_id_list": [account_id]},
-            ),
+        resp = await manager.route_call(
+            lambda conn: conn.fetchMultiAccountBrief([account_id])
         )
         if resp.error.code:
             meta_msg = f"NotifyNewFriendApply信息序列化错误{account_id}!"
@@ -453,23 +622,39 @@ class MajsoulConnection:
             await self.send_meta(meta_msg)
 
         if MAJS_CONFIG.get_config("MajsIsAutoApplyFriend").data:
-            await self.acceptFriendApply(account_id)
+            if manager.shards.has_capacity(self):
+                await self.acceptFriendApply(account_id)
+            else:
+                await self.send_meta(
+                    f"账号好友数已达到上限, 未自动同意 {account_id} 的好友申请"
+                )
 
     async def dispatch_msg(self):
-        if self._ws is None:
+        ws = self._ws
+        if ws is None:
             raise ConnectionError("Connection is broken")
 
         while True:
-            msg = await self._ws.recv()
+            try:
+                msg = await ws.recv()
+            except Exception as e:
+                self._fail_pending(
+                    ConnectionError(f"Connection is broken: {e}")
+                )
+                raise
             assert isinstance(msg, bytes)
-            data = self._codec.decode_message(msg)
+            try:
+                data = self._codec.decode_message(msg)
+            except ValueError as e:
+                # 例如已超时请求的迟到响应
+                logger.warning(f"[majs] 丢弃无法解析的消息: {e}")
+                continue
             logger.debug(f"[majs] 收到消息, index: {data.req_index}")
             if data.msg_type == self._codec.RESPONSE:
-                idx = data.req_index
-                if idx not in self._req_events:
-                    continue
-                self._res[idx] = data
-                self._req_events[idx].set()
+                fut = self._pending.get(data.req_index)
+                if fut is not None and not fut.done():
+                    fut.set_result(data)
+                continue
             if data.msg_type == self._codec.NOTIFY:
                 try:
                     await self.handle_notify(data)
@@ -480,29 +665,63 @@ class MajsoulConnection:
                 logger.info(f"Request: {data}")
                 continue
 
-    async def rpc_call(self, method_name: str, payload: dict):
-        idx = self._codec.index
-        logger.debug(f"[majs] 触发rpc_call, index: {idx}")
+    def _fail_pending(self, error: Exception):
+        for idx, fut in self._pending.items():
+            if not fut.done():
+                fut.set_exception(error)
+            self._codec.cancel_request(idx)
+        self._pending.clear()
+
+    async def rpc_call(
+        self,
+        method_name: str,
+        payload: dict,
+        timeout: float | None = None,
+    ):
         if self._ws is None:
             raise ConnectionError("Connection is broken")
 
-        req = self._codec.encode_request(method_name, payload)
+        if timeout is None:
+            timeout = MAJS_CONFIG.get_config("MajsRpcTimeout").data
 
-        evt = asyncio.Event()
-        self._req_events[idx] = evt
-        await self._ws.send(req)
-        await evt.wait()
-
-        res = self._res[idx]
-        del self._res[idx]
-        if idx in self._req_events:
-            del self._req_events[idx]
+        self.rpc_stats.begin()
+        start, ok = time.perf_counter(), False
+        try:
+            res = await self._rpc_call(method_name, payload, timeout)
+            ok = True
+        finally:
+            self.rpc_stats.end(time.perf_counter() - start, ok)
+        return res
+
+    async def _rpc_call(self, method_name: str, payload: dict, timeout: float):
+        # 超出并发上限的请求在此排队, 避免一次性塞满socket
+        async with self._rpc_limit:
+            # 排队期间连接可能已断开
+            ws = self._ws
+            if ws is None:
+                raise ConnectionError("Connection is broken")
+            idx, req = self._codec.encode_request(method_name, payload)
+            logger.debug(f"[majs] 触发rpc_call, index: {idx}")
+
+            fut = asyncio.get_running_loop().create_future()
+            self._pending[idx] = fut
+            try:
+                await ws.send(req)
+                res = await asyncio.wait_for(fut, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"[majs] {method_name} 请求超时, index: {idx}")
+                raise MajsoulRpcTimeoutError(f"{method_name} timed out")
+            finally:
+                self._pending.pop(idx, None)
+                self._codec.cancel_request(idx)
 
         return res.payload
 
-    async def error_handler(self, error: liblq.Error):
+    async def error_handler(self, error: Union[liblq.Error, Exception]):
         logger.error(f"[majs] {self.account_id} Connection lost: {error}")
-        await manager.restart()
+        # 关闭连接后由 _supervise 负责重连
+        self.online = False
+        await self._close_ws()
 
     async def create_heartbeat_task(self):
         # create a new task to keep the connection alive, 300s heartbeat
@@ -511,48 +730,41 @@ class MajsoulConnection:
                 # random sleep to avoid heartbeat collision
                 timeout = random.randint(300, 360)
                 await asyncio.sleep(timeout)
-                resp = cast(
-                    liblq.ResServerTime,
-                    await self.rpc_call(".lq.Lobby.fetchServerTime", {}),
-                )
-                # check if the connection is still alive
-                if resp.error.code:
-                    await self.error_handler(resp.error)
-                resp = cast(
-                    liblq.ResCommon,
-                    await self.rpc_call(
-                        ".lq.Route.heartbeat",
-                        {
-                            "delay": random.randint(0, 200),
-                            "no_operation_counter": 0,
-                            "platform": 11,
-                            "network_quality": random.randint(0, 100),
-                        },
-                    ),
-                )
-                if resp.error.code:
-                    await self.error_handler(resp.error)
+                try:
+                    resp = cast(
+                        liblq.ResServerTime,
+                        await self.rpc_call(".lq.Lobby.fetchServerTime", {}),
+                    )
+                    # check if the connection is still alive
+                    if resp.error.code:
+                        await self.error_handler(resp.error)
+                    resp = cast(
+                        liblq.ResCommon,
+                        await self.rpc_call(
+                            ".lq.Route.heartbeat",
+                            {
+                                "delay": random.randint(0, 200),
+                                "no_operation_counter": 0,
+                                "platform": 11,
+                                "network_quality": random.randint(0, 100),
+                            },
+                        ),
+                    )
+                    if resp.error.code:
+                        await self.error_handler(resp.error)
+                except Exception as e:
+                    await self.error_handler(e)
 
-        task = asyncio.create_task(heartbeat())
-        self.bg_tasks.append(task)
+        self._create_task(heartbeat())
 
     async def process(self):
-        while True:
-            data = await self.queue.get()
-            asyncio.create_task(data)
-            self.queue.task_done()
+        await self.notify_pool.run()
 
     async def check_connection(self):
         if self._ws is None:
             raise ConnectionError("Connection is broken")
         return True
 
-    def remove_duplicate_friends(self):
-        # friends: List[MajsoulFriend] = []
-        unique_friends = {friend.account_id: friend for friend in self.friends}
-        self.friends = list(unique_friends.values())
-        return self.friends
-
     def encode_p(self, password: str):
         return hmac.new(b"lailai", password.encode(), hashlib.sha256).hexdigest()
 
@@ -577,7 +789,13 @@ class MajsoulConnection:
         logger.info(f"OAuth2 Auth: {resp}")
         if resp.error.code:
             raise ValueError(f"Failed to oauth2Auth: {resp}")
-        access_token = resp.access_token
+        await self.jp_access_token_login(version_info, resp.access_token)
+
+    async def jp_access_token_login(
+        self,
+        version_info: MajsoulVersionInfo,
+        access_token: str,
+    ):
         resp = cast(
             liblq.ResOauth2Check,
             await self.rpc_call(
@@ -640,6 +858,7 @@ class MajsoulConnection:
             raise ValueError(f"Failed to loginBeat: {resp}")
         logger.info("Connection ready")
         self.access_token = access_token
+        self.online = True
 
     async def manual_login(
         self,
@@ -679,6 +898,7 @@ class MajsoulConnection:
         self.manual_login_username = username
         self.manual_login_password = password
         logger.info("Connection ready")
+        self.online = True
         return self.account_id, self.access_token
 
     async def access_token_login(
@@ -746,21 +966,23 @@ class MajsoulConnection:
             raise ValueError(f"Failed to loginBeat: {resp}")
         logger.info("Connection ready")
         self.access_token = access_token
+        self.online = True
+
+    async def fetchGameLiveList(
+        self, filter_id: int
+    ) -> List[liblq.GameLiveHead]:
+        games = cast(
+            liblq.ResGameLiveList,
+            await self.rpc_call(
+                ".lq.Lobby.fetchGameLiveList",
+                {"filter_id": filter_id},
+            ),
+        )
+        return games.live_list
 
     async def fetchLiveGames(self):
-        game_live_list: List[liblq.GameLiveHead] = []
-        for gm in GameMode:
-            filter_id = f"2{gm.value}"
-            games = cast(
-                liblq.ResGameLiveList,
-                await self.rpc_call(
-                    ".lq.Lobby.fetchGameLiveList",
-                    {"filter_id": int(filter_id)},
-                ),
-            )
-            game_live_list.extend(games.live_list)
-            await asyncio.sleep(0.7)
-        return game_live_list
+        poller = MajsoulLivePoller(self.fetchGameLiveList)
+        return list((await poller.fetch_all()).values())
 
     async def fetchInfo(self):
         resp = cast(
@@ -770,16 +992,18 @@ class MajsoulConnection:
                 {},
             ),
         )
+        # 重新生成好友列表, 重连后再次调用时丢弃断线期间过期的状态
+        friends = MajsoulFriendIndex()
         friend_list = resp.friend_list.friends
         if isinstance(friend_list, Iterable):
             for friend in friend_list:
-                friend = MajsoulFriend(friend)
-                if friend not in self.friends:
-                    self.friends.append(friend)
+                friends.add(MajsoulFriend(friend))
+        self.friends = friends
         friend_apply_list = resp.friend_apply_list.applies
         if isinstance(friend_apply_list, Iterable):
-            for apply in friend_apply_list:
-                self.friend_apply_list.append(apply.account_id)
+            self.friend_apply_list = [
+                apply.account_id for apply in friend_apply_list
+            ]
         return resp
 
     async def acceptFriendApply(self, account_id: int):
@@ -794,85 +1018,52 @@ class MajsoulConnection:
             self.friend_apply_list.remove(account_id)
         return resp
 
-    async def fetchLogs(self, game_id: str):
-        data = await get_paipu_by_game_id(game_id)
-        if data:
-            return data
-
-        seps = game_id.split("_")
-        log_id = seps[0]
-
-        if len(seps) >= 3 and seps[2] == "2":
-            log_id = decode_log_id(log_id)
-
-        target_id = None
-        if len(seps) >= 2:
-            if seps[1][0] == "a":
-                target_id = decode_account_id2(int(seps[1][1:]))
-            else:
-                target_id = int(seps[1])
-
-        logs = cast(
+    async def fetchGameRecord(self, game_uuid: str) -> liblq.ResGameRecord:
+        return cast(
             liblq.ResGameRecord,
             await self.rpc_call(
                 ".lq.Lobby.fetchGameRecord",
                 {
-                    "game_uuid": log_id,
+                    "game_uuid": game_uuid,
                     "client_version_string": self.clientVersionString,
                 },
             ),
         )
-        detail_records = liblq.Wrapper().parse(logs.data)
-
-        payload = liblq.GameDetailRecords().parse(detail_records.data)
-
-        action_list = []
-        if payload.version < 210715 and len(payload.records) > 0:
-            for value in payload.records:
-                raw = liblq.Wrapper().parse(value)
-                name = raw.name.split(".")[2]
-                msg = getattr(liblq, name)().parse(raw.data)
-                item = MjsLogItem(name=name, data=msg)
-                action_list.append(item)
-        else:
-            for action in payload.actions:
-                if action.result and len(action.result) > 0:
-                    raw = liblq.Wrapper().parse(action.result)
-                    name = raw.name.split(".")[2]
-                    msg = getattr(liblq, name)().parse(raw.data)
-                    item = MjsLogItem(name=name, data=msg)
-                    action_list.append(item)
-
-        tenhou_log = MajsoulPaipuParser().handle_game_record(
-            record=MjsLog(logs.head, action_list)
+
+    async def fetchMultiAccountBrief(
+        self, account_ids: List[int]
+    ) -> liblq.ResMultiAccountBrief:
+        return cast(
+            liblq.ResMultiAccountBrief,
+            await self.rpc_call(
+                ".lq.Lobby.fetchMultiAccountBrief",
+                {"account_id_list": account_ids},
+            ),
+        )
+
+    async def fetchLogs(self, game_id: str):
+        return await fetch_logs_flight.do(
+            game_id, partial(self._fetchLogs, game_id)
         )
 
-        tenhou_log["head"] = process_dict(logs.head.__dict__)
-        tenhou_log["game_id"] = game_id
-        tenhou_log["log_id"] = log_id
-        tenhou_log["target_id"] = target_id
+    async def _fetchLogs(self, game_id: str):
+        data = await get_paipu_by_game_id(game_id)
+        if data:
+            return data
 
-        logger.info(f"[Majsoul] target_id: {target_id}")
+        log_id, _ = parse_game_id(game_id)
+        logs = await self.fetchGameRecord(log_id)
+        tenhou_log = convert_game_record(
+            game_id, logs, self._codec.lookup_message
+        )
+        logger.info(f"[Majsoul] target_id: {tenhou_log['target_id']}")
         logger.info(f"[Majsoul] logs.head.accounts: {logs.head.accounts}")
 
-        if target_id is not None:
-            for acc in logs.head.accounts:
-                if acc.account_id == target_id:
-                    tenhou_log["_target_actor"] = acc.seat
-                    break
-
-        async with aiofiles.open(
-            PAIPU_PATH / f"{game_id} - raw.json",
-            "w",
-            encoding="utf-8",
-        ) as f:
-            await f.write(
-                json.dumps(
-                    dict(tenhou_log),
-                    ensure_ascii=False,
-                    indent=4,
-                )
-            )
+        await paipu_store.save(
+            game_id,
+            record=bytes(logs),
+            tenhou=dict(tenhou_log),
+        )
 
         return tenhou_log
 
@@ -914,19 +1105,49 @@ async def fetchMajsoulInfo(URL_BASE: str):
     return server, pbDef, pbVersion, version_info
 
 
+def yostar_url_base(lang: str) -> str:
+    return (
+        "https://game.mahjongsoul.com/"
+        if lang == "jp"
+        else "https://mahjongsoul.game.yo-star.com/"
+    )
+
+
+def user_url_base(user: MajsUser) -> str:
+    return CN_URL_BASE if user.login_type == 0 else yostar_url_base(user.lang)
+
+
 async def createMajsoulConnection(
     username: str = "",
     password: str = "",
     access_token: str = "",
+    majsoul_info: Optional[MajsoulInfo] = None,
 ):
-    URL_BASE = "https://game.maj-soul.com/"
-
-    server, pbDef, pbVersion, version_info = await fetchMajsoulInfo(URL_BASE)
+    if majsoul_info is None:
+        majsoul_info = await fetchMajsoulInfo(CN_URL_BASE)
+    server, pbDef, pbVersion, version_info = majsoul_info
 
     codec = MajsoulProtoCodec(pbDef, pbVersion)
     conn = MajsoulConnection(f"wss://{server}", 0, codec, version_info)
     await conn.connect()
+    try:
+        await _login(conn, username, password, access_token, version_info)
+    except BaseException:
+        await conn.close()
+        raise
+
+    await conn.create_heartbeat_task()
 
+    return conn
+
+
+async def _login(
+    conn: MajsoulConnection,
+    username: str,
+    password: str,
+    access_token: str,
+    version_info: MajsoulVersionInfo,
+):
     logger.info("Connection established, sending heartbeat")
     _ = await conn.rpc_call(
         ".lq.Route.heartbeat",
@@ -967,47 +1188,97 @@ async def createMajsoulConnection(
         except ValueError as e:
             raise ValueError(f"Manual login failed: {e}")
 
-    await conn.create_heartbeat_task()
-
-    return conn
-
-
-async def createYostarMajsoulConnection(uid: str, code: str, lang: str):
-    URL_BASE = (
-        "https://game.mahjongsoul.com/"
-        if lang == "jp"
-        else "https://mahjongsoul.game.yo-star.com/"
-    )
 
-    server, pbDef, pbVersion, version_info = await fetchMajsoulInfo(URL_BASE)
+async def createYostarMajsoulConnection(
+    uid: str,
+    code: str,
+    lang: str,
+    majsoul_info: Optional[MajsoulInfo] = None,
+):
+    if majsoul_info is None:
+        majsoul_info = await fetchMajsoulInfo(yostar_url_base(lang))
+    server, pbDef, pbVersion, version_info = majsoul_info
 
     codec = MajsoulProtoCodec(pbDef, pbVersion)
     conn = MajsoulConnection(f"wss://{server}", 7, codec, version_info)
     await conn.connect()
 
-    logger.info("Connection established, sending heartbeat")
-    _ = await conn.rpc_call(
-        ".lq.Route.heartbeat",
-        {
-            "delay": random.randint(0, 200),
-            "no_operation_counter": 0,
-            "platform": 11,
-            "network_quality": random.randint(0, 100),
-        },
-    )
-    logger.info(f"Authenticating ({version_info.version})")
+    try:
+        logger.info("Connection established, sending heartbeat")
+        _ = await conn.rpc_call(
+            ".lq.Route.heartbeat",
+            {
+                "delay": random.randint(0, 200),
+                "no_operation_counter": 0,
+                "platform": 11,
+                "network_quality": random.randint(0, 100),
+            },
+        )
+        logger.info(f"Authenticating ({version_info.version})")
 
-    await conn.jp_login(uid, code, version_info)
+        await conn.jp_login(uid, code, version_info)
+    except BaseException:
+        await conn.close()
+        raise
 
     await conn.create_heartbeat_task()
 
     return conn
 
 
+async def fetchYostarCode(user: MajsUser) -> str:
+    """使用保存的 Yostar token 换取本次登录用的 accessToken"""
+    URL_BASE = yostar_url_base(user.lang)
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "User-Agent": USER_AGENT,
+        "Referer": URL_BASE,
+        "Origin": URL_BASE,
+    }
+    url = "https://passport.mahjongsoul.com/user/login"
+    payload = {
+        "uid": user.uid,
+        "token": user.token,
+        "deviceId": f"web|{user.uid}",
+    }
+    async with httpx.AsyncClient(headers=headers, verify=False) as sess:
+        response = await sess.post(url, json=payload)
+    if response.status_code != 200:
+        logger.error(response.text)
+        raise ValueError("JP Yostar token已失效, 请重新登录！")
+    res = response.json()
+    if res["result"] != 0:
+        logger.error(res)
+        raise ValueError("JP Yostar token已失效, 请重新登录！")
+    return res["accessToken"]
+
+
+class MajsoulStartupResult(Struct):
+    uid: str
+    login_type: int
+    ok: bool
+    latency: float
+    message: str = ""
+
+
 class MajsoulManager:
     def __init__(self):
-        # maybe we need to support multiple connections in the future
         self.conn: list[MajsoulConnection] = []
+        self.startup_report: list[MajsoulStartupResult] = []
+        self._start_lock = asyncio.Lock()
+        # 已通知过更换账号的玩家 -> 新账号ID, 避免重启账号池时重复通知
+        self._rebalance_notified: Dict[int, int] = {}
+        self.shards: MajsoulShardMap[MajsoulConnection] = MajsoulShardMap(
+            node_key=lambda conn: str(conn.account_id),
+            load=lambda conn: len(conn.friends),
+            has_player=lambda conn, player_id: player_id in conn.friends,
+            capacity=MAJS_CONFIG.get_config("MajsFriendCapacity").data,
+        )
+        self.router: MajsoulRouter[MajsoulConnection] = MajsoulRouter(
+            stats=lambda conn: conn.rpc_stats,
+            is_online=lambda conn: conn.online,
+            probe=lambda conn: conn.check_alive(),
+        )
 
     async def check_username_password(
         self,
@@ -1041,91 +1312,144 @@ class MajsoulManager:
         return conn
 
     async def start(self):
-        if len(self.conn) == 0:
-            # get all accounts
-            users: Sequence[MajsUser] = await MajsUser.get_all_user()
-            logger.info(f"[majs] Found {len(users)} accounts to connect")
-            logger.debug(f"[majs] Users: {users}")
-            for user in users:
-                if user.login_type == 0:
-                    try:
-                        conn = await createMajsoulConnection(access_token=user.cookie)
-                    except MajsoulMaintenanceError as e:
-                        return f"❌ 登陆失败, 雀魂服务器正在维护中!\ncontext: {e}"
-                    except ValueError as e:
-                        logger.warning(
-                            f"[majs] AccessToken已失效, 使用账密进行刷新！\n{e}"
-                        )
-                        try:
-                            conn = await createMajsoulConnection(
-                                username=user.username,
-                                password=user.password,
-                            )
-                        except ValueError as e:
-                            logger.error(
-                                f"[majs] 刷新AccessToken失败, 请重新登录！\n{e}"
-                            )
-                            return "❌ AccessToken已失效, 请重新登录！"
-
-                    self.conn.append(conn)
-                    await conn.fetchInfo()
-                elif user.login_type == 7:
-                    URL_BASE = (
-                        "https://game.mahjongsoul.com/"
-                        if user.lang == "jp"
-                        else "https://mahjongsoul.game.yo-star.com/"
-                    )
-                    headers = {
-                        "Content-Type": "application/json; charset=utf-8",
-                        "User-Agent": USER_AGENT,
-                        "Referer": URL_BASE,
-                        "Origin": URL_BASE,
-                    }
-                    sess = httpx.AsyncClient(headers=headers, verify=False)
-                    url = "https://passport.mahjongsoul.com/user/login"
-                    payload = {
-                        "uid": user.uid,
-                        "token": user.token,
-                        "deviceId": f"web|{user.uid}",
-                    }
-                    response = await sess.post(url, json=payload)
-                    if response.status_code == 200:
-                        res = response.json()
-                        if res["result"] == 0:
-                            code = res["accessToken"]
-                        else:
-                            logger.error(res)
-                            return "❌ JP Yostar token已失效, 请重新登录！"
-                    else:
-                        logger.error(response.text)
-                        return "❌ JP Yostar token已失效, 请重新登录！"
-
-                    if user.uid is None:
-                        logger.error("Yostar UID is None, please check your config")
-                        return "❌ Yostar UID is None, 请检查配置"
-
-                    try:
-                        conn = await createYostarMajsoulConnection(
-                            user.uid,
-                            code,
-                            user.lang,
-                        )
-                    except ValueError as e:
-                        logger.warning(f"[majs] Yostar token已失效, 请重新登录！\n{e}")
-                        return "❌ Yostar token已失效, 请重新登录！"
-
-                    self.conn.append(conn)
-                    await conn.fetchInfo()
+        async with self._start_lock:
+            if not self.conn:
+                await self._start_all()
+            if not self.conn:
+                return self.format_startup_report() or "❌ 账号池中没有可用的账号！"
         return self.conn[0]
 
-    async def restart(self):
+    async def _start_all(self):
+        users: Sequence[MajsUser] = await MajsUser.get_all_user()
+        logger.info(f"[majs] Found {len(users)} accounts to connect")
+        logger.debug(f"[majs] Users: {users}")
+        if not users:
+            self.startup_report = []
+            return
+
+        # 同一地区的账号共用一次 fetchMajsoulInfo 的结果
+        url_bases = list(dict.fromkeys(user_url_base(user) for user in users))
+        infos = await asyncio.gather(
+            *(fetchMajsoulInfo(url_base) for url_base in url_bases),
+            return_exceptions=True,
+        )
+        region_info = dict(zip(url_bases, infos))
+
+        limit = asyncio.Semaphore(
+            MAJS_CONFIG.get_config("MajsStartupConcurrency").data
+        )
+
+        async def start_user(user: MajsUser):
+            async with limit:
+                return await self._start_user(
+                    user, region_info[user_url_base(user)]
+                )
+
+        results = await asyncio.gather(*(start_user(user) for user in users))
+
+        self.startup_report = []
+        for conn, result in results:
+            self.startup_report.append(result)
+            if conn is not None:
+                self.conn.append(conn)
+        logger.info(f"[majs] 账号池启动完成:\n{self.format_startup_report()}")
         if self.conn:
-            if len(self.conn) >= 1:
-                for task in self.conn[0].bg_tasks:
-                    task.cancel()  # type: ignore
-            for conn in self.conn:
-                await conn._ws.close()  # type: ignore
-        self.conn = []
+            pending = await self.rebalance()
+            if pending:
+                logger.info(
+                    f"[majs] {len(pending)} 名订阅玩家尚未添加所属账号为好友"
+                )
+            # 有账号启动失败时, 其好友看起来没有归属账号, 但失败可能只是暂时的
+            if all(result.ok for result in self.startup_report):
+                await self.notify_rebalance(pending)
+            elif pending:
+                logger.info(
+                    "[majs] 部分账号启动失败, 暂不通知订阅玩家更换账号"
+                )
+
+    async def _start_user(
+        self,
+        user: MajsUser,
+        info: Union[MajsoulInfo, BaseException],
+    ) -> Tuple[Optional[MajsoulConnection], MajsoulStartupResult]:
+        start = time.perf_counter()
+        conn, message = None, ""
+        try:
+            if isinstance(info, BaseException):
+                raise info
+            conn = await self._connect_user(user, info)
+            await conn.fetchInfo()
+        except Exception as e:
+            logger.exception(f"[majs] 账号 {user.uid} 启动失败: {e}")
+            message = str(e) or type(e).__name__
+            if conn is not None:
+                await conn.close()
+                conn = None
+
+        result = MajsoulStartupResult(
+            uid=str(user.uid),
+            login_type=user.login_type,
+            ok=conn is not None,
+            latency=time.perf_counter() - start,
+            message=message,
+        )
+        return conn, result
+
+    async def _connect_user(
+        self,
+        user: MajsUser,
+        info: MajsoulInfo,
+    ) -> MajsoulConnection:
+        if user.login_type == 0:
+            try:
+                return await createMajsoulConnection(
+                    access_token=user.cookie,
+                    majsoul_info=info,
+                )
+            except ValueError as e:
+                logger.warning(f"[majs] AccessToken已失效, 使用账密进行刷新！\n{e}")
+            try:
+                return await createMajsoulConnection(
+                    username=user.username,
+                    password=user.password,
+                    majsoul_info=info,
+                )
+            except ValueError as e:
+                logger.error(f"[majs] 刷新AccessToken失败, 请重新登录！\n{e}")
+                raise ValueError("AccessToken已失效, 请重新登录！")
+
+        if user.login_type == 7:
+            if user.uid is None:
+                logger.error("Yostar UID is None, please check your config")
+                raise ValueError("Yostar UID is None, 请检查配置")
+            code = await fetchYostarCode(user)
+            try:
+                return await createYostarMajsoulConnection(
+                    user.uid,
+                    code,
+                    user.lang,
+                    majsoul_info=info,
+                )
+            except ValueError as e:
+                logger.warning(f"[majs] Yostar token已失效, 请重新登录！\n{e}")
+                raise ValueError("Yostar token已失效, 请重新登录！")
+
+        raise ValueError(f"未知的登录类型: {user.login_type}")
+
+    def format_startup_report(self) -> str:
+        lines = []
+        for r in self.startup_report:
+            status = "✅" if r.ok else f"❌ {r.message}"
+            lines.append(
+                f"账号 {r.uid}(类型{r.login_type}) "
+                f"{r.latency * 1000:.0f}ms {status}"
+            )
+        return "\n".join(lines)
+
+    async def restart(self):
+        conns, self.conn = self.conn, []
+        for conn in conns:
+            await conn.close()
         return await self.start()
 
     def get_conn(self):
@@ -1133,11 +1457,140 @@ class MajsoulManager:
         if conns:
             return conns[0]
         return None
-        return self.get_all_conn()[0]
 
     def get_all_conn(self):
         return self.conn
 
+    def route(
+        self, exclude: Sequence[MajsoulConnection] = ()
+    ) -> Optional[MajsoulConnection]:
+        """为只读请求选择负载最低的健康连接"""
+        return self.router.pick(self.conn, exclude)
+
+    async def route_call(
+        self,
+        func: Callable[[MajsoulConnection], Awaitable[T]],
+        retries: int = 1,
+    ) -> T:
+        """
+        在选出的连接上执行只读请求
+        (fetchGameRecord / fetchGameLiveList / fetchMultiAccountBrief 等),
+        连接断开或超时时换一个连接重试
+        """
+        tried: List[MajsoulConnection] = []
+        while True:
+            conn = self.route(tried)
+            if conn is None:
+                raise ConnectionError("No available connection")
+            try:
+                return await func(conn)
+            except (ConnectionError, MajsoulRpcTimeoutError) as e:
+                tried.append(conn)
+                if len(tried) > retries:
+                    raise
+                logger.warning(
+                    f"[majs] 账号 {conn.account_id} 请求失败, 更换连接重试: {e}"
+                )
+
+    def get_conn_for(
+        self, player_id: Union[int, str]
+    ) -> Optional[MajsoulConnection]:
+        """玩家所属的账号: 已是好友的账号, 或按一致性哈希分配的账号"""
+        if not self.conn:
+            return None
+        return self.shards.owner(self.conn, int(player_id))
+
+    def get_conn_by_apply(
+        self, account_id: int
+    ) -> Optional[MajsoulConnection]:
+        """收到该玩家好友申请的账号"""
+        for conn in self.conn:
+            if account_id in conn.friend_apply_list:
+                return conn
+        return None
+
+    def ranked_friends(self, mode: str = "4") -> List[MajsoulFriend]:
+        """合并账号池中所有账号已排序的好友排行"""
+        seen: Set[int] = set()
+        ranked: List[MajsoulFriend] = []
+        for friend in heapq.merge(
+            *(conn.friends.ranked(mode) for conn in self.conn),
+            key=rank_key(mode),
+            reverse=True,
+        ):
+            # 同一玩家可能是多个账号的好友
+            if friend.account_id in seen:
+                continue
+            seen.add(friend.account_id)
+            ranked.append(friend)
+        return ranked
+
+    async def rebalance(self) -> Dict[int, MajsoulConnection]:
+        """
+        重新计算订阅玩家的归属, 返回尚未添加归属账号为好友的玩家。
+        账号增减后, 被移除账号的玩家以及新的哈希区间内的玩家会分配到其他账号。
+        """
+        uids = await MajsPush.get_subscribed_uids()
+        player_ids = [int(uid) for uid in uids if uid.isdigit()]
+        plan = self.shards.plan(self.conn, player_ids)
+        return {
+            player_id: conn
+            for player_id, conn in plan.items()
+            if conn is not None and player_id not in conn.friends
+        }
+
+    async def notify_rebalance(self, pending: Dict[int, MajsoulConnection]):
+        """
+        账号池中没有账号是该玩家的好友时 (例如原账号已被移除),
+        告知订阅者需要添加的新账号的好友码
+        """
+        for player_id, conn in pending.items():
+            if self._rebalance_notified.get(player_id) == conn.account_id:
+                continue
+            friend_code = await MajsUser.get_user_attr_by_uid(
+                str(conn.account_id),
+                "friend_code",
+            )
+            if not friend_code:
+                continue
+            msg = (
+                f"[majs] 账号池发生变化, 玩家 {player_id} 的推送"
+                f"改由账号 {conn.nick_name} 负责\n"
+                f"请在【游戏中】添加 {conn.nick_name}: {friend_code} 为好友, "
+                "否则将无法继续收到好友推送！"
+            )
+            try:
+                await conn.send_msg_to_user(str(player_id), msg)
+            except Exception as e:
+                logger.warning(
+                    f"[majs] 通知玩家 {player_id} 更换账号失败: {e}"
+                )
+                continue
+            self._rebalance_notified[player_id] = conn.account_id
+
+    async def refresh_friends(self):
+        """刷新账号池中所有账号的好友列表"""
+        results = await asyncio.gather(
+            *(conn.fetchInfo() for conn in self.conn),
+            return_exceptions=True,
+        )
+        for conn, result in zip(self.conn, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"[majs] 账号 {conn.account_id} 刷新好友列表失败: {result}"
+                )
+
+    async def format_shard_stats(self) -> str:
+        pending = await self.rebalance()
+        waiting: Dict[int, int] = {}
+        for conn in pending.values():
+            waiting[conn.account_id] = waiting.get(conn.account_id, 0) + 1
+        return "\n".join(
+            f"账号 {conn.account_id} 好友: {len(conn.friends)}"
+            f"/{self.shards.capacity} 待添加: {waiting.get(conn.account_id, 0)}"
+            for conn in self.conn
+        )
+
     async def is_online(self):
         if self.conn == []:
             return False
@@ -1146,5 +1599,12 @@ class MajsoulManager:
 
 manager = MajsoulManager()
 
+# 观战列表的各段位场请求分散到账号池中负载最低的连接
+live_poller = MajsoulLivePoller(
+    lambda filter_id: manager.route_call(
+        lambda conn: conn.fetchGameLiveList(filter_id)
+    )
+)
+
 if __name__ == "__main__":
     asyncio.run(manager.start())
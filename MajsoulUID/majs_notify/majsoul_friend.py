@@ -1,3 +1,5 @@
+from typing import Dict, List, Tuple, Callable, Iterator, Optional
+
 from ..lib import lq as liblq
 from ._level import MajsoulLevel
 
@@ -30,3 +32,59 @@ class MajsoulFriend:
         self.logout_time = state.logout_time
         self.is_online = state.is_online
         self.playing = state.playing
+
+
+def rank_key(mode: str = "4") -> Callable[["MajsoulFriend"], Tuple[int, int]]:
+    """好友排行的排序键: (段位ID, 段位分数)"""
+    if mode == "3":
+        return lambda x: (x.level3.id, x.level3_score)
+    return lambda x: (x.level.id, x.level_score)
+
+
+class MajsoulFriendIndex:
+    """按 account_id 索引的好友列表, 并缓存按段位排序的视图"""
+
+    def __init__(self):
+        self._friends: Dict[int, MajsoulFriend] = {}
+        self._ranked: Dict[str, List[MajsoulFriend]] = {}
+
+    def __len__(self):
+        return len(self._friends)
+
+    def __iter__(self) -> Iterator[MajsoulFriend]:
+        return iter(self._friends.values())
+
+    def __contains__(self, account_id: int):
+        return account_id in self._friends
+
+    def get(self, account_id: int) -> Optional[MajsoulFriend]:
+        return self._friends.get(account_id)
+
+    def add(self, friend: MajsoulFriend) -> bool:
+        """添加或替换好友, 返回是否为新好友"""
+        is_new = friend.account_id not in self._friends
+        self._friends[friend.account_id] = friend
+        self._ranked.clear()
+        return is_new
+
+    def remove(self, account_id: int) -> Optional[MajsoulFriend]:
+        friend = self._friends.pop(account_id, None)
+        if friend is not None:
+            self._ranked.clear()
+        return friend
+
+    def change_base(self, account_id: int, base: liblq.PlayerBaseView):
+        friend = self._friends.get(account_id)
+        if friend is not None:
+            friend.change_base(base)
+            self._ranked.clear()
+        return friend
+
+    def ranked(self, mode: str = "4") -> List[MajsoulFriend]:
+        if mode not in self._ranked:
+            self._ranked[mode] = sorted(
+                self._friends.values(),
+                key=rank_key(mode),
+                reverse=True,
+            )
+        return self._ranked[mode]
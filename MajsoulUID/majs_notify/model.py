@@ -11,6 +11,11 @@ class InflightRequest(Struct):
     msg_obj: type[betterproto.Message]
 
 
+class MajsoulMethod(Struct):
+    request_type: type[betterproto.Message]
+    response_type: type[betterproto.Message]
+
+
 class MajsoulVersionInfo(Struct):
     version: str
     force_version: str
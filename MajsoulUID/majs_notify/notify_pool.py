@@ -0,0 +1,169 @@
+import time
+import asyncio
+from collections import deque
+from typing import (
+    Any,
+    Dict,
+    List,
+    Deque,
+    Literal,
+    Callable,
+    Hashable,
+    Optional,
+    Awaitable,
+)
+
+from gsuid_core.logger import logger
+
+OverflowPolicy = Literal["drop", "coalesce"]
+
+
+class NotifyJob:
+    __slots__ = ("key", "coalesce_key", "func", "enqueued_at")
+
+    def __init__(
+        self,
+        key: int,
+        coalesce_key: Optional[Hashable],
+        func: Callable[[], Awaitable[Any]],
+    ):
+        self.key = key
+        self.coalesce_key = coalesce_key
+        self.func = func
+        self.enqueued_at = time.perf_counter()
+
+
+class MajsoulNotifyPool:
+    """
+    固定数量的worker处理通知, 每个worker拥有独立的有界队列。
+    同一个key(好友ID)总是分配给同一个worker, 保证同一好友的通知按顺序处理。
+
+    队列满时的策略:
+        drop: 丢弃新通知
+        coalesce: 合并仍在排队的同类通知, 无法合并时丢弃新通知
+
+    submit 由接收消息的循环调用, 不能等待: worker 中的处理函数
+    可能在等待 rpc_call 的响应, 而响应只有接收循环才能派发。
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        maxsize: int = 256,
+        policy: OverflowPolicy = "coalesce",
+    ):
+        self.workers = max(1, workers)
+        self.maxsize = max(1, maxsize)
+        if policy not in ("drop", "coalesce"):
+            logger.warning(
+                f"[majs] 不支持的通知队列溢出策略 {policy}, 使用 coalesce"
+            )
+            policy = "coalesce"
+        self.policy = policy
+
+        self._queues: List[Deque[NotifyJob]] = [
+            deque() for _ in range(self.workers)
+        ]
+        self._ready = [asyncio.Event() for _ in range(self.workers)]
+        # 排队中且可合并的通知
+        self._pending: Dict[Hashable, NotifyJob] = {}
+
+        self.handled = 0
+        self.failed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    @property
+    def depth(self) -> int:
+        return sum(len(q) for q in self._queues)
+
+    def _shard(self, key: int) -> int:
+        return hash(key) % self.workers
+
+    def submit(
+        self,
+        key: int,
+        func: Callable[[], Awaitable[Any]],
+        coalesce_key: Optional[Hashable] = None,
+    ):
+        if coalesce_key is not None and self.policy == "coalesce":
+            job = self._pending.get(coalesce_key)
+            if job is not None:
+                # 仅保留最新的一次, 排队位置不变
+                job.func = func
+                self.coalesced += 1
+                return
+
+        shard = self._shard(key)
+        queue = self._queues[shard]
+        if len(queue) >= self.maxsize:
+            self.dropped += 1
+            logger.warning(f"[majs] 通知队列已满, 丢弃来自 {key} 的通知")
+            return
+
+        job = NotifyJob(key, coalesce_key, func)
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = job
+        queue.append(job)
+        self._ready[shard].set()
+
+        depth = self.depth
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    async def _worker(self, shard: int):
+        queue = self._queues[shard]
+        while True:
+            if not queue:
+                self._ready[shard].clear()
+                await self._ready[shard].wait()
+                continue
+
+            job = queue.popleft()
+            if job.coalesce_key is not None:
+                self._pending.pop(job.coalesce_key, None)
+
+            start = time.perf_counter()
+            self.total_wait += start - job.enqueued_at
+            try:
+                await job.func()
+            except Exception as e:
+                self.failed += 1
+                logger.exception(f"[majs] 处理通知时发生错误: {e}")
+            latency = time.perf_counter() - start
+
+            self.handled += 1
+            self.total_latency += latency
+            if latency > self.max_latency:
+                self.max_latency = latency
+
+    async def run(self):
+        await asyncio.gather(*(self._worker(i) for i in range(self.workers)))
+
+    def stats(self) -> Dict[str, float]:
+        handled = self.handled or 1
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "handled": self.handled,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "avg_wait": self.total_wait / handled,
+            "avg_latency": self.total_latency / handled,
+            "max_latency": self.max_latency,
+        }
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        return (
+            f"通知队列: {s['depth']}(峰值{s['max_depth']}) "
+            f"已处理: {s['handled']} 丢弃: {s['dropped']} 合并: {s['coalesced']}\n"
+            f"平均耗时: {s['avg_latency'] * 1000:.0f}ms "
+            f"最大耗时: {s['max_latency'] * 1000:.0f}ms "
+            f"平均排队: {s['avg_wait'] * 1000:.0f}ms"
+        )
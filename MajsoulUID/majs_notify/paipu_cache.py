@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Hashable
+
+_MISSING = object()
+
+
+class PaipuCache:
+    """
+    已解码牌谱/Review的LRU缓存, 按占用内存淘汰。
+    占用大小使用解码前的序列化长度估算, 不精确计算 Python 对象大小。
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._data: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return item[0]
+
+    def put(self, key: Hashable, value: Any, size: int):
+        self.pop(key)
+        if size > self.max_bytes:
+            # 单条超过上限, 不缓存
+            return
+        self._data[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, old_size) = self._data.popitem(last=False)
+            self.size -= old_size
+            self.evictions += 1
+
+    def pop(self, key: Hashable):
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.size -= item[1]
+
+    def clear(self):
+        self._data.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "items": len(self._data),
+            "size": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        return (
+            f"牌谱缓存: {s['items']}条 "
+            f"{s['size'] / 1024 / 1024:.1f}/"
+            f"{s['max_bytes'] / 1024 / 1024:.0f}MB "
+            f"命中率: {s['hit_rate'] * 100:.1f}% "
+            f"({s['hits']}/{s['hits'] + s['misses']}) 淘汰: {s['evictions']}"
+        )
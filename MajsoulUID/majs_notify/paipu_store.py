@@ -0,0 +1,316 @@
+"""
+牌谱本地存储
+
+每个对局一个 `{game_id}.paipu` 文件, 内部分为多个独立压缩的分段:
+    record: 原始 ResGameRecord protobuf 字节 (含 GameDetailRecords)
+    tenhou: 转换后的天凤格式牌谱
+    review: Review 结果
+
+文件结构:
+    MAGIC(4) | VERSION(1) | 头部长度(u32) | 头部(msgpack) | 分段数据...
+头部记录每个分段的 (offset, length), 读取时只解压需要的分段。
+
+写入 tenhou/review 分段时同步更新数据库中的牌谱索引 (MajsPaipuIndex),
+按对局ID前缀、玩家ID查找牌谱时无需遍历目录。建立索引之前保存的牌谱
+在首次查找时统一补建一次索引, 完成后写入标记文件, 之后不再遍历目录。
+
+解码后的 tenhou/review 分段保存在内存 LRU 缓存中, 同一对局的多次请求
+不会重复读取和解压文件。缓存中的对象由调用方共享, 需要修改时
+(例如 MeguruLog 按巡推演配牌) 先复制。
+"""
+
+import json
+import uuid
+import zlib
+import struct
+import asyncio
+from pathlib import Path
+from weakref import WeakValueDictionary
+from typing import Any, Dict, List, Tuple, Union, Optional
+
+import aiofiles
+from msgspec import msgpack
+from gsuid_core.logger import logger
+
+from .paipu_cache import PaipuCache
+from ..majs_config.majs_config import MAJS_CONFIG
+from ..utils.database.models import MajsPaipuIndex
+from ..utils.resource.RESOURCE_PATH import PAIPU_PATH
+
+MAGIC = b"MJPP"
+VERSION = 1
+PREFIX = struct.Struct("<4sBI")
+SUFFIX = ".paipu"
+
+# 以 bytes 原样保存的分段, 其余分段使用 msgpack 编码
+BYTES_SECTIONS = {"record"}
+# 旧版本 JSON 文件名后缀
+LEGACY_SECTIONS = {"tenhou": " - raw.json", "review": " - review.json"}
+# 已为建立索引之前保存的牌谱补建索引
+INDEX_MARKER = ".indexed"
+
+Header = Dict[str, Tuple[int, int]]
+
+
+class PaipuStore:
+    def __init__(self, root: Path, level: int = 6, cache_size: int = 0):
+        self.root = root
+        self.level = level
+        self.cache = PaipuCache(cache_size)
+        # 同一对局的写入串行执行, 不再使用的锁自动回收
+        self._locks: "WeakValueDictionary[str, asyncio.Lock]" = (
+            WeakValueDictionary()
+        )
+        self._indexed = False
+        self._index_lock = asyncio.Lock()
+
+    def path(self, game_id: str) -> Path:
+        return self.root / f"{game_id}{SUFFIX}"
+
+    def legacy_path(self, game_id: str, section: str) -> Optional[Path]:
+        suffix = LEGACY_SECTIONS.get(section)
+        if suffix is None:
+            return None
+        return self.root / f"{game_id}{suffix}"
+
+    def _encode(self, section: str, value: Any) -> Tuple[bytes, int]:
+        """返回压缩后的数据与压缩前的长度"""
+        if section in BYTES_SECTIONS:
+            raw = bytes(value)
+        else:
+            raw = msgpack.encode(value)
+        return zlib.compress(raw, self.level), len(raw)
+
+    def _decode(self, section: str, blob: bytes) -> Tuple[Any, int]:
+        raw = zlib.decompress(blob)
+        if section in BYTES_SECTIONS:
+            return raw, len(raw)
+        return msgpack.decode(raw), len(raw)
+
+    async def _read_header(self, f) -> Tuple[Header, int]:
+        """返回分段头部与分段数据的起始位置"""
+        magic, version, header_len = PREFIX.unpack(await f.read(PREFIX.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Invalid paipu file: {magic!r} v{version}")
+        header = msgpack.decode(await f.read(header_len))
+        return header, PREFIX.size + header_len
+
+    async def _read_blobs(self, path: Path) -> Dict[str, bytes]:
+        async with aiofiles.open(path, "rb") as f:
+            header, data_start = await self._read_header(f)
+            blobs = {}
+            for section, (offset, length) in header.items():
+                await f.seek(data_start + offset)
+                blobs[section] = await f.read(length)
+        return blobs
+
+    async def sections(self, game_id: str) -> Header:
+        path = self.path(game_id)
+        if not path.exists():
+            return {}
+        async with aiofiles.open(path, "rb") as f:
+            header, _ = await self._read_header(f)
+        return header
+
+    async def has(self, game_id: str, section: str) -> bool:
+        if section in await self.sections(game_id):
+            return True
+        legacy = self.legacy_path(game_id, section)
+        return legacy is not None and legacy.exists()
+
+    async def load(self, game_id: str, section: str) -> Any:
+        cacheable = section not in BYTES_SECTIONS
+        if cacheable:
+            data = self.cache.get((game_id, section))
+            if data is not None:
+                return data
+
+        data, size = await self._load(game_id, section)
+        if data is not None and cacheable:
+            self.cache.put((game_id, section), data, size)
+        return data
+
+    async def _load(self, game_id: str, section: str) -> Tuple[Any, int]:
+        path = self.path(game_id)
+        if path.exists():
+            async with aiofiles.open(path, "rb") as f:
+                header, data_start = await self._read_header(f)
+                if section in header:
+                    offset, length = header[section]
+                    await f.seek(data_start + offset)
+                    return self._decode(section, await f.read(length))
+
+        # 尚未迁移的旧版 JSON
+        legacy = self.legacy_path(game_id, section)
+        if legacy is not None and legacy.exists():
+            async with aiofiles.open(legacy, "r", encoding="utf-8") as f:
+                raw = await f.read()
+            return json.loads(raw), len(raw)
+        return None, 0
+
+    def _lock(self, game_id: str) -> asyncio.Lock:
+        lock = self._locks.get(game_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[game_id] = lock
+        return lock
+
+    async def save(self, game_id: str, **sections: Any):
+        """写入一个或多个分段, 保留文件中已有的其他分段"""
+        async with self._lock(game_id):
+            blobs = await self._save(game_id, sections)
+
+        if "tenhou" in sections:
+            await self._index(game_id, sections["tenhou"], "review" in blobs)
+        elif "review" in sections:
+            await MajsPaipuIndex.set_review(game_id)
+
+    async def _save(
+        self, game_id: str, sections: Dict[str, Any]
+    ) -> Dict[str, bytes]:
+        path = self.path(game_id)
+        blobs = await self._read_blobs(path) if path.exists() else {}
+        sizes: Dict[str, int] = {}
+        for section, value in sections.items():
+            blobs[section], sizes[section] = self._encode(section, value)
+
+        header: Header = {}
+        offset = 0
+        for section, blob in blobs.items():
+            header[section] = (offset, len(blob))
+            offset += len(blob)
+        header_raw = msgpack.encode(header)
+
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(tmp, "wb") as f:
+                await f.write(PREFIX.pack(MAGIC, VERSION, len(header_raw)))
+                await f.write(header_raw)
+                for blob in blobs.values():
+                    await f.write(blob)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        for section, value in sections.items():
+            if section not in BYTES_SECTIONS:
+                self.cache.put((game_id, section), value, sizes[section])
+        return blobs
+
+    async def _index(self, game_id: str, tenhou: Dict, has_review: bool):
+        head = tenhou.get("head") or {}
+        account_ids = [
+            str(acc["account_id"])
+            for acc in head.get("accounts", [])
+            if acc.get("account_id")
+        ]
+        await MajsPaipuIndex.index_paipu(
+            game_id,
+            account_ids,
+            int(head.get("end_time") or 0),
+            has_review,
+        )
+
+    async def rebuild_index(self) -> Tuple[int, int]:
+        """为已保存的牌谱重建索引, 返回 (成功数, 失败数)"""
+        success, failed = 0, 0
+        for path in self.root.iterdir():
+            game_id = game_id_from_path(path)
+            if game_id is None:
+                continue
+            try:
+                tenhou = await self.load(game_id, "tenhou")
+                if tenhou is None:
+                    continue
+                await self._index(
+                    game_id, tenhou, await self.has(game_id, "review")
+                )
+            except Exception as e:
+                logger.warning(f"[majs] 索引牌谱 {path.name} 失败: {e}")
+                failed += 1
+                continue
+            success += 1
+        (self.root / INDEX_MARKER).touch()
+        self._indexed = True
+        return success, failed
+
+    async def ensure_index(self):
+        """首次使用时为建立索引之前保存的牌谱补建索引, 只执行一次"""
+        if self._indexed:
+            return
+        async with self._index_lock:
+            if self._indexed:
+                return
+            if (self.root / INDEX_MARKER).exists():
+                self._indexed = True
+                return
+            logger.info("[majs] 正在为已保存的牌谱建立索引...")
+            success, failed = await self.rebuild_index()
+            logger.info(
+                f"[majs] 牌谱索引建立完成, 成功: {success}, 失败: {failed}"
+            )
+
+    async def find(self, prefix: str) -> Optional[str]:
+        """按对局ID前缀查找已保存的牌谱"""
+        await self.ensure_index()
+        return await MajsPaipuIndex.find_by_prefix(prefix)
+
+    async def recent_games(
+        self, account_id: str, limit: int = 10
+    ) -> List[str]:
+        """玩家最近结束的 limit 局已保存牌谱的对局ID"""
+        await self.ensure_index()
+        return await MajsPaipuIndex.get_recent_games(account_id, limit)
+
+    async def export_json(
+        self,
+        game_id: str,
+        section: str,
+        target: Optional[Path] = None,
+    ) -> Optional[Path]:
+        data = await self.load(game_id, section)
+        if data is None or isinstance(data, bytes):
+            return None
+
+        if target is None:
+            target = self.root / "export" / f"{game_id} - {section}.json"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(target, "w", encoding="utf-8") as f:
+            await f.write(json.dumps(data, ensure_ascii=False, indent=4))
+        return target
+
+    async def migrate(self, remove: bool = True) -> Tuple[int, int]:
+        """将旧版 JSON 文件转换为新格式, 返回 (成功数, 失败数)"""
+        success, failed = 0, 0
+        for section, suffix in LEGACY_SECTIONS.items():
+            for legacy in self.root.glob(f"*{suffix}"):
+                game_id = legacy.name[: -len(suffix)]
+                try:
+                    async with aiofiles.open(
+                        legacy, "r", encoding="utf-8"
+                    ) as f:
+                        data = json.loads(await f.read())
+                    await self.save(game_id, **{section: data})
+                except Exception as e:
+                    logger.warning(f"[majs] 迁移牌谱 {legacy.name} 失败: {e}")
+                    failed += 1
+                    continue
+                if remove:
+                    legacy.unlink()
+                success += 1
+        return success, failed
+
+
+def game_id_from_path(path: Path) -> Union[str, None]:
+    if path.name.endswith(SUFFIX):
+        return path.name[: -len(SUFFIX)]
+    suffix = LEGACY_SECTIONS["tenhou"]
+    if path.name.endswith(suffix):
+        return path.name[: -len(suffix)]
+    return None
+
+
+paipu_store = PaipuStore(
+    PAIPU_PATH,
+    cache_size=MAJS_CONFIG.get_config("MajsPaipuCacheSize").data * 1024 * 1024,
+)
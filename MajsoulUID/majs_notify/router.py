@@ -0,0 +1,177 @@
+import time
+import asyncio
+from collections import deque
+from typing import (
+    Set,
+    Deque,
+    Generic,
+    TypeVar,
+    Callable,
+    Optional,
+    Sequence,
+    Awaitable,
+)
+
+from gsuid_core.logger import logger
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class MajsoulRpcStats:
+    """
+    单个连接的请求统计与熔断状态
+
+    连续失败 max_failures 次, 或最近 window 次请求中失败比例达到
+    error_threshold 时熔断; 熔断 cooldown 秒后由 MajsoulRouter 发送探测请求,
+    探测成功则恢复, 失败则冷却时间加倍。
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_samples: int = 10,
+        error_threshold: float = 0.5,
+        max_failures: int = 3,
+        cooldown: float = 30,
+        max_cooldown: float = 300,
+        alpha: float = 0.2,
+    ):
+        self.min_samples = min_samples
+        self.error_threshold = error_threshold
+        self.max_failures = max_failures
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.alpha = alpha
+
+        self.inflight = 0
+        # 请求耗时的指数移动平均(秒)
+        self.latency = 0.0
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.total = 0
+        self.failed = 0
+
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.cooldown = cooldown
+        self.trips = 0
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def begin(self):
+        self.inflight += 1
+
+    def end(self, latency: float, ok: bool):
+        self.inflight -= 1
+        self.total += 1
+        if self.latency:
+            self.latency += self.alpha * (latency - self.latency)
+        else:
+            self.latency = latency
+        self.outcomes.append(ok)
+
+        if ok:
+            self.consecutive_failures = 0
+            return
+        self.failed += 1
+        self.consecutive_failures += 1
+        # 半开状态由探测结果决定
+        if self.state == CLOSED and (
+            self.consecutive_failures >= self.max_failures
+            or (
+                len(self.outcomes) >= self.min_samples
+                and self.error_rate >= self.error_threshold
+            )
+        ):
+            self.trip()
+
+    def trip(self):
+        if self.state == HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.trips += 1
+
+    def reset(self):
+        self.state = CLOSED
+        self.cooldown = self.base_cooldown
+        self.consecutive_failures = 0
+        self.outcomes.clear()
+
+    def probe_due(self) -> bool:
+        return (
+            self.state == OPEN
+            and time.monotonic() - self.opened_at >= self.cooldown
+        )
+
+    def score(self) -> float:
+        """越小越优先: 排队中的请求数 * 平均耗时"""
+        return (self.inflight + 1) * max(self.latency, 0.05)
+
+    def format_stats(self) -> str:
+        state = {CLOSED: "正常", OPEN: "熔断", HALF_OPEN: "探测中"}[self.state]
+        return (
+            f"请求: {self.total} 失败: {self.failed} "
+            f"进行中: {self.inflight} "
+            f"平均耗时: {self.latency * 1000:.0f}ms "
+            f"状态: {state}"
+        )
+
+
+class MajsoulRouter(Generic[T]):
+    """在账号池中为只读请求选择负载最低的健康连接"""
+
+    def __init__(
+        self,
+        stats: Callable[[T], MajsoulRpcStats],
+        is_online: Callable[[T], bool],
+        probe: Callable[[T], Awaitable[bool]],
+    ):
+        self.stats = stats
+        self.is_online = is_online
+        self.probe = probe
+        self._probes: Set[asyncio.Task] = set()
+
+    def pick(
+        self,
+        nodes: Sequence[T],
+        exclude: Sequence[T] = (),
+    ) -> Optional[T]:
+        self._schedule_probes(nodes)
+        online = [n for n in nodes if n not in exclude and self.is_online(n)]
+        healthy = [n for n in online if self.stats(n).state == CLOSED]
+        # 全部熔断时仍尝试在线的连接, 不直接拒绝请求
+        candidates = healthy or online
+        if not candidates:
+            return None
+        return min(candidates, key=lambda n: self.stats(n).score())
+
+    def _schedule_probes(self, nodes: Sequence[T]):
+        for node in nodes:
+            stats = self.stats(node)
+            if not stats.probe_due() or not self.is_online(node):
+                continue
+            stats.state = HALF_OPEN
+            task = asyncio.create_task(self._probe(node, stats))
+            self._probes.add(task)
+            task.add_done_callback(self._probes.discard)
+
+    async def _probe(self, node: T, stats: MajsoulRpcStats):
+        try:
+            ok = await self.probe(node)
+        except Exception as e:
+            logger.debug(f"[majs] 连接探测失败: {e}")
+            ok = False
+        if ok:
+            logger.info("[majs] 连接探测成功, 恢复请求")
+            stats.reset()
+        else:
+            stats.trip()
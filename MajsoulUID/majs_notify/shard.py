@@ -0,0 +1,138 @@
+import hashlib
+from bisect import bisect
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Generic,
+    TypeVar,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+)
+
+T = TypeVar("T")
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class ConsistentHashRing(Generic[T]):
+    """
+    一致性哈希环, 每个节点在环上放置 replicas 个虚拟节点。
+    节点增减时只有相邻区间的 key 改变归属。
+    """
+
+    def __init__(self, replicas: int = 64):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._nodes: List[Tuple[str, T]] = []
+        self._keys: Tuple[str, ...] = ()
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        return self._keys
+
+    def rebuild(self, nodes: Dict[str, T]):
+        ring = sorted(
+            (_hash(f"{key}#{i}"), key, node)
+            for key, node in nodes.items()
+            for i in range(self.replicas)
+        )
+        self._points = [point for point, _, _ in ring]
+        self._nodes = [(key, node) for _, key, node in ring]
+        self._keys = tuple(sorted(nodes))
+
+    def walk(self, key: str) -> Iterator[T]:
+        """从 key 的位置顺时针依次返回不重复的节点"""
+        if not self._points:
+            return
+        start = bisect(self._points, _hash(key))
+        seen = set()
+        for i in range(len(self._points)):
+            node_key, node = self._nodes[(start + i) % len(self._points)]
+            if node_key in seen:
+                continue
+            seen.add(node_key)
+            yield node
+            if len(seen) == len(self._keys):
+                return
+
+
+class MajsoulShardMap(Generic[T]):
+    """
+    按一致性哈希把订阅的玩家分配给账号池中的账号。
+
+    - 已经是某个账号好友的玩家固定归属该账号, 不会因为重新分配而需要重新加好友
+    - 其余玩家从哈希位置开始顺时针查找第一个好友数未达到上限的账号
+    - 账号增减后在下一次查询时自动重建哈希环
+    """
+
+    def __init__(
+        self,
+        node_key: Callable[[T], str],
+        load: Callable[[T], int],
+        has_player: Callable[[T, int], bool],
+        capacity: int,
+        replicas: int = 64,
+    ):
+        self.node_key = node_key
+        self.load = load
+        self.has_player = has_player
+        self.capacity = capacity
+        self.ring: ConsistentHashRing[T] = ConsistentHashRing(replicas)
+
+    def sync(self, nodes: Sequence[T]):
+        keys = tuple(sorted(self.node_key(node) for node in nodes))
+        if keys != self.ring.keys:
+            self.ring.rebuild({self.node_key(node): node for node in nodes})
+
+    def holder(self, nodes: Sequence[T], player_id: int) -> Optional[T]:
+        """已将该玩家加为好友的账号"""
+        for node in nodes:
+            if self.has_player(node, player_id):
+                return node
+        return None
+
+    def has_capacity(self, node: T) -> bool:
+        return self.load(node) < self.capacity
+
+    def owner(self, nodes: Sequence[T], player_id: int) -> Optional[T]:
+        self.sync(nodes)
+        holder = self.holder(nodes, player_id)
+        if holder is not None:
+            return holder
+
+        fallback = None
+        for node in self.ring.walk(str(player_id)):
+            if self.has_capacity(node):
+                return node
+            if fallback is None:
+                fallback = node
+        # 所有账号均已满员时仍返回哈希位置上的账号
+        return fallback
+
+    def plan(
+        self, nodes: Sequence[T], player_ids: Sequence[int]
+    ) -> Dict[int, Optional[T]]:
+        """
+        为一批玩家计算归属, 计入本批中已分配的玩家数量,
+        返回 {玩家ID: 账号}, 用于账号增减后检查需要迁移的玩家
+        """
+        self.sync(nodes)
+        extra: Dict[str, int] = {}
+        result: Dict[int, Optional[T]] = {}
+        for player_id in player_ids:
+            node = self.holder(nodes, player_id)
+            if node is None:
+                for candidate in self.ring.walk(str(player_id)):
+                    key = self.node_key(candidate)
+                    load = self.load(candidate) + extra.get(key, 0)
+                    if load < self.capacity:
+                        node = candidate
+                        extra[key] = extra.get(key, 0) + 1
+                        break
+            result[player_id] = node
+        return result
@@ -0,0 +1,40 @@
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    TypeVar,
+    Callable,
+    Hashable,
+    Awaitable,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    合并相同key的并发调用: 同一时间只执行一次, 其余调用者等待并共享结果。
+    调用完成后立即移除, 不缓存结果。
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self.shared = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(func))
+            self._flights[key] = task
+            task.add_done_callback(lambda _: self._flights.pop(key, None))
+        else:
+            self.shared += 1
+        # 单个调用者被取消时不影响其他等待者
+        return await asyncio.shield(task)
+
+    async def _run(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        return await func()
@@ -1,5 +1,17 @@
 from enum import IntEnum
-from typing import List, Union, Optional, Protocol, Sequence, NamedTuple
+from array import array
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    Sequence,
+    NamedTuple,
+)
 from dataclasses import field, dataclass
 
 from .cfg import cfg
@@ -38,18 +50,15 @@ class Tile(NamedTuple):
            41-47    - 1-7z
            51,52,53 - 0m, 0p, 0s
         """
-        if self.num != 0:
-            result = 10 * (self.type.value + 1) + self.num
-        else:
-            # aka
-            result = 50 + (self.type.value + 1)
-
-        return result
+        return _TENHOU_CODE[self.type][self.num]
 
     @classmethod
     def parse(cls, text: str) -> "Tile":
-        assert len(text) == 2
-        return Tile(int(text[0]), TileType[text[1].upper()])
+        tile = _PARSE.get(text)
+        if tile is None:
+            assert len(text) == 2
+            tile = Tile(int(text[0]), TileType[text[1].upper()])
+        return tile
 
     def is_aka(self) -> bool:
         return self.num == 0 and self.type != TileType.Z
@@ -58,9 +67,70 @@ class Tile(NamedTuple):
         """
         return normal tile from aka
         """
-        if self.type != TileType.Z and self.num == 0:
-            return Tile(5, self.type)
-        return self
+        return _DEAKA[self.type][self.num]
+
+
+def _encode_tenhou(num: int, type: TileType) -> int:
+    if num != 0:
+        return 10 * (type.value + 1) + num
+    # aka
+    return 50 + (type.value + 1)
+
+
+# 预先生成的牌对象, 相同的牌共享同一个实例
+# 0-9m 0-9p 0-9s 1-7z 共37种, 其中 0m/0p/0s 为赤宝牌
+TILES: Tuple[Tile, ...] = tuple(
+    Tile(num, t)
+    for t in TileType
+    for num in (range(1, 8) if t == TileType.Z else range(10))
+)
+TILE_ID: Dict[Tile, int] = {tile: i for i, tile in enumerate(TILES)}
+
+# 以下按 [TileType][num] 索引, 包含 0z/8z/9z 等非法组合以保持原有行为
+_GRID = [[Tile(num, t) for num in range(10)] for t in TileType]
+for _tile in TILES:
+    _GRID[_tile.type][_tile.num] = _tile
+
+_PARSE: Dict[str, Tile] = {
+    f"{tile.num}{tile.type.name.lower()}": tile
+    for row in _GRID
+    for tile in row
+}
+_TENHOU_CODE: List[List[int]] = [
+    [_encode_tenhou(tile.num, tile.type) for tile in row] for row in _GRID
+]
+_DEAKA: List[List[Tile]] = [
+    [
+        (
+            _GRID[tile.type][5]
+            if tile.num == 0 and tile.type != TileType.Z
+            else tile
+        )
+        for tile in row
+    ]
+    for row in _GRID
+]
+
+_PARSE_CODE: Dict[str, int] = {
+    text: tile.encode_tenhou() for text, tile in _PARSE.items()
+}
+
+
+def tile_code(text: str) -> int:
+    """牌的字符串 -> 天凤编码"""
+    code = _PARSE_CODE.get(text)
+    if code is None:
+        code = Tile.parse(text).encode_tenhou()
+    return code
+
+
+def tile_codes(texts: Iterable[str]) -> array:
+    return array("b", [tile_code(t) for t in texts])
+
+
+WINDS = frozenset(_GRID[TileType.Z][1:5])
+# 0z would be aka haku
+DRAGS = frozenset((*_GRID[TileType.Z][5:8], _GRID[TileType.Z][0]))
 
 
 class DiscardSymbol(NamedTuple):
@@ -146,7 +216,7 @@ class AnkanSymbol(NamedTuple):
     def encode_tenhou(self) -> str:
         t = self.tile.encode_tenhou()
         if self.tile.num == 5 and self.tile.type != TileType.Z:
-            return f"{Tile(0, self.tile.type).encode_tenhou()}{t}{t}a{t}"
+            return f"{_TENHOU_CODE[self.tile.type][0]}{t}{t}a{t}"
         else:
             return f"{t}{t}{t}a{t}"
 
@@ -181,6 +251,51 @@ class KakanSymbol(NamedTuple):
         return "".join(t)
 
 
+class SymbolSeq:
+    """
+    摸牌/舍牌序列, 以天凤编码保存在 array 中。
+    副露、立直宣言等无法用单个整数表示的符号保存在 calls 中,
+    codes 中对应位置记为 -(在 calls 中的下标 + 1)。
+    """
+
+    __slots__ = ("codes", "calls")
+
+    def __init__(self):
+        self.codes = array("h")
+        self.calls: List[Symbol] = []
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append_code(self, code: int):
+        self.codes.append(code)
+
+    def append_call(self, symbol: Symbol):
+        self.calls.append(symbol)
+        self.codes.append(-len(self.calls))
+
+    def pop(self, index: int = -1) -> int:
+        # calls 中的符号保留, 避免其余符号的下标变化
+        code = self.codes[index]
+        del self.codes[index]
+        return code
+
+    def iter_calls(self) -> Iterator[Tuple[int, Symbol]]:
+        """(在序列中的位置, 符号)"""
+        for i, code in enumerate(self.codes):
+            if code < 0:
+                yield i, self.calls[-code - 1]
+
+    def dump(self) -> List[Union[int, str]]:
+        if not self.calls:
+            return self.codes.tolist()
+        calls = self.calls
+        return [
+            code if code >= 0 else calls[-code - 1].encode_tenhou()
+            for code in self.codes
+        ]
+
+
 class Round(NamedTuple):
     kyoku: int
     honba: int
@@ -369,15 +484,16 @@ class Agari:
         return li
 
 
-@dataclass
+@dataclass(slots=True)
 class Kyoku:
     nplayers: int
     round: Round
     initscores: list[int]
-    doras: list[Tile]
-    draws: list[list[Symbol]]
-    discards: list[list[Symbol]]
-    haipais: list[list[Tile]]
+    # 以下均为天凤编码
+    doras: array
+    draws: list[SymbolSeq]
+    discards: list[SymbolSeq]
+    haipais: list[array]
 
     # treat the last tile in the dealer's hand as a drawn tile
     poppedtile: Tile
@@ -405,7 +521,7 @@ class Kyoku:
         entry = [
             self.round,
             self.initscores,
-            [t.encode_tenhou() for t in self.doras],
+            self.doras.tolist(),
         ]
 
         if isinstance(self.result, Agari):
@@ -414,9 +530,9 @@ class Kyoku:
             entry.append([])
 
         for i in range(self.nplayers):
-            entry.append([t.encode_tenhou() for t in self.haipais[i]])
-            entry.append([t.encode_tenhou() for t in self.draws[i]])
-            entry.append([t.encode_tenhou() for t in self.discards[i]])
+            entry.append(self.haipais[i].tolist())
+            entry.append(self.draws[i].dump())
+            entry.append(self.discards[i].dump())
 
         if self.result is not None:
             entry.append(self.result.dump())
@@ -424,19 +540,6 @@ class Kyoku:
         return entry
 
     def countpao(self, tile: Tile, owner: int, feeder: int):
-        WINDS = [
-            Tile(1, TileType.Z),
-            Tile(2, TileType.Z),
-            Tile(3, TileType.Z),
-            Tile(4, TileType.Z),
-        ]
-        DRAGS = [
-            Tile(5, TileType.Z),
-            Tile(6, TileType.Z),
-            Tile(7, TileType.Z),
-            Tile(0, TileType.Z),
-        ]  # 0z would be aka haku
-
         # owner and feeder are seats, tile should be tenhou
         if tile in WINDS:
             self.nowinds[owner] += 1
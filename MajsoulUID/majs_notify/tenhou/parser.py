@@ -1,16 +1,19 @@
 from datetime import datetime
 from math import ceil
-from typing import TypeVar, cast
+from typing import Callable, Iterable, Iterator, TypeVar, cast
 
 from pydantic import BaseModel, Field
 
+from ...lib import lq as liblq
 from ...lib.lq import (
+    GameDetailRecords,
     HuleInfo,
     RecordAnGangAddGang,
     RecordBaBei,
     RecordChiPengGang,
     RecordDealTile,
     RecordDiscardTile,
+    RecordGame,
     RecordHule,
     RecordLiuJu,
     RecordNewRound,
@@ -18,7 +21,7 @@ from ...lib.lq import (
 )
 from ..model import MjsLog, MjsLogItem
 from .cfg import cfg
-from .constants import DAISANGEN, DAISUUSHI, JPNAME, RUNES, YSCORE
+from .constants import DAISANGEN, DAISUUSHI, JPNAME, RUNES, TSUMOGIRI, YSCORE
 from .model import (
     Agari,
     AgariPoint,
@@ -34,16 +37,38 @@ from .model import (
     Ryukyoku,
     SingleAgari,
     SpecialRyukyoku,
+    SymbolSeq,
     Tile,
     TileType,
     Yaku,
-    ZeroSymbol,
+    tile_code,
+    tile_codes,
 )
 from .utils import pad_list, relative_seating
 
 T = TypeVar("T")
 
 
+def _lookup_message(name: str) -> type:
+    return getattr(liblq, name.rsplit(".", 1)[-1])
+
+
+def iter_record_actions(
+    payload: GameDetailRecords,
+    lookup: Callable[[str], type] = _lookup_message,
+) -> Iterator[MjsLogItem]:
+    """按顺序惰性解码 GameDetailRecords 中的对局操作"""
+    if payload.version < 210715 and len(payload.records) > 0:
+        raws = payload.records
+    else:
+        raws = [action.result for action in payload.actions if action.result]
+
+    for value in raws:
+        raw = liblq.Wrapper().parse(value)
+        msg_obj = lookup(raw.name)
+        yield MjsLogItem(name=msg_obj.__name__, data=msg_obj().parse(raw.data))
+
+
 class TenhouModel(BaseModel):
     ver: str = "2.3"
     ref: str = Field(default="")
@@ -63,18 +88,42 @@ class MajsoulPaipuParser:
     def __init__(self):
         self.kyokus: list[Kyoku] = []
         self.kyoku: Kyoku | None = None
+        # 仅友人场/比赛场可能关闭自摸损
+        self.tsumoloss_off = False
 
     def handle_game_record(self, record: MjsLog):
+        return self.parse(record.head, record.data)
+
+    def parse(self, head: RecordGame, actions: Iterable[MjsLogItem]) -> dict:
+        """转换完整对局, actions 可以是惰性的迭代器"""
+        res = self.handle_head(head)
+        res.log = list(self.iter_log(actions))
+        return res.model_dump()
+
+    def iter_kyokus(self, actions: Iterable[MjsLogItem]) -> Iterator[Kyoku]:
+        """逐个产出已结束的小局, 调用方可以随时停止迭代"""
+        for item in actions:
+            self.handle(item)
+            if self.kyokus:
+                yield from self.kyokus
+                self.kyokus.clear()
+
+    def iter_log(self, actions: Iterable[MjsLogItem]) -> Iterator[list]:
+        """逐个产出天凤格式的小局"""
+        for kyoku in self.iter_kyokus(actions):
+            yield kyoku.dump()
+
+    def handle_head(self, head: RecordGame) -> TenhouModel:
         res = TenhouModel()
         ruledisp = ""
         lobby = ""  # usually 0, is the custom lobby number
-        nplayers = len(record.head.result.players)
+        nplayers = len(head.result.players)
         nakas = nplayers - 1  # default
 
         # mlog version number
         res.ver = "2.3"
         # game id - copy and paste into "other" on the log page to view
-        res.ref = record.head.uuid
+        res.ref = head.uuid
 
         # PF4 is yonma, PF3 is sanma
         res.ratingc = f"PF{nplayers}"
@@ -83,33 +132,33 @@ class MajsoulPaipuParser:
         if nplayers == 3:
             ruledisp += RUNES["sanma"][JPNAME]
 
-        if record.head.config.meta.mode_id:  # ranked or casual
+        if head.config.meta.mode_id:  # ranked or casual
             ruledisp += cfg["desktop"]["matchmode"]["map_"][
-                str(record.head.config.meta.mode_id)
+                str(head.config.meta.mode_id)
             ]["room_name_jp"]
-        elif record.head.config.meta.room_id:  # friendly
+        elif head.config.meta.room_id:  # friendly
             # can set room number as lobby number
-            lobby = f": {record.head.config.meta.room_id}"
+            lobby = f": {head.config.meta.room_id}"
             ruledisp += RUNES["friendly"][JPNAME]  # "Friendly"
-            nakas = record.head.config.mode.detail_rule.dora_count
+            nakas = head.config.mode.detail_rule.dora_count
             self.tsumoloss_off = (
-                nplayers == 3 and not record.head.config.mode.detail_rule.have_zimosun
+                nplayers == 3 and not head.config.mode.detail_rule.have_zimosun
             )
-        elif record.head.config.meta.contest_uid:  # tourney
-            lobby = f": {record.head.config.meta.contest_uid}"
+        elif head.config.meta.contest_uid:  # tourney
+            lobby = f": {head.config.meta.contest_uid}"
             ruledisp += RUNES["tournament"][JPNAME]  # "Tournament"
-            nakas = record.head.config.mode.detail_rule.dora_count
+            nakas = head.config.mode.detail_rule.dora_count
             self.tsumoloss_off = (
-                nplayers == 3 and not record.head.config.mode.detail_rule.have_zimosun
+                nplayers == 3 and not head.config.mode.detail_rule.have_zimosun
             )
-        if record.head.config.mode.mode == 1:
+        if head.config.mode.mode == 1:
             ruledisp += RUNES["tonpuu"][JPNAME]  # " East"
-        elif record.head.config.mode.mode == 2:
+        elif head.config.mode.mode == 2:
             ruledisp += RUNES["hanchan"][JPNAME]
 
         if (
-            record.head.config.meta.mode_id == 0
-            and record.head.config.mode.detail_rule.dora_count == 0
+            head.config.meta.mode_id == 0
+            and head.config.mode.detail_rule.dora_count == 0
         ):
             res.rule = {
                 "disp": ruledisp,
@@ -133,14 +182,14 @@ class MajsoulPaipuParser:
         # autism to fix logs with AI
         # ranks
         res.dan = [""] * nplayers
-        for e in record.head.accounts:
+        for e in head.accounts:
             res.dan[e.seat] = cfg["level_definition"]["level_definition"]["map_"][
                 str(e.level.id)
             ]["full_name_jp"]
 
         # level score, no real analog to rate
         res.rate = [0] * nplayers
-        for e in record.head.accounts:
+        for e in head.accounts:
             res.rate[e.seat] = e.level.score  # level score, closest thing to rate
 
         # sex
@@ -148,7 +197,7 @@ class MajsoulPaipuParser:
 
         # >names
         res.name = ["AI"] * nplayers
-        for e in record.head.accounts:
+        for e in head.accounts:
             res.name[e.seat] = e.nickname
 
         # clean up for sanma AI
@@ -159,7 +208,7 @@ class MajsoulPaipuParser:
         # scores
         scores = [
             [e.seat, e.part_point_1, e.total_point / 1000]
-            for e in record.head.result.players
+            for e in head.result.players
         ]
         res.sc = [0.0] * nplayers * 2
         for i, e in enumerate(scores):
@@ -169,15 +218,12 @@ class MajsoulPaipuParser:
         # optional title - why not give the room and put the timestamp here
         res.title = [
             ruledisp + lobby,
-            datetime.fromtimestamp(record.head.end_time).strftime("%Y-%m-%d %H:%M:%S"),
+            datetime.fromtimestamp(head.end_time).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
         ]
 
-        for item in record.data:
-            self.handle(item)
-
-        res.log = [kyoku.dump() for kyoku in self.kyokus]
-
-        return res.model_dump()
+        return res
 
     def handle(self, log: MjsLogItem):
         match log.name:
@@ -208,23 +254,18 @@ class MajsoulPaipuParser:
             nplayers=nplayers,
             round=Round(4 * log.chang + log.ju, log.ben, log.liqibang),
             initscores=pad_list(list(log.scores), 4, 0),
-            doras=(
-                [Tile.parse(log.dora)]
-                if log.dora
-                else [Tile.parse(t) for t in log.doras]
-            ),
-            draws=[[], [], [], []],
-            discards=[[], [], [], []],
+            doras=tile_codes([log.dora] if log.dora else log.doras),
+            draws=[SymbolSeq() for _ in range(4)],
+            discards=[SymbolSeq() for _ in range(4)],
             haipais=[
-                [Tile.parse(t) for t in getattr(log, f"tiles{i}")]
-                for i in range(nplayers)
+                tile_codes(getattr(log, f"tiles{i}")) for i in range(nplayers)
             ],
             poppedtile=Tile(0, TileType.M),  # placeholder, will be set below
             # information we need, but can 't expect in every record
             dealerseat=log.ju,
         )
 
-        self.kyoku.draws[log.ju].append(self.kyoku.haipais[log.ju].pop())
+        self.kyoku.draws[log.ju].append_code(self.kyoku.haipais[log.ju].pop())
 
     def _handle_discard_tile(self, log: RecordDiscardTile):
         assert self.kyoku is not None, "discard tile before new round"
@@ -239,19 +280,21 @@ class MajsoulPaipuParser:
         ):
             tsumogiri = True
 
-        sym = DiscardSymbol(tile, tsumogiri)
-
         # 立直宣言
         if log.is_liqi:
             self.kyoku.priichi = True
-            sym = DiscardSymbol(sym.tile, sym.tsumogiri, True)
-
-        self.kyoku.discards[log.seat].append(sym)
+            self.kyoku.discards[log.seat].append_call(
+                DiscardSymbol(tile, tsumogiri, True)
+            )
+        else:
+            self.kyoku.discards[log.seat].append_code(
+                TSUMOGIRI if tsumogiri else tile.encode_tenhou()
+            )
         self.kyoku.ldseat = log.seat
 
         # 更新dora
         if len(log.doras) > len(self.kyoku.doras):
-            self.kyoku.doras = [Tile.parse(t) for t in log.doras]
+            self.kyoku.doras = tile_codes(log.doras)
 
     def _accept_riichi(self):
         assert self.kyoku is not None, "accept riichi before new round"
@@ -265,9 +308,9 @@ class MajsoulPaipuParser:
 
         # 更新dora
         if len(log.doras) > len(self.kyoku.doras):
-            self.kyoku.doras = [Tile.parse(t) for t in log.doras]
+            self.kyoku.doras = tile_codes(log.doras)
 
-        self.kyoku.draws[log.seat].append(Tile.parse(log.tile))
+        self.kyoku.draws[log.seat].append_code(tile_code(log.tile))
 
     def _handle_chi_peng_gang(self, log: RecordChiPengGang):
         assert self.kyoku is not None, "chi/peng/gang before new round"
@@ -275,7 +318,7 @@ class MajsoulPaipuParser:
 
         if log.type == 0:
             # chii
-            self.kyoku.draws[log.seat].append(
+            self.kyoku.draws[log.seat].append_call(
                 ChiSymbol(
                     Tile.parse(log.tiles[2]),
                     Tile.parse(log.tiles[0]),
@@ -288,7 +331,7 @@ class MajsoulPaipuParser:
             idx = relative_seating(log.seat, self.kyoku.ldseat)
             self.kyoku.countpao(worktiles[0], log.seat, self.kyoku.ldseat)
             # pop the called tile and prepend 'p'
-            self.kyoku.draws[log.seat].append(
+            self.kyoku.draws[log.seat].append_call(
                 PonSymbol(worktiles[0], worktiles[1], worktiles[2], idx)
             )
         elif log.type == 2:
@@ -296,13 +339,13 @@ class MajsoulPaipuParser:
             calltiles = [Tile.parse(t) for t in log.tiles]
             idx = relative_seating(log.seat, self.kyoku.ldseat)
             self.kyoku.countpao(calltiles[0], log.seat, self.kyoku.ldseat)
-            self.kyoku.draws[log.seat].append(
+            self.kyoku.draws[log.seat].append_call(
                 DaiminkanSymbol(
                     calltiles[0], calltiles[1], calltiles[2], calltiles[3], idx
                 )
             )
             # tenhou drops a 0 in discards for this
-            self.kyoku.discards[log.seat].append(ZeroSymbol())
+            self.kyoku.discards[log.seat].append_code(0)
             # register kan
             self.kyoku.nkan += 1
         else:
@@ -323,33 +366,23 @@ class MajsoulPaipuParser:
             # count the group as visible, but don't set pao
             self.kyoku.countpao(tile, log.seat, -1)
 
-            # get the tiles from haipai and draws that
-            # are involved in ankan, dumb
-            # because n aka might be involved
-            ankantiles = [
-                t for t in self.kyoku.haipais[log.seat] if t.deaka() == tile.deaka()
-            ] + [
-                t
-                for t in self.kyoku.draws[log.seat]
-                if isinstance(t, Tile) and t.deaka() == tile.deaka()
-            ]
-
-            # doesn't really matter which tile we mark ankan with - choosing last drawn
-            ankan_tile = ankantiles.pop() if ankantiles else tile
-
-            self.kyoku.discards[log.seat].append(AnkanSymbol(ankan_tile.deaka()))
+            # every tile involved in the ankan has the same deaka'd tile,
+            # so there is no need to look them up in haipai and draws
+            self.kyoku.discards[log.seat].append_call(
+                AnkanSymbol(tile.deaka())
+            )
             self.kyoku.nkan += 1
 
         elif log.type == 2:
             # shouminkan
             # get pon naki from .draws and swap in new symbol
-            for i, sy in enumerate(self.kyoku.draws[log.seat]):
+            for i, sy in self.kyoku.draws[log.seat].iter_calls():
                 if isinstance(sy, PonSymbol) and (
                     sy.tile == tile or sy.tile == tile.deaka()
                 ):
                     # remove the pon from draws and add kakan to discards
                     self.kyoku.draws[log.seat].pop(i)
-                    self.kyoku.discards[log.seat].append(
+                    self.kyoku.discards[log.seat].append_call(
                         KakanSymbol(sy.a, sy.b, sy.tile, tile, sy.feeder_relative)
                     )
                     self.kyoku.nkan += 1
@@ -360,7 +393,7 @@ class MajsoulPaipuParser:
     def _handle_ba_bei(self, log: RecordBaBei):
         assert self.kyoku is not None, "ba bei before new round"
         # kita - this record (only) gives {seat, moqie}
-        self.kyoku.discards[log.seat].append(PeSymbol())
+        self.kyoku.discards[log.seat].append_call(PeSymbol())
         self.kyoku.ldseat = log.seat
 
     def _handle_liu_ju(self, log: RecordLiuJu):
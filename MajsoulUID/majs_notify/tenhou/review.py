@@ -1,14 +1,13 @@
-import json
 import time
 import asyncio
 from typing import Dict, List, Tuple, Union
 
 import httpx
-import aiofiles
 from gsuid_core.logger import logger
 
+from ..paipu_store import paipu_store
+from ..singleflight import SingleFlight
 from ...majs_config.majs_config import MAJS_CONFIG
-from ...utils.resource.RESOURCE_PATH import PAIPU_PATH
 
 
 async def check_url(tag: str, url: str):
@@ -48,13 +47,28 @@ async def find_fastest_url(
     ]
 
 
+review_flight: SingleFlight[Union[str, Dict]] = SingleFlight()
+
+
 async def review_tenhou(tenhou_log: Dict[str, str]) -> Union[str, Dict]:
     game_id = tenhou_log["game_id"]
-    path = PAIPU_PATH / f"{game_id} - review.json"
-    if path.exists():
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            data = json.loads(await f.read())
-            return data
+    data = await paipu_store.load(game_id, "review")
+    if data is not None:
+        return data
+
+    engine: str = MAJS_CONFIG.get_config("MajsReviewEngine").data
+    return await review_flight.do(
+        (game_id, engine), lambda: _review_tenhou(tenhou_log, engine)
+    )
+
+
+async def _review_tenhou(
+    tenhou_log: Dict[str, str], engine: str
+) -> Union[str, Dict]:
+    game_id = tenhou_log["game_id"]
+    data = await paipu_store.load(game_id, "review")
+    if data is not None:
+        return data
 
     sess = httpx.AsyncClient(verify=False)
     urls = {
@@ -82,7 +96,6 @@ async def review_tenhou(tenhou_log: Dict[str, str]) -> Union[str, Dict]:
     player_id = tenhou_log.get("_target_actor", 0)
     auth_token: str = MAJS_CONFIG.get_config("MajsReviewToken").data
     headers = {"Authentication": f"Bear {auth_token}"} if auth_token else {}
-    engine: str = MAJS_CONFIG.get_config("MajsReviewEngine").data
     payload = {
         "type": engine.lower(),
         "player_id": player_id,
@@ -111,8 +124,7 @@ async def review_tenhou(tenhou_log: Dict[str, str]) -> Union[str, Dict]:
     else:
         return "❌ 未找到有效的Review信息!可能是处理超过等待时间请在2分钟后重试!"
 
-    async with aiofiles.open(path, "w", encoding="utf-8") as f:
-        await f.write(json.dumps(res, ensure_ascii=False, indent=4))
+    await paipu_store.save(game_id, review=res)
     return res
 
 
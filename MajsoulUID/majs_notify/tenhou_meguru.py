@@ -52,6 +52,8 @@ def n2p(number: int):
 
 class MeguruLog:
     def __init__(self, log: List[List[Union[str, int]]], _target_actor: int):
+        # 牌谱来自共享的缓存, process() 会原地修改配牌, 需要复制一份
+        log = deepcopy(log)
         self.log = log
         self._target_actor = _target_actor
         self.now_state = log[0]
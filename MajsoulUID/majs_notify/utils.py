@@ -1,35 +1,133 @@
+import re
+import json
+import uuid
 import random
 import hashlib
-from typing import Dict
 from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 
 import aiofiles
 from httpx import AsyncClient
+from gsuid_core.logger import logger
 
 from .constants import HEADERS
+from ..utils.resource.RESOURCE_PATH import HTTP_CACHE_PATH
 
 HTTPX_CLIENT = AsyncClient(headers=HEADERS)
 
+# 响应内容按 sha256 保存在 blobs 下, meta 下按 URL 记录对应的内容与验证信息
+BLOB_PATH = HTTP_CACHE_PATH / "blobs"
+META_PATH = HTTP_CACHE_PATH / "meta"
+BLOB_PATH.mkdir(parents=True, exist_ok=True)
+META_PATH.mkdir(parents=True, exist_ok=True)
+
+# resversion{版本}.json 与 v{版本}/ 前缀下的资源内容不会变化
+IMMUTABLE_PATH = re.compile(r"^(resversion[\w.]+\.json$|v\d+(\.\d+)*\.\w+/)")
+MEMO_SIZE = 8
+
+_memo: "OrderedDict[str, Any]" = OrderedDict()
+
+
+def is_immutable(path: str) -> bool:
+    return IMMUTABLE_PATH.match(path) is not None
+
+
+def _meta_file(url: str) -> Path:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return META_PATH / f"{key}.json"
+
+
+async def _load_meta(url: str) -> Optional[Dict[str, str]]:
+    meta_file = _meta_file(url)
+    if not meta_file.exists():
+        return None
+    async with aiofiles.open(meta_file, "r", encoding="utf-8") as f:
+        meta = json.loads(await f.read())
+    if not (BLOB_PATH / meta["blob"]).exists():
+        return None
+    return meta
+
+
+async def _read_blob(blob: str) -> bytes:
+    async with aiofiles.open(BLOB_PATH / blob, "rb") as f:
+        return await f.read()
 
-async def getRes(URL_BASE: str, path: str, bust_cache: bool = False) -> Dict:
-    HTTPX_CLIENT.headers["Referer"] = URL_BASE
 
+async def _write_atomic(path: Path, data: bytes):
+    # 同一文件可能被并发写入 (例如多个地区同时启动), 临时文件名不能重复
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        async with aiofiles.open(tmp, "wb") as f:
+            await f.write(data)
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+async def _save(url: str, content: bytes, headers: Dict[str, str]):
+    blob = hashlib.sha256(content).hexdigest()
+    if not (BLOB_PATH / blob).exists():
+        await _write_atomic(BLOB_PATH / blob, content)
+
+    meta = {"url": url, "blob": blob}
+    for key in ("etag", "last-modified"):
+        if key in headers:
+            meta[key] = headers[key]
+    await _write_atomic(_meta_file(url), json.dumps(meta).encode("utf-8"))
+
+
+def _remember(url: str, data: Any):
+    _memo[url] = data
+    _memo.move_to_end(url)
+    while len(_memo) > MEMO_SIZE:
+        _memo.popitem(last=False)
+
+
+async def getRes(URL_BASE: str, path: str, bust_cache: bool = False) -> Dict:
+    """
+    获取雀魂的 JSON 资源。
+    带版本号的资源直接使用本地缓存 (以及进程内缓存),
+    其余资源使用 ETag / Last-Modified 向服务器验证缓存是否仍然有效。
+    """
     url = (
         f"{URL_BASE}/1/{path}"
         if URL_BASE == "https://game.maj-soul.com/"
         else f"{URL_BASE}{path}"
     )
 
-    cache_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    immutable = not bust_cache and is_immutable(path)
+    if immutable and url in _memo:
+        _memo.move_to_end(url)
+        return _memo[url]
+
+    meta = await _load_meta(url)
+    if immutable and meta is not None:
+        data = json.loads(await _read_blob(meta["blob"]))
+        _remember(url, data)
+        return data
+
+    headers = {"Referer": URL_BASE}
+    if meta is not None:
+        if "etag" in meta:
+            headers["If-None-Match"] = meta["etag"]
+        if "last-modified" in meta:
+            headers["If-Modified-Since"] = meta["last-modified"]
+
+    request_url = url
     if bust_cache:
-        url += f"?randv={str(random.random())[2:]}"
+        request_url += f"?randv={str(random.random())[2:]}"
 
-    cache_dir = Path(".cache")
-    cache_dir.mkdir(exist_ok=True)
-    cache_file = cache_dir / cache_hash
+    resp = await HTTPX_CLIENT.get(request_url, headers=headers)
+    if resp.status_code == 304 and meta is not None:
+        logger.debug(f"[majs] {path} 未变化, 使用缓存")
+        content = await _read_blob(meta["blob"])
+    else:
+        resp.raise_for_status()
+        content = resp.content
+        await _save(url, content, dict(resp.headers))
 
-    resp = await HTTPX_CLIENT.get(url)
-    resp.raise_for_status()
-    async with aiofiles.open(cache_file, "wb") as f:
-        await f.write(resp.content)
-    return resp.json()
+    data = json.loads(content)
+    if immutable:
+        _remember(url, data)
+    return data
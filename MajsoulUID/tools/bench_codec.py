@@ -0,0 +1,135 @@
+"""
+MajsoulProtoCodec 编解码基准测试
+
+在仓库根目录执行:
+    python -m MajsoulUID.tools.bench_codec
+"""
+
+import time
+
+import betterproto
+
+from MajsoulUID.lib import lq as liblq
+from MajsoulUID.majs_notify.codec import MajsoulProtoCodec
+from MajsoulUID.majs_notify.model import (
+    ReqRes,
+    MajsoulMethod,
+    MajsoulLiqiItem,
+    MajsoulLiqiProto,
+    MajsoulLiqiNested,
+)
+
+FRAMES = 50000
+LOOKUPS = 500000
+
+PB_DEF = MajsoulLiqiProto(
+    nested={
+        "lq": MajsoulLiqiNested(
+            nested={
+                "Lobby": MajsoulLiqiItem(
+                    methods={
+                        "fetchServerTime": ReqRes(
+                            "ReqCommon", "ResServerTime"
+                        ),
+                        "fetchGameRecord": ReqRes(
+                            "ReqGameRecord", "ResGameRecord"
+                        ),
+                    }
+                ),
+                "Route": MajsoulLiqiItem(
+                    methods={"heartbeat": ReqRes("ReqHeartbeat", "ResCommon")}
+                ),
+                "NotifyFriendStateChange": MajsoulLiqiItem(fields={}),
+            }
+        )
+    }
+)
+
+
+class LegacyProtoCodec(MajsoulProtoCodec):
+    """优化前的查找方式: 每一帧都拆分方法名并遍历 liqi 定义"""
+
+    def lookup_rpc(self, method_name: str) -> MajsoulMethod:
+        _, lq, service, rpc = method_name.split(".")
+        proto_method = self._pb.nested[lq].nested[service].methods
+        if proto_method is None or rpc not in proto_method:
+            raise ValueError(f"Unknown method {rpc}")
+        proto_domain = proto_method[rpc]
+        return MajsoulMethod(
+            request_type=self.lookup_method(proto_domain.requestType),
+            response_type=self.lookup_method(proto_domain.responseType),
+        )
+
+    def lookup_message(self, name: str) -> type[betterproto.Message]:
+        _, lq, notify = name.split(".")
+        return self.lookup_method(notify)
+
+
+def build_frames(codec: MajsoulProtoCodec):
+    notify = liblq.NotifyFriendStateChange(target_id=10000)
+    notify_frame = bytes([codec.NOTIFY]) + codec.wrap(
+        ".lq.NotifyFriendStateChange", bytes(notify)
+    )
+    request_frame = bytes([codec.REQUEST, 1, 0]) + codec.wrap(
+        ".lq.Route.heartbeat", bytes(liblq.ReqHeartbeat(delay=100))
+    )
+    response_frame = bytes([codec.RESPONSE, 1, 0]) + codec.wrap(
+        "", bytes(liblq.ResCommon())
+    )
+    return notify_frame, request_frame, response_frame
+
+
+def run_frames(codec: MajsoulProtoCodec) -> float:
+    notify_frame, request_frame, response_frame = build_frames(codec)
+    heartbeat = {"delay": 100, "no_operation_counter": 0, "platform": 11}
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        codec.index = 1
+        codec.encode_request(".lq.Route.heartbeat", heartbeat)
+        codec.decode_message(response_frame)
+        codec.decode_message(notify_frame)
+        codec.decode_message(request_frame)
+    elapsed = time.perf_counter() - start
+
+    # 每轮包含 encode + 3 次 decode
+    return FRAMES * 4 / elapsed
+
+
+def run_lookups(codec: MajsoulProtoCodec) -> float:
+    """只测方法查找, 不包含 protobuf 编解码"""
+    start = time.perf_counter()
+    for _ in range(LOOKUPS):
+        codec.lookup_rpc(".lq.Route.heartbeat")
+        codec.lookup_rpc(".lq.Lobby.fetchGameRecord")
+        codec.lookup_message(".lq.NotifyFriendStateChange")
+    elapsed = time.perf_counter() - start
+
+    return LOOKUPS * 3 / elapsed
+
+
+def report(title: str, unit: str, legacy: float, current: float):
+    print(title)
+    print(f"  legacy : {legacy:>12.0f} {unit}")
+    print(f"  current: {current:>12.0f} {unit}")
+    print(f"  speedup: {current / legacy:>12.2f}x")
+
+
+def main():
+    report(
+        "方法查找",
+        "lookups/s",
+        run_lookups(LegacyProtoCodec(PB_DEF, "bench")),
+        run_lookups(MajsoulProtoCodec(PB_DEF, "bench")),
+    )
+    # 完整的编解码以 protobuf 解析/序列化为主, 查找只占很小一部分
+    report(
+        "完整编解码",
+        "frames/s",
+        run_frames(LegacyProtoCodec(PB_DEF, "bench")),
+        run_frames(MajsoulProtoCodec(PB_DEF, "bench")),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+lib/lq 导入耗时基准测试
+
+在仓库根目录执行:
+    python -m MajsoulUID.tools.bench_import [--legacy 旧版lq.py] [-n 次数]
+
+每次测试在新的子进程中执行, 输出中位数:
+    runtime: 导入 lq 并使用推送服务运行时需要的消息类
+    all    : 导入全部子模块 (最坏情况)
+    legacy : 拆分前的单文件模块, 例如
+             git show <拆分前的提交>:MajsoulUID/lib/lq/__init__.py > /tmp/lq.py
+"""
+
+import sys
+import argparse
+import statistics
+import subprocess
+from typing import Optional
+
+RUNTIME_CLASSES = [
+    "Wrapper",
+    "ReqCommon",
+    "ResCommon",
+    "ReqHeartbeat",
+    "ResFetchInfo",
+    "ResGameRecord",
+    "GameDetailRecords",
+    "NotifyFriendStateChange",
+    "NotifyFriendViewChange",
+    "RecordNewRound",
+]
+
+TEMPLATE = """
+import time
+import betterproto
+import MajsoulUID.lib
+
+start = time.perf_counter()
+{body}
+print(time.perf_counter() - start)
+"""
+
+RUNTIME = f"""
+from MajsoulUID.lib import lq
+for name in {RUNTIME_CLASSES!r}:
+    getattr(lq, name)
+lq.ResGameRecord().parse(bytes(lq.ResGameRecord()))
+"""
+
+ALL = """
+from MajsoulUID.lib import lq
+for name in lq.__all__:
+    getattr(lq, name)
+"""
+
+LEGACY = """
+import sys
+import importlib.util
+spec = importlib.util.spec_from_file_location("lq_legacy", {path!r})
+lq = importlib.util.module_from_spec(spec)
+sys.modules["lq_legacy"] = lq
+spec.loader.exec_module(lq)
+lq.ResGameRecord().parse(bytes(lq.ResGameRecord()))
+"""
+
+
+def measure(body: str, runs: int) -> float:
+    code = TEMPLATE.format(body=body)
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="lib/lq 导入耗时基准测试")
+    parser.add_argument(
+        "--legacy", default=None, help="拆分前的 lq/__init__.py"
+    )
+    parser.add_argument("-n", "--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    legacy: Optional[float] = None
+    if args.legacy:
+        legacy = measure(LEGACY.format(path=args.legacy), args.runs)
+        print(f"legacy : {legacy * 1000:>8.1f} ms")
+
+    runtime = measure(RUNTIME, args.runs)
+    print(f"runtime: {runtime * 1000:>8.1f} ms")
+    print(f"all    : {measure(ALL, args.runs) * 1000:>8.1f} ms")
+
+    if legacy is not None:
+        print(f"speedup: {legacy / runtime:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+天凤格式牌谱转换基准测试
+
+在仓库根目录执行:
+    python -m MajsoulUID.tools.bench_tenhou [语料目录] [-n 局数]
+
+1. 牌的解析/编码: 优化前的逐次计算 与 预生成查找表 对比
+2. 完整转换: 对语料中保存的原始牌谱 (record 分段) 重复转换, 输出 局/秒,
+   可在修改前后分别执行比较。语料目录默认为牌谱存储目录。
+"""
+
+import time
+import asyncio
+import argparse
+from pathlib import Path
+from typing import List, Tuple
+
+from MajsoulUID.lib import lq as liblq
+from MajsoulUID.majs_notify.majsoul import convert_game_record
+from MajsoulUID.majs_notify.tenhou.model import TILES, Tile, TileType
+from MajsoulUID.majs_notify.paipu_store import (
+    SUFFIX,
+    PaipuStore,
+    paipu_store,
+    game_id_from_path,
+)
+
+ROUNDS = 20000
+TILE_STRS = [f"{t.num}{t.type.name.lower()}" for t in TILES]
+
+
+def legacy_parse(text: str) -> Tile:
+    assert len(text) == 2
+    return Tile(int(text[0]), TileType[text[1].upper()])
+
+
+def legacy_encode(tile: Tile) -> int:
+    if tile.num != 0:
+        return 10 * (tile.type.value + 1) + tile.num
+    return 50 + (tile.type.value + 1)
+
+
+def legacy_deaka(tile: Tile) -> Tile:
+    if tile.type != TileType.Z and tile.num == 0:
+        return Tile(5, tile.type)
+    return tile
+
+
+def bench_tiles() -> Tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for s in TILE_STRS:
+            tile = legacy_parse(s)
+            legacy_encode(tile)
+            legacy_encode(legacy_deaka(tile))
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for s in TILE_STRS:
+            tile = Tile.parse(s)
+            tile.encode_tenhou()
+            tile.deaka().encode_tenhou()
+    current = time.perf_counter() - start
+
+    ops = ROUNDS * len(TILE_STRS)
+    return ops / legacy, ops / current
+
+
+async def load_corpus(
+    store: PaipuStore, limit: int
+) -> List[Tuple[str, bytes]]:
+    corpus = []
+    for path in sorted(store.root.glob(f"*{SUFFIX}")):
+        game_id = game_id_from_path(path)
+        if game_id is None:
+            continue
+        record = await store.load(game_id, "record")
+        if record is not None:
+            corpus.append((game_id, record))
+        if len(corpus) >= limit:
+            break
+    return corpus
+
+
+def bench_convert(corpus: List[Tuple[str, bytes]], repeat: int) -> float:
+    records = [
+        (game_id, liblq.ResGameRecord().parse(record))
+        for game_id, record in corpus
+    ]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for game_id, logs in records:
+            convert_game_record(game_id, logs)
+    return len(records) * repeat / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="天凤格式牌谱转换基准测试")
+    parser.add_argument("corpus", nargs="?", type=Path, default=None)
+    parser.add_argument("-n", "--limit", type=int, default=50)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy, current = bench_tiles()
+    print(f"tile legacy : {legacy:>12.0f} tiles/s")
+    print(f"tile current: {current:>12.0f} tiles/s")
+    print(f"tile speedup: {current / legacy:>12.2f}x")
+
+    store = PaipuStore(args.corpus) if args.corpus else paipu_store
+    corpus = asyncio.run(load_corpus(store, args.limit))
+    if not corpus:
+        print(f"{store.root} 中没有包含原始牌谱的对局, 跳过转换测试")
+        return
+    print(f"convert     : {bench_convert(corpus, args.repeat):>12.1f} games/s")
+
+
+if __name__ == "__main__":
+    main()
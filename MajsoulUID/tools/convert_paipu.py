@@ -0,0 +1,136 @@
+"""
+离线批量重新生成天凤格式牌谱
+
+从牌谱存储中读取原始 ResGameRecord (record 分段), 在进程池中重新转换,
+结果写回 tenhou 分段。适用于修改 tenhou/parser.py 或 tenhou/data.json 之后。
+
+在仓库根目录执行:
+    python -m MajsoulUID.tools.convert_paipu [-j 进程数] [--restart]
+
+已完成的对局ID按行追加写入检查点文件, 中断后再次执行会跳过这些对局;
+全部完成后删除检查点, 使用 --restart 可忽略已有检查点重新开始。
+"""
+
+import os
+import time
+import asyncio
+import argparse
+from pathlib import Path
+from typing import Set, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+
+from MajsoulUID.lib import lq as liblq
+from MajsoulUID.majs_notify.majsoul import convert_game_record
+from MajsoulUID.majs_notify.paipu_store import (
+    SUFFIX,
+    PaipuStore,
+    paipu_store,
+    game_id_from_path,
+)
+
+CHECKPOINT = paipu_store.root / "convert_checkpoint.txt"
+REPORT_INTERVAL = 5
+
+
+def convert_record(game_id: str, record: bytes) -> Dict:
+    """在子进程中执行"""
+    logs = liblq.ResGameRecord().parse(record)
+    return convert_game_record(game_id, logs)
+
+
+def load_checkpoint(path: Path) -> Set[str]:
+    if not path.exists():
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+async def convert_all(
+    store: PaipuStore,
+    workers: int,
+    checkpoint: Path,
+) -> Tuple[int, int, int]:
+    """返回 (成功数, 失败数, 跳过数)"""
+    done = load_checkpoint(checkpoint)
+    game_ids = sorted(
+        game_id
+        for path in store.root.glob(f"*{SUFFIX}")
+        if (game_id := game_id_from_path(path)) and game_id not in done
+    )
+    print(f"待转换: {len(game_ids)} 局, 检查点中已完成: {len(done)} 局")
+
+    loop = asyncio.get_running_loop()
+    success, failed, skipped = 0, 0, 0
+    start = last_report = time.perf_counter()
+    pending: Dict[asyncio.Future, str] = {}
+
+    async def collect(return_when: str):
+        nonlocal success, failed
+        finished, _ = await asyncio.wait(pending, return_when=return_when)
+        for fut in finished:
+            game_id = pending.pop(fut)
+            try:
+                await store.save(game_id, tenhou=fut.result())
+            except Exception as e:
+                print(f"[失败] {game_id}: {e!r}")
+                failed += 1
+                continue
+            ckpt.write(f"{game_id}\n")
+            success += 1
+        ckpt.flush()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, open(
+        checkpoint, "a", encoding="utf-8"
+    ) as ckpt:
+        for game_id in game_ids:
+            record = await store.load(game_id, "record")
+            if record is None:
+                # 旧版本只保存了转换结果, 无法重新生成
+                skipped += 1
+                continue
+
+            fut = loop.run_in_executor(pool, convert_record, game_id, record)
+            pending[fut] = game_id
+            if len(pending) >= workers * 2:
+                await collect(asyncio.FIRST_COMPLETED)
+
+            now = time.perf_counter()
+            if now - last_report >= REPORT_INTERVAL:
+                last_report = now
+                print(
+                    f"进度: {success + failed}/{len(game_ids)} "
+                    f"{success / (now - start):.1f} 局/秒"
+                )
+
+        if pending:
+            await collect(asyncio.ALL_COMPLETED)
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"完成: 成功 {success} 失败 {failed} 跳过(无原始牌谱) {skipped}, "
+        f"耗时 {elapsed:.1f}s, {success / elapsed if elapsed else 0:.1f} 局/秒"
+    )
+    return success, failed, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="批量重新生成天凤格式牌谱")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--restart", action="store_true", help="忽略检查点, 全部重新转换"
+    )
+    args = parser.parse_args()
+
+    if args.restart:
+        CHECKPOINT.unlink(missing_ok=True)
+
+    _, failed, _ = asyncio.run(
+        convert_all(paipu_store, args.workers or 1, CHECKPOINT)
+    )
+    # 有失败的对局时保留检查点, 再次执行只重试失败的部分
+    if not failed:
+        CHECKPOINT.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
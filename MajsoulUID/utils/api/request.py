@@ -1,9 +1,13 @@
+import time
+import random
+import asyncio
 import datetime
 from json import JSONDecodeError
 from typing import Any, Dict, List, Union, Literal, Optional, cast
 
-from httpx import AsyncClient
 from gsuid_core.logger import logger
+from gsuid_core.server import on_core_shutdown
+from httpx import Limits, Timeout, AsyncClient, TransportError
 
 from .remote_const import GameMode
 from .models import Game, Stats, Player, Extended
@@ -30,10 +34,97 @@ MODE_MAP = {
 MODE_3 = ",".join(str(mode.value) for mode in GameMode if "三" in mode.name)
 MODE_4 = ",".join(str(mode.value) for mode in GameMode if "三" not in mode.name)
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2 = True
+except ImportError:
+    # 未安装 httpx[http2] 时退回 HTTP/1.1 keep-alive
+    HTTP2 = False
+
+# 对 5xx / 429 / 网络错误的重试次数, 等待时间为 [0, min(MAX, BASE * 2^n)]
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8
+
+_client: Optional[AsyncClient] = None
+
+
+def get_client() -> AsyncClient:
+    """所有 Koromo 请求共用的连接池"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = AsyncClient(
+            http2=HTTP2,
+            limits=Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=60,
+            ),
+            timeout=Timeout(20, connect=5),
+        )
+    return _client
+
+
+@on_core_shutdown
+async def close_client():
+    if _client is not None:
+        await _client.aclose()
+
+
+class KoromoStats:
+    """按接口统计请求次数、失败次数与耗时"""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, endpoint: str, latency: float, ok: bool, retries: int):
+        s = self._stats.setdefault(
+            endpoint,
+            {"count": 0, "errors": 0, "retries": 0, "total": 0.0, "max": 0.0},
+        )
+        s["count"] += 1
+        s["retries"] += retries
+        s["total"] += latency
+        if latency > s["max"]:
+            s["max"] = latency
+        if not ok:
+            s["errors"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            endpoint: {**s, "avg": s["total"] / s["count"]}
+            for endpoint, s in self._stats.items()
+        }
+
+    def format_stats(self) -> str:
+        return "\n".join(
+            f"{endpoint}: {s['count']:.0f}次 失败: {s['errors']:.0f} "
+            f"重试: {s['retries']:.0f} "
+            f"平均耗时: {s['avg'] * 1000:.0f}ms "
+            f"最大耗时: {s['max'] * 1000:.0f}ms"
+            for endpoint, s in self.stats().items()
+        )
+
+
+def _endpoint(url: str) -> str:
+    # https://host/api/v2/pl4/player_stats/... -> player_stats
+    parts = url.split("/")
+    return parts[6] if len(parts) > 6 else url
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_DELAY)
+    return random.uniform(
+        0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+    )
+
 
 class KoromoApi:
     ssl_verify = True
     _HEADER: Dict[str, str] = {}
+    metrics = KoromoStats()
 
     async def get_player_stats(
         self,
@@ -111,16 +202,42 @@ class KoromoApi:
         json: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
     ) -> Union[Dict, int]:
-        async with AsyncClient() as client:
-            resp = await client.request(
-                method,
-                url=url,
-                headers=header,
-                params=params,
-                json=json,
-                data=data,
-                timeout=300,
-            )
+        endpoint = _endpoint(url)
+        client = get_client()
+        start = time.perf_counter()
+        retries, ok = 0, False
+        try:
+            while True:
+                try:
+                    resp = await client.request(
+                        method,
+                        url=url,
+                        headers=header,
+                        params=params,
+                        json=json,
+                        data=data,
+                    )
+                except TransportError as e:
+                    if retries >= MAX_RETRIES:
+                        raise
+                    logger.warning(f"[majs] Koromo {endpoint} 请求失败: {e!r}")
+                    await asyncio.sleep(_retry_delay(retries, None))
+                    retries += 1
+                    continue
+
+                if (
+                    resp.status_code == 429 or resp.status_code >= 500
+                ) and retries < MAX_RETRIES:
+                    logger.warning(
+                        f"[majs] Koromo {endpoint} 返回 {resp.status_code}, 重试"
+                    )
+                    await asyncio.sleep(
+                        _retry_delay(retries, resp.headers.get("Retry-After"))
+                    )
+                    retries += 1
+                    continue
+                break
+
             try:
                 raw_data = resp.json()
             except JSONDecodeError:
@@ -129,4 +246,9 @@ class KoromoApi:
             logger.debug(raw_data)
             if "error" in raw_data:
                 return -1
+            ok = resp.is_success
             return raw_data
+        finally:
+            self.metrics.record(
+                endpoint, time.perf_counter() - start, ok, retries
+            )
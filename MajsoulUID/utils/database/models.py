@@ -1,6 +1,7 @@
-from typing import Type, TypeVar, Optional
+from typing import Dict, List, Type, TypeVar, Optional
 
 from sqlmodel import Field, select
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from gsuid_core.utils.database.startup import exec_list
 from gsuid_core.webconsole.mount_app import PageSchema, GsAdminModel, site
@@ -13,6 +14,8 @@ from gsuid_core.utils.database.base_models import (
 )
 
 T_MajsPaipu = TypeVar("T_MajsPaipu", bound="MajsPaipu")
+T_MajsPaipuIndex = TypeVar("T_MajsPaipuIndex", bound="MajsPaipuIndex")
+T_MajsLiveGame = TypeVar("T_MajsLiveGame", bound="MajsLiveGame")
 
 exec_list.append('ALTER TABLE MajsUser ADD COLUMN username TEXT DEFAULT ""')
 exec_list.append('ALTER TABLE MajsUser ADD COLUMN password TEXT DEFAULT ""')
@@ -22,10 +25,19 @@ exec_list.append('ALTER TABLE MajsUser ADD COLUMN token TEXT DEFAULT ""')
 exec_list.append('ALTER TABLE MajsUser ADD COLUMN lang TEXT DEFAULT "zh"')
 exec_list.append("ALTER TABLE MajsUser ADD COLUMN login_type INT DEFAULT 0")
 
+# 旧版本可能写入了重复的牌谱, 去重后再建立唯一索引
+exec_list.append(
+    "DELETE FROM MajsPaipu WHERE id NOT IN "
+    "(SELECT MIN(id) FROM MajsPaipu GROUP BY uuid)"
+)
+exec_list.append(
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_majspaipu_uuid ON MajsPaipu (uuid)"
+)
+
 
 class MajsPaipu(BaseIDModel, table=True):
     account_id: str = Field(default="", title="雀魂账号ID")
-    uuid: str = Field(default="", title="牌谱UUID")
+    uuid: str = Field(default="", title="牌谱UUID", index=True, unique=True)
     paipu_type: int = Field(default=-1, title="牌谱类型")
     paipu_type_name: str = Field(default="", title="牌谱类型名称")
 
@@ -51,10 +63,178 @@ class MajsPaipu(BaseIDModel, table=True):
     async def data_exist(
         cls: Type[T_MajsPaipu], session: AsyncSession, uuid: str
     ) -> bool:
-        stmt = select(cls).where(cls.uuid == uuid)
+        stmt = select(cls.id).where(cls.uuid == uuid).limit(1)
+        result = await session.execute(stmt)
+        return result.first() is not None
+
+    @classmethod
+    @with_session
+    async def batch_insert_data(
+        cls: Type[T_MajsPaipu],
+        session: AsyncSession,
+        datas: List[Dict],
+    ) -> int:
+        """批量写入牌谱, 已存在的uuid会被跳过, 返回实际写入的数量"""
+        uuids = [data["uuid"] for data in datas]
+        stmt = select(cls.uuid).where(cls.uuid.in_(uuids))  # type: ignore
+        result = await session.execute(stmt)
+        exist = set(result.scalars().all())
+
+        new_datas = [
+            cls(**data) for data in datas if data["uuid"] not in exist
+        ]
+        if new_datas:
+            session.add_all(new_datas)
+            await session.commit()
+        return len(new_datas)
+
+
+class MajsPaipuIndex(BaseIDModel, table=True):
+    """本地已保存牌谱的索引, 每个对局的每名玩家一行"""
+
+    game_id: str = Field(default="", title="对局ID", index=True)
+    account_id: str = Field(default="", title="雀魂账号ID", index=True)
+    end_time: int = Field(default=0, title="结束时间", index=True)
+    has_review: bool = Field(default=False, title="是否已Review")
+
+    @classmethod
+    @with_session
+    async def index_paipu(
+        cls: Type[T_MajsPaipuIndex],
+        session: AsyncSession,
+        game_id: str,
+        account_ids: List[str],
+        end_time: int,
+        has_review: bool = False,
+    ) -> int:
+        await session.execute(
+            delete(cls).where(cls.game_id == game_id)  # type: ignore
+        )
+        session.add_all(
+            [
+                cls(
+                    game_id=game_id,
+                    account_id=account_id,
+                    end_time=end_time,
+                    has_review=has_review,
+                )
+                for account_id in account_ids
+            ]
+        )
+        await session.commit()
+        return 0
+
+    @classmethod
+    @with_session
+    async def set_review(
+        cls: Type[T_MajsPaipuIndex],
+        session: AsyncSession,
+        game_id: str,
+    ) -> int:
+        stmt = (
+            update(cls)
+            .where(cls.game_id == game_id)  # type: ignore
+            .values(has_review=True)
+        )
+        await session.execute(stmt)
+        await session.commit()
+        return 0
+
+    @classmethod
+    @with_session
+    async def find_by_prefix(
+        cls: Type[T_MajsPaipuIndex],
+        session: AsyncSession,
+        prefix: str,
+    ) -> Optional[str]:
+        """按对局ID前缀查找, 多个匹配时返回最近结束的对局"""
+        # 使用范围查询以命中 game_id 索引
+        stmt = (
+            select(cls.game_id)
+            .where(
+                cls.game_id >= prefix,
+                cls.game_id < f"{prefix}\U0010ffff",
+            )
+            .order_by(cls.end_time.desc())  # type: ignore
+            .limit(1)
+        )
         result = await session.execute(stmt)
-        data = result.scalars().all()
-        return bool(data)
+        return result.scalars().first()
+
+    @classmethod
+    @with_session
+    async def get_recent_games(
+        cls: Type[T_MajsPaipuIndex],
+        session: AsyncSession,
+        account_id: str,
+        limit: int = 10,
+    ) -> List[str]:
+        stmt = (
+            select(cls.game_id)
+            .where(cls.account_id == account_id)
+            .order_by(cls.end_time.desc())  # type: ignore
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+
+class MajsLiveGame(BaseIDModel, table=True):
+    """观战订阅中正在进行的对局, 重启后继续跟踪"""
+
+    game_uuid: str = Field(default="", title="对局UUID", index=True, unique=True)
+    mode_id: int = Field(default=0, title="模式ID")
+    start_time: int = Field(default=0, title="开始时间", index=True)
+    # JSON: [[雀魂账号ID, 昵称], ...]
+    watchers: str = Field(default="[]", title="订阅的玩家")
+
+    @classmethod
+    @with_session
+    async def get_all_games(
+        cls: Type[T_MajsLiveGame],
+        session: AsyncSession,
+    ) -> List[T_MajsLiveGame]:
+        result = await session.execute(select(cls))
+        return list(result.scalars().all())
+
+    @classmethod
+    @with_session
+    async def upsert_game(
+        cls: Type[T_MajsLiveGame],
+        session: AsyncSession,
+        game_uuid: str,
+        mode_id: int,
+        start_time: int,
+        watchers: str,
+    ) -> int:
+        await session.execute(
+            delete(cls).where(cls.game_uuid == game_uuid)  # type: ignore
+        )
+        session.add(
+            cls(
+                game_uuid=game_uuid,
+                mode_id=mode_id,
+                start_time=start_time,
+                watchers=watchers,
+            )
+        )
+        await session.commit()
+        return 0
+
+    @classmethod
+    @with_session
+    async def delete_games(
+        cls: Type[T_MajsLiveGame],
+        session: AsyncSession,
+        game_uuids: List[str],
+    ) -> int:
+        if game_uuids:
+            stmt = delete(cls).where(
+                cls.game_uuid.in_(game_uuids)  # type: ignore
+            )
+            await session.execute(stmt)
+            await session.commit()
+        return 0
 
 
 class MajsPush(Push, table=True):
@@ -62,6 +242,22 @@ class MajsPush(Push, table=True):
     user_id: str = Field(default="", title="用户ID")
     push_id: str = Field(default="off", title="是否开启推送")
 
+    @classmethod
+    @with_session
+    async def get_subscribed_uids(
+        cls: Type["MajsPush"],
+        session: AsyncSession,
+    ) -> List[str]:
+        """开启了好友推送的雀魂UID"""
+        stmt = (
+            select(cls.uid)
+            .where(cls.push_id != "off")
+            .where(cls.uid != None)  # noqa: E711
+            .distinct()
+        )
+        result = await session.execute(stmt)
+        return [uid for uid in result.scalars().all() if uid]
+
 
 class MajsBind(Bind, table=True):
     uid: Optional[str] = Field(default=None, title="雀魂UID")
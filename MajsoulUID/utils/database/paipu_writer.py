@@ -0,0 +1,89 @@
+import asyncio
+from typing import Dict, Optional
+from collections import OrderedDict
+
+from gsuid_core.logger import logger
+from gsuid_core.server import on_core_shutdown
+
+from .models import MajsPaipu
+
+
+class MajsPaipuWriter:
+    """
+    牌谱记录的写缓冲: 通知处理中只写入内存, 按uuid去重,
+    定时或达到数量上限时一次性批量写入数据库。
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 5,
+        max_size: int = 64,
+        seen_size: int = 4096,
+    ):
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.seen_size = seen_size
+
+        self._buffer: Dict[str, Dict] = {}
+        # 最近已写入的uuid, 避免同一对局开始/结束时重复写库
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._timer: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    def add(
+        self,
+        uuid: str,
+        account_id: str,
+        paipu_type: int,
+        paipu_type_name: str,
+    ):
+        if not uuid or uuid in self._seen or uuid in self._buffer:
+            return
+
+        self._buffer[uuid] = {
+            "uuid": uuid,
+            "account_id": account_id,
+            "paipu_type": paipu_type,
+            "paipu_type_name": paipu_type_name,
+        }
+
+        if len(self._buffer) >= self.max_size:
+            self._schedule_flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.flush_interval)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        while self._buffer:
+            datas = self._buffer
+            self._buffer = {}
+            try:
+                count = await MajsPaipu.batch_insert_data(list(datas.values()))
+            except Exception as e:
+                logger.exception(f"[majs] 批量写入牌谱失败: {e}")
+                # 放回缓冲区, 等待下次写入
+                datas.update(self._buffer)
+                self._buffer = datas
+                self._timer = asyncio.create_task(self._delayed_flush())
+                return
+
+            logger.debug(f"[majs] 批量写入牌谱 {count}/{len(datas)} 条")
+            for uuid in datas:
+                self._seen[uuid] = None
+            while len(self._seen) > self.seen_size:
+                self._seen.popitem(last=False)
+
+
+paipu_writer = MajsPaipuWriter()
+
+
+@on_core_shutdown
+async def flush_paipu_writer():
+    await paipu_writer.flush()
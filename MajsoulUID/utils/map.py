@@ -1,12 +1,139 @@
+"""
+lqc.json (皮肤定义) 与 extendRes.json (资源路径 -> 版本) 的索引
+
+两个 JSON 文件合计约 3MB, 不再在导入时加载, 而是在首次查询时生成
+SQLite 索引 (MAIN_PATH/res_map.db), 此后直接查询索引。
+JSON 文件更新后 (大小或修改时间变化) 会自动重新生成。
+
+在协程中使用前先 await res_map.prepare(), 在线程中生成索引,
+避免阻塞事件循环。
+"""
+
 import json
-from typing import Dict
+import asyncio
+import sqlite3
 from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+
+from .resource.RESOURCE_PATH import MAIN_PATH
 
 lqc_path = Path(__file__).parent / "proto" / "lqc.json"
 extend_res_path = Path(__file__).parent / "proto" / "extendRes.json"
 
-with open(lqc_path, "r", encoding="utf-8") as f:
-    lqc: Dict = json.load(f)
+SCHEMA = """
+CREATE TABLE meta (source TEXT PRIMARY KEY, signature TEXT);
+CREATE TABLE skin (id TEXT PRIMARY KEY, path TEXT, data TEXT);
+CREATE TABLE extend_res (path TEXT PRIMARY KEY, rpath TEXT, version TEXT);
+CREATE INDEX ix_extend_res_rpath ON extend_res (rpath);
+"""
+
+
+def _signature(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class ResMap:
+    def __init__(self, db_path: Path, lqc: Path, extend_res: Path):
+        self.db_path = db_path
+        self.sources = {"lqc": lqc, "extend_res": extend_res}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = asyncio.Lock()
+
+    async def prepare(self):
+        if self._conn is not None:
+            return
+        async with self._lock:
+            if self._conn is None:
+                await asyncio.to_thread(lambda: self.conn)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if not self._is_fresh():
+                self._build()
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._conn
+
+    def _is_fresh(self) -> bool:
+        if not self.db_path.exists():
+            return False
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                stored = dict(
+                    conn.execute("SELECT source, signature FROM meta")
+                )
+        except sqlite3.Error:
+            return False
+        return stored == {
+            name: _signature(path) for name, path in self.sources.items()
+        }
+
+    def _build(self):
+        with open(self.sources["lqc"], "r", encoding="utf-8") as f:
+            lqc: Dict[str, Dict] = json.load(f)
+        with open(self.sources["extend_res"], "r", encoding="utf-8") as f:
+            extend_res: Dict[str, str] = json.load(f)
+
+        tmp = self.db_path.with_name(f"{self.db_path.name}.tmp")
+        tmp.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp)
+        try:
+            conn.executescript(SCHEMA)
+            conn.executemany(
+                "INSERT INTO skin VALUES (?, ?, ?)",
+                (
+                    (
+                        key,
+                        value.get("path"),
+                        json.dumps(value, ensure_ascii=False),
+                    )
+                    for key, value in lqc.items()
+                ),
+            )
+            # 保存反转后的路径, 后缀查询转换为索引上的前缀范围查询
+            conn.executemany(
+                "INSERT INTO extend_res VALUES (?, ?, ?)",
+                ((path, path[::-1], ver) for path, ver in extend_res.items()),
+            )
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                (
+                    (name, _signature(path))
+                    for name, path in self.sources.items()
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        tmp.replace(self.db_path)
+
+    def get_skin(self, skin_id: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT data FROM skin WHERE id = ?", (skin_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_skin_path(self, skin_id: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT path FROM skin WHERE id = ?", (skin_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_res_version(self, path: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT version FROM extend_res WHERE path = ?", (path,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def find_res(self, suffix: str, limit: int = 1) -> List[Tuple[str, str]]:
+        """查找以 suffix 结尾的资源 (例如带有语言前缀的路径), 返回 [(路径, 版本)]"""
+        rsuffix = suffix[::-1]
+        return self.conn.execute(
+            "SELECT path, version FROM extend_res "
+            "WHERE rpath >= ? AND rpath < ? ORDER BY rowid LIMIT ?",
+            (rsuffix, f"{rsuffix}\U0010ffff", limit),
+        ).fetchall()
+
 
-with open(extend_res_path, "r", encoding="utf-8") as f:
-    extend_res: Dict[str, str] = json.load(f)
+res_map = ResMap(MAIN_PATH / "res_map.db", lqc_path, extend_res_path)
@@ -0,0 +1,189 @@
+"""
+将 protoc 生成的 lib/lq/__init__.py (单文件约 2.4 万行) 拆分为多个按需导入的子模块
+
+在 protoc 生成代码之后执行:
+    python ./MajsoulUID/utils/proto/split_lq.py
+
+- 消息按类名前缀 (Req/Res/Notify/Record...) 分组写入 lq/_<前缀>.py,
+  数量较少的前缀合并到 lq/_misc.py, 过大的分组按顺序拆为 _<前缀>_<n>.py
+- lq/__init__.py 改为名称 -> 子模块的索引, 通过模块级 __getattr__
+  在首次访问时导入对应子模块
+- 子模块之间不互相导入, 字段类型在 betterproto 首次解析类型注解时
+  通过 lq/_base.py 中的 Message._type_hints 按需导入
+- grpclib 的 ServiceStub / ServiceBase 在运行时不使用, 直接丢弃
+"""
+
+import re
+import ast
+from pathlib import Path
+from typing import Dict, List, Tuple
+from collections import Counter, defaultdict
+
+LQ_PATH = Path(__file__).parents[2] / "lib" / "lq"
+# 类数量少于该值的前缀合并到 _misc
+MIN_GROUP_SIZE = 20
+# 单个子模块最多包含的类数量
+MAX_GROUP_SIZE = 50
+
+HEADER = '''# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# sources: liqi.proto
+# plugin: python-betterproto
+# This file has been @generated
+# Split by MajsoulUID/utils/proto/split_lq.py
+'''
+
+MODULE_IMPORTS = """import builtins
+from typing import Dict, List, Optional
+from dataclasses import dataclass
+
+import betterproto
+
+from ._base import Message
+"""
+
+BASE = (
+    HEADER
+    + '''import sys
+from typing import Any, Dict, Type, get_type_hints
+
+import betterproto
+
+
+class _LazyNamespace(dict):
+    """类型注解中引用的其他子模块的消息, 通过 lq.__getattr__ 按需导入"""
+
+    def __missing__(self, key: str) -> Any:
+        try:
+            return getattr(sys.modules[__package__], key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+class Message(betterproto.Message):
+    @classmethod
+    def _type_hints(cls) -> Dict[str, Type]:
+        module = sys.modules[cls.__module__]
+        return get_type_hints(cls, module.__dict__, _LazyNamespace())
+'''
+)
+
+INIT = (
+    HEADER
+    + '''import importlib
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+_GROUPS: Dict[str, Tuple[str, ...]] = {groups}
+
+_MODULES: Dict[str, str] = {{
+    name: module for module, names in _GROUPS.items() for name in names
+}}
+
+__all__ = tuple(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(
+            f"module {{__name__!r}} has no attribute {{name!r}}"
+        )
+    mod = importlib.import_module(f"{{__name__}}.{{module}}")
+    # 同一子模块的其他类也一并缓存, 之后的访问不再经过 __getattr__
+    namespace = globals()
+    for n in _GROUPS[module]:
+        namespace[n] = getattr(mod, n)
+    return namespace[name]
+
+
+def __dir__():
+    return __all__
+
+
+if TYPE_CHECKING:
+{type_imports}
+'''
+)
+
+
+def prefix_of(name: str) -> str:
+    m = re.match(r"[A-Z][a-z0-9]*", name)
+    return m.group() if m else name
+
+
+def split(source: str) -> Dict[str, Tuple[List[str], List[str]]]:
+    """返回 {子模块名: ([类名], [类定义源码])}"""
+    tree = ast.parse(source)
+    lines = source.splitlines()
+
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        base = ast.unparse(node.bases[0]) if node.bases else ""
+        if "Service" in base:
+            continue
+        start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        code = "\n".join(lines[start - 1 : node.end_lineno])  # noqa: E203
+        # 只替换类声明中的基类, 声明可能跨多行
+        header_end = code.index("):")
+        code = (
+            code[:header_end].replace("betterproto.Message", "Message")
+            + code[header_end:]
+        )
+        classes.append((node.name, code))
+
+    sizes = Counter(prefix_of(name) for name, _ in classes)
+    prefixes: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for name, code in classes:
+        prefix = prefix_of(name)
+        group = prefix.lower() if sizes[prefix] >= MIN_GROUP_SIZE else "misc"
+        prefixes[group].append((name, code))
+
+    modules: Dict[str, Tuple[List[str], List[str]]] = {}
+    for group, items in sorted(prefixes.items()):
+        chunks = [
+            items[i : i + MAX_GROUP_SIZE]  # noqa: E203
+            for i in range(0, len(items), MAX_GROUP_SIZE)
+        ]
+        for n, chunk in enumerate(chunks):
+            module = f"_{group}_{n}" if len(chunks) > 1 else f"_{group}"
+            modules[module] = ([i[0] for i in chunk], [i[1] for i in chunk])
+    return modules
+
+
+def main():
+    init = LQ_PATH / "__init__.py"
+    source = init.read_text(encoding="utf-8")
+    if "_GROUPS" in source:
+        print("lq 已拆分, 跳过")
+        return
+
+    modules = split(source)
+    for old in LQ_PATH.glob("_*.py"):
+        if old.name != "__init__.py":
+            old.unlink()
+
+    (LQ_PATH / "_base.py").write_text(BASE, encoding="utf-8")
+    for module, (names, codes) in modules.items():
+        body = "\n\n\n".join(codes)
+        (LQ_PATH / f"{module}.py").write_text(
+            f"{HEADER}{MODULE_IMPORTS}\n\n{body}\n", encoding="utf-8"
+        )
+        print(f"{module}: {len(names)}")
+
+    groups = "{\n"
+    for module, (names, _) in modules.items():
+        groups += f'    "{module}": (\n'
+        groups += "".join(f'        "{n}",\n' for n in names)
+        groups += "    ),\n"
+    groups += "}"
+    type_imports = "\n".join(
+        f"    from .{module} import *  # noqa: F401,F403" for module in modules
+    )
+    init.write_text(
+        INIT.format(groups=groups, type_imports=type_imports), encoding="utf-8"
+    )
+
+
+if __name__ == "__main__":
+    main()
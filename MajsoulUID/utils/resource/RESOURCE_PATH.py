@@ -8,8 +8,9 @@ CONFIG_PATH = MAIN_PATH / "config.json"
 EXTEND_RES = MAIN_PATH / "extendRes"
 CHARACTOR_PATH = EXTEND_RES / "charactor"
 PAIPU_PATH = MAIN_PATH / "paipu"
+HTTP_CACHE_PATH = MAIN_PATH / "http_cache"
 
 
-for i in [EXTEND_RES, CHARACTOR_PATH, PAIPU_PATH]:
+for i in [EXTEND_RES, CHARACTOR_PATH, PAIPU_PATH, HTTP_CACHE_PATH]:
     if not i.exists():
         i.mkdir(parents=True)
@@ -0,0 +1,30 @@
+from copy import deepcopy
+
+import pytest
+
+pytest.importorskip("gsuid_core")
+
+from MajsoulUID.majs_notify.tenhou_meguru import MeguruLog  # noqa: E402
+
+
+def make_kyoku():
+    """四家各摸切一次, 再摸入一张打出配牌中的一张"""
+    log = [[0, 0, 0], [25000, 25000, 25000, 25000], [15], []]
+    for seat in range(4):
+        haipai = [11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24]
+        log += [haipai, [31 + seat, 41 + seat], [60, 11]]
+    log.append(["流局"])
+    return log
+
+
+def test_process_keeps_shared_paipu():
+    # 渲染场况时使用的是牌谱缓存中的同一个对象
+    kyoku = make_kyoku()
+    origin = deepcopy(kyoku)
+
+    first = MeguruLog(kyoku, 0).process()
+    second = MeguruLog(kyoku, 0).process()
+
+    assert kyoku == origin
+    assert first == second
+    assert len(first) == 2